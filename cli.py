@@ -697,6 +697,10 @@ async def pool_discover():
         print(f"\n❌ Error running discovery: {str(e)}\n")
         logger.error("cli_pool_discover_exception", error=str(e))
         sys.exit(1)
+    finally:
+        # Write LLM usage still buffered in the tracker before the loop closes
+        from utils.usage_tracker import close_usage_tracker
+        await close_usage_tracker()
 
 
 async def pool_ingest():
@@ -723,6 +727,10 @@ async def pool_ingest():
         print(f"\n❌ Error running ingestion: {str(e)}\n")
         logger.error("cli_pool_ingest_exception", error=str(e))
         sys.exit(1)
+    finally:
+        # Write LLM usage still buffered in the tracker before the loop closes
+        from utils.usage_tracker import close_usage_tracker
+        await close_usage_tracker()
 
 
 async def pool_stats():
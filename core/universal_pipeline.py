@@ -143,14 +143,7 @@ class UniversalPipeline:
     async def _get_company(self, company_id: str) -> Dict[str, Any]:
         """Get company by ID."""
         try:
-            result = self.supabase.client.table("companies") \
-                .select("*") \
-                .eq("id", company_id) \
-                .eq("is_active", True) \
-                .single() \
-                .execute()
-
-            return result.data
+            return await self.supabase.get_company_by_id(company_id)
 
         except Exception as e:
             logger.error("get_company_error", company_id=company_id, error=str(e))
@@ -10,9 +10,10 @@ import asyncio
 from fastapi import APIRouter, HTTPException, Depends
 
 from utils.logger import get_logger
-from utils.supabase_client import get_supabase_client
+from utils.supabase_client import get_supabase_client, execute_async
 from utils.auth_dependencies import get_company_id_from_auth, get_auth_context
 from utils.helpers import generate_slug_from_title
+from publishers.publication_executor import MediaBundle, get_publication_executor
 
 # Initialize
 logger = get_logger("api.articles")
@@ -60,7 +61,7 @@ async def list_articles(
         query = query.order("created_at", desc=True)\
             .range(offset, offset + limit - 1)
 
-        result = query.execute()
+        result = await execute_async(query)
         total = result.count if hasattr(result, 'count') else 0
         items = result.data or []
 
@@ -98,12 +99,13 @@ async def get_article_by_slug(
     try:
         supabase = get_supabase_client()
 
-        result = supabase.client.table("press_articles")\
-            .select("*")\
-            .eq("slug", slug)\
-            .eq("company_id", company_id)\
-            .maybe_single()\
-            .execute()
+        result = await execute_async(
+            supabase.client.table("press_articles")
+            .select("*")
+            .eq("slug", slug)
+            .eq("company_id", company_id)
+            .maybe_single()
+        )
 
         if not result.data:
             raise HTTPException(status_code=404, detail="Article not found")
@@ -194,9 +196,10 @@ async def create_article(
             )
             # Continue without embedding - not critical
 
-        result = supabase.client.table("press_articles")\
-            .insert(article_data)\
-            .execute()
+        result = await execute_async(
+            supabase.client.table("press_articles")
+            .insert(article_data)
+        )
 
         if not result.data or len(result.data) == 0:
             raise HTTPException(status_code=500, detail="Failed to create article")
@@ -233,12 +236,13 @@ async def get_article(
     try:
         supabase = get_supabase_client()
 
-        result = supabase.client.table("press_articles")\
-            .select("*")\
-            .eq("id", article_id)\
-            .eq("company_id", company_id)\
-            .maybe_single()\
-            .execute()
+        result = await execute_async(
+            supabase.client.table("press_articles")
+            .select("*")
+            .eq("id", article_id)
+            .eq("company_id", company_id)
+            .maybe_single()
+        )
 
         if not result.data:
             raise HTTPException(status_code=404, detail="Article not found")
@@ -278,12 +282,13 @@ async def get_related_articles(
         supabase = get_supabase_client()
 
         # Get the current article's embedding
-        article_result = supabase.client.table("press_articles")\
-            .select("embedding, titulo")\
-            .eq("id", article_id)\
-            .eq("company_id", company_id)\
-            .maybe_single()\
-            .execute()
+        article_result = await execute_async(
+            supabase.client.table("press_articles")
+            .select("embedding, titulo")
+            .eq("id", article_id)
+            .eq("company_id", company_id)
+            .maybe_single()
+        )
 
         if not article_result.data:
             raise HTTPException(status_code=404, detail="Article not found")
@@ -296,7 +301,7 @@ async def get_related_articles(
             return {"items": [], "count": 0}
 
         # Use the RPC function for similarity search
-        similar_result = supabase.client.rpc(
+        similar_result = await execute_async(supabase.client.rpc(
             'find_similar_articles',
             {
                 'target_embedding': article_result.data["embedding"],
@@ -305,7 +310,7 @@ async def get_related_articles(
                 'similarity_threshold': 0.5,
                 'max_results': limit
             }
-        ).execute()
+        ))
 
         items = similar_result.data or []
 
@@ -362,11 +367,12 @@ async def update_article(
         clean_data["updated_at"] = datetime.utcnow().isoformat()
 
         # Update only the provided fields
-        result = supabase.client.table("press_articles")\
-            .update(clean_data)\
-            .eq("id", article_id)\
-            .eq("company_id", company_id)\
-            .execute()
+        result = await execute_async(
+            supabase.client.table("press_articles")
+            .update(clean_data)
+            .eq("id", article_id)
+            .eq("company_id", company_id)
+        )
 
         if not result.data or len(result.data) == 0:
             raise HTTPException(status_code=404, detail="Article not found")
@@ -403,11 +409,12 @@ async def delete_article(
         supabase = get_supabase_client()
 
         # First verify the article exists and belongs to this company
-        check_result = supabase.client.table("press_articles")\
-            .select("id, titulo")\
-            .eq("id", article_id)\
-            .eq("company_id", company_id)\
-            .execute()
+        check_result = await execute_async(
+            supabase.client.table("press_articles")
+            .select("id, titulo")
+            .eq("id", article_id)
+            .eq("company_id", company_id)
+        )
 
         if not check_result.data or len(check_result.data) == 0:
             raise HTTPException(status_code=404, detail="Article not found")
@@ -415,11 +422,12 @@ async def delete_article(
         article_title = check_result.data[0].get("titulo", "Unknown")
 
         # Delete the article
-        result = supabase.client.table("press_articles")\
-            .delete()\
-            .eq("id", article_id)\
-            .eq("company_id", company_id)\
-            .execute()
+        result = await execute_async(
+            supabase.client.table("press_articles")
+            .delete()
+            .eq("id", article_id)
+            .eq("company_id", company_id)
+        )
 
         logger.info(
             "article_deleted",
@@ -462,6 +470,8 @@ async def publish_to_platforms(
 
     publication_results = {}
     supabase = get_supabase_client()
+    executor = get_publication_executor()
+    bundle = None
 
     try:
         # Get publication targets
@@ -473,7 +483,7 @@ async def publish_to_platforms(
                 .eq("is_active", True)\
                 .in_("id", target_ids)
 
-            targets_result = targets_query.execute()
+            targets_result = await execute_async(targets_query)
             targets = targets_result.data or []
         else:
             # First try default targets for each platform
@@ -483,7 +493,7 @@ async def publish_to_platforms(
                 .eq("is_active", True)\
                 .eq("is_default", True)
 
-            targets_result = targets_query.execute()
+            targets_result = await execute_async(targets_query)
             targets = targets_result.data or []
 
             # If no default targets found, use the first available target
@@ -499,7 +509,7 @@ async def publish_to_platforms(
                     .order("created_at")\
                     .limit(1)
 
-                targets_result = targets_query.execute()
+                targets_result = await execute_async(targets_query)
                 targets = targets_result.data or []
 
         if not targets:
@@ -513,11 +523,12 @@ async def publish_to_platforms(
         if not target_ids:  # Only if no targets were specified (auto-assignment case)
             assigned_target_ids = [t['id'] for t in targets]
             try:
-                supabase.client.table("press_articles")\
-                    .update({"publication_targets": assigned_target_ids})\
-                    .eq("id", article['id'])\
-                    .eq("company_id", company_id)\
-                    .execute()
+                await execute_async(
+                    supabase.client.table("press_articles")
+                    .update({"publication_targets": assigned_target_ids})
+                    .eq("id", article['id'])
+                    .eq("company_id", company_id)
+                )
 
                 logger.info("publication_targets_auto_assigned",
                     article_id=article['id'],
@@ -551,65 +562,15 @@ async def publish_to_platforms(
 
         # Get image UUID for unified image endpoint
         imagen_uuid = article.get('imagen_uuid')
-        temp_image_path = None
-
-        # Transform image for publication if present
-        if imagen_uuid:
-            try:
-                from utils.image_transformer import ImageTransformer
-                from pathlib import Path
-                import os
-
-                # Read image from cache using same logic as GET /api/v1/images/{image_id}
-                # The imagen_uuid from frontend already includes _0 suffix when needed
-                cache_dir = Path("/app/cache/images")
-                extensions = [".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp"]
-                original_image_data = None
-
-                for ext in extensions:
-                    cache_file = cache_dir / f"{imagen_uuid}{ext}"
-                    if cache_file.exists():
-                        original_image_data = cache_file.read_bytes()
-                        logger.debug("publication_image_cache_hit",
-                            imagen_uuid=imagen_uuid,
-                            extension=ext,
-                            cache_file=str(cache_file)
-                        )
-                        break
-
-                if original_image_data:
-                    # Transform image to temporary file with brand consistency and uniqueness
-                    temp_image_path = ImageTransformer.transform_for_publication(
-                        image_data=original_image_data,
-                        platform="wordpress",  # TODO: Make dynamic per platform
-                        image_uuid=imagen_uuid
-                    )
 
-                    if temp_image_path:
-                        temp_size_kb = round(os.path.getsize(temp_image_path) / 1024, 2)
-                        logger.info("publication_image_transformed",
-                            article_id=article.get('id'),
-                            imagen_uuid=imagen_uuid,
-                            temp_image_path=temp_image_path,
-                            transformed_size_kb=temp_size_kb
-                        )
-                    else:
-                        logger.error("publication_image_transformation_returned_none",
-                            article_id=article.get('id'),
-                            imagen_uuid=imagen_uuid
-                        )
-                else:
-                    logger.warn("publication_image_not_found_in_cache",
-                        article_id=article.get('id'),
-                        imagen_uuid=imagen_uuid
-                    )
-            except Exception as e:
-                logger.error("publication_image_transformation_failed",
-                    article_id=article.get('id'),
-                    imagen_uuid=imagen_uuid,
-                    error=str(e)
-                )
-                # Continue without transformed image (fallback to UUID method)
+        # Image read once, transformed once per platform (brand consistency and uniqueness)
+        bundle = await MediaBundle.load(imagen_uuid)
+        temp_image_path = await bundle.variant_path("wordpress")
+        if imagen_uuid and not temp_image_path:
+            logger.warn("publication_image_not_found_in_cache",
+                article_id=article.get('id'),
+                imagen_uuid=imagen_uuid
+            )
 
         # Add references and image attribution footer
         content = await _add_article_footer(content, article.get('id'), company_id)
@@ -666,7 +627,10 @@ async def publish_to_platforms(
                 else:
                     publish_kwargs["imagen_uuid"] = imagen_uuid
 
-                result = await publisher.publish_article(**publish_kwargs)
+                result = await executor.run(
+                    'wordpress',
+                    lambda: publisher.publish_article(**publish_kwargs)
+                )
 
                 publication_results[target_id] = {
                     "success": result.success,
@@ -770,14 +734,15 @@ async def publish_to_platforms(
 
             if not social_url:
                 try:
-                    default_wp = supabase.client.table("press_publication_targets")\
-                        .select("base_url")\
-                        .eq("company_id", company_id)\
-                        .eq("platform_type", "wordpress")\
-                        .eq("is_active", True)\
-                        .eq("is_default", True)\
-                        .limit(1)\
-                        .execute()
+                    default_wp = await execute_async(
+                        supabase.client.table("press_publication_targets")
+                        .select("base_url")
+                        .eq("company_id", company_id)
+                        .eq("platform_type", "wordpress")
+                        .eq("is_active", True)
+                        .eq("is_default", True)
+                        .limit(1)
+                    )
                     if default_wp.data:
                         social_url = default_wp.data[0].get('base_url', '')
                         logger.info("social_using_default_wordpress_url",
@@ -790,7 +755,7 @@ async def publish_to_platforms(
                         error=str(e)
                     )
 
-            for target in social_targets:
+            async def publish_to_social(target: Dict) -> None:
                 target_id = target['id']
                 platform = target['platform_type']
 
@@ -826,7 +791,7 @@ async def publish_to_platforms(
                         url=social_url,
                         image_uuid=imagen_uuid,
                         tags=[],  # No hashtags
-                        temp_image_path=temp_image_path
+                        temp_image_path=await bundle.variant_path(platform)
                     )
 
                     publication_results[target_id] = {
@@ -864,22 +829,8 @@ async def publish_to_platforms(
                         error=str(e)
                     )
 
-        # Clean up temp image file if it was created
-        if temp_image_path:
-            try:
-                import os
-                if os.path.exists(temp_image_path):
-                    os.remove(temp_image_path)
-                    logger.debug("temp_image_cleaned_up",
-                        article_id=article['id'],
-                        temp_image_path=temp_image_path
-                    )
-            except Exception as e:
-                logger.warn("failed_to_cleanup_temp_image",
-                    article_id=article['id'],
-                    temp_image_path=temp_image_path,
-                    error=str(e)
-                )
+            # All social targets in parallel (per-platform limits)
+            await executor.fan_out(social_targets, lambda target: target['platform_type'], publish_to_social)
 
     except Exception as e:
         logger.error("publish_to_platforms_error",
@@ -887,6 +838,10 @@ async def publish_to_platforms(
             error=str(e)
         )
         # Return empty dict on error rather than failing the whole publication
+    finally:
+        # Remove the transformed image temp files
+        if bundle is not None:
+            await bundle.close()
 
     return publication_results
 
@@ -921,11 +876,12 @@ async def _add_article_footer(content: str, article_id: str, company_id: str) ->
 
         # Get context units used in this article
         # Get article data to find context_unit_ids
-        article_data = supabase.client.table("press_articles")\
-            .select("context_unit_ids")\
-            .eq("id", article_id)\
-            .maybe_single()\
-            .execute()
+        article_data = await execute_async(
+            supabase.client.table("press_articles")
+            .select("context_unit_ids")
+            .eq("id", article_id)
+            .maybe_single()
+        )
 
         context_units_result = {"data": []}
 
@@ -933,20 +889,22 @@ async def _add_article_footer(content: str, article_id: str, company_id: str) ->
             # Use context units linked to this article
             context_unit_ids = article_data.data["context_unit_ids"]
             if context_unit_ids:
-                context_units_result = supabase.client.table("press_context_units")\
-                    .select("source_metadata, id")\
-                    .in_("id", context_unit_ids)\
-                    .execute()
+                context_units_result = await execute_async(
+                    supabase.client.table("press_context_units")
+                    .select("source_metadata, id")
+                    .in_("id", context_unit_ids)
+                )
 
         # If no context units found, use fallback to recent units from same company (no time limit)
         if not context_units_result.data or len(context_units_result.data) == 0:
-            context_units_result = supabase.client.table("press_context_units")\
-                .select("source_metadata, id")\
-                .eq("company_id", company_id)\
-                .is_not("source_metadata->url", "null")\
-                .order("created_at", desc=True)\
-                .limit(10)\
-                .execute()
+            context_units_result = await execute_async(
+                supabase.client.table("press_context_units")
+                .select("source_metadata, id")
+                .eq("company_id", company_id)
+                .is_not("source_metadata->url", "null")
+                .order("created_at", desc=True)
+                .limit(10)
+            )
 
         context_units = context_units_result.data or []
 
@@ -966,11 +924,12 @@ async def _add_article_footer(content: str, article_id: str, company_id: str) ->
                     continue
 
         # Get article image info for attribution
-        article_result = supabase.client.table("press_articles")\
-            .select("imagen_uuid, working_json")\
-            .eq("id", article_id)\
-            .maybe_single()\
-            .execute()
+        article_result = await execute_async(
+            supabase.client.table("press_articles")
+            .select("imagen_uuid, working_json")
+            .eq("id", article_id)
+            .maybe_single()
+        )
 
         image_attribution = None
         if article_result.data and article_result.data.get("imagen_uuid"):
@@ -997,16 +956,17 @@ async def _add_article_footer(content: str, article_id: str, company_id: str) ->
         # Add related articles section (FIRST)
         try:
             # Get the current article's embedding
-            current_article = supabase.client.table("press_articles")\
-                .select("embedding")\
-                .eq("id", article_id)\
-                .eq("company_id", company_id)\
-                .maybe_single()\
-                .execute()
+            current_article = await execute_async(
+                supabase.client.table("press_articles")
+                .select("embedding")
+                .eq("id", article_id)
+                .eq("company_id", company_id)
+                .maybe_single()
+            )
 
             if current_article.data and current_article.data.get("embedding"):
                 # Get related articles using similarity search
-                similar_result = supabase.client.rpc(
+                similar_result = await execute_async(supabase.client.rpc(
                     'find_similar_articles',
                     {
                         'target_embedding': current_article.data["embedding"],
@@ -1015,7 +975,7 @@ async def _add_article_footer(content: str, article_id: str, company_id: str) ->
                         'similarity_threshold': 0.5,
                         'max_results': 3
                     }
-                ).execute()
+                ))
 
                 if similar_result.data and len(similar_result.data) > 0:
                     footer_parts.append("<strong>Artículos relacionados:</strong>")
@@ -1131,12 +1091,13 @@ async def publish_article(
         supabase = get_supabase_client()
 
         # Get article to verify it exists and belongs to company
-        article_result = supabase.client.table("press_articles")\
-            .select("*")\
-            .eq("id", article_id)\
-            .eq("company_id", company_id)\
-            .single()\
-            .execute()
+        article_result = await execute_async(
+            supabase.client.table("press_articles")
+            .select("*")
+            .eq("id", article_id)
+            .eq("company_id", company_id)
+            .single()
+        )
 
         if not article_result.data:
             raise HTTPException(status_code=404, detail="Article not found")
@@ -1211,12 +1172,13 @@ async def _publish_with_target_schedules(
 
     # Get target details
     target_ids = [ts['target_id'] for ts in target_schedules]
-    targets_result = supabase.client.table("press_publication_targets")\
-        .select("id, platform_type, name, base_url, credentials_encrypted")\
-        .eq("company_id", company_id)\
-        .eq("is_active", True)\
-        .in_("id", target_ids)\
-        .execute()
+    targets_result = await execute_async(
+        supabase.client.table("press_publication_targets")
+        .select("id, platform_type, name, base_url, credentials_encrypted")
+        .eq("company_id", company_id)
+        .eq("is_active", True)
+        .in_("id", target_ids)
+    )
 
     targets_by_id = {t['id']: t for t in (targets_result.data or [])}
 
@@ -1224,10 +1186,11 @@ async def _publish_with_target_schedules(
     if social_hooks:
         working_json = article.get('working_json') or {}
         working_json['social_hooks'] = social_hooks
-        supabase.client.table("press_articles")\
-            .update({"working_json": working_json, "updated_at": datetime.utcnow().isoformat()})\
-            .eq("id", article_id)\
-            .execute()
+        await execute_async(
+            supabase.client.table("press_articles")
+            .update({"working_json": working_json, "updated_at": datetime.utcnow().isoformat()})
+            .eq("id", article_id)
+        )
         article['working_json'] = working_json
 
     # Mapping: platform -> hook type
@@ -1311,7 +1274,8 @@ async def _publish_with_target_schedules(
 
                 # Log immediate publication to scheduled_publications table
                 try:
-                    supabase.client.table("scheduled_publications")\
+                    await execute_async(
+                        supabase.client.table("scheduled_publications")
                         .upsert({
                             "article_id": article_id,
                             "target_id": target_id,
@@ -1324,8 +1288,8 @@ async def _publish_with_target_schedules(
                             "publication_result": result,
                             "error_message": result.get('error') if not result.get('success') else None,
                             "created_at": datetime.utcnow().isoformat()
-                        }, on_conflict="article_id,target_id")\
-                        .execute()
+                        }, on_conflict="article_id,target_id")
+                    )
                 except Exception as log_err:
                     logger.warn("immediate_publication_log_failed",
                         article_id=article_id, target_id=target_id, error=str(log_err))
@@ -1350,7 +1314,8 @@ async def _publish_with_target_schedules(
 
         # Create scheduled_publication record
         try:
-            insert_result = supabase.client.table("scheduled_publications")\
+            insert_result = await execute_async(
+                supabase.client.table("scheduled_publications")
                 .upsert({
                     "article_id": article_id,
                     "target_id": target['id'],
@@ -1360,8 +1325,8 @@ async def _publish_with_target_schedules(
                     "status": "scheduled",
                     "social_hook": hook_text if target['platform_type'] != 'wordpress' else None,
                     "created_at": datetime.utcnow().isoformat()
-                }, on_conflict="article_id,target_id")\
-                .execute()
+                }, on_conflict="article_id,target_id")
+            )
 
             publications.append({
                 "target_id": target['id'],
@@ -1431,10 +1396,11 @@ async def _publish_with_target_schedules(
                 update_data["fecha_publicacion"] = datetime.utcnow().isoformat()
                 break
 
-    supabase.client.table("press_articles")\
-        .update(update_data)\
-        .eq("id", article_id)\
-        .execute()
+    await execute_async(
+        supabase.client.table("press_articles")
+        .update(update_data)
+        .eq("id", article_id)
+    )
 
     logger.info("publish_with_schedules_completed",
         article_id=article_id,
@@ -1550,11 +1516,12 @@ async def _publish_legacy_format(
         scheduled_for = scheduled_datetime.isoformat()
         new_status = "programado"
 
-    update_result = supabase.client.table("press_articles")\
-        .update(update_data)\
-        .eq("id", article_id)\
-        .eq("company_id", company_id)\
-        .execute()
+    update_result = await execute_async(
+        supabase.client.table("press_articles")
+        .update(update_data)
+        .eq("id", article_id)
+        .eq("company_id", company_id)
+    )
 
     if not update_result.data:
         raise HTTPException(status_code=500, detail="Failed to update article")
@@ -1598,13 +1565,14 @@ async def calculate_optimal_schedule_time(company_id: str) -> datetime:
     start_time = now + timedelta(hours=2)  # Minimum 2 hours from now
     end_time = now + timedelta(hours=48)
 
-    scheduled_result = supabase.client.table("press_articles")\
-        .select("to_publish_at")\
-        .eq("company_id", company_id)\
-        .eq("estado", "programado")\
-        .gte("to_publish_at", start_time.isoformat())\
-        .lte("to_publish_at", end_time.isoformat())\
-        .execute()
+    scheduled_result = await execute_async(
+        supabase.client.table("press_articles")
+        .select("to_publish_at")
+        .eq("company_id", company_id)
+        .eq("estado", "programado")
+        .gte("to_publish_at", start_time.isoformat())
+        .lte("to_publish_at", end_time.isoformat())
+    )
 
     # Count articles per hour
     scheduled_by_hour = {}
@@ -1779,28 +1747,30 @@ async def _get_last_scheduled_wp(company_id: str) -> Optional[datetime]:
         supabase = get_supabase_client()
 
         # Check scheduled_publications table first
-        result = supabase.client.table("scheduled_publications")\
-            .select("scheduled_for")\
-            .eq("company_id", company_id)\
-            .eq("platform_type", "wordpress")\
-            .eq("status", "scheduled")\
-            .gt("scheduled_for", datetime.utcnow().isoformat())\
-            .order("scheduled_for", desc=True)\
-            .limit(1)\
-            .execute()
+        result = await execute_async(
+            supabase.client.table("scheduled_publications")
+            .select("scheduled_for")
+            .eq("company_id", company_id)
+            .eq("platform_type", "wordpress")
+            .eq("status", "scheduled")
+            .gt("scheduled_for", datetime.utcnow().isoformat())
+            .order("scheduled_for", desc=True)
+            .limit(1)
+        )
 
         if result.data:
             return datetime.fromisoformat(result.data[0]["scheduled_for"].replace("Z", "+00:00"))
 
         # Also check articles with to_publish_at (legacy)
-        result = supabase.client.table("press_articles")\
-            .select("to_publish_at")\
-            .eq("company_id", company_id)\
-            .eq("estado", "programado")\
-            .gt("to_publish_at", datetime.utcnow().isoformat())\
-            .order("to_publish_at", desc=True)\
-            .limit(1)\
-            .execute()
+        result = await execute_async(
+            supabase.client.table("press_articles")
+            .select("to_publish_at")
+            .eq("company_id", company_id)
+            .eq("estado", "programado")
+            .gt("to_publish_at", datetime.utcnow().isoformat())
+            .order("to_publish_at", desc=True)
+            .limit(1)
+        )
 
         if result.data and result.data[0].get("to_publish_at"):
             return datetime.fromisoformat(result.data[0]["to_publish_at"].replace("Z", "+00:00"))
@@ -1858,7 +1828,7 @@ async def get_scheduled_publications(
     if status:
         query = query.eq("status", status)
 
-    pubs_result = query.execute()
+    pubs_result = await execute_async(query)
 
     publications = []
     for pub in (pubs_result.data or []):
@@ -1878,11 +1848,12 @@ async def get_scheduled_publications(
         })
 
     # Summary counts (within same time window, same OR logic)
-    all_pubs = supabase.client.table("scheduled_publications")\
-        .select("status")\
-        .eq("company_id", company_id)\
-        .or_(f"scheduled_for.gte.{from_time_iso},and(scheduled_for.is.null,published_at.gte.{from_time_iso})")\
-        .execute()
+    all_pubs = await execute_async(
+        supabase.client.table("scheduled_publications")
+        .select("status")
+        .eq("company_id", company_id)
+        .or_(f"scheduled_for.gte.{from_time_iso},and(scheduled_for.is.null,published_at.gte.{from_time_iso})")
+    )
 
     total = len(all_pubs.data or [])
     scheduled_count = len([p for p in (all_pubs.data or []) if p['status'] == 'scheduled'])
@@ -1931,12 +1902,13 @@ async def update_scheduled_publication(
     supabase = get_supabase_client()
 
     # Verify publication exists and belongs to company
-    pub_result = supabase.client.table("scheduled_publications")\
-        .select("id, status, scheduled_for")\
-        .eq("id", publication_id)\
-        .eq("company_id", company_id)\
-        .single()\
-        .execute()
+    pub_result = await execute_async(
+        supabase.client.table("scheduled_publications")
+        .select("id, status, scheduled_for")
+        .eq("id", publication_id)
+        .eq("company_id", company_id)
+        .single()
+    )
 
     if not pub_result.data:
         raise HTTPException(status_code=404, detail="Scheduled publication not found")
@@ -1967,10 +1939,11 @@ async def update_scheduled_publication(
         update_data["status"] = status
 
     # Update
-    result = supabase.client.table("scheduled_publications")\
-        .update(update_data)\
-        .eq("id", publication_id)\
-        .execute()
+    result = await execute_async(
+        supabase.client.table("scheduled_publications")
+        .update(update_data)
+        .eq("id", publication_id)
+    )
 
     logger.info("scheduled_publication_updated",
         publication_id=publication_id,
@@ -2007,12 +1980,13 @@ async def delete_scheduled_publication(
     supabase = get_supabase_client()
 
     # Verify publication exists and belongs to company
-    pub_result = supabase.client.table("scheduled_publications")\
-        .select("id, status, platform_type, article_id")\
-        .eq("id", publication_id)\
-        .eq("company_id", company_id)\
-        .single()\
-        .execute()
+    pub_result = await execute_async(
+        supabase.client.table("scheduled_publications")
+        .select("id, status, platform_type, article_id")
+        .eq("id", publication_id)
+        .eq("company_id", company_id)
+        .single()
+    )
 
     if not pub_result.data:
         raise HTTPException(status_code=404, detail="Scheduled publication not found")
@@ -2021,10 +1995,11 @@ async def delete_scheduled_publication(
         raise HTTPException(status_code=400, detail="Cannot delete already published publication")
 
     # Delete
-    supabase.client.table("scheduled_publications")\
-        .delete()\
-        .eq("id", publication_id)\
-        .execute()
+    await execute_async(
+        supabase.client.table("scheduled_publications")
+        .delete()
+        .eq("id", publication_id)
+    )
 
     logger.info("scheduled_publication_deleted",
         publication_id=publication_id,
@@ -2071,24 +2046,26 @@ async def propose_schedule(
         supabase = get_supabase_client()
 
         # Verify article exists
-        article_result = supabase.client.table("press_articles")\
-            .select("id")\
-            .eq("id", article_id)\
-            .eq("company_id", company_id)\
-            .single()\
-            .execute()
+        article_result = await execute_async(
+            supabase.client.table("press_articles")
+            .select("id")
+            .eq("id", article_id)
+            .eq("company_id", company_id)
+            .single()
+        )
 
         if not article_result.data:
             raise HTTPException(status_code=404, detail="Article not found")
 
         # Get all active publication targets for this company
-        targets_result = supabase.client.table("press_publication_targets")\
-            .select("id, platform_type, name, is_default")\
-            .eq("company_id", company_id)\
-            .eq("is_active", True)\
-            .order("is_default", desc=True)\
-            .order("created_at")\
-            .execute()
+        targets_result = await execute_async(
+            supabase.client.table("press_publication_targets")
+            .select("id, platform_type, name, is_default")
+            .eq("company_id", company_id)
+            .eq("is_active", True)
+            .order("is_default", desc=True)
+            .order("created_at")
+        )
 
         targets = targets_result.data or []
 
@@ -2193,12 +2170,13 @@ async def list_executions(
         company_id = auth["company_id"]
         supabase = get_supabase_client()
 
-        result = supabase.client.table("executions")\
-            .select("*", count="exact")\
-            .eq("company_id", company_id)\
-            .order("timestamp", desc=True)\
-            .range(offset, offset + limit - 1)\
-            .execute()
+        result = await execute_async(
+            supabase.client.table("executions")
+            .select("*", count="exact")
+            .eq("company_id", company_id)
+            .order("timestamp", desc=True)
+            .range(offset, offset + limit - 1)
+        )
 
         total = result.count if hasattr(result, 'count') else 0
         items = result.data or []
@@ -2229,12 +2207,13 @@ async def list_styles(
         company_id = auth["company_id"]
         supabase = get_supabase_client()
 
-        result = supabase.client.table("press_styles")\
-            .select("*")\
-            .eq("company_id", company_id)\
-            .eq("is_active", True)\
-            .order("created_at", desc=True)\
-            .execute()
+        result = await execute_async(
+            supabase.client.table("press_styles")
+            .select("*")
+            .eq("company_id", company_id)
+            .eq("is_active", True)
+            .order("created_at", desc=True)
+        )
 
         return {
             "items": result.data or []
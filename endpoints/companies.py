@@ -6,6 +6,7 @@ from typing import Dict, Optional
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
+from utils.config_cache import get_config_cache
 from utils.logger import get_logger
 from utils.supabase_client import get_supabase_client
 from utils.auth_dependencies import get_company_id_from_auth
@@ -157,6 +158,9 @@ async def update_current_company_settings(
         if not update_result.data:
             raise HTTPException(status_code=500, detail="Failed to update company settings")
 
+        # Drop cached company/settings so this process sees the change at once
+        get_config_cache().invalidate_company(auth_company_id)
+
         logger.info("current_company_settings_updated",
             company_id=auth_company_id,
             updated_fields=list(settings_dict.keys()),
@@ -320,6 +324,9 @@ async def update_company_settings(
         if not update_result.data:
             raise HTTPException(status_code=500, detail="Failed to update company settings")
 
+        # Drop cached company/settings so this process sees the change at once
+        get_config_cache().invalidate_company(company_id)
+
         logger.info("company_settings_updated",
             company_id=company_id,
             auth_company_id=auth_company_id,
@@ -7,7 +7,7 @@ from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel, Field
 
 from utils.logger import get_logger
-from utils.supabase_client import get_supabase_client
+from utils.supabase_client import get_supabase_client, execute_async
 from utils.auth_dependencies import get_company_id_from_auth, get_auth_context
 
 logger = get_logger("api.context_units")
@@ -90,12 +90,13 @@ async def enrichment_context_unit(
         # Allow access to both client's own units AND pool units
         pool_company_id = "99999999-9999-9999-9999-999999999999"
 
-        result = supabase_client.client.table("press_context_units")\
-            .select("*")\
-            .eq("id", context_unit_id)\
-            .or_(f"company_id.eq.{auth['company_id']},company_id.eq.{pool_company_id}")\
-            .maybe_single()\
-            .execute()
+        result = await execute_async(
+            supabase_client.client.table("press_context_units")
+            .select("*")
+            .eq("id", context_unit_id)
+            .or_(f"company_id.eq.{auth['company_id']},company_id.eq.{pool_company_id}")
+            .maybe_single()
+        )
 
         if not result or not result.data:
             logger.warn(
@@ -218,12 +219,13 @@ async def save_enriched_statements(
         # Allow access to both client's own units AND pool units
         pool_company_id = "99999999-9999-9999-9999-999999999999"
 
-        result = supabase_client.client.table("press_context_units")\
-            .select("*")\
-            .eq("id", context_unit_id)\
-            .or_(f"company_id.eq.{auth['company_id']},company_id.eq.{pool_company_id}")\
-            .maybe_single()\
-            .execute()
+        result = await execute_async(
+            supabase_client.client.table("press_context_units")
+            .select("*")
+            .eq("id", context_unit_id)
+            .or_(f"company_id.eq.{auth['company_id']},company_id.eq.{pool_company_id}")
+            .maybe_single()
+        )
 
         if not result or not result.data:
             logger.warn(
@@ -301,12 +303,13 @@ async def save_enriched_statements(
         # DECISION: Pool unit → create enrichment child, Own unit → update directly
         if is_pool_unit:
             # Check if enrichment child already exists for this user
-            enrichment_check = supabase_client.client.table("press_context_units")\
-                .select("id, enriched_statements")\
-                .eq("base_id", base_id)\
-                .eq("company_id", auth["company_id"])\
-                .maybe_single()\
-                .execute()
+            enrichment_check = await execute_async(
+                supabase_client.client.table("press_context_units")
+                .select("id, enriched_statements")
+                .eq("base_id", base_id)
+                .eq("company_id", auth["company_id"])
+                .maybe_single()
+            )
 
             if enrichment_check.data:
                 # Update existing enrichment
@@ -314,9 +317,9 @@ async def save_enriched_statements(
                 if request.append:
                     final_statements = existing_enriched_statements + new_statements
 
-                update_result = supabase_client.client.table("press_context_units").update({
+                update_result = await execute_async(supabase_client.client.table("press_context_units").update({
                     "enriched_statements": final_statements
-                }).eq("id", enrichment_check.data["id"]).execute()
+                }).eq("id", enrichment_check.data["id"]))
 
                 enrichment_id = enrichment_check.data["id"]
                 logger.info("enrichment_child_updated",
@@ -329,7 +332,7 @@ async def save_enriched_statements(
                 import uuid
                 enrichment_id = str(uuid.uuid4())
 
-                insert_result = supabase_client.client.table("press_context_units").insert({
+                insert_result = await execute_async(supabase_client.client.table("press_context_units").insert({
                     "id": enrichment_id,
                     "base_id": base_id,
                     "company_id": auth["company_id"],
@@ -343,7 +346,7 @@ async def save_enriched_statements(
                     "enriched_statements": final_statements,
                     "embedding": None,
                     "created_at": datetime.utcnow().isoformat()
-                }).execute()
+                }))
 
                 update_result = insert_result
                 logger.info("enrichment_child_created",
@@ -353,9 +356,9 @@ async def save_enriched_statements(
                 )
         else:
             # Own unit - update directly
-            update_result = supabase_client.client.table("press_context_units").update({
+            update_result = await execute_async(supabase_client.client.table("press_context_units").update({
                 "enriched_statements": final_statements
-            }).eq("id", context_unit_id).execute()
+            }).eq("id", context_unit_id))
 
         if not update_result.data:
             logger.error(
@@ -465,9 +468,10 @@ async def list_context_units(
             query = query.eq("is_starred", True)
 
         # Order and paginate
-        result = query.order("created_at", desc=True)\
-            .range(offset, offset + limit - 1)\
-            .execute()
+        result = await execute_async(
+            query.order("created_at", desc=True)
+            .range(offset, offset + limit - 1)
+        )
 
         total = result.count if hasattr(result, 'count') else 0
         items = result.data or []
@@ -501,10 +505,11 @@ async def get_filter_options(
         supabase = get_supabase_client()
 
         # Query all units and aggregate manually (simple and reliable)
-        all_units = supabase.client.table("press_context_units")\
-            .select("source_type, tags, category")\
-            .eq("company_id", company_id)\
-            .execute()
+        all_units = await execute_async(
+            supabase.client.table("press_context_units")
+            .select("source_type, tags, category")
+            .eq("company_id", company_id)
+        )
 
         # Manual aggregation
         sources_map = {}
@@ -555,11 +560,12 @@ async def get_context_unit(
         supabase = get_supabase_client()
 
         # First, get the requested unit to determine its base_id
-        initial_result = supabase.client.table("press_context_units")\
-            .select("*")\
-            .eq("id", context_unit_id)\
-            .single()\
-            .execute()
+        initial_result = await execute_async(
+            supabase.client.table("press_context_units")
+            .select("*")
+            .eq("id", context_unit_id)
+            .single()
+        )
 
         if not initial_result.data:
             raise HTTPException(status_code=404, detail="Context unit not found or access denied")
@@ -568,11 +574,12 @@ async def get_context_unit(
         base_id = initial_unit.get("base_id", context_unit_id)
 
         # Fetch base + user's enrichment (if exists)
-        all_units_result = supabase.client.table("press_context_units")\
-            .select("*")\
-            .eq("base_id", base_id)\
-            .in_("company_id", [pool_company_id, company_id])\
-            .execute()
+        all_units_result = await execute_async(
+            supabase.client.table("press_context_units")
+            .select("*")
+            .eq("base_id", base_id)
+            .in_("company_id", [pool_company_id, company_id])
+        )
 
         units = all_units_result.data or [initial_unit]
 
@@ -698,7 +705,7 @@ async def hybrid_semantic_search(
         }
 
         # Step 4: Execute hybrid search via new RPC function
-        result = supabase_client.client.rpc('hybrid_search_context_units', rpc_params).execute()
+        result = await execute_async(supabase_client.client.rpc('hybrid_search_context_units', rpc_params))
 
         results = result.data or []
 
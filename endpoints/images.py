@@ -1,19 +1,22 @@
 """Image generation, retrieval, and upload endpoints."""
 
+import asyncio
 import re
 import ssl
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 import aiohttp
-from fastapi import APIRouter, HTTPException, Depends, Query, UploadFile, File
-from fastapi.responses import Response
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, UploadFile, File
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel, Field
 
 from utils.logger import get_logger
-from utils.supabase_client import get_supabase_client
+from utils.supabase_client import execute_async, get_supabase_client
 from utils.auth_dependencies import get_company_id_from_auth
+from utils.image_store import get_image_store
+from utils.image_variants import etag_matches, file_etag, media_type_for, resolve_variant, variant_etag, variant_path
 
 logger = get_logger("api.images")
 router = APIRouter(tags=["images"])
@@ -21,6 +24,15 @@ router = APIRouter(tags=["images"])
 # Initialize supabase client
 supabase_client = get_supabase_client()
 
+# Responsive variant query parameters (shared by the image GET endpoints)
+WIDTH_QUERY = Query(None, ge=1, le=4096, description="Max width in px, snapped up to IMAGE_VARIANT_SIZES (resized, cached variant)")
+HEIGHT_QUERY = Query(None, ge=1, le=4096, description="Max height in px, snapped up to IMAGE_VARIANT_SIZES (resized, cached variant)")
+FORMAT_QUERY = Query(
+    None,
+    alias="format",
+    pattern="^(auto|avif|webp|jpeg|jpg|png)$",
+    description="Output format (auto = negotiate from Accept)"
+)
 
 # ============================================
 # PYDANTIC MODELS
@@ -41,6 +53,159 @@ class ImageUploadRequest(BaseModel):
 # HELPER FUNCTIONS
 # ============================================
 
+def find_cached_image(stem: str) -> Optional[Path]:
+    """Image store file for stem ({uuid} or {context_unit_id}_{index}), any extension."""
+    return get_image_store().path(stem)
+
+
+async def serve_image_file(
+    request: Request,
+    path: Path,
+    headers: Dict[str, str],
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    image_format: Optional[str] = None
+) -> Response:
+    """Serve a cached image from disk (sendfile), resized if requested.
+
+    Adds a strong ETag and answers If-None-Match with 304 before any
+    variant is rendered. Negotiated variants add Vary: Accept.
+    """
+    spec = resolve_variant(width, height, image_format, request.headers.get("accept"), path.suffix)
+    if spec is None:
+        etag = await asyncio.to_thread(file_etag, path)
+    else:
+        etag = await variant_etag(path, spec)
+
+    headers = {**headers, "ETag": etag}
+    if spec is not None and spec.negotiated:
+        headers["Vary"] = "Accept"
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    if spec is None:
+        served, media_type = path, media_type_for(path)
+    else:
+        served, media_type, etag = await variant_path(path, spec)
+        headers["ETag"] = etag
+
+    return FileResponse(served, media_type=media_type, headers=headers)
+
+
+FEATURED_IMAGE_KEY = re.compile(r"^([0-9a-fA-F-]{36})_0$")
+FEATURED_IMAGE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+    "image/bmp": ".bmp"
+}
+
+
+async def fetch_featured_image(
+    context_unit_id: str,
+    source_metadata: Dict[str, Any]
+) -> Optional[Tuple[bytes, str, Optional[Path]]]:
+    """Download a context unit's featured image and store it as {id}_0.
+
+    Stored evictable: it can always be fetched again from the same URL.
+
+    Returns:
+        (image_bytes, content_type, stored path or None), or None if the
+        image is unavailable
+    """
+    featured_image = source_metadata.get("featured_image") or {}
+    image_url = featured_image.get("url") or ""
+    if not image_url.startswith(("http://", "https://")):
+        return None
+
+    try:
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+
+        connector = aiohttp.TCPConnector(ssl=ssl_context)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async with session.get(
+                image_url,
+                headers={
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                    'Accept': 'image/*',
+                    'Referer': source_metadata.get("url", "https://ekimen.ai")
+                },
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status != 200:
+                    logger.warn("featured_image_fetch_failed",
+                        context_unit_id=context_unit_id,
+                        status=response.status,
+                        url=image_url
+                    )
+                    return None
+                image_bytes = await response.read()
+                content_type = response.headers.get("Content-Type", "image/jpeg")
+    except Exception as e:
+        logger.warn("featured_image_proxy_error",
+            context_unit_id=context_unit_id,
+            error=str(e),
+            url=image_url
+        )
+        return None
+
+    # Caching is optional: the bytes are served either way
+    try:
+        cache_file = await asyncio.to_thread(
+            get_image_store().put,
+            f"{context_unit_id}_0",
+            image_bytes,
+            FEATURED_IMAGE_EXTENSIONS.get(content_type, ".jpg"),
+            True
+        )
+        logger.info("featured_image_cached",
+            context_unit_id=context_unit_id,
+            size_bytes=len(image_bytes),
+            cache_path=str(cache_file)
+        )
+    except Exception as e:
+        cache_file = None
+        logger.warn("featured_image_cache_write_failed",
+            context_unit_id=context_unit_id,
+            error=str(e)
+        )
+
+    return image_bytes, content_type, cache_file
+
+
+async def refetch_evicted_image(image_id: str) -> Optional[Path]:
+    """Store miss for a featured image key ({context_unit_id}_0): download it again.
+
+    Featured images are evictable in the image store, but articles keep
+    pointing at them (imagen_uuid) and publishers fetch them through the
+    unified endpoint, so an evicted one must come back instead of the
+    placeholder.
+    """
+    match = FEATURED_IMAGE_KEY.match(image_id)
+    if not match:
+        return None
+
+    context_unit_id = match.group(1)
+    result = await execute_async(
+        supabase_client.client.table("press_context_units")
+        .select("id, source_metadata")
+        .eq("id", context_unit_id)
+        .limit(1)
+    )
+    if not result.data:
+        return None
+
+    fetched = await fetch_featured_image(context_unit_id, result.data[0].get("source_metadata") or {})
+    if fetched is None:
+        return None
+    logger.info("evicted_featured_image_refetched", image_id=image_id)
+    return fetched[2]
+
+
 def generate_placeholder_image() -> bytes:
     """Generate SVG placeholder image with 1.91:1 aspect ratio.
 
@@ -79,7 +244,7 @@ async def generate_image_for_article(
     - Quality: Excellent for simple photorealistic objects
 
     Generated images are:
-    - Cached permanently in /app/cache/images/{article_id}.jpg
+    - Cached permanently in the image store ({article_id})
     - Served via GET /api/v1/images/{article_id} (unified endpoint)
 
     **Authentication**: Accepts JWT or API Key
@@ -195,6 +360,10 @@ async def generate_image_for_article(
 @router.get("/api/v1/articles/{article_id}/image")
 async def get_article_image(
     article_id: str,
+    request: Request,
+    w: Optional[int] = WIDTH_QUERY,
+    h: Optional[int] = HEIGHT_QUERY,
+    image_format: Optional[str] = FORMAT_QUERY,
     company_id: str = Depends(get_company_id_from_auth)
 ):
     """Get image for article with fallback to placeholder.
@@ -203,18 +372,20 @@ async def get_article_image(
     1. Cached image (from POST /generate-image) - X-Image-Source: "cached"
     2. Placeholder SVG - X-Image-Source: "placeholder"
 
-    Images are cached in /app/cache/images/{article_id}.jpg
+    Images are cached in the image store under {article_id}
 
     Args:
         article_id: Article UUID
+        w, h, format: Optional resized variant (see serve_image_file)
         company_id: Company ID from auth
 
     Returns:
-        Image bytes (JPEG or SVG placeholder)
+        Image file (JPEG, negotiated variant or SVG placeholder)
 
     Response Headers:
-        - Content-Type: image/jpeg or image/svg+xml
+        - Content-Type: image/jpeg, variant type or image/svg+xml
         - Cache-Control: public, max-age=86400 (24 hours)
+        - ETag (cached images; If-None-Match returns 304)
         - X-Image-Source: "cached" | "placeholder"
 
     Expected aspect ratio: 16:9 (1024x576) for generated
@@ -223,24 +394,24 @@ async def get_article_image(
         HTTPException: 404 if article not found
     """
     try:
-        # Check unified cache
-        cache_dir = Path("/app/cache/images")
-        cache_file = cache_dir / f"{article_id}.jpg"
+        # Check image store
+        cache_file = await asyncio.to_thread(find_cached_image, article_id)
 
-        if cache_file.exists():
+        if cache_file:
             logger.debug("article_image_cache_hit",
                 article_id=article_id,
                 cache_file=str(cache_file)
             )
 
-            return Response(
-                content=cache_file.read_bytes(),
-                media_type="image/jpeg",
-                headers={
+            return await serve_image_file(
+                request,
+                cache_file,
+                {
                     "Cache-Control": "public, max-age=86400",
                     "X-Image-Source": "cached",
                     "X-Image-Cache": "hit"
-                }
+                },
+                w, h, image_format
             )
 
         # Fallback: Return placeholder
@@ -279,13 +450,18 @@ async def get_article_image(
 @router.get("/api/v1/context-units/{context_unit_id}/image")
 async def get_context_unit_image(
     context_unit_id: str,
-    index: int = Query(0, ge=0, le=10, description="Image index (0 = first image)")
+    request: Request,
+    index: int = Query(0, ge=0, le=10, description="Image index (0 = first image)"),
+    w: Optional[int] = WIDTH_QUERY,
+    h: Optional[int] = HEIGHT_QUERY,
+    image_format: Optional[str] = FORMAT_QUERY
 ):
     """Get featured or manual image for context unit.
 
     Args:
         context_unit_id: UUID of context unit
         index: Image index (0 = first image, 1 = second, etc.)
+        w, h, format: Optional resized variant (see serve_image_file)
 
     Returns:
         Image file or placeholder.
@@ -312,70 +488,45 @@ async def get_context_unit_image(
         source_metadata = context_unit.get("source_metadata") or {}
 
         # Priority 1: Check for manual uploaded images (indexed)
-        cache_dir = Path("/app/cache/images")
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
         # Try manual images with index: {context_unit_id}_{index}.ext
-        for ext in [".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp"]:
-            indexed_cache_file = cache_dir / f"{context_unit_id}_{index}{ext}"
-            if indexed_cache_file.exists():
-                # Determine media type from extension
-                media_type_map = {
-                    ".jpg": "image/jpeg",
-                    ".jpeg": "image/jpeg",
-                    ".png": "image/png",
-                    ".webp": "image/webp",
-                    ".gif": "image/gif",
-                    ".bmp": "image/bmp"
-                }
-                media_type = media_type_map.get(ext, "image/jpeg")
-
-                logger.debug("manual_image_cache_hit",
-                    context_unit_id=context_unit_id,
-                    index=index,
-                    cache_file=str(indexed_cache_file)
-                )
+        indexed_cache_file = await asyncio.to_thread(find_cached_image, f"{context_unit_id}_{index}")
+        if indexed_cache_file:
+            logger.debug("manual_image_cache_hit",
+                context_unit_id=context_unit_id,
+                index=index,
+                cache_file=str(indexed_cache_file)
+            )
 
-                return Response(
-                    content=indexed_cache_file.read_bytes(),
-                    media_type=media_type,
-                    headers={
-                        "Cache-Control": "public, max-age=86400",
-                        "X-Image-Source": "manual_upload",
-                        "X-Image-Index": str(index)
-                    }
-                )
+            return await serve_image_file(
+                request,
+                indexed_cache_file,
+                {
+                    "Cache-Control": "public, max-age=86400",
+                    "X-Image-Source": "manual_upload",
+                    "X-Image-Index": str(index)
+                },
+                w, h, image_format
+            )
 
         # Priority 2: For index=0, try old format without index (backward compatibility)
         if index == 0:
-            for ext in [".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp"]:
-                legacy_cache_file = cache_dir / f"{context_unit_id}{ext}"
-                if legacy_cache_file.exists():
-                    # Determine media type from extension
-                    media_type_map = {
-                        ".jpg": "image/jpeg",
-                        ".jpeg": "image/jpeg",
-                        ".png": "image/png",
-                        ".webp": "image/webp",
-                        ".gif": "image/gif",
-                        ".bmp": "image/bmp"
-                    }
-                    media_type = media_type_map.get(ext, "image/jpeg")
-
-                    logger.debug("legacy_image_cache_hit",
-                        context_unit_id=context_unit_id,
-                        cache_file=str(legacy_cache_file),
-                        extension=ext
-                    )
-                    return Response(
-                        content=legacy_cache_file.read_bytes(),
-                        media_type=media_type,
-                        headers={
-                            "Cache-Control": "public, max-age=86400",
-                            "X-Image-Source": "legacy_format",
-                            "X-Image-Cache": "hit"
-                        }
-                    )
+            legacy_cache_file = await asyncio.to_thread(find_cached_image, context_unit_id)
+            if legacy_cache_file:
+                logger.debug("legacy_image_cache_hit",
+                    context_unit_id=context_unit_id,
+                    cache_file=str(legacy_cache_file),
+                    extension=legacy_cache_file.suffix
+                )
+                return await serve_image_file(
+                    request,
+                    legacy_cache_file,
+                    {
+                        "Cache-Control": "public, max-age=86400",
+                        "X-Image-Source": "legacy_format",
+                        "X-Image-Cache": "hit"
+                    },
+                    w, h, image_format
+                )
 
         # Priority 3: For index=0, try featured image from scraping
         if index == 0:
@@ -391,74 +542,17 @@ async def get_context_unit_image(
                     )
                     # Fall through to placeholder
                 else:
-                    # Try to fetch and cache featured image
-                    try:
-                        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-                        ssl_context.check_hostname = False
-                        ssl_context.verify_mode = ssl.CERT_NONE
-
-                        connector = aiohttp.TCPConnector(ssl=ssl_context)
-                        async with aiohttp.ClientSession(connector=connector) as session:
-                            async with session.get(
-                                image_url,
-                                headers={
-                                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                                    'Accept': 'image/*',
-                                    'Referer': source_metadata.get("url", "https://ekimen.ai")
-                                },
-                                timeout=aiohttp.ClientTimeout(total=10)
-                            ) as response:
-
-                                if response.status == 200:
-                                    image_bytes = await response.read()
-                                    content_type = response.headers.get("Content-Type", "image/jpeg")
-
-                                    # Try to cache to disk (optional - don't fail if this fails)
-                                    try:
-                                        # Determine extension from content type
-                                        ext_map = {
-                                            "image/jpeg": ".jpg",
-                                            "image/png": ".png",
-                                            "image/webp": ".webp",
-                                            "image/gif": ".gif",
-                                            "image/bmp": ".bmp"
-                                        }
-                                        ext = ext_map.get(content_type, ".jpg")
-                                        cache_file = cache_dir / f"{context_unit_id}_{index}{ext}"
-
-                                        cache_file.write_bytes(image_bytes)
-                                        logger.info("featured_image_cached",
-                                            context_unit_id=context_unit_id,
-                                            size_bytes=len(image_bytes),
-                                            cache_path=str(cache_file)
-                                        )
-                                    except Exception as e:
-                                        logger.warn("featured_image_cache_write_failed",
-                                            context_unit_id=context_unit_id,
-                                            error=str(e)
-                                        )
-
-                                    return Response(
-                                        content=image_bytes,
-                                        media_type=content_type,
-                                        headers={
-                                            "Cache-Control": "public, max-age=86400",
-                                            "X-Image-Source": "featured_image",
-                                            "X-Image-Extraction": featured_image.get("source", "unknown")
-                                        }
-                                    )
-                                else:
-                                    logger.warn("featured_image_fetch_failed",
-                                        context_unit_id=context_unit_id,
-                                        status=response.status,
-                                        url=image_url
-                                    )
-                    except Exception as e:
-                        logger.warn("featured_image_proxy_error",
-                            context_unit_id=context_unit_id,
-                            error=str(e),
-                            url=image_url
-                        )
+                    fetched = await fetch_featured_image(context_unit_id, source_metadata)
+                    if fetched:
+                        image_bytes, content_type, cache_file = fetched
+                        headers = {
+                            "Cache-Control": "public, max-age=86400",
+                            "X-Image-Source": "featured_image",
+                            "X-Image-Extraction": featured_image.get("source", "unknown")
+                        }
+                        if cache_file and (w or h or image_format):
+                            return await serve_image_file(request, cache_file, headers, w, h, image_format)
+                        return Response(content=image_bytes, media_type=content_type, headers=headers)
 
         # Priority 4: Return 400 error (no image available)
         logger.debug("image_not_found_return_400",
@@ -571,60 +665,77 @@ async def serve_cached_email_image(
 # ============================================
 
 @router.get("/api/v1/images/{image_id}")
-async def get_image_unified(image_id: str):
+async def get_image_unified(
+    image_id: str,
+    request: Request,
+    w: Optional[int] = WIDTH_QUERY,
+    h: Optional[int] = HEIGHT_QUERY,
+    image_format: Optional[str] = FORMAT_QUERY
+):
     """Unified public image endpoint.
 
-    Serves cached images from /app/cache/images/{uuid}.{ext}
+    Serves cached images from the image store ({uuid})
     No authentication required - knowing the UUID is the protection.
 
     Images can be:
     1. AI-generated (from POST /articles/{id}/generate-image) - typically .jpg
-    2. Featured images (cached from GET /context-units/{id}/image) - .jpg, .png, .gif, .webp, .bmp
+    2. Featured images (cached from GET /context-units/{id}/image) - .jpg, .png, .gif, .webp, .bmp.
+       These may be evicted from the store; {context_unit_id}_0 is then
+       downloaded again from the context unit's featured_image URL
+
+    Responsive variants: ?w= and/or ?h= fit the image in that box (never
+    upscaled). Sizes snap up to the IMAGE_VARIANT_SIZES ladder
+    (160/320/640/1280/2048 by default), capped at its largest size, and ?format=avif|webp|jpeg|png|auto picks
+    the encoding; auto (the default when resizing) negotiates AVIF/WebP from
+    the Accept header. Variants are rendered once and cached.
 
     Args:
         image_id: UUID of article or context unit
+        w: Max width in px
+        h: Max height in px
+        format: Output format
 
     Returns:
-        - Image if cached (JPEG/PNG/GIF/WebP/BMP) (X-Image-Source: "cached")
+        - Image if cached (JPEG/PNG/GIF/WebP/BMP or variant) (X-Image-Source: "cached")
+        - 304 if If-None-Match matches the ETag
         - SVG placeholder if not found (X-Image-Source: "placeholder")
 
     Headers:
         - Cache-Control: public, max-age=86400 (24h)
+        - ETag: strong validator of the served file
+        - Vary: Accept (negotiated variants)
         - X-Image-Source: "cached" | "placeholder"
     """
     try:
-        cache_dir = Path("/app/cache/images")
-
-        # Check for cached image with multiple extensions
-        extensions = [".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp"]
-
-        for ext in extensions:
-            cache_file = cache_dir / f"{image_id}{ext}"
-            if cache_file.exists():
-                # Determine media type from extension
-                media_type_map = {
-                    ".jpg": "image/jpeg",
-                    ".jpeg": "image/jpeg",
-                    ".png": "image/png",
-                    ".webp": "image/webp",
-                    ".gif": "image/gif",
-                    ".bmp": "image/bmp"
-                }
-                media_type = media_type_map.get(ext, "image/jpeg")
-
-                logger.debug("unified_image_cache_hit",
-                    image_id=image_id,
-                    extension=ext,
-                    media_type=media_type
-                )
-                return Response(
-                    content=cache_file.read_bytes(),
-                    media_type=media_type,
-                    headers={
-                        "Cache-Control": "public, max-age=86400",
-                        "X-Image-Source": "cached"
-                    }
-                )
+        cache_file = await asyncio.to_thread(find_cached_image, image_id)
+        if cache_file:
+            logger.debug("unified_image_cache_hit",
+                image_id=image_id,
+                extension=cache_file.suffix
+            )
+            return await serve_image_file(
+                request,
+                cache_file,
+                {
+                    "Cache-Control": "public, max-age=86400",
+                    "X-Image-Source": "cached"
+                },
+                w, h, image_format
+            )
+
+        # Evicted featured image: fetch it again from its source URL
+        cache_file = await refetch_evicted_image(image_id)
+        if cache_file:
+            return await serve_image_file(
+                request,
+                cache_file,
+                {
+                    "Cache-Control": "public, max-age=86400",
+                    "X-Image-Source": "cached",
+                    "X-Image-Cache": "refetched"
+                },
+                w, h, image_format
+            )
 
         # Not cached - return placeholder
         logger.debug("unified_image_not_found", image_id=image_id)
@@ -718,16 +829,9 @@ async def upload_image(
                 detail="Multipart file upload required. Send image as 'image_file' field."
             )
 
-        # Save to cache directory with UUID
-        cache_dir = Path("/app/cache/images")
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
+        # Save to image store with UUID
         cache_filename = f"{image_uuid}{extension}"
-        cache_path = cache_dir / cache_filename
-
-        # Write to disk
-        with open(cache_path, "wb") as f:
-            f.write(image_data)
+        await asyncio.to_thread(get_image_store().put, image_uuid, image_data, extension)
 
         logger.info("independent_image_uploaded",
             image_uuid=image_uuid,
@@ -801,16 +905,9 @@ async def upload_image_base64(
             if not extension:
                 extension = ".jpg"  # Default
 
-        # Save to cache directory with UUID
-        cache_dir = Path("/app/cache/images")
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
+        # Save to image store with UUID
         cache_filename = f"{image_uuid}{extension}"
-        cache_path = cache_dir / cache_filename
-
-        # Write to disk
-        with open(cache_path, "wb") as f:
-            f.write(image_data)
+        await asyncio.to_thread(get_image_store().put, image_uuid, image_data, extension)
 
         logger.info("independent_image_uploaded_base64",
             image_uuid=image_uuid,
@@ -13,6 +13,7 @@ from pydantic import BaseModel, Field
 
 from utils.logger import get_logger
 from utils.supabase_client import get_supabase_client
+from utils.config_cache import get_config_cache
 from utils.auth_dependencies import get_auth_context
 from utils.unified_context_ingester import ingest_context_unit
 from core_ingest import IngestPipeline
@@ -656,6 +657,7 @@ async def update_source(
             .execute()
 
         if result.data and len(result.data) > 0:
+            get_config_cache().invalidate_source(source_id)
             logger.info("source_updated",
                 source_id=source_id,
                 client_id=auth["client_id"],
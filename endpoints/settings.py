@@ -7,6 +7,8 @@ from typing import Dict, Any
 
 from fastapi import APIRouter, Depends, HTTPException
 
+from utils.auth_cache import invalidate_company_clients
+from utils.config import settings
 from utils.logger import get_logger
 from utils.supabase_client import get_supabase_client
 from utils.auth_dependencies import get_company_id_from_auth
@@ -98,7 +100,8 @@ async def regenerate_api_key(company_id: str = Depends(get_company_id_from_auth)
     """
     Regenerate API key for the current user's company.
 
-    This will invalidate the old key immediately.
+    The old key stops working in this process immediately and in every
+    other process within AUTH_CACHE_TTL_SECONDS (see utils/auth_cache).
 
     Auth: JWT or API Key
 
@@ -106,7 +109,7 @@ async def regenerate_api_key(company_id: str = Depends(get_company_id_from_auth)
         {
             "success": true,
             "api_key": "sk-new-...",
-            "message": "API key regenerated successfully"
+            "message": "API key regenerated successfully. The old key stops working within 15 seconds."
         }
     """
     try:
@@ -144,6 +147,10 @@ async def regenerate_api_key(company_id: str = Depends(get_company_id_from_auth)
         if not update_result.data:
             raise HTTPException(status_code=500, detail="Failed to update API key")
 
+        # Old key stops working here now; other processes drop it when their entry expires
+        invalidate_company_clients(company_id)
+        grace_seconds = int(settings.auth_cache_ttl_seconds) if settings.auth_cache_enabled else 0
+
         logger.info("api_key_regenerated",
             company_id=company_id,
             client_id=client_id,
@@ -153,7 +160,7 @@ async def regenerate_api_key(company_id: str = Depends(get_company_id_from_auth)
         return {
             "success": True,
             "api_key": new_api_key,
-            "message": "API key regenerated successfully. The old key is now invalid."
+            "message": f"API key regenerated successfully. The old key stops working within {grace_seconds} seconds."
         }
 
     except HTTPException:
@@ -1,15 +1,17 @@
 """TTS (Text-to-Speech) endpoints using Piper TTS."""
 
-import io
-import subprocess
+import asyncio
+import os
 from typing import Dict
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
+from utils.config import settings
 from utils.logger import get_logger
 from utils.auth_dependencies import get_auth_context
+from utils.tts_service import TTSError, TTSService, get_tts_service
 from utils.usage_tracker import get_usage_tracker
 
 logger = get_logger("api.tts")
@@ -39,6 +41,7 @@ async def tts_health(auth: Dict = Depends(get_auth_context)):
         "model": "es_ES-carlfm-x_low",
         "quality": "x_low (3-4x faster, 28MB)",
         "integrated": True,
+        "synthesis": get_tts_service().stats(),
         "client_id": auth["client_id"]
     }
 
@@ -50,6 +53,9 @@ async def tts_synthesize(
 ):
     """Synthesize speech from text using Piper TTS.
 
+    Audio is streamed sentence by sentence (WAV header with unknown size);
+    repeated (text, rate) requests are served from the disk cache.
+
     Args:
         request: TTSRequest with text and rate
 
@@ -68,7 +74,30 @@ async def tts_synthesize(
             text_preview=request.text[:50]
         )
 
-        # Warn if text is long (may take >10s)
+        service = get_tts_service()
+        company_id = auth.get("company_id", "00000000-0000-0000-0000-000000000001")
+
+        # Identical (voice, rate, text) already synthesized: serve from disk
+        cached_path = service.cached_path(request.text, request.rate)
+        if cached_path:
+            audio_size = os.path.getsize(cached_path)
+            logger.info(
+                "tts_cache_hit",
+                client_id=auth["client_id"],
+                audio_size=audio_size,
+                text_length=len(request.text)
+            )
+            await _track_tts_usage(auth, company_id, request, service, audio_size, cache_hit=True)
+            return FileResponse(
+                cached_path,
+                media_type="audio/wav",
+                headers={
+                    "Content-Disposition": "attachment; filename=speech.wav",
+                    "Cache-Control": "public, max-age=3600"
+                }
+            )
+
+        # Warn if text is long (streamed sentence by sentence, first audio comes early)
         if len(request.text) > 2000:
             logger.warn(
                 "tts_long_text",
@@ -77,82 +106,40 @@ async def tts_synthesize(
                 estimated_duration_seconds=len(request.text) // 200  # ~200 chars/sec
             )
 
-        # Convert rate to length_scale (inverse)
-        # rate 1.3 = 30% faster = length_scale 0.77
-        length_scale = 1.0 / request.rate
-
-        # Call Piper binary with X_LOW quality model (3-4x faster, carlfm voice)
-        # Output to stdout as WAV format
-        process = subprocess.Popen(
-            [
-                '/app/piper/piper',
-                '--model', '/app/models/es_ES-carlfm-x_low.onnx',
-                '--length_scale', str(length_scale),
-                '--output_file', '-'  # Output WAV to stdout
-            ],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-
-        audio_data, error = process.communicate(
-            input=request.text.encode('utf-8'),
-            timeout=15  # 15s timeout for better UX (fallback to browser TTS)
-        )
-
-        if process.returncode != 0:
-            error_msg = error.decode('utf-8', errors='ignore')
-            logger.error(
-                "piper_tts_error",
-                returncode=process.returncode,
-                error=error_msg[:200]
-            )
-            raise HTTPException(
-                status_code=500,
-                detail=f"TTS synthesis failed: {error_msg[:100]}"
+        # Synthesize the first sentence before answering, so Piper failures
+        # still map to HTTP errors (client falls back to browser TTS)
+        stream = service.synthesize(request.text, request.rate)
+        header = await anext(stream)
+        first_audio = await anext(stream, b"")
+
+        async def audio_stream():
+            audio_size = len(first_audio)
+            yield header
+            yield first_audio
+            async for chunk in stream:
+                audio_size += len(chunk)
+                yield chunk
+
+            logger.info(
+                "tts_success",
+                client_id=auth["client_id"],
+                audio_size=audio_size,
+                estimated_duration_seconds=audio_size // 32000,  # Rough estimate
+                text_length=len(request.text),
+                rate=request.rate
             )
-
-        audio_size = len(audio_data)
-        estimated_duration = audio_size // 32000  # Rough estimate
-
-        logger.info(
-            "tts_success",
-            client_id=auth["client_id"],
-            audio_size=audio_size,
-            estimated_duration_seconds=estimated_duration,
-            text_length=len(request.text),
-            rate=request.rate
-        )
-
-        # Track usage as simple operation (microedicion)
-        tracker = get_usage_tracker()
-        await tracker.track(
-            model="piper/es_ES-carlfm-x_low",
-            operation="tts_synthesize",
-            input_tokens=0,
-            output_tokens=0,
-            company_id=auth.get("company_id", "00000000-0000-0000-0000-000000000001"),
-            client_id=auth["client_id"],
-            metadata={
-                "text_length": len(request.text),
-                "audio_size": audio_size,
-                "rate": request.rate,
-                "duration_seconds": estimated_duration,
-                "usage_type": "simple"
-            }
-        )
+            await _track_tts_usage(auth, company_id, request, service, audio_size, cache_hit=False)
 
         return StreamingResponse(
-            io.BytesIO(audio_data),
+            audio_stream(),
             media_type="audio/wav",
             headers={
                 "Content-Disposition": "attachment; filename=speech.wav",
-                "Content-Length": str(audio_size),
                 "Cache-Control": "public, max-age=3600"
             }
         )
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         logger.error(
             "tts_timeout",
             client_id=auth["client_id"],
@@ -160,7 +147,17 @@ async def tts_synthesize(
         )
         raise HTTPException(
             status_code=504,
-            detail=f"TTS timeout (>15s) - texto demasiado largo ({len(request.text)} caracteres). Usa menos de 2000 caracteres para sintesis rapida."
+            detail=f"TTS timeout (>{settings.tts_sentence_timeout_seconds:.0f}s por frase) - texto demasiado largo ({len(request.text)} caracteres)."
+        )
+    except TTSError as e:
+        logger.error(
+            "piper_tts_error",
+            client_id=auth["client_id"],
+            error=str(e)[:200]
+        )
+        raise HTTPException(
+            status_code=500,
+            detail=f"TTS synthesis failed: {str(e)[:100]}"
         )
     except HTTPException:
         raise
@@ -174,3 +171,31 @@ async def tts_synthesize(
             status_code=500,
             detail=f"TTS error: {str(e)}"
         )
+
+
+async def _track_tts_usage(
+    auth: Dict,
+    company_id: str,
+    request: TTSRequest,
+    service: TTSService,
+    audio_size: int,
+    cache_hit: bool
+) -> None:
+    """Track usage as simple operation (microedicion)."""
+    tracker = get_usage_tracker()
+    await tracker.track(
+        model=f"piper/{service.voice}",
+        operation="tts_synthesize",
+        input_tokens=0,
+        output_tokens=0,
+        company_id=company_id,
+        client_id=auth["client_id"],
+        metadata={
+            "text_length": len(request.text),
+            "audio_size": audio_size,
+            "rate": request.rate,
+            "duration_seconds": audio_size // 32000,
+            "cache_hit": cache_hit,
+            "usage_type": "simple"
+        }
+    )
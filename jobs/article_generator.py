@@ -9,13 +9,14 @@ Handles:
 import asyncio
 import uuid
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 import aiohttp
 
+from publishers.publication_executor import MediaBundle, get_publication_executor
 from utils.logger import get_logger
 from utils.config import settings
-from utils.supabase_client import get_supabase_client
+from utils.supabase_client import get_supabase_client, execute_async
 from utils.llm_client import LLMClient
 
 logger = get_logger("jobs.article_generator")
@@ -134,8 +135,7 @@ async def generate_articles_for_company(
         return 0
 
     # Get company settings to check quality threshold
-    company_result = supabase.client.table("companies").select("settings").eq("id", company_id).execute()
-    company_settings = company_result.data[0].get('settings', {}) if company_result.data else {}
+    company_settings = await supabase.get_company_settings(company_id)
     min_quality = company_settings.get('autogenerate_min_quality', 3.0)
 
     if min_quality > 0:
@@ -576,74 +576,270 @@ def _is_valid_public_url(url: str) -> bool:
     return True
 
 
-async def _download_image_to_temp(image_uuid: str) -> str:
-    """Download image from API and save to temp file.
+def _publication_update(result) -> Dict[str, Any]:
+    """scheduled_publications update for a PublicationResult."""
+    return {
+        "status": "published" if result.success else "failed",
+        "published_at": datetime.utcnow().isoformat() if result.success else None,
+        "error_message": result.error if not result.success else None,
+        "publication_result": {
+            "success": result.success,
+            "url": result.url,
+            "external_id": result.external_id,
+            "error": result.error
+        }
+    }
+
+
+async def _mark_publication_failed(supabase, pub_id: str, error: str) -> None:
+    await execute_async(
+        supabase.client.table("scheduled_publications")
+        .update({
+            "status": "failed",
+            "error_message": error
+        })
+        .eq("id", pub_id)
+    )
+
 
-    Returns path to temp file, or None if failed.
+async def _publish_scheduled_article(article_id: str, publications: List[Dict]) -> Tuple[int, int]:
+    """Publish one article's due publications: WordPress first, then social in parallel.
+
+    Returns:
+        (published_count, failed_count)
     """
-    import tempfile
-    import os
+    from publishers.publisher_factory import PublisherFactory
 
-    if not image_uuid:
-        return None
+    supabase = get_supabase_client()
+    executor = get_publication_executor()
+    published_count = 0
+    failed_count = 0
 
-    try:
-        # Fetch from internal API (docker service name)
-        url = f"http://semantika-api:8000/api/v1/images/{image_uuid}"
+    # Get article data from first publication
+    article = publications[0]['press_articles']
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                if response.status != 200:
-                    logger.warn("image_download_failed",
-                        image_uuid=image_uuid,
-                        status=response.status
-                    )
-                    return None
+    # Separate WordPress vs Social targets
+    wp_pubs = [p for p in publications if p['platform_type'] == 'wordpress']
+    social_pubs = [p for p in publications if p['platform_type'] != 'wordpress']
+
+    wordpress_url = article.get('published_url')
+    imagen_uuid = article.get('imagen_uuid')
+
+    # Image loaded once per article, transformed once per platform
+    async with await MediaBundle.load(imagen_uuid) as bundle:
+
+        # Step 1: Publish WordPress first (to get URL for social)
+        for pub in wp_pubs:
+            try:
+                target = pub['press_publication_targets']
+
+                publisher = PublisherFactory.create_publisher(
+                    target['platform_type'],
+                    target['base_url'],
+                    target['credentials_encrypted']
+                )
 
-                image_data = await response.read()
-                content_type = response.headers.get('content-type', 'image/jpeg')
+                # Prepare content
+                content = article.get('contenido', '')
 
-                # Determine extension from content type
-                ext_map = {
-                    'image/jpeg': '.jpg',
-                    'image/png': '.png',
-                    'image/gif': '.gif',
-                    'image/webp': '.webp'
+                # Add footer with related articles
+                try:
+                    from endpoints.articles import _add_article_footer
+                    content = await _add_article_footer(content, article_id, article['company_id'])
+                except Exception as e:
+                    logger.warn("add_footer_failed", error=str(e))
+
+                publish_kwargs = {
+                    "title": article.get('titulo', 'Untitled'),
+                    "content": content,
+                    "excerpt": article.get('excerpt', ''),
+                    "tags": article.get('tags', []),
+                    "category": article.get('category'),
+                    "status": "publish",
+                    "slug": article.get('slug')
                 }
-                ext = ext_map.get(content_type, '.jpg')
 
-                # Save to temp file
-                fd, temp_path = tempfile.mkstemp(suffix=ext, prefix=f'social_{image_uuid[:8]}_')
-                os.close(fd)
+                temp_image_path = await bundle.variant_path('wordpress')
+                if temp_image_path:
+                    publish_kwargs["temp_image_path"] = temp_image_path
+                else:
+                    publish_kwargs["imagen_uuid"] = imagen_uuid
 
-                with open(temp_path, 'wb') as f:
-                    f.write(image_data)
+                result = await executor.run(
+                    'wordpress',
+                    lambda: publisher.publish_article(**publish_kwargs)
+                )
 
-                logger.info("image_downloaded_to_temp",
-                    image_uuid=image_uuid,
-                    temp_path=temp_path,
-                    size_kb=round(len(image_data) / 1024, 1)
+                # Update scheduled_publication record
+                await execute_async(
+                    supabase.client.table("scheduled_publications")
+                    .update(_publication_update(result))
+                    .eq("id", pub['id'])
                 )
 
-                return temp_path
+                if result.success:
+                    wordpress_url = result.url
+                    published_count += 1
+                    logger.info("scheduled_wp_published",
+                        article_id=article_id,
+                        target_id=target['id'],
+                        url=result.url
+                    )
+                else:
+                    failed_count += 1
+                    logger.error("scheduled_wp_failed",
+                        article_id=article_id,
+                        target_id=target['id'],
+                        error=result.error
+                    )
 
-    except Exception as e:
-        logger.error("image_download_error",
-            image_uuid=image_uuid,
-            error=str(e)
+            except Exception as e:
+                logger.error("scheduled_wp_publication_error",
+                    article_id=article_id,
+                    pub_id=pub['id'],
+                    error=str(e)
+                )
+                await _mark_publication_failed(supabase, pub['id'], str(e))
+                failed_count += 1
+
+        # Brief delay before social media
+        if wp_pubs and social_pubs and wordpress_url:
+            await asyncio.sleep(2)
+
+        # Determine social URL with fallback for draft URLs
+        social_url = None
+
+        # Try wordpress_url from current publication
+        if _is_valid_public_url(wordpress_url):
+            social_url = wordpress_url
+        elif wordpress_url:
+            logger.info("scheduled_social_skipping_draft_url",
+                article_id=article_id,
+                draft_url=wordpress_url
+            )
+
+        # Try previous published_url
+        if not social_url and article.get('published_url'):
+            if _is_valid_public_url(article['published_url']):
+                social_url = article['published_url']
+                logger.info("scheduled_social_using_previous_url",
+                    article_id=article_id,
+                    published_url=social_url
+                )
+
+        # Fallback to WordPress target's base_url
+        if not social_url:
+            # Get WordPress target base_url from this article's WP publications
+            for wp_pub in wp_pubs:
+                wp_target = wp_pub.get('press_publication_targets', {})
+                base_url = wp_target.get('base_url')
+                if base_url:
+                    social_url = base_url
+                    logger.info("scheduled_social_using_fallback_base_url",
+                        article_id=article_id,
+                        fallback_url=social_url
+                    )
+                    break
+
+        # Step 2: Publish to social media with hook (targets in parallel)
+        async def publish_social(pub: Dict) -> bool:
+            try:
+                target = pub['press_publication_targets']
+
+                # Get hook from scheduled_publication record
+                hook_text = pub.get('social_hook') or article.get('titulo', '')[:147]
+                if len(hook_text) > 150:
+                    hook_text = hook_text[:147] + "..."
+
+                # Build social content
+                social_content = f"{hook_text}\n\n{social_url}" if social_url else hook_text
+
+                publisher = PublisherFactory.create_publisher(
+                    target['platform_type'],
+                    target.get('base_url', ''),
+                    target['credentials_encrypted']
+                )
+
+                result = await publisher.publish_social(
+                    content=social_content,
+                    url=social_url,
+                    image_uuid=imagen_uuid,
+                    tags=[],
+                    temp_image_path=await bundle.variant_path(target['platform_type'])
+                )
+
+                # Update scheduled_publication record
+                await execute_async(
+                    supabase.client.table("scheduled_publications")
+                    .update(_publication_update(result))
+                    .eq("id", pub['id'])
+                )
+
+                if result.success:
+                    logger.info("scheduled_social_published",
+                        article_id=article_id,
+                        platform=target['platform_type'],
+                        url=result.url
+                    )
+                else:
+                    logger.error("scheduled_social_failed",
+                        article_id=article_id,
+                        platform=target['platform_type'],
+                        error=result.error
+                    )
+                return result.success
+
+            except Exception as e:
+                logger.error("scheduled_social_publication_error",
+                    article_id=article_id,
+                    pub_id=pub['id'],
+                    error=str(e)
+                )
+                await _mark_publication_failed(supabase, pub['id'], str(e))
+                return False
+
+        social_results = await executor.fan_out(social_pubs, lambda pub: pub['platform_type'], publish_social)
+        for success in social_results:
+            if success is True:
+                published_count += 1
+            else:
+                failed_count += 1
+
+    # Check if all publications for this article are done
+    remaining_result = await execute_async(
+        supabase.client.table("scheduled_publications")
+        .select("id")
+        .eq("article_id", article_id)
+        .eq("status", "scheduled")
+    )
+
+    if not remaining_result.data:
+        # All done - update article to published
+        await execute_async(
+            supabase.client.table("press_articles")
+            .update({
+                "estado": "publicado",
+                "published_url": wordpress_url,
+                "fecha_publicacion": datetime.utcnow().isoformat(),
+                "updated_at": datetime.utcnow().isoformat()
+            })
+            .eq("id", article_id)
+        )
+
+        logger.info("article_all_publications_complete",
+            article_id=article_id
         )
-        return None
+
+    return published_count, failed_count
 
 
 async def process_scheduled_publications():
     """Process individual scheduled publications from scheduled_publications table.
 
     This handles the new per-target scheduling system where each target
-    can have a different schedule time.
+    can have a different schedule time. Articles are processed concurrently
+    (PUBLICATION_ARTICLE_CONCURRENCY); see publishers/publication_executor.
     """
-    from publishers.publisher_factory import PublisherFactory
-    from itertools import groupby
-
     try:
         logger.info("process_scheduled_publications_start")
 
@@ -651,13 +847,14 @@ async def process_scheduled_publications():
         now = datetime.utcnow()
 
         # Get all pending scheduled publications that are due
-        pending_result = supabase.client.table("scheduled_publications")\
-            .select("*, press_articles!inner(id, titulo, contenido, excerpt, slug, tags, category, imagen_uuid, working_json, published_url, company_id), press_publication_targets!inner(id, platform_type, name, base_url, credentials_encrypted)")\
-            .eq("status", "scheduled")\
-            .lte("scheduled_for", now.isoformat())\
-            .order("article_id")\
-            .order("scheduled_for")\
-            .execute()
+        pending_result = await execute_async(
+            supabase.client.table("scheduled_publications")
+            .select("*, press_articles!inner(id, titulo, contenido, excerpt, slug, tags, category, imagen_uuid, working_json, published_url, company_id), press_publication_targets!inner(id, platform_type, name, base_url, credentials_encrypted)")
+            .eq("status", "scheduled")
+            .lte("scheduled_for", now.isoformat())
+            .order("article_id")
+            .order("scheduled_for")
+        )
 
         if not pending_result.data:
             logger.debug("no_scheduled_publications_pending")
@@ -675,264 +872,21 @@ async def process_scheduled_publications():
                 grouped[article_id] = []
             grouped[article_id].append(pub)
 
-        published_count = 0
-        failed_count = 0
-
-        for article_id, publications in grouped.items():
+        async def process_article(item: Tuple[str, List[Dict]]) -> Tuple[int, int]:
+            article_id, publications = item
             try:
-                # Get article data from first publication
-                article = publications[0]['press_articles']
-
-                # Separate WordPress vs Social targets
-                wp_pubs = [p for p in publications if p['platform_type'] == 'wordpress']
-                social_pubs = [p for p in publications if p['platform_type'] != 'wordpress']
-
-                wordpress_url = article.get('published_url')
-
-                # Step 1: Publish WordPress first (to get URL for social)
-                for pub in wp_pubs:
-                    try:
-                        target = pub['press_publication_targets']
-
-                        publisher = PublisherFactory.create_publisher(
-                            target['platform_type'],
-                            target['base_url'],
-                            target['credentials_encrypted']
-                        )
-
-                        # Prepare content
-                        content = article.get('contenido', '')
-
-                        # Add footer with related articles
-                        try:
-                            from endpoints.articles import _add_article_footer
-                            content = await _add_article_footer(content, article_id, article['company_id'])
-                        except Exception as e:
-                            logger.warn("add_footer_failed", error=str(e))
-
-                        result = await publisher.publish_article(
-                            title=article.get('titulo', 'Untitled'),
-                            content=content,
-                            excerpt=article.get('excerpt', ''),
-                            tags=article.get('tags', []),
-                            category=article.get('category'),
-                            status="publish",
-                            slug=article.get('slug'),
-                            imagen_uuid=article.get('imagen_uuid')
-                        )
-
-                        # Update scheduled_publication record
-                        update_data = {
-                            "status": "published" if result.success else "failed",
-                            "published_at": datetime.utcnow().isoformat() if result.success else None,
-                            "error_message": result.error if not result.success else None,
-                            "publication_result": {
-                                "success": result.success,
-                                "url": result.url,
-                                "external_id": result.external_id,
-                                "error": result.error
-                            }
-                        }
-
-                        supabase.client.table("scheduled_publications")\
-                            .update(update_data)\
-                            .eq("id", pub['id'])\
-                            .execute()
-
-                        if result.success:
-                            wordpress_url = result.url
-                            published_count += 1
-                            logger.info("scheduled_wp_published",
-                                article_id=article_id,
-                                target_id=target['id'],
-                                url=result.url
-                            )
-                        else:
-                            failed_count += 1
-                            logger.error("scheduled_wp_failed",
-                                article_id=article_id,
-                                target_id=target['id'],
-                                error=result.error
-                            )
-
-                    except Exception as e:
-                        logger.error("scheduled_wp_publication_error",
-                            article_id=article_id,
-                            pub_id=pub['id'],
-                            error=str(e)
-                        )
-                        supabase.client.table("scheduled_publications")\
-                            .update({
-                                "status": "failed",
-                                "error_message": str(e)
-                            })\
-                            .eq("id", pub['id'])\
-                            .execute()
-                        failed_count += 1
-
-                # Brief delay before social media
-                if wp_pubs and social_pubs and wordpress_url:
-                    await asyncio.sleep(2)
-
-                # Step 2: Download image once for all social media
-                social_temp_image = None
-                imagen_uuid = article.get('imagen_uuid')
-                if imagen_uuid:
-                    social_temp_image = await _download_image_to_temp(imagen_uuid)
-
-                # Step 3: Publish to social media with hook
-                for pub in social_pubs:
-                    try:
-                        target = pub['press_publication_targets']
-
-                        # Get hook from scheduled_publication record
-                        hook_text = pub.get('social_hook') or article.get('titulo', '')[:147]
-                        if len(hook_text) > 150:
-                            hook_text = hook_text[:147] + "..."
-
-                        # Determine social URL with fallback for draft URLs
-                        social_url = None
-
-                        # Try wordpress_url from current publication
-                        if _is_valid_public_url(wordpress_url):
-                            social_url = wordpress_url
-                        elif wordpress_url:
-                            logger.info("scheduled_social_skipping_draft_url",
-                                article_id=article_id,
-                                draft_url=wordpress_url
-                            )
-
-                        # Try previous published_url
-                        if not social_url and article.get('published_url'):
-                            if _is_valid_public_url(article['published_url']):
-                                social_url = article['published_url']
-                                logger.info("scheduled_social_using_previous_url",
-                                    article_id=article_id,
-                                    published_url=social_url
-                                )
-
-                        # Fallback to WordPress target's base_url
-                        if not social_url:
-                            # Get WordPress target base_url from this article's WP publications
-                            for wp_pub in wp_pubs:
-                                wp_target = wp_pub.get('press_publication_targets', {})
-                                base_url = wp_target.get('base_url')
-                                if base_url:
-                                    social_url = base_url
-                                    logger.info("scheduled_social_using_fallback_base_url",
-                                        article_id=article_id,
-                                        fallback_url=social_url
-                                    )
-                                    break
-
-                        # Build social content
-                        social_content = f"{hook_text}\n\n{social_url}" if social_url else hook_text
-
-                        publisher = PublisherFactory.create_publisher(
-                            target['platform_type'],
-                            target.get('base_url', ''),
-                            target['credentials_encrypted']
-                        )
-
-                        result = await publisher.publish_social(
-                            content=social_content,
-                            url=social_url,
-                            image_uuid=imagen_uuid,
-                            tags=[],
-                            temp_image_path=social_temp_image
-                        )
-
-                        # Update scheduled_publication record
-                        update_data = {
-                            "status": "published" if result.success else "failed",
-                            "published_at": datetime.utcnow().isoformat() if result.success else None,
-                            "error_message": result.error if not result.success else None,
-                            "publication_result": {
-                                "success": result.success,
-                                "url": result.url,
-                                "external_id": result.external_id,
-                                "error": result.error
-                            }
-                        }
-
-                        supabase.client.table("scheduled_publications")\
-                            .update(update_data)\
-                            .eq("id", pub['id'])\
-                            .execute()
-
-                        if result.success:
-                            published_count += 1
-                            logger.info("scheduled_social_published",
-                                article_id=article_id,
-                                platform=target['platform_type'],
-                                url=result.url
-                            )
-                        else:
-                            failed_count += 1
-                            logger.error("scheduled_social_failed",
-                                article_id=article_id,
-                                platform=target['platform_type'],
-                                error=result.error
-                            )
-
-                    except Exception as e:
-                        logger.error("scheduled_social_publication_error",
-                            article_id=article_id,
-                            pub_id=pub['id'],
-                            error=str(e)
-                        )
-                        supabase.client.table("scheduled_publications")\
-                            .update({
-                                "status": "failed",
-                                "error_message": str(e)
-                            })\
-                            .eq("id", pub['id'])\
-                            .execute()
-                        failed_count += 1
-
-                # Cleanup temp image file
-                if social_temp_image:
-                    try:
-                        import os
-                        if os.path.exists(social_temp_image):
-                            os.remove(social_temp_image)
-                            logger.debug("social_temp_image_cleaned",
-                                temp_path=social_temp_image
-                            )
-                    except Exception as e:
-                        logger.warn("social_temp_image_cleanup_failed",
-                            temp_path=social_temp_image,
-                            error=str(e)
-                        )
-
-                # Check if all publications for this article are done
-                remaining_result = supabase.client.table("scheduled_publications")\
-                    .select("id")\
-                    .eq("article_id", article_id)\
-                    .eq("status", "scheduled")\
-                    .execute()
-
-                if not remaining_result.data:
-                    # All done - update article to published
-                    supabase.client.table("press_articles")\
-                        .update({
-                            "estado": "publicado",
-                            "published_url": wordpress_url,
-                            "fecha_publicacion": datetime.utcnow().isoformat(),
-                            "updated_at": datetime.utcnow().isoformat()
-                        })\
-                        .eq("id", article_id)\
-                        .execute()
-
-                    logger.info("article_all_publications_complete",
-                        article_id=article_id
-                    )
-
+                return await _publish_scheduled_article(article_id, publications)
             except Exception as e:
                 logger.error("process_article_publications_failed",
                     article_id=article_id,
                     error=str(e)
                 )
+                return 0, 0
+
+        results = await get_publication_executor().map_articles(list(grouped.items()), process_article)
+
+        published_count = sum(result[0] for result in results if isinstance(result, tuple))
+        failed_count = sum(result[1] for result in results if isinstance(result, tuple))
 
         if published_count > 0 or failed_count > 0:
             logger.info("process_scheduled_publications_completed",
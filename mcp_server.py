@@ -106,23 +106,25 @@ async def authenticate_api_key(api_key: str) -> dict:
 
     supabase = get_supabase_client()
 
-    result = supabase.client.table("clients")\
-        .select("client_id, company_id, client_name, is_active")\
-        .eq("api_key", api_key)\
-        .maybe_single()\
-        .execute()
+    # Cached per process (see utils/auth_cache)
+    client = await supabase.get_client_record_by_api_key(api_key)
 
-    if not result.data:
+    if not client:
         raise HTTPException(status_code=401, detail="Invalid API key")
 
-    if not result.data.get("is_active"):
+    if not client.get("is_active"):
         raise HTTPException(status_code=403, detail="Client is inactive")
 
-    if not result.data.get("company_id"):
+    if not client.get("company_id"):
         raise HTTPException(status_code=403, detail="Client has no company assigned")
 
-    result.data["auth_method"] = "api_key"
-    return result.data
+    return {
+        "client_id": client["client_id"],
+        "company_id": client["company_id"],
+        "client_name": client.get("client_name"),
+        "is_active": client["is_active"],
+        "auth_method": "api_key"
+    }
 
 
 # ============================================
@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from .publisher_http import PublisherSessionPool, get_publisher_pool
+
 
 class PublicationResult:
     """Result of a publication attempt."""
@@ -27,9 +29,20 @@ class PublicationResult:
 class BasePublisher(ABC):
     """Abstract base class for platform publishers."""
     
-    def __init__(self, credentials: Dict[str, Any], base_url: str):
+    def __init__(
+        self,
+        credentials: Dict[str, Any],
+        base_url: str,
+        http_pool: Optional[PublisherSessionPool] = None
+    ):
         self.credentials = credentials
         self.base_url = base_url
+        # Shared per-platform sessions (keep-alive, timeouts, retries, metrics)
+        self.http_pool = http_pool or get_publisher_pool()
+    
+    def _request(self, method: str, url: str, **kwargs: Any):
+        """Pooled request for this platform: `async with self._request(...) as response`."""
+        return self.http_pool.request(self.get_platform_type(), method, url, **kwargs)
         
     @abstractmethod
     async def test_connection(self) -> Dict[str, Any]:
@@ -6,6 +6,7 @@ from typing import Dict, Any, Optional, List
 from urllib.parse import urlencode
 
 from .base_publisher import BasePublisher, PublicationResult
+from .publisher_http import publisher_request
 from utils.logger import get_logger
 
 logger = get_logger("facebook_publisher")
@@ -52,33 +53,32 @@ class FacebookPublisher(BasePublisher):
                 'fields': 'name,id,link'
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        page_name = data.get('name', 'Unknown')
-
-                        return {
-                            "success": True,
-                            "message": f"Connected to Facebook Page: {page_name}",
-                            "details": {
-                                "page_name": page_name,
-                                "page_id": page_id,
-                                "page_url": data.get('link')
-                            }
-                        }
-                    else:
-                        error_data = await response.json()
-                        error_msg = error_data.get('error', {}).get('message', f'HTTP {response.status}')
-                        logger.error("facebook_test_connection_failed",
-                            status=response.status,
-                            error=error_msg
-                        )
-                        return {
-                            "success": False,
-                            "message": f"Facebook API error: {error_msg}",
-                            "details": {"error": error_data}
+            async with self._request("GET", url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    page_name = data.get('name', 'Unknown')
+
+                    return {
+                        "success": True,
+                        "message": f"Connected to Facebook Page: {page_name}",
+                        "details": {
+                            "page_name": page_name,
+                            "page_id": page_id,
+                            "page_url": data.get('link')
                         }
+                    }
+                else:
+                    error_data = await response.json()
+                    error_msg = error_data.get('error', {}).get('message', f'HTTP {response.status}')
+                    logger.error("facebook_test_connection_failed",
+                        status=response.status,
+                        error=error_msg
+                    )
+                    return {
+                        "success": False,
+                        "message": f"Facebook API error: {error_msg}",
+                        "details": {"error": error_data}
+                    }
 
         except Exception as e:
             logger.error("facebook_test_connection_error", error=str(e))
@@ -240,39 +240,40 @@ class FacebookPublisher(BasePublisher):
             }
             content_type = content_types.get(ext, 'image/jpeg')
 
-            # Use multipart/form-data
-            form = aiohttp.FormData()
-            form.add_field('source',
-                          image_data,
-                          filename=f'image{ext}',
-                          content_type=content_type)
-            form.add_field('access_token', page_token)
-            form.add_field('published', 'false')  # Don't publish yet, attach to post
+            # Use multipart/form-data (a FormData can only be sent once, so build per attempt)
+            def form():
+                form_data = aiohttp.FormData()
+                form_data.add_field('source',
+                              image_data,
+                              filename=f'image{ext}',
+                              content_type=content_type)
+                form_data.add_field('access_token', page_token)
+                form_data.add_field('published', 'false')  # Don't publish yet, attach to post
+                return form_data
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, data=form) as response:
-                    response_data = await response.json()
+            async with self._request("POST", url, data=form) as response:
+                response_data = await response.json()
 
-                    if response.status == 200:
-                        photo_id = response_data.get('id')
+                if response.status == 200:
+                    photo_id = response_data.get('id')
 
-                        if photo_id:
-                            return {
-                                "success": True,
-                                "photo_id": photo_id,
-                                "size_kb": round(size_kb, 1)
-                            }
-                        else:
-                            return {
-                                "success": False,
-                                "error": "No photo_id in response"
-                            }
+                    if photo_id:
+                        return {
+                            "success": True,
+                            "photo_id": photo_id,
+                            "size_kb": round(size_kb, 1)
+                        }
                     else:
-                        error_msg = response_data.get('error', {}).get('message', f'HTTP {response.status}')
                         return {
                             "success": False,
-                            "error": f"Upload failed: {error_msg}"
+                            "error": "No photo_id in response"
                         }
+                else:
+                    error_msg = response_data.get('error', {}).get('message', f'HTTP {response.status}')
+                    return {
+                        "success": False,
+                        "error": f"Upload failed: {error_msg}"
+                    }
 
         except FileNotFoundError:
             return {
@@ -303,23 +304,22 @@ class FacebookPublisher(BasePublisher):
 
             url = f"{GRAPH_API_BASE}/{page_id}/feed"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=post_data) as response:
-                    response_data = await response.json()
+            async with self._request("POST", url, json=post_data) as response:
+                response_data = await response.json()
 
-                    if response.status == 200:
-                        post_id = response_data.get('id')
-                        return {
-                            "success": True,
-                            "post_id": post_id
-                        }
-                    else:
-                        error_msg = response_data.get('error', {}).get('message', f'HTTP {response.status}')
-                        return {
-                            "success": False,
-                            "error": error_msg,
-                            "response": response_data
-                        }
+                if response.status == 200:
+                    post_id = response_data.get('id')
+                    return {
+                        "success": True,
+                        "post_id": post_id
+                    }
+                else:
+                    error_msg = response_data.get('error', {}).get('message', f'HTTP {response.status}')
+                    return {
+                        "success": False,
+                        "error": error_msg,
+                        "response": response_data
+                    }
 
         except Exception as e:
             return {
@@ -360,21 +360,20 @@ class FacebookPublisher(BasePublisher):
                 'access_token': page_token
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, data=data) as response:
-                    response_data = await response.json()
+            async with self._request("POST", url, data=data) as response:
+                response_data = await response.json()
 
-                    if response.status == 200:
-                        return {
-                            "success": True,
-                            "comment_id": response_data.get('id')
-                        }
-                    else:
-                        error_msg = response_data.get('error', {}).get('message', f'HTTP {response.status}')
-                        return {
-                            "success": False,
-                            "error": error_msg
-                        }
+                if response.status == 200:
+                    return {
+                        "success": True,
+                        "comment_id": response_data.get('id')
+                    }
+                else:
+                    error_msg = response_data.get('error', {}).get('message', f'HTTP {response.status}')
+                    return {
+                        "success": False,
+                        "error": error_msg
+                    }
 
         except Exception as e:
             return {
@@ -530,28 +529,27 @@ class FacebookPublisher(BasePublisher):
 
             url = f"{GRAPH_API_BASE}/oauth/access_token"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    response_data = await response.json()
+            async with publisher_request("facebook", "GET", url, params=params) as response:
+                response_data = await response.json()
 
-                    if response.status == 200 and 'access_token' in response_data:
-                        logger.info("facebook_token_exchange_success")
-                        return {
-                            "success": True,
-                            "access_token": response_data.get('access_token'),
-                            "token_type": response_data.get('token_type'),
-                            "expires_in": response_data.get('expires_in')
-                        }
-                    else:
-                        error = response_data.get('error', {}).get('message', f'HTTP {response.status}')
-                        logger.error("facebook_token_exchange_failed",
-                            status=response.status,
-                            error=error
-                        )
-                        return {
-                            "success": False,
-                            "error": error
-                        }
+                if response.status == 200 and 'access_token' in response_data:
+                    logger.info("facebook_token_exchange_success")
+                    return {
+                        "success": True,
+                        "access_token": response_data.get('access_token'),
+                        "token_type": response_data.get('token_type'),
+                        "expires_in": response_data.get('expires_in')
+                    }
+                else:
+                    error = response_data.get('error', {}).get('message', f'HTTP {response.status}')
+                    logger.error("facebook_token_exchange_failed",
+                        status=response.status,
+                        error=error
+                    )
+                    return {
+                        "success": False,
+                        "error": error
+                    }
 
         except Exception as e:
             logger.error("facebook_token_exchange_error", error=str(e))
@@ -570,41 +568,40 @@ class FacebookPublisher(BasePublisher):
                 'fields': 'id,name,access_token,category,link'
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        pages = data.get('data', [])
+            async with publisher_request("facebook", "GET", url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    pages = data.get('data', [])
 
-                        logger.info("facebook_pages_fetched",
-                            count=len(pages)
-                        )
+                    logger.info("facebook_pages_fetched",
+                        count=len(pages)
+                    )
 
-                        return {
-                            "success": True,
-                            "pages": [
-                                {
-                                    'id': page['id'],
-                                    'name': page['name'],
-                                    'access_token': page['access_token'],
-                                    'category': page.get('category', ''),
-                                    'link': page.get('link', '')
-                                }
-                                for page in pages
-                            ]
-                        }
-                    else:
-                        error_data = await response.json()
-                        error_msg = error_data.get('error', {}).get('message', f'HTTP {response.status}')
-                        logger.error("facebook_pages_fetch_failed",
-                            status=response.status,
-                            error=error_msg
-                        )
-                        return {
-                            "success": False,
-                            "error": f"Failed to fetch pages: {error_msg}",
-                            "pages": []
-                        }
+                    return {
+                        "success": True,
+                        "pages": [
+                            {
+                                'id': page['id'],
+                                'name': page['name'],
+                                'access_token': page['access_token'],
+                                'category': page.get('category', ''),
+                                'link': page.get('link', '')
+                            }
+                            for page in pages
+                        ]
+                    }
+                else:
+                    error_data = await response.json()
+                    error_msg = error_data.get('error', {}).get('message', f'HTTP {response.status}')
+                    logger.error("facebook_pages_fetch_failed",
+                        status=response.status,
+                        error=error_msg
+                    )
+                    return {
+                        "success": False,
+                        "error": f"Failed to fetch pages: {error_msg}",
+                        "pages": []
+                    }
 
         except Exception as e:
             logger.error("facebook_pages_error", error=str(e))
@@ -624,20 +621,19 @@ class FacebookPublisher(BasePublisher):
                 'fields': 'id,name'
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "user_id": data.get('id'),
-                            "user_name": data.get('name')
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "error": f"HTTP {response.status}"
-                        }
+            async with publisher_request("facebook", "GET", url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return {
+                        "success": True,
+                        "user_id": data.get('id'),
+                        "user_name": data.get('name')
+                    }
+                else:
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status}"
+                    }
 
         except Exception as e:
             return {
@@ -661,35 +657,34 @@ class FacebookPublisher(BasePublisher):
                 'limit': 10
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    response_data = await response.json()
+            async with self._request("GET", url, params=params) as response:
+                response_data = await response.json()
 
-                    if response.status == 200:
-                        comments = response_data.get('data', [])
-                        logger.info("facebook_get_comments_success",
-                            post_id=post_id,
-                            comments_count=len(comments)
-                        )
-                        return {
-                            "success": True,
-                            "comments": comments,
-                            "permission_verified": "pages_read_user_content"
-                        }
-                    else:
-                        error_msg = response_data.get('error', {}).get('message', f'HTTP {response.status}')
-                        error_code = response_data.get('error', {}).get('code')
-                        logger.error("facebook_get_comments_failed",
-                            post_id=post_id,
-                            status=response.status,
-                            error=error_msg,
-                            error_code=error_code
-                        )
-                        return {
-                            "success": False,
-                            "error": error_msg,
-                            "error_code": error_code
-                        }
+                if response.status == 200:
+                    comments = response_data.get('data', [])
+                    logger.info("facebook_get_comments_success",
+                        post_id=post_id,
+                        comments_count=len(comments)
+                    )
+                    return {
+                        "success": True,
+                        "comments": comments,
+                        "permission_verified": "pages_read_user_content"
+                    }
+                else:
+                    error_msg = response_data.get('error', {}).get('message', f'HTTP {response.status}')
+                    error_code = response_data.get('error', {}).get('code')
+                    logger.error("facebook_get_comments_failed",
+                        post_id=post_id,
+                        status=response.status,
+                        error=error_msg,
+                        error_code=error_code
+                    )
+                    return {
+                        "success": False,
+                        "error": error_msg,
+                        "error_code": error_code
+                    }
 
         except Exception as e:
             logger.error("facebook_get_comments_error", error=str(e))
@@ -721,13 +716,12 @@ class FacebookPublisher(BasePublisher):
             try:
                 url = f"{GRAPH_API_BASE}/{page_id}"
                 params = {'access_token': page_token, 'fields': 'name,id'}
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, params=params) as response:
-                        if response.status == 200:
-                            results["pages_manage_posts"] = {"status": "verified", "test": "get_page_info"}
-                        else:
-                            data = await response.json()
-                            results["pages_manage_posts"] = {"status": "failed", "error": data.get('error', {}).get('message')}
+                async with self._request("GET", url, params=params) as response:
+                    if response.status == 200:
+                        results["pages_manage_posts"] = {"status": "verified", "test": "get_page_info"}
+                    else:
+                        data = await response.json()
+                        results["pages_manage_posts"] = {"status": "failed", "error": data.get('error', {}).get('message')}
             except Exception as e:
                 results["pages_manage_posts"] = {"status": "error", "error": str(e)}
 
@@ -735,51 +729,50 @@ class FacebookPublisher(BasePublisher):
             try:
                 url = f"{GRAPH_API_BASE}/{page_id}/feed"
                 params = {'access_token': page_token, 'fields': 'id,message,created_time', 'limit': 1}
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, params=params) as response:
-                        data = await response.json()
-                        if response.status == 200:
-                            posts = data.get('data', [])
-                            results["pages_read_engagement"] = {
-                                "status": "verified",
-                                "test": "get_page_feed",
-                                "posts_found": len(posts)
-                            }
+                async with self._request("GET", url, params=params) as response:
+                    data = await response.json()
+                    if response.status == 200:
+                        posts = data.get('data', [])
+                        results["pages_read_engagement"] = {
+                            "status": "verified",
+                            "test": "get_page_feed",
+                            "posts_found": len(posts)
+                        }
 
-                            # If we have a post, test comment-related permissions
-                            if posts:
-                                post_id = posts[0]['id']
-
-                                # 3. Test pages_read_user_content - Read comments
-                                try:
-                                    comments_url = f"{GRAPH_API_BASE}/{post_id}/comments"
-                                    comments_params = {'access_token': page_token, 'fields': 'id,message', 'limit': 5}
-                                    async with session.get(comments_url, params=comments_params) as comments_resp:
-                                        comments_data = await comments_resp.json()
-                                        if comments_resp.status == 200:
-                                            results["pages_read_user_content"] = {
-                                                "status": "verified",
-                                                "test": "read_post_comments",
-                                                "post_id": post_id,
-                                                "comments_found": len(comments_data.get('data', []))
-                                            }
-                                        else:
-                                            results["pages_read_user_content"] = {
-                                                "status": "failed",
-                                                "error": comments_data.get('error', {}).get('message'),
-                                                "error_code": comments_data.get('error', {}).get('code')
-                                            }
-                                except Exception as e:
-                                    results["pages_read_user_content"] = {"status": "error", "error": str(e)}
-
-                                # 4. Test pages_manage_engagement - We don't want to post a test comment
-                                # Just verify by checking if we can access the comments endpoint for posting
-                                results["pages_manage_engagement"] = {
-                                    "status": "requires_action",
-                                    "note": "This permission is verified when posting URL as comment on published articles"
-                                }
-                        else:
-                            results["pages_read_engagement"] = {"status": "failed", "error": data.get('error', {}).get('message')}
+                        # If we have a post, test comment-related permissions
+                        if posts:
+                            post_id = posts[0]['id']
+
+                            # 3. Test pages_read_user_content - Read comments
+                            try:
+                                comments_url = f"{GRAPH_API_BASE}/{post_id}/comments"
+                                comments_params = {'access_token': page_token, 'fields': 'id,message', 'limit': 5}
+                                async with self._request("GET", comments_url, params=comments_params) as comments_resp:
+                                    comments_data = await comments_resp.json()
+                                    if comments_resp.status == 200:
+                                        results["pages_read_user_content"] = {
+                                            "status": "verified",
+                                            "test": "read_post_comments",
+                                            "post_id": post_id,
+                                            "comments_found": len(comments_data.get('data', []))
+                                        }
+                                    else:
+                                        results["pages_read_user_content"] = {
+                                            "status": "failed",
+                                            "error": comments_data.get('error', {}).get('message'),
+                                            "error_code": comments_data.get('error', {}).get('code')
+                                        }
+                            except Exception as e:
+                                results["pages_read_user_content"] = {"status": "error", "error": str(e)}
+
+                            # 4. Test pages_manage_engagement - We don't want to post a test comment
+                            # Just verify by checking if we can access the comments endpoint for posting
+                            results["pages_manage_engagement"] = {
+                                "status": "requires_action",
+                                "note": "This permission is verified when posting URL as comment on published articles"
+                            }
+                    else:
+                        results["pages_read_engagement"] = {"status": "failed", "error": data.get('error', {}).get('message')}
             except Exception as e:
                 results["pages_read_engagement"] = {"status": "error", "error": str(e)}
 
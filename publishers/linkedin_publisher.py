@@ -1,11 +1,11 @@
 """LinkedIn publisher for semantika articles."""
 
-import aiohttp
 import re
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlencode
 
 from .base_publisher import BasePublisher, PublicationResult
+from .publisher_http import publisher_request
 from utils.logger import get_logger
 
 logger = get_logger("linkedin_publisher")
@@ -35,40 +35,40 @@ class LinkedInPublisher(BasePublisher):
         try:
             headers = self._get_headers()
 
-            async with aiohttp.ClientSession() as session:
-                # Get user profile to verify token
-                async with session.get(
-                    'https://api.linkedin.com/v2/userinfo',
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        name = data.get('name', 'Unknown')
-
-                        # Check if we have organization access
-                        organization_id = self.credentials.get('organization_id')
-                        org_name = self.credentials.get('organization_name', 'Unknown')
-
-                        return {
-                            "success": True,
-                            "message": f"Connected to LinkedIn as {name}" + (f" (Page: {org_name})" if organization_id else ""),
-                            "details": {
-                                "user_name": name,
-                                "organization_id": organization_id,
-                                "organization_name": org_name
-                            }
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error("linkedin_test_connection_failed",
-                            status=response.status,
-                            error=error_text
-                        )
-                        return {
-                            "success": False,
-                            "message": f"LinkedIn API returned status {response.status}",
-                            "details": {"error": error_text}
+            # Get user profile to verify token
+            async with self._request(
+                "GET",
+                'https://api.linkedin.com/v2/userinfo',
+                headers=headers
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    name = data.get('name', 'Unknown')
+
+                    # Check if we have organization access
+                    organization_id = self.credentials.get('organization_id')
+                    org_name = self.credentials.get('organization_name', 'Unknown')
+
+                    return {
+                        "success": True,
+                        "message": f"Connected to LinkedIn as {name}" + (f" (Page: {org_name})" if organization_id else ""),
+                        "details": {
+                            "user_name": name,
+                            "organization_id": organization_id,
+                            "organization_name": org_name
                         }
+                    }
+                else:
+                    error_text = await response.text()
+                    logger.error("linkedin_test_connection_failed",
+                        status=response.status,
+                        error=error_text
+                    )
+                    return {
+                        "success": False,
+                        "message": f"LinkedIn API returned status {response.status}",
+                        "details": {"error": error_text}
+                    }
 
         except Exception as e:
             logger.error("linkedin_test_connection_error", error=str(e))
@@ -163,49 +163,49 @@ class LinkedInPublisher(BasePublisher):
                 content_length=len(post_text)
             )
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    'https://api.linkedin.com/v2/ugcPosts',
-                    headers=headers,
-                    json=post_data
-                ) as response:
-                    response_data = await response.json() if response.content_length else {}
-
-                    if response.status == 201:
-                        post_id = response_data.get('id', '')
-                        # Extract the activity ID for the URL
-                        # Format: urn:li:share:1234567890
-                        activity_id = post_id.split(':')[-1] if post_id else ''
-
-                        post_url = f"https://www.linkedin.com/feed/update/{post_id}" if post_id else None
-
-                        logger.info("linkedin_post_published",
-                            post_id=post_id,
-                            url=post_url,
-                            organization_id=organization_id
-                        )
+            async with self._request(
+                "POST",
+                'https://api.linkedin.com/v2/ugcPosts',
+                headers=headers,
+                json=post_data
+            ) as response:
+                response_data = await response.json() if response.content_length else {}
+
+                if response.status == 201:
+                    post_id = response_data.get('id', '')
+                    # Extract the activity ID for the URL
+                    # Format: urn:li:share:1234567890
+                    activity_id = post_id.split(':')[-1] if post_id else ''
+
+                    post_url = f"https://www.linkedin.com/feed/update/{post_id}" if post_id else None
+
+                    logger.info("linkedin_post_published",
+                        post_id=post_id,
+                        url=post_url,
+                        organization_id=organization_id
+                    )
 
-                        return PublicationResult(
-                            success=True,
-                            url=post_url,
-                            external_id=post_id,
-                            metadata={
-                                "platform": "linkedin",
-                                "organization_id": organization_id,
-                                "post_type": "share"
-                            }
-                        )
-                    else:
-                        error_msg = response_data.get('message', f'HTTP {response.status}')
-                        logger.error("linkedin_publish_failed",
-                            status=response.status,
-                            error=error_msg,
-                            response=response_data
-                        )
-                        return PublicationResult(
-                            success=False,
-                            error=f"LinkedIn API error: {error_msg}"
-                        )
+                    return PublicationResult(
+                        success=True,
+                        url=post_url,
+                        external_id=post_id,
+                        metadata={
+                            "platform": "linkedin",
+                            "organization_id": organization_id,
+                            "post_type": "share"
+                        }
+                    )
+                else:
+                    error_msg = response_data.get('message', f'HTTP {response.status}')
+                    logger.error("linkedin_publish_failed",
+                        status=response.status,
+                        error=error_msg,
+                        response=response_data
+                    )
+                    return PublicationResult(
+                        success=False,
+                        error=f"LinkedIn API error: {error_msg}"
+                    )
 
         except Exception as e:
             logger.error("linkedin_publish_error",
@@ -271,33 +271,34 @@ class LinkedInPublisher(BasePublisher):
                 'redirect_uri': redirect_uri
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    'https://www.linkedin.com/oauth/v2/accessToken',
-                    data=data,
-                    headers={'Content-Type': 'application/x-www-form-urlencoded'}
-                ) as response:
-                    response_data = await response.json()
-
-                    if response.status == 200:
-                        logger.info("linkedin_token_exchange_success")
-                        return {
-                            "success": True,
-                            "access_token": response_data.get('access_token'),
-                            "expires_in": response_data.get('expires_in'),
-                            "refresh_token": response_data.get('refresh_token'),
-                            "scope": response_data.get('scope')
-                        }
-                    else:
-                        error = response_data.get('error_description', f'HTTP {response.status}')
-                        logger.error("linkedin_token_exchange_failed",
-                            status=response.status,
-                            error=error
-                        )
-                        return {
-                            "success": False,
-                            "error": error
-                        }
+            async with publisher_request(
+                "linkedin",
+                "POST",
+                'https://www.linkedin.com/oauth/v2/accessToken',
+                data=data,
+                headers={'Content-Type': 'application/x-www-form-urlencoded'}
+            ) as response:
+                response_data = await response.json()
+
+                if response.status == 200:
+                    logger.info("linkedin_token_exchange_success")
+                    return {
+                        "success": True,
+                        "access_token": response_data.get('access_token'),
+                        "expires_in": response_data.get('expires_in'),
+                        "refresh_token": response_data.get('refresh_token'),
+                        "scope": response_data.get('scope')
+                    }
+                else:
+                    error = response_data.get('error_description', f'HTTP {response.status}')
+                    logger.error("linkedin_token_exchange_failed",
+                        status=response.status,
+                        error=error
+                    )
+                    return {
+                        "success": False,
+                        "error": error
+                    }
 
         except Exception as e:
             logger.error("linkedin_token_exchange_error", error=str(e))
@@ -315,40 +316,41 @@ class LinkedInPublisher(BasePublisher):
                 'X-Restli-Protocol-Version': '2.0.0'
             }
 
-            async with aiohttp.ClientSession() as session:
-                # Get user info from /me endpoint (works with w_member_social)
-                async with session.get(
-                    'https://api.linkedin.com/v2/me',
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        # Extract name from localized fields
-                        first_name = ""
-                        last_name = ""
-                        if 'localizedFirstName' in data:
-                            first_name = data['localizedFirstName']
-                        if 'localizedLastName' in data:
-                            last_name = data['localizedLastName']
-
-                        full_name = f"{first_name} {last_name}".strip() or "LinkedIn User"
-                        member_id = data.get('id', '')
-
-                        return {
-                            "success": True,
-                            "sub": f"urn:li:person:{member_id}",
-                            "name": full_name,
-                            "given_name": first_name,
-                            "family_name": last_name,
-                            "member_id": member_id
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error("linkedin_me_failed",
-                            status=response.status,
-                            error=error_text[:200]
-                        )
-                        return {"success": False, "error": f"HTTP {response.status}"}
+            # Get user info from /me endpoint (works with w_member_social)
+            async with publisher_request(
+                "linkedin",
+                "GET",
+                'https://api.linkedin.com/v2/me',
+                headers=headers
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    # Extract name from localized fields
+                    first_name = ""
+                    last_name = ""
+                    if 'localizedFirstName' in data:
+                        first_name = data['localizedFirstName']
+                    if 'localizedLastName' in data:
+                        last_name = data['localizedLastName']
+
+                    full_name = f"{first_name} {last_name}".strip() or "LinkedIn User"
+                    member_id = data.get('id', '')
+
+                    return {
+                        "success": True,
+                        "sub": f"urn:li:person:{member_id}",
+                        "name": full_name,
+                        "given_name": first_name,
+                        "family_name": last_name,
+                        "member_id": member_id
+                    }
+                else:
+                    error_text = await response.text()
+                    logger.error("linkedin_me_failed",
+                        status=response.status,
+                        error=error_text[:200]
+                    )
+                    return {"success": False, "error": f"HTTP {response.status}"}
 
         except Exception as e:
             logger.error("linkedin_me_error", error=str(e))
@@ -364,59 +366,60 @@ class LinkedInPublisher(BasePublisher):
                 'LinkedIn-Version': '202401'
             }
 
-            async with aiohttp.ClientSession() as session:
-                # Get organization access control
-                async with session.get(
-                    'https://api.linkedin.com/v2/organizationAcls?q=roleAssignee',
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        elements = data.get('elements', [])
-
-                        organizations = []
-                        for element in elements:
-                            org_urn = element.get('organization')
-                            if org_urn:
-                                org_id = org_urn.split(':')[-1]
-                                role = element.get('role', 'UNKNOWN')
-
-                                # Only include if user can post (ADMINISTRATOR or CONTENT_ADMIN)
-                                if role in ['ADMINISTRATOR', 'CONTENT_ADMIN']:
-                                    organizations.append({
-                                        'id': org_id,
-                                        'urn': org_urn,
-                                        'role': role
-                                    })
-
-                        # Get organization details
-                        for org in organizations:
-                            org_details = await LinkedInPublisher._get_organization_details(
-                                access_token, org['id']
-                            )
-                            if org_details:
-                                org['name'] = org_details.get('name', f"Organization {org['id']}")
-                                org['vanity_name'] = org_details.get('vanityName', '')
-
-                        logger.info("linkedin_organizations_fetched",
-                            count=len(organizations)
+            # Get organization access control
+            async with publisher_request(
+                "linkedin",
+                "GET",
+                'https://api.linkedin.com/v2/organizationAcls?q=roleAssignee',
+                headers=headers
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    elements = data.get('elements', [])
+
+                    organizations = []
+                    for element in elements:
+                        org_urn = element.get('organization')
+                        if org_urn:
+                            org_id = org_urn.split(':')[-1]
+                            role = element.get('role', 'UNKNOWN')
+
+                            # Only include if user can post (ADMINISTRATOR or CONTENT_ADMIN)
+                            if role in ['ADMINISTRATOR', 'CONTENT_ADMIN']:
+                                organizations.append({
+                                    'id': org_id,
+                                    'urn': org_urn,
+                                    'role': role
+                                })
+
+                    # Get organization details
+                    for org in organizations:
+                        org_details = await LinkedInPublisher._get_organization_details(
+                            access_token, org['id']
                         )
+                        if org_details:
+                            org['name'] = org_details.get('name', f"Organization {org['id']}")
+                            org['vanity_name'] = org_details.get('vanityName', '')
 
-                        return {
-                            "success": True,
-                            "organizations": organizations
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error("linkedin_organizations_fetch_failed",
-                            status=response.status,
-                            error=error_text
-                        )
-                        return {
-                            "success": False,
-                            "error": f"Failed to fetch organizations: {error_text}",
-                            "organizations": []
-                        }
+                    logger.info("linkedin_organizations_fetched",
+                        count=len(organizations)
+                    )
+
+                    return {
+                        "success": True,
+                        "organizations": organizations
+                    }
+                else:
+                    error_text = await response.text()
+                    logger.error("linkedin_organizations_fetch_failed",
+                        status=response.status,
+                        error=error_text
+                    )
+                    return {
+                        "success": False,
+                        "error": f"Failed to fetch organizations: {error_text}",
+                        "organizations": []
+                    }
 
         except Exception as e:
             logger.error("linkedin_organizations_error", error=str(e))
@@ -436,17 +439,18 @@ class LinkedInPublisher(BasePublisher):
                 'LinkedIn-Version': '202401'
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f'https://api.linkedin.com/v2/organizations/{org_id}',
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            'name': data.get('localizedName', ''),
-                            'vanityName': data.get('vanityName', '')
-                        }
+            async with publisher_request(
+                "linkedin",
+                "GET",
+                f'https://api.linkedin.com/v2/organizations/{org_id}',
+                headers=headers
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return {
+                        'name': data.get('localizedName', ''),
+                        'vanityName': data.get('vanityName', '')
+                    }
         except Exception as e:
             logger.warn("linkedin_org_details_error", org_id=org_id, error=str(e))
 
@@ -0,0 +1,292 @@
+"""Publication fan-out: WordPress first, then social targets concurrently.
+
+Both the publish endpoint and the scheduled_publications job used to publish
+article after article and, within an article, target after target. Every
+social publisher re-read the same image and the endpoint transformed it once
+for WordPress (WebP) and reused that file for Twitter/Facebook. This module
+provides:
+
+- MediaBundle: one per article. Loads the image bytes once (shared
+  image store first, internal API as fallback) and renders each
+  platform variant (ImageTransformer.PLATFORM_SETTINGS) at most once, off the
+  event loop (utils/cpu_pool). Variants come from utils/derivative_cache, so
+  retries and re-publications of the same image skip the encode; with the
+  cache disabled they are temp files and close() removes them.
+- PublicationExecutor: process-wide limits shared by every article being
+  published. fan_out() runs social targets concurrently under per-platform
+  semaphores (PUBLICATION_<PLATFORM>_CONCURRENCY); map_articles() processes
+  several articles at once (PUBLICATION_ARTICLE_CONCURRENCY). WordPress
+  ordering stays with the caller: social posts need its URL.
+
+Usage:
+    executor = get_publication_executor()
+    async with await MediaBundle.load(imagen_uuid) as bundle:
+        wp_image = await bundle.variant_path("wordpress")
+        ...
+        results = await executor.fan_out(social_targets, lambda t: t["platform_type"], publish_one)
+"""
+
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+import aiohttp
+
+from utils.config import settings
+from utils.cpu_pool import run_cpu
+from utils.derivative_cache import DerivativeCache, derivative_key, get_derivative_cache, source_digest
+from utils.http_client import get_http_session
+from utils.image_store import get_image_store
+from utils.image_transformer import ImageTransformer
+from utils.logger import get_logger
+
+logger = get_logger("publication_executor")
+
+INTERNAL_IMAGE_URL = "http://semantika-api:8000/api/v1/images/{image_uuid}"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _read_cached_image(image_uuid: str) -> Optional[bytes]:
+    # The imagen_uuid from frontend already includes _0 suffix when needed
+    return get_image_store().read(image_uuid)
+
+
+class MediaBundle:
+    """Image bytes of one article plus its per-platform transformed variants."""
+
+    def __init__(
+        self,
+        image_uuid: Optional[str],
+        image_data: Optional[bytes],
+        derivative_cache: Optional[DerivativeCache] = None
+    ):
+        self.image_uuid = image_uuid
+        self.image_data = image_data
+        self.derivative_cache = derivative_cache
+        self._digest: Optional[str] = None
+        self._variants: Dict[str, asyncio.Task] = {}
+
+    @classmethod
+    async def load(cls, image_uuid: Optional[str]) -> "MediaBundle":
+        """Load the article image once (empty bundle if missing)."""
+        if not image_uuid:
+            return cls(None, None)
+
+        image_data = await asyncio.to_thread(_read_cached_image, image_uuid)
+        source = "cache"
+
+        if image_data is None:
+            source = "api"
+            try:
+                session = await get_http_session()
+                url = INTERNAL_IMAGE_URL.format(image_uuid=image_uuid)
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    if response.status == 200:
+                        image_data = await response.read()
+                    else:
+                        logger.warn("media_bundle_image_download_failed",
+                            image_uuid=image_uuid,
+                            status=response.status
+                        )
+            except Exception as e:
+                logger.error("media_bundle_image_download_error",
+                    image_uuid=image_uuid,
+                    error=str(e)
+                )
+
+        if image_data:
+            logger.debug("media_bundle_loaded",
+                image_uuid=image_uuid,
+                source=source,
+                size_kb=round(len(image_data) / 1024, 1)
+            )
+
+        return cls(image_uuid, image_data, get_derivative_cache())
+
+    async def variant_path(self, platform: str) -> Optional[str]:
+        """Temp file with the image transformed for platform (None if no image).
+
+        Concurrent callers for the same platform share one transformation.
+        """
+        if not self.image_data:
+            return None
+
+        task = self._variants.get(platform)
+        if task is None:
+            task = asyncio.ensure_future(self._render(platform))
+            self._variants[platform] = task
+
+        try:
+            return await asyncio.shield(task)
+        except Exception as e:
+            logger.error("media_bundle_transform_failed",
+                image_uuid=self.image_uuid,
+                platform=platform,
+                error=str(e)
+            )
+            return None
+
+    async def _render(self, platform: str) -> Optional[str]:
+        cache = self.derivative_cache
+        if cache is None:
+            return await run_cpu(
+                ImageTransformer.transform_for_publication,
+                self.image_data,
+                platform,
+                self.image_uuid,
+                size_hint=len(self.image_data)
+            )
+
+        if self._digest is None:
+            self._digest = await asyncio.to_thread(source_digest, self.image_data)
+        # Keyed by output settings, not platform name: identical settings share a file
+        output = ImageTransformer.platform_settings(platform)
+        key = derivative_key(
+            self._digest,
+            image_uuid=self.image_uuid,
+            output=output,
+            brand=ImageTransformer.BRAND_SETTINGS
+        )
+        ext = output["format"].lower()
+
+        path = await asyncio.to_thread(cache.lookup, key, ext)
+        if path:
+            logger.debug("media_bundle_variant_cached", image_uuid=self.image_uuid, platform=platform)
+            return path
+
+        try:
+            encoded = await run_cpu(
+                ImageTransformer.encode_for_publication,
+                self.image_data,
+                platform,
+                self.image_uuid,
+                size_hint=len(self.image_data)
+            )
+        except Exception as e:
+            # Undecodable image: transform_for_publication falls back to the original bytes
+            logger.warn("media_bundle_encode_failed", image_uuid=self.image_uuid, platform=platform, error=str(e))
+            return await run_cpu(
+                ImageTransformer.transform_for_publication,
+                self.image_data,
+                platform,
+                self.image_uuid,
+                size_hint=len(self.image_data)
+            )
+
+        return await asyncio.to_thread(cache.store, key, ext, encoded)
+
+    async def close(self) -> None:
+        """Remove the variant temp files (cached derivatives are kept)."""
+        variants, self._variants = self._variants, {}
+        for platform, task in variants.items():
+            try:
+                path = await task
+            except Exception:
+                continue
+            if self.derivative_cache and self.derivative_cache.owns(path):
+                continue
+            if path and os.path.exists(path):
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    logger.warn("media_bundle_cleanup_failed", platform=platform, path=path, error=str(e))
+
+    async def __aenter__(self) -> "MediaBundle":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
+class PublicationExecutor:
+    """Per-platform and per-article concurrency limits for publication."""
+
+    def __init__(self, platform_limits: Dict[str, int], default_limit: int = 2, article_concurrency: int = 4):
+        """
+        Initialize executor.
+
+        Args:
+            platform_limits: Max concurrent publications per platform type
+            default_limit: Limit for platforms not in platform_limits
+            article_concurrency: Max articles processed concurrently by map_articles()
+        """
+        self.platform_limits = dict(platform_limits)
+        self.default_limit = max(1, default_limit)
+        self.article_concurrency = max(1, article_concurrency)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Semaphores can't be shared across event loops
+            self._semaphores = {}
+            self._loop = loop
+
+    def _semaphore(self, platform: str) -> asyncio.Semaphore:
+        self._ensure_loop()
+        semaphore = self._semaphores.get(platform)
+        if semaphore is None:
+            limit = max(1, self.platform_limits.get(platform, self.default_limit))
+            semaphore = asyncio.Semaphore(limit)
+            self._semaphores[platform] = semaphore
+        return semaphore
+
+    async def run(self, platform: str, call: Callable[[], Awaitable[R]]) -> R:
+        """Run one publication under the platform limit."""
+        async with self._semaphore(platform):
+            return await call()
+
+    async def fan_out(
+        self,
+        targets: List[T],
+        platform_of: Callable[[T], str],
+        publish: Callable[[T], Awaitable[R]]
+    ) -> List[R]:
+        """Publish to all targets concurrently (results in target order).
+
+        publish() is expected to handle its own errors; an exception is
+        returned in place of its result so one target cannot cancel the rest.
+        """
+        return await asyncio.gather(
+            *(self.run(platform_of(target), lambda target=target: publish(target)) for target in targets),
+            return_exceptions=True
+        )
+
+    async def map_articles(self, articles: List[T], process: Callable[[T], Awaitable[R]]) -> List[R]:
+        """Process articles concurrently, at most article_concurrency at a time."""
+        semaphore = asyncio.Semaphore(self.article_concurrency)
+
+        async def bounded(article: T) -> R:
+            async with semaphore:
+                return await process(article)
+
+        return await asyncio.gather(*(bounded(article) for article in articles), return_exceptions=True)
+
+
+# Global executor instance
+_publication_executor: Optional[PublicationExecutor] = None
+
+
+def get_publication_executor() -> PublicationExecutor:
+    """Get or create publication executor singleton."""
+    global _publication_executor
+
+    if _publication_executor is None:
+        _publication_executor = PublicationExecutor(
+            platform_limits={
+                "wordpress": settings.publication_wordpress_concurrency,
+                "twitter": settings.publication_twitter_concurrency,
+                "facebook": settings.publication_facebook_concurrency,
+                "linkedin": settings.publication_linkedin_concurrency
+            },
+            article_concurrency=settings.publication_article_concurrency
+        )
+        logger.info("publication_executor_initialized",
+            platform_limits=_publication_executor.platform_limits,
+            article_concurrency=_publication_executor.article_concurrency
+        )
+
+    return _publication_executor
@@ -7,6 +7,7 @@ from .wordpress_publisher import WordPressPublisher
 from .twitter_publisher import TwitterPublisher
 from .linkedin_publisher import LinkedInPublisher
 from .facebook_publisher import FacebookPublisher
+from .publisher_http import get_publisher_pool
 from utils.logger import get_logger
 from utils.config import settings
 
@@ -54,15 +55,18 @@ class PublisherFactory:
             logger.error("credential_decryption_failed", error=str(e))
             raise ValueError(f"Failed to decrypt credentials: {str(e)}")
         
+        # Publishers share one pooled session per platform
+        http_pool = get_publisher_pool()
+        
         # Create publisher based on platform type
         if platform_type == "wordpress":
-            return WordPressPublisher(credentials, base_url)
+            return WordPressPublisher(credentials, base_url, http_pool=http_pool)
         elif platform_type == "twitter":
-            return TwitterPublisher(credentials, base_url)
+            return TwitterPublisher(credentials, base_url, http_pool=http_pool)
         elif platform_type == "linkedin":
-            return LinkedInPublisher(credentials, base_url)
+            return LinkedInPublisher(credentials, base_url, http_pool=http_pool)
         elif platform_type == "facebook":
-            return FacebookPublisher(credentials, base_url)
+            return FacebookPublisher(credentials, base_url, http_pool=http_pool)
         # elif platform_type == "medium":
         #     return MediumPublisher(credentials, base_url)
         # elif platform_type == "substack":
@@ -0,0 +1,298 @@
+"""Pooled HTTP sessions for platform publishers.
+
+Every publisher call (WordPress media/tags/posts, tweets, Facebook photos,
+LinkedIn posts, OAuth exchanges) used to open its own aiohttp.ClientSession,
+so a single WordPress publication paid a TLS handshake per tag and a 429 from
+a platform failed the publication outright. This module provides:
+
+- One keep-alive session per platform (PUBLISHER_HTTP_LIMIT_PER_HOST
+  connections), created lazily and bound to the running event loop
+- Default timeouts (PUBLISHER_HTTP_TIMEOUT_SECONDS total,
+  PUBLISHER_HTTP_CONNECT_TIMEOUT_SECONDS connect)
+- Retry with exponential backoff on 429/5xx and connection failures,
+  honoring Retry-After (up to PUBLISHER_HTTP_MAX_RETRY_AFTER_SECONDS).
+  Non-idempotent requests (POST) are only retried when the platform did not
+  process them: 429, 503 and connect errors
+- Per-platform latency metrics (avg/p95/max time to response headers,
+  retries, errors, status classes)
+
+Usage:
+    async with self._request("POST", url, json=payload) as response:
+        data = await response.json()
+
+    # Outside a publisher instance (OAuth staticmethods)
+    async with publisher_request("facebook", "GET", url, params=params) as response:
+        ...
+
+`data` and `headers` may be zero-argument callables evaluated per attempt:
+an aiohttp.FormData can only be sent once and OAuth 1.0a headers carry a
+single-use nonce. Call close_publisher_sessions() on shutdown.
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+import aiohttp
+
+from utils.config import settings
+from utils.logger import get_logger
+
+logger = get_logger("publisher_http")
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Statuses where the platform did not act on the request (safe to resend a POST)
+UNPROCESSED_STATUSES = {429, 503}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+LATENCY_WINDOW = 500
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class PlatformMetrics:
+    """Request counters and a rolling latency window for one platform."""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0
+        self.statuses: Dict[str, int] = {}
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def record(self, elapsed: float, status: Optional[int] = None, retried: bool = False) -> None:
+        self.requests += 1
+        self._latencies.append(elapsed)
+        if retried:
+            self.retries += 1
+        if status is None:
+            self.errors += 1
+        else:
+            status_class = f"{status // 100}xx"
+            self.statuses[status_class] = self.statuses.get(status_class, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+        stats: Dict[str, Any] = {
+            "requests": self.requests,
+            "retries": self.retries,
+            "errors": self.errors,
+            "statuses": dict(self.statuses)
+        }
+        if latencies:
+            stats.update({
+                "avg_ms": round(sum(latencies) / len(latencies) * 1000, 1),
+                "p95_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000, 1),
+                "max_ms": round(latencies[-1] * 1000, 1)
+            })
+        return stats
+
+
+class PublisherSessionPool:
+    """Per-platform keep-alive sessions with retry and latency metrics."""
+
+    def __init__(
+        self,
+        timeout_seconds: float = 60,
+        connect_timeout_seconds: float = 10,
+        limit_per_host: int = 10,
+        max_retries: int = 3,
+        backoff_seconds: float = 1.0,
+        max_retry_after_seconds: float = 60
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            timeout_seconds: Default total timeout per request
+            connect_timeout_seconds: Default connect timeout
+            limit_per_host: Max open connections per host and platform
+            max_retries: Retries after the first attempt
+            backoff_seconds: Base of the exponential backoff (plus jitter)
+            max_retry_after_seconds: Longer Retry-After values are not waited for
+        """
+        self.timeout = aiohttp.ClientTimeout(total=timeout_seconds, connect=connect_timeout_seconds)
+        self.limit_per_host = max(1, limit_per_host)
+        self.max_retries = max(0, max_retries)
+        self.backoff_seconds = backoff_seconds
+        self.max_retry_after_seconds = max_retry_after_seconds
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._metrics: Dict[str, PlatformMetrics] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _build_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=settings.http_dns_cache_ttl,
+            keepalive_timeout=settings.http_keepalive_timeout,
+            enable_cleanup_closed=True
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+
+    async def get_session(self, platform: str) -> aiohttp.ClientSession:
+        """Return the platform session, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Sessions can't be shared across event loops
+            self._sessions = {}
+            self._loop = loop
+
+        session = self._sessions.get(platform)
+        if session is None or session.closed:
+            session = self._build_session()
+            self._sessions[platform] = session
+            logger.info("publisher_session_created",
+                platform=platform,
+                limit_per_host=self.limit_per_host
+            )
+        return session
+
+    def metrics(self, platform: str) -> PlatformMetrics:
+        metrics = self._metrics.get(platform)
+        if metrics is None:
+            metrics = self._metrics[platform] = PlatformMetrics()
+        return metrics
+
+    def _backoff(self, attempt: int) -> float:
+        return self.backoff_seconds * (2 ** attempt) + random.uniform(0, self.backoff_seconds)
+
+    def _retry_delay(self, response: aiohttp.ClientResponse, method: str, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying, or None to hand the response to the caller."""
+        if attempt >= self.max_retries or response.status not in RETRY_STATUSES:
+            return None
+        if method not in IDEMPOTENT_METHODS and response.status not in UNPROCESSED_STATUSES:
+            return None
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            return self._backoff(attempt)
+        if retry_after > self.max_retry_after_seconds:
+            return None
+        return retry_after
+
+    @asynccontextmanager
+    async def request(self, platform: str, method: str, url: str, **kwargs: Any) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Send a request on the platform session, retrying transient failures.
+
+        The yielded response is the last attempt's (a 429 is returned as is
+        once retries or the Retry-After budget are exhausted).
+        """
+        method = method.upper()
+        idempotent = method in IDEMPOTENT_METHODS
+        session = await self.get_session(platform)
+        metrics = self.metrics(platform)
+        attempt = 0
+        yielded = False
+
+        while True:
+            attempt_kwargs = dict(kwargs)
+            for key in ("data", "headers"):
+                if callable(attempt_kwargs.get(key)):
+                    attempt_kwargs[key] = attempt_kwargs[key]()
+
+            started = time.monotonic()
+            try:
+                async with session.request(method, url, **attempt_kwargs) as response:
+                    elapsed = time.monotonic() - started
+                    delay = self._retry_delay(response, method, attempt)
+                    metrics.record(elapsed, response.status, retried=delay is not None)
+                    if delay is None:
+                        yielded = True
+                        yield response
+                        return
+                    logger.warn("publisher_request_retry",
+                        platform=platform,
+                        method=method,
+                        status=response.status,
+                        attempt=attempt + 1,
+                        delay_seconds=round(delay, 2)
+                    )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if yielded:
+                    raise
+                # Connect failures never reached the platform; anything later only retries if idempotent
+                retryable = idempotent or isinstance(e, aiohttp.ClientConnectorError)
+                metrics.record(time.monotonic() - started, retried=retryable and attempt < self.max_retries)
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warn("publisher_request_retry",
+                    platform=platform,
+                    method=method,
+                    error=type(e).__name__,
+                    attempt=attempt + 1,
+                    delay_seconds=round(delay, 2)
+                )
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-platform request metrics."""
+        return {platform: metrics.stats() for platform, metrics in self._metrics.items()}
+
+    async def close(self) -> None:
+        """Close all platform sessions (call on shutdown)."""
+        sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            if not session.closed:
+                await session.close()
+        if sessions:
+            logger.info("publisher_sessions_closed", count=len(sessions))
+
+
+# Global pool instance
+_publisher_pool: Optional[PublisherSessionPool] = None
+
+
+def get_publisher_pool() -> PublisherSessionPool:
+    """Get or create the publisher session pool singleton."""
+    global _publisher_pool
+
+    if _publisher_pool is None:
+        _publisher_pool = PublisherSessionPool(
+            timeout_seconds=settings.publisher_http_timeout_seconds,
+            connect_timeout_seconds=settings.publisher_http_connect_timeout_seconds,
+            limit_per_host=settings.publisher_http_limit_per_host,
+            max_retries=settings.publisher_http_max_retries,
+            backoff_seconds=settings.publisher_http_backoff_seconds,
+            max_retry_after_seconds=settings.publisher_http_max_retry_after_seconds
+        )
+
+    return _publisher_pool
+
+
+def publisher_request(platform: str, method: str, url: str, **kwargs: Any):
+    """Pooled request for code without a publisher instance (OAuth flows)."""
+    return get_publisher_pool().request(platform, method, url, **kwargs)
+
+
+def get_publisher_http_stats() -> Dict[str, Any]:
+    """Per-platform latency metrics (empty until the first request)."""
+    return _publisher_pool.stats() if _publisher_pool else {}
+
+
+async def close_publisher_sessions() -> None:
+    """Close publisher sessions (server/scheduler shutdown)."""
+    if _publisher_pool is not None:
+        await _publisher_pool.close()
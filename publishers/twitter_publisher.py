@@ -14,6 +14,7 @@ import time
 import secrets
 
 from .base_publisher import BasePublisher, PublicationResult
+from .publisher_http import publisher_request
 from utils.logger import get_logger
 
 logger = get_logger("twitter_publisher")
@@ -147,32 +148,33 @@ class TwitterPublisher(BasePublisher):
         """Test Twitter connection and authentication."""
         try:
             url = self._get_api_url("users/me")
-            headers = {
-                'Authorization': self._generate_oauth1_header('GET', url),
-                'Content-Type': 'application/json'
-            }
+            # Built per attempt: a retried request needs a fresh OAuth nonce/timestamp
+            def headers():
+                return {
+                    'Authorization': self._generate_oauth1_header('GET', url),
+                    'Content-Type': 'application/json'
+                }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        username = data.get('data', {}).get('username', 'unknown')
-                        return {
-                            "success": True,
-                            "message": f"Successfully connected to Twitter as @{username}",
-                            "details": {
-                                "username": username,
-                                "user_id": data.get('data', {}).get('id')
-                            }
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {
-                            "success": False,
-                            "message": f"Twitter API returned status {response.status}",
-                            "details": {"error": error_text}
+            async with self._request("GET", url, headers=headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    username = data.get('data', {}).get('username', 'unknown')
+                    return {
+                        "success": True,
+                        "message": f"Successfully connected to Twitter as @{username}",
+                        "details": {
+                            "username": username,
+                            "user_id": data.get('data', {}).get('id')
                         }
-                        
+                    }
+                else:
+                    error_text = await response.text()
+                    return {
+                        "success": False,
+                        "message": f"Twitter API returned status {response.status}",
+                        "details": {"error": error_text}
+                    }
+                    
         except Exception as e:
             logger.error("twitter_test_connection_error", error=str(e))
             return {
@@ -417,12 +419,10 @@ class TwitterPublisher(BasePublisher):
             url = "https://upload.twitter.com/1.1/media/upload.json"
 
             # Generate OAuth header (no body params in signature for multipart)
-            headers = {
-                'Authorization': self._generate_oauth1_header('POST', url),
-            }
-
-            # Use multipart/form-data with binary file
-            form = aiohttp.FormData()
+            def headers():
+                return {
+                    'Authorization': self._generate_oauth1_header('POST', url),
+                }
 
             # Detect content type from extension
             ext = os.path.splitext(image_path)[1].lower()
@@ -435,34 +435,37 @@ class TwitterPublisher(BasePublisher):
             }
             content_type = content_types.get(ext, 'image/jpeg')
 
-            form.add_field('media',
-                          image_data,
-                          filename=f'image{ext}',
-                          content_type=content_type)
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, data=form) as response:
-                    if response.status in (200, 201):
-                        data = await response.json()
-                        media_id = data.get('media_id_string')
-
-                        if media_id:
-                            return {
-                                "success": True,
-                                "media_id": media_id,
-                                "size_kb": round(size_kb, 1)
-                            }
-                        else:
-                            return {
-                                "success": False,
-                                "error": "No media_id in response"
-                            }
+            # Use multipart/form-data with binary file (a FormData can only be sent once)
+            def form():
+                form_data = aiohttp.FormData()
+                form_data.add_field('media',
+                              image_data,
+                              filename=f'image{ext}',
+                              content_type=content_type)
+                return form_data
+
+            async with self._request("POST", url, headers=headers, data=form) as response:
+                if response.status in (200, 201):
+                    data = await response.json()
+                    media_id = data.get('media_id_string')
+
+                    if media_id:
+                        return {
+                            "success": True,
+                            "media_id": media_id,
+                            "size_kb": round(size_kb, 1)
+                        }
                     else:
-                        error_text = await response.text()
                         return {
                             "success": False,
-                            "error": f"HTTP {response.status}: {error_text[:200]}"
+                            "error": "No media_id in response"
                         }
+                else:
+                    error_text = await response.text()
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status}: {error_text[:200]}"
+                    }
 
         except FileNotFoundError:
             return {
@@ -489,42 +492,42 @@ class TwitterPublisher(BasePublisher):
             if media_id:
                 tweet_data["media"] = {"media_ids": [media_id]}
             
-            headers = {
-                'Authorization': self._generate_oauth1_header('POST', url),
-                'Content-Type': 'application/json'
-            }
+            def headers():
+                return {
+                    'Authorization': self._generate_oauth1_header('POST', url),
+                    'Content-Type': 'application/json'
+                }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=tweet_data) as response:
-                    response_data = await response.json()
-                    
-                    if response.status == 201:
-                        return {
-                            "success": True,
-                            "data": response_data["data"]
-                        }
-                    else:
-                        # Log full error response for debugging
-                        error_msg = response_data.get('detail') or response_data.get('title') or f'HTTP {response.status}'
-
-                        # Twitter often returns errors in 'errors' array
-                        if 'errors' in response_data:
-                            errors = response_data['errors']
-                            if errors:
-                                error_msg = errors[0].get('message', error_msg)
-
-                        logger.error("twitter_api_error_response",
-                            status=response.status,
-                            error_msg=error_msg,
-                            full_response=response_data
-                        )
+            async with self._request("POST", url, headers=headers, json=tweet_data) as response:
+                response_data = await response.json()
+                
+                if response.status == 201:
+                    return {
+                        "success": True,
+                        "data": response_data["data"]
+                    }
+                else:
+                    # Log full error response for debugging
+                    error_msg = response_data.get('detail') or response_data.get('title') or f'HTTP {response.status}'
+
+                    # Twitter often returns errors in 'errors' array
+                    if 'errors' in response_data:
+                        errors = response_data['errors']
+                        if errors:
+                            error_msg = errors[0].get('message', error_msg)
+
+                    logger.error("twitter_api_error_response",
+                        status=response.status,
+                        error_msg=error_msg,
+                        full_response=response_data
+                    )
 
-                        return {
-                            "success": False,
-                            "error": error_msg,
-                            "response": response_data
-                        }
-                        
+                    return {
+                        "success": False,
+                        "error": error_msg,
+                        "response": response_data
+                    }
+                    
         except Exception as e:
             return {
                 "success": False,
@@ -550,81 +553,81 @@ class TwitterPublisher(BasePublisher):
         try:
             url = "https://api.twitter.com/oauth/request_token"
             
-            # OAuth parameters
-            oauth_params = {
-                'oauth_callback': callback_url,
-                'oauth_consumer_key': consumer_key,
-                'oauth_signature_method': 'HMAC-SHA1',
-                'oauth_timestamp': str(int(time.time())),
-                'oauth_nonce': secrets.token_hex(16),
-                'oauth_version': '1.0'
-            }
+            # Built per attempt: a retried request needs a fresh OAuth nonce/timestamp
+            def headers():
+                # OAuth parameters
+                oauth_params = {
+                    'oauth_callback': callback_url,
+                    'oauth_consumer_key': consumer_key,
+                    'oauth_signature_method': 'HMAC-SHA1',
+                    'oauth_timestamp': str(int(time.time())),
+                    'oauth_nonce': secrets.token_hex(16),
+                    'oauth_version': '1.0'
+                }
             
-            # Create signature base string
-            normalized_params = '&'.join([
-                f'{urllib.parse.quote_plus(str(k))}={urllib.parse.quote_plus(str(v))}'
-                for k, v in sorted(oauth_params.items())
-            ])
+                # Create signature base string
+                normalized_params = '&'.join([
+                    f'{urllib.parse.quote_plus(str(k))}={urllib.parse.quote_plus(str(v))}'
+                    for k, v in sorted(oauth_params.items())
+                ])
             
-            base_string = f'POST&{urllib.parse.quote_plus(url)}&{urllib.parse.quote_plus(normalized_params)}'
+                base_string = f'POST&{urllib.parse.quote_plus(url)}&{urllib.parse.quote_plus(normalized_params)}'
             
-            # Create signing key (consumer_secret + "&" for request token)
-            signing_key = f'{urllib.parse.quote_plus(consumer_secret)}&'
+                # Create signing key (consumer_secret + "&" for request token)
+                signing_key = f'{urllib.parse.quote_plus(consumer_secret)}&'
             
-            # Generate signature
-            signature = base64.b64encode(
-                hmac.new(signing_key.encode(), base_string.encode(), hashlib.sha1).digest()
-            ).decode()
+                # Generate signature
+                signature = base64.b64encode(
+                    hmac.new(signing_key.encode(), base_string.encode(), hashlib.sha1).digest()
+                ).decode()
             
-            oauth_params['oauth_signature'] = signature
+                oauth_params['oauth_signature'] = signature
             
-            # Build authorization header
-            auth_header = 'OAuth ' + ', '.join([
-                f'{k}="{urllib.parse.quote_plus(str(v))}"'
-                for k, v in sorted(oauth_params.items())
-            ])
+                # Build authorization header
+                auth_header = 'OAuth ' + ', '.join([
+                    f'{k}="{urllib.parse.quote_plus(str(v))}"'
+                    for k, v in sorted(oauth_params.items())
+                ])
             
-            # Make request
-            headers = {
-                'Authorization': auth_header,
-                'Content-Type': 'application/x-www-form-urlencoded'
-            }
+                return {
+                    'Authorization': auth_header,
+                    'Content-Type': 'application/x-www-form-urlencoded'
+                }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers) as response:
-                    if response.status == 200:
-                        response_text = await response.text()
-                        
-                        # Parse response
-                        parsed = dict(urllib.parse.parse_qsl(response_text))
-                        
-                        if 'oauth_token' in parsed and 'oauth_token_secret' in parsed:
-                            logger.info("twitter_request_token_success", 
-                                oauth_token=parsed['oauth_token'][:10] + "..."
-                            )
-                            return {
-                                "success": True,
-                                "oauth_token": parsed['oauth_token'],
-                                "oauth_token_secret": parsed['oauth_token_secret'],
-                                "oauth_callback_confirmed": parsed.get('oauth_callback_confirmed', 'true')
-                            }
-                        else:
-                            logger.error("twitter_request_token_invalid_response", response=response_text)
-                            return {
-                                "success": False,
-                                "error": "Invalid response format from Twitter"
-                            }
-                    else:
-                        error_text = await response.text()
-                        logger.error("twitter_request_token_failed", 
-                            status=response.status,
-                            error=error_text
+            async with publisher_request("twitter", "POST", url, headers=headers) as response:
+                if response.status == 200:
+                    response_text = await response.text()
+                    
+                    # Parse response
+                    parsed = dict(urllib.parse.parse_qsl(response_text))
+                    
+                    if 'oauth_token' in parsed and 'oauth_token_secret' in parsed:
+                        logger.info("twitter_request_token_success", 
+                            oauth_token=parsed['oauth_token'][:10] + "..."
                         )
+                        return {
+                            "success": True,
+                            "oauth_token": parsed['oauth_token'],
+                            "oauth_token_secret": parsed['oauth_token_secret'],
+                            "oauth_callback_confirmed": parsed.get('oauth_callback_confirmed', 'true')
+                        }
+                    else:
+                        logger.error("twitter_request_token_invalid_response", response=response_text)
                         return {
                             "success": False,
-                            "error": f"Twitter API error {response.status}: {error_text}"
+                            "error": "Invalid response format from Twitter"
                         }
-                        
+                else:
+                    error_text = await response.text()
+                    logger.error("twitter_request_token_failed", 
+                        status=response.status,
+                        error=error_text
+                    )
+                    return {
+                        "success": False,
+                        "error": f"Twitter API error {response.status}: {error_text}"
+                    }
+                    
         except Exception as e:
             logger.error("twitter_request_token_exception", error=str(e))
             return {
@@ -649,84 +652,84 @@ class TwitterPublisher(BasePublisher):
         try:
             url = "https://api.twitter.com/oauth/access_token"
             
-            # OAuth parameters
-            oauth_params = {
-                'oauth_consumer_key': consumer_key,
-                'oauth_token': oauth_token,
-                'oauth_signature_method': 'HMAC-SHA1',
-                'oauth_timestamp': str(int(time.time())),
-                'oauth_nonce': secrets.token_hex(16),
-                'oauth_version': '1.0',
-                'oauth_verifier': oauth_verifier
-            }
+            # Built per attempt: a retried request needs a fresh OAuth nonce/timestamp
+            def headers():
+                # OAuth parameters
+                oauth_params = {
+                    'oauth_consumer_key': consumer_key,
+                    'oauth_token': oauth_token,
+                    'oauth_signature_method': 'HMAC-SHA1',
+                    'oauth_timestamp': str(int(time.time())),
+                    'oauth_nonce': secrets.token_hex(16),
+                    'oauth_version': '1.0',
+                    'oauth_verifier': oauth_verifier
+                }
             
-            # Create signature base string
-            normalized_params = '&'.join([
-                f'{urllib.parse.quote_plus(str(k))}={urllib.parse.quote_plus(str(v))}'
-                for k, v in sorted(oauth_params.items())
-            ])
+                # Create signature base string
+                normalized_params = '&'.join([
+                    f'{urllib.parse.quote_plus(str(k))}={urllib.parse.quote_plus(str(v))}'
+                    for k, v in sorted(oauth_params.items())
+                ])
             
-            base_string = f'POST&{urllib.parse.quote_plus(url)}&{urllib.parse.quote_plus(normalized_params)}'
+                base_string = f'POST&{urllib.parse.quote_plus(url)}&{urllib.parse.quote_plus(normalized_params)}'
             
-            # Create signing key
-            signing_key = f'{urllib.parse.quote_plus(consumer_secret)}&{urllib.parse.quote_plus(oauth_token_secret)}'
+                # Create signing key
+                signing_key = f'{urllib.parse.quote_plus(consumer_secret)}&{urllib.parse.quote_plus(oauth_token_secret)}'
             
-            # Generate signature
-            signature = base64.b64encode(
-                hmac.new(signing_key.encode(), base_string.encode(), hashlib.sha1).digest()
-            ).decode()
+                # Generate signature
+                signature = base64.b64encode(
+                    hmac.new(signing_key.encode(), base_string.encode(), hashlib.sha1).digest()
+                ).decode()
             
-            oauth_params['oauth_signature'] = signature
+                oauth_params['oauth_signature'] = signature
             
-            # Build authorization header
-            auth_header = 'OAuth ' + ', '.join([
-                f'{k}="{urllib.parse.quote_plus(str(v))}"'
-                for k, v in sorted(oauth_params.items())
-            ])
+                # Build authorization header
+                auth_header = 'OAuth ' + ', '.join([
+                    f'{k}="{urllib.parse.quote_plus(str(v))}"'
+                    for k, v in sorted(oauth_params.items())
+                ])
             
-            # Make request
-            headers = {
-                'Authorization': auth_header,
-                'Content-Type': 'application/x-www-form-urlencoded'
-            }
+                return {
+                    'Authorization': auth_header,
+                    'Content-Type': 'application/x-www-form-urlencoded'
+                }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers) as response:
-                    if response.status == 200:
-                        response_text = await response.text()
-                        
-                        # Parse response
-                        parsed = dict(urllib.parse.parse_qsl(response_text))
-                        
-                        if 'oauth_token' in parsed and 'oauth_token_secret' in parsed:
-                            logger.info("twitter_access_token_success", 
-                                username=parsed.get('screen_name', 'unknown'),
-                                user_id=parsed.get('user_id', 'unknown')
-                            )
-                            return {
-                                "success": True,
-                                "oauth_token": parsed['oauth_token'],
-                                "oauth_token_secret": parsed['oauth_token_secret'],
-                                "user_id": parsed.get('user_id'),
-                                "screen_name": parsed.get('screen_name')
-                            }
-                        else:
-                            logger.error("twitter_access_token_invalid_response", response=response_text)
-                            return {
-                                "success": False,
-                                "error": "Invalid access token response from Twitter"
-                            }
-                    else:
-                        error_text = await response.text()
-                        logger.error("twitter_access_token_failed", 
-                            status=response.status,
-                            error=error_text
+            async with publisher_request("twitter", "POST", url, headers=headers) as response:
+                if response.status == 200:
+                    response_text = await response.text()
+                    
+                    # Parse response
+                    parsed = dict(urllib.parse.parse_qsl(response_text))
+                    
+                    if 'oauth_token' in parsed and 'oauth_token_secret' in parsed:
+                        logger.info("twitter_access_token_success", 
+                            username=parsed.get('screen_name', 'unknown'),
+                            user_id=parsed.get('user_id', 'unknown')
                         )
+                        return {
+                            "success": True,
+                            "oauth_token": parsed['oauth_token'],
+                            "oauth_token_secret": parsed['oauth_token_secret'],
+                            "user_id": parsed.get('user_id'),
+                            "screen_name": parsed.get('screen_name')
+                        }
+                    else:
+                        logger.error("twitter_access_token_invalid_response", response=response_text)
                         return {
                             "success": False,
-                            "error": f"Twitter API error {response.status}: {error_text}"
+                            "error": "Invalid access token response from Twitter"
                         }
-                        
+                else:
+                    error_text = await response.text()
+                    logger.error("twitter_access_token_failed", 
+                        status=response.status,
+                        error=error_text
+                    )
+                    return {
+                        "success": False,
+                        "error": f"Twitter API error {response.status}: {error_text}"
+                    }
+                    
         except Exception as e:
             logger.error("twitter_access_token_exception", error=str(e))
             return {
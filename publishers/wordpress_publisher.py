@@ -8,6 +8,7 @@ import json
 from urllib.parse import urljoin, urlparse
 
 from .base_publisher import BasePublisher, PublicationResult
+from utils.http_client import get_http_session
 from utils.logger import get_logger
 
 logger = get_logger("wordpress_publisher")
@@ -50,41 +51,40 @@ class WordPressPublisher(BasePublisher):
             }
             
             # Test by getting current user
-            async with aiohttp.ClientSession() as session:
-                url = self._get_api_url('users/me')
-                
-                async with session.get(url, headers=headers, timeout=10) as response:
-                    if response.status == 200:
-                        user_data = await response.json()
-                        auth_method = "API Key" if self.credentials.get('api_key') else "Application Password"
-                        return {
-                            "success": True,
-                            "message": f"Connected as {user_data.get('name', 'Unknown')} using {auth_method}",
-                            "details": {
-                                "user_id": user_data.get('id'),
-                                "username": user_data.get('username'),
-                                "capabilities": user_data.get('capabilities', {}),
-                                "auth_method": auth_method
-                            }
-                        }
-                    elif response.status == 401:
-                        auth_method = "API key" if self.credentials.get('api_key') else "username/app password"
-                        return {
-                            "success": False,
-                            "message": f"Authentication failed. Check your WordPress {auth_method}."
-                        }
-                    elif response.status == 403:
-                        return {
-                            "success": False,
-                            "message": "Access forbidden. User may not have sufficient permissions."
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {
-                            "success": False,
-                            "message": f"Connection failed (HTTP {response.status}): {error_text[:200]}"
+            url = self._get_api_url('users/me')
+            
+            async with self._request("GET", url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    user_data = await response.json()
+                    auth_method = "API Key" if self.credentials.get('api_key') else "Application Password"
+                    return {
+                        "success": True,
+                        "message": f"Connected as {user_data.get('name', 'Unknown')} using {auth_method}",
+                        "details": {
+                            "user_id": user_data.get('id'),
+                            "username": user_data.get('username'),
+                            "capabilities": user_data.get('capabilities', {}),
+                            "auth_method": auth_method
                         }
-                        
+                    }
+                elif response.status == 401:
+                    auth_method = "API key" if self.credentials.get('api_key') else "username/app password"
+                    return {
+                        "success": False,
+                        "message": f"Authentication failed. Check your WordPress {auth_method}."
+                    }
+                elif response.status == 403:
+                    return {
+                        "success": False,
+                        "message": "Access forbidden. User may not have sufficient permissions."
+                    }
+                else:
+                    error_text = await response.text()
+                    return {
+                        "success": False,
+                        "message": f"Connection failed (HTTP {response.status}): {error_text[:200]}"
+                    }
+                    
         except aiohttp.ClientError as e:
             return {
                 "success": False,
@@ -99,14 +99,14 @@ class WordPressPublisher(BasePublisher):
     
     async def _upload_featured_image(
         self, 
-        session: aiohttp.ClientSession, 
         image_url: str,
         headers: Dict[str, str]
     ) -> Optional[int]:
         """Upload image to WordPress media library."""
         try:
             # Download image from semantika
-            async with session.get(image_url) as img_response:
+            download_session = await get_http_session()
+            async with download_session.get(image_url) as img_response:
                 if img_response.status != 200:
                     logger.warn("image_download_failed", 
                         image_url=image_url,
@@ -130,7 +130,8 @@ class WordPressPublisher(BasePublisher):
             
             upload_url = self._get_api_url('media')
             
-            async with session.post(
+            async with self._request(
+                "POST",
                 upload_url, 
                 data=image_data, 
                 headers=upload_headers
@@ -160,7 +161,6 @@ class WordPressPublisher(BasePublisher):
     
     async def _upload_featured_image_from_uuid(
         self, 
-        session: aiohttp.ClientSession, 
         imagen_uuid: str,
         headers: Dict[str, str]
     ) -> Optional[int]:
@@ -183,7 +183,8 @@ class WordPressPublisher(BasePublisher):
             # Use docker-compose service name (not container name)
             unified_image_url = f"http://semantika-api:8000/api/v1/images/{imagen_uuid}"
             
-            async with session.get(unified_image_url) as img_response:
+            download_session = await get_http_session()
+            async with download_session.get(unified_image_url) as img_response:
                 if img_response.status != 200:
                     logger.warn("image_download_failed_from_unified", 
                         imagen_uuid=imagen_uuid,
@@ -204,7 +205,8 @@ class WordPressPublisher(BasePublisher):
             
             upload_url = self._get_api_url('media')
             
-            async with session.post(
+            async with self._request(
+                "POST",
                 upload_url, 
                 data=image_data, 
                 headers=upload_headers
@@ -244,7 +246,6 @@ class WordPressPublisher(BasePublisher):
     
     async def _upload_from_temp_file(
         self, 
-        session: aiohttp.ClientSession, 
         temp_file_path: str,
         headers: Dict[str, str]
     ) -> Optional[int]:
@@ -267,7 +268,8 @@ class WordPressPublisher(BasePublisher):
             
             upload_url = self._get_api_url('media')
             
-            async with session.post(
+            async with self._request(
+                "POST",
                 upload_url, 
                 data=image_data, 
                 headers=upload_headers
@@ -323,157 +325,157 @@ class WordPressPublisher(BasePublisher):
                 'Content-Type': 'application/json'
             }
             
-            async with aiohttp.ClientSession() as session:
-                featured_media_id = None
-                
-                # Upload featured image if provided
-                if temp_image_path:
-                    # Use temporary transformed image file (preferred method)
-                    featured_media_id = await self._upload_from_temp_file(
-                        session, temp_image_path, headers
-                    )
-                elif imagen_uuid:
-                    # Fallback to unified image endpoint with UUID
-                    featured_media_id = await self._upload_featured_image_from_uuid(
-                        session, imagen_uuid, headers
-                    )
-                elif image_url:
-                    # Fallback to URL-based method (legacy)
-                    featured_media_id = await self._upload_featured_image(
-                        session, image_url, headers
-                    )
-                
-                # Handle tags - get or create tag IDs
-                tag_ids = []
-                if tags:
-                    tag_ids = await self._get_or_create_tags(session, tags, headers)
+            featured_media_id = None
+            
+            # Upload featured image if provided
+            if temp_image_path:
+                # Use temporary transformed image file (preferred method)
+                featured_media_id = await self._upload_from_temp_file(
+                    temp_image_path, headers
+                )
+            elif imagen_uuid:
+                # Fallback to unified image endpoint with UUID
+                featured_media_id = await self._upload_featured_image_from_uuid(
+                    imagen_uuid, headers
+                )
+            elif image_url:
+                # Fallback to URL-based method (legacy)
+                featured_media_id = await self._upload_featured_image(
+                    image_url, headers
+                )
+            
+            # Handle tags - get or create tag IDs
+            tag_ids = []
+            if tags:
+                tag_ids = await self._get_or_create_tags(tags, headers)
+            
+            # Handle category - get or create category ID
+            category_ids = []
+            if category:
+                category_id = await self._get_or_create_category(category, headers)
+                if category_id:
+                    category_ids.append(category_id)
+            
+            # Use provided slug or generate from title
+            if not slug:
+                slug = self._generate_slug(title)
+                logger.debug("wordpress_slug_generated_from_title",
+                    original_title=title[:50],
+                    generated_slug=slug
+                )
+            else:
+                logger.debug("wordpress_using_provided_slug",
+                    provided_slug=slug
+                )
+            
+            # Check if post with this slug already exists
+            existing_post_id = await self._find_post_by_slug(slug, headers)
+            
+            # Prepare post data
+            post_data = {
+                "title": title,
+                "content": self.sanitize_content(content),
+                "status": status,  # "draft" or "publish"
+                "slug": slug
+            }
+            
+            if excerpt:
+                post_data["excerpt"] = excerpt
+            
+            if featured_media_id:
+                post_data["featured_media"] = featured_media_id
+            
+            if tag_ids:
+                post_data["tags"] = tag_ids
+            
+            if category_ids:
+                post_data["categories"] = category_ids
+            
+            # Update existing post or create new one
+            posts_url = self._get_api_url('posts')
+            if existing_post_id:
+                # Update existing post - preserve original publication date
+                posts_url = f"{posts_url}/{existing_post_id}"
+                method = "PUT"
+                action = "updated"
+                logger.info("wordpress_updating_existing_post",
+                    post_id=existing_post_id,
+                    article_title=title[:50],
+                    message="Preserving original WordPress publication date"
+                )
+            else:
+                # Create new post - set custom publication date if provided
+                method = "POST"
+                action = "created"
                 
-                # Handle category - get or create category ID
-                category_ids = []
-                if category:
-                    category_id = await self._get_or_create_category(session, category, headers)
-                    if category_id:
-                        category_ids.append(category_id)
+                if fecha_publicacion:
+                    try:
+                        # Convert ISO 8601 to WordPress format
+                        from datetime import datetime
+                        dt = datetime.fromisoformat(fecha_publicacion.replace('Z', '+00:00'))
+                        wordpress_date = dt.strftime('%Y-%m-%dT%H:%M:%S')
+                        post_data["date"] = wordpress_date
+                        
+                        logger.info("wordpress_custom_publication_date", 
+                            article_title=title[:50],
+                            original_date=fecha_publicacion,
+                            wordpress_date=wordpress_date
+                        )
+                    except ValueError as e:
+                        logger.warn("wordpress_invalid_date_format",
+                            article_title=title[:50],
+                            fecha_publicacion=fecha_publicacion,
+                            error=str(e)
+                        )
+            
+            async with self._request(
+                method,
+                posts_url,
+                json=post_data,
+                headers=headers
+            ) as response:
                 
-                # Use provided slug or generate from title
-                if not slug:
-                    slug = self._generate_slug(title)
-                    logger.debug("wordpress_slug_generated_from_title",
-                        original_title=title[:50],
-                        generated_slug=slug
+                # WordPress returns 201 for POST (create) and 200 for PUT (update)
+                if response.status in [200, 201]:
+                    post_data_response = await response.json()
+                    post_id = post_data_response.get('id')
+                    post_url = post_data_response.get('link')
+                    
+                    logger.info("wordpress_article_published",
+                        post_id=post_id,
+                        title=title[:50],
+                        url=post_url,
+                        status=status,
+                        operation=action,
+                        slug=slug
                     )
-                else:
-                    logger.debug("wordpress_using_provided_slug",
-                        provided_slug=slug
+                    
+                    return PublicationResult(
+                        success=True,
+                        url=post_url,
+                        external_id=str(post_id),
+                        metadata={
+                            "platform": "wordpress",
+                            "post_id": post_id,
+                            "featured_media_id": featured_media_id,
+                            "tag_count": len(tag_ids) if tag_ids else 0,
+                            "category_count": len(category_ids) if category_ids else 0
+                        }
                     )
                 
-                # Check if post with this slug already exists
-                existing_post_id = await self._find_post_by_slug(session, slug, headers)
-                
-                # Prepare post data
-                post_data = {
-                    "title": title,
-                    "content": self.sanitize_content(content),
-                    "status": status,  # "draft" or "publish"
-                    "slug": slug
-                }
-                
-                if excerpt:
-                    post_data["excerpt"] = excerpt
-                
-                if featured_media_id:
-                    post_data["featured_media"] = featured_media_id
-                
-                if tag_ids:
-                    post_data["tags"] = tag_ids
-                
-                if category_ids:
-                    post_data["categories"] = category_ids
-                
-                # Update existing post or create new one
-                posts_url = self._get_api_url('posts')
-                if existing_post_id:
-                    # Update existing post - preserve original publication date
-                    posts_url = f"{posts_url}/{existing_post_id}"
-                    method = session.put
-                    action = "updated"
-                    logger.info("wordpress_updating_existing_post",
-                        post_id=existing_post_id,
-                        article_title=title[:50],
-                        message="Preserving original WordPress publication date"
-                    )
                 else:
-                    # Create new post - set custom publication date if provided
-                    method = session.post
-                    action = "created"
-                    
-                    if fecha_publicacion:
-                        try:
-                            # Convert ISO 8601 to WordPress format
-                            from datetime import datetime
-                            dt = datetime.fromisoformat(fecha_publicacion.replace('Z', '+00:00'))
-                            wordpress_date = dt.strftime('%Y-%m-%dT%H:%M:%S')
-                            post_data["date"] = wordpress_date
-                            
-                            logger.info("wordpress_custom_publication_date", 
-                                article_title=title[:50],
-                                original_date=fecha_publicacion,
-                                wordpress_date=wordpress_date
-                            )
-                        except ValueError as e:
-                            logger.warn("wordpress_invalid_date_format",
-                                article_title=title[:50],
-                                fecha_publicacion=fecha_publicacion,
-                                error=str(e)
-                            )
-                
-                async with method(
-                    posts_url,
-                    json=post_data,
-                    headers=headers
-                ) as response:
+                    error_text = await response.text()
+                    logger.error("wordpress_publish_failed",
+                        status=response.status,
+                        title=title[:50],
+                        error=error_text[:200]
+                    )
                     
-                    # WordPress returns 201 for POST (create) and 200 for PUT (update)
-                    if response.status in [200, 201]:
-                        post_data_response = await response.json()
-                        post_id = post_data_response.get('id')
-                        post_url = post_data_response.get('link')
-                        
-                        logger.info("wordpress_article_published",
-                            post_id=post_id,
-                            title=title[:50],
-                            url=post_url,
-                            status=status,
-                            operation=action,
-                            slug=slug
-                        )
-                        
-                        return PublicationResult(
-                            success=True,
-                            url=post_url,
-                            external_id=str(post_id),
-                            metadata={
-                                "platform": "wordpress",
-                                "post_id": post_id,
-                                "featured_media_id": featured_media_id,
-                                "tag_count": len(tag_ids) if tag_ids else 0,
-                                "category_count": len(category_ids) if category_ids else 0
-                            }
-                        )
+                    return PublicationResult(
+                        success=False,
+                        error=f"WordPress API error (HTTP {response.status}): {error_text[:200]}"
+                    )
                     
-                    else:
-                        error_text = await response.text()
-                        logger.error("wordpress_publish_failed",
-                            status=response.status,
-                            title=title[:50],
-                            error=error_text[:200]
-                        )
-                        
-                        return PublicationResult(
-                            success=False,
-                            error=f"WordPress API error (HTTP {response.status}): {error_text[:200]}"
-                        )
-                        
         except Exception as e:
             logger.error("wordpress_publish_error",
                 title=title[:50],
@@ -487,7 +489,6 @@ class WordPressPublisher(BasePublisher):
     
     async def _get_or_create_tags(
         self,
-        session: aiohttp.ClientSession,
         tags: list,
         headers: Dict[str, str]
     ) -> list:
@@ -500,7 +501,8 @@ class WordPressPublisher(BasePublisher):
             search_params = {'search': tag_name}
             
             try:
-                async with session.get(
+                async with self._request(
+                    "GET",
                     search_url,
                     params=search_params,
                     headers=headers
@@ -520,7 +522,8 @@ class WordPressPublisher(BasePublisher):
                         if tag_id is None:
                             create_data = {'name': tag_name}
                             
-                            async with session.post(
+                            async with self._request(
+                                "POST",
                                 search_url,
                                 json=create_data,
                                 headers=headers
@@ -549,14 +552,12 @@ class WordPressPublisher(BasePublisher):
     
     async def _get_or_create_category(
         self,
-        session: aiohttp.ClientSession,
         category_name: str,
         headers: Dict[str, str]
     ) -> Optional[int]:
         """Get existing category ID or create new category.
         
         Args:
-            session: HTTP session for requests
             category_name: Name of the category
             headers: Authentication headers
             
@@ -568,7 +569,8 @@ class WordPressPublisher(BasePublisher):
             search_url = self._get_api_url('categories')
             search_params = {'search': category_name}
             
-            async with session.get(
+            async with self._request(
+                "GET",
                 search_url,
                 params=search_params,
                 headers=headers
@@ -595,7 +597,8 @@ class WordPressPublisher(BasePublisher):
                             'slug': category_name.lower().replace(' ', '-').replace('á', 'a').replace('é', 'e').replace('í', 'i').replace('ó', 'o').replace('ú', 'u').replace('ñ', 'n')
                         }
                         
-                        async with session.post(
+                        async with self._request(
+                            "POST",
                             search_url,
                             json=create_data,
                             headers=headers
@@ -667,7 +670,6 @@ class WordPressPublisher(BasePublisher):
     
     async def _find_post_by_slug(
         self, 
-        session: aiohttp.ClientSession, 
         slug: str, 
         headers: Dict[str, str]
     ) -> Optional[int]:
@@ -680,7 +682,8 @@ class WordPressPublisher(BasePublisher):
             search_url = self._get_api_url('posts')
             search_params = {'slug': slug}
             
-            async with session.get(
+            async with self._request(
+                "GET",
                 search_url,
                 params=search_params,
                 headers=headers
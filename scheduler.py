@@ -18,6 +18,12 @@ from apscheduler.triggers.cron import CronTrigger
 from utils.logger import get_logger
 from utils.config import settings
 from utils.supabase_client import get_supabase_client
+from utils.http_client import close_http_sessions
+from publishers.publisher_http import close_publisher_sessions
+from utils.browser_pool import close_browser_pool
+from utils.cpu_pool import shutdown_cpu_pool
+from utils.transcription_service import shutdown_transcription_services
+from utils.usage_tracker import close_usage_tracker
 from utils.qdrant_client import get_qdrant_client
 from sources.file_monitor import FileMonitor
 from sources.email_monitor import EmailMonitor
@@ -103,7 +109,12 @@ async def run_multi_company_email_monitor():
             imap_port=settings.imap_port,
             email_address=settings.imap_user,
             password=settings.imap_password,
-            check_interval=settings.imap_listener_interval
+            check_interval=settings.imap_listener_interval,
+            mailbox=settings.imap_inbox_folder,
+            idle_enabled=settings.imap_idle_enabled,
+            idle_timeout=settings.imap_idle_timeout_seconds,
+            max_concurrent_messages=settings.imap_max_concurrent_messages,
+            reconnect_max_backoff=settings.imap_reconnect_max_backoff_seconds
         )
 
         await monitor.start()
@@ -622,6 +633,17 @@ async def schedule_garbage_collection(scheduler):
     logger.info("garbage_collection_scheduled", interval_minutes=30)
 
 
+async def image_store_maintenance():
+    """Migrate legacy flat image files and apply the image store eviction policy."""
+    try:
+        from utils.image_store import get_image_store
+
+        result = await asyncio.to_thread(get_image_store().maintenance)
+        logger.info("image_store_maintenance_completed", **result)
+    except Exception as e:
+        logger.error("image_store_maintenance_error", error=str(e))
+
+
 async def main():
     """Main scheduler entry point."""
     logger.info("scheduler_starting")
@@ -682,6 +704,18 @@ async def main():
         )
         logger.info("process_scheduled_publications_scheduled", interval_minutes=2)
 
+        # Image store legacy import + eviction
+        scheduler.add_job(
+            image_store_maintenance,
+            trigger=IntervalTrigger(minutes=settings.image_store_maintenance_interval_minutes),
+            id="image_store_maintenance",
+            replace_existing=True,
+            max_instances=1
+        )
+        logger.info("image_store_maintenance_scheduled",
+            interval_minutes=settings.image_store_maintenance_interval_minutes
+        )
+
         # Create tasks for monitors
         monitor_tasks = []
 
@@ -709,6 +743,13 @@ async def main():
         logger.error("scheduler_error", error=str(e))
         scheduler.shutdown()
         raise
+    finally:
+        await close_usage_tracker()
+        await close_publisher_sessions()
+        await close_http_sessions()
+        await close_browser_pool()
+        shutdown_cpu_pool()
+        shutdown_transcription_services()
 
 
 if __name__ == "__main__":
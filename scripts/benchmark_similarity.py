@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: pure-Python cosine loop vs NumPy EmbeddingMatrix.
+
+Compares the old find_similar_embeddings implementation (generator
+expressions over 768 floats, one candidate at a time) with
+utils.vector_similarity for 1k / 10k / 100k random candidates.
+
+Usage:
+    python scripts/benchmark_similarity.py
+    python scripts/benchmark_similarity.py --sizes 1000 10000 --skip-python-above 10000
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from utils.vector_similarity import EmbeddingMatrix
+
+DIM = 768
+
+
+def python_cosine(a: List[float], b: List[float]) -> float:
+    """Reference implementation (previous embedding_generator.cosine_similarity)."""
+    dot_product = sum(x * y for x, y in zip(a, b))
+    magnitude1 = math.sqrt(sum(x * x for x in a))
+    magnitude2 = math.sqrt(sum(y * y for y in b))
+    if magnitude1 == 0 or magnitude2 == 0:
+        return 0.0
+    return dot_product / (magnitude1 * magnitude2)
+
+
+def python_find_similar(query: List[float], candidates: List[List[float]], threshold: float) -> List[int]:
+    return [i for i, c in enumerate(candidates) if python_cosine(query, c) >= threshold]
+
+
+def bench(n: int, run_python: bool, threshold: float) -> None:
+    rng = np.random.default_rng(42)
+    candidates_np = rng.standard_normal((n, DIM), dtype=np.float32)
+    query_np = candidates_np[random.randrange(n)] + rng.normal(0, 0.05, DIM).astype(np.float32)
+
+    candidates = candidates_np.tolist()
+    query = query_np.tolist()
+
+    start = time.perf_counter()
+    matrix = EmbeddingMatrix(candidates)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    numpy_matches = matrix.above_threshold(query, threshold)
+    numpy_s = time.perf_counter() - start
+
+    line = (
+        f"{n:>7} candidates | numpy build {build_s * 1000:8.2f} ms"
+        f" | numpy query {numpy_s * 1000:8.3f} ms"
+    )
+
+    if run_python:
+        start = time.perf_counter()
+        python_matches = python_find_similar(query, candidates, threshold)
+        python_s = time.perf_counter() - start
+        assert python_matches == numpy_matches, "result mismatch"
+        line += (
+            f" | python {python_s * 1000:10.2f} ms"
+            f" | speedup x{python_s / numpy_s:,.0f} (query)"
+            f" x{python_s / (build_s + numpy_s):,.1f} (build+query)"
+        )
+    else:
+        line += " | python skipped"
+
+    print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--threshold", type=float, default=0.95)
+    parser.add_argument("--skip-python-above", type=int, default=100000,
+                        help="Skip the slow pure-Python baseline above this size")
+    args = parser.parse_args()
+
+    print(f"Cosine similarity benchmark ({DIM}d, threshold={args.threshold})")
+    for n in args.sizes:
+        bench(n, run_python=n <= args.skip_python_above, threshold=args.threshold)
+
+
+if __name__ == "__main__":
+    main()
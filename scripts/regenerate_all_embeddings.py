@@ -1,12 +1,29 @@
 #!/usr/bin/env python3
-"""Regenerate embeddings for all context units without embeddings."""
+"""Regenerate embeddings for all context units without embeddings.
+
+Uses the shared embedding generator, so repeated title+summary texts are
+served from the embedding cache and misses are embedded in one batched
+FastEmbed call per batch.
+"""
 
 import asyncio
 import os
+import sys
+from pathlib import Path
 from typing import List, Dict
-from fastembed import TextEmbedding
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Load environment variables from .env
+from dotenv import load_dotenv
+load_dotenv()
+
 from supabase import create_client, Client
 
+from utils.embedding_generator import generate_embeddings_batch
+from utils.embedding_cache import get_embedding_cache_stats
+
 # Supabase config
 SUPABASE_URL = os.getenv("SUPABASE_URL", "https://isqvgddijyweardygoah.supabase.co")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_KEY")  # Need service key for updates
@@ -17,12 +34,9 @@ if not SUPABASE_KEY:
 
 # Initialize clients
 supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-model = TextEmbedding(
-    model_name="sentence-transformers/paraphrase-multilingual-mpnet-base-v2"
-)
 
 print(f"✓ Supabase connected: {SUPABASE_URL}")
-print(f"✓ FastEmbed model loaded: paraphrase-multilingual-mpnet-base-v2 (768d)\n")
+print(f"✓ Using shared FastEmbed generator: paraphrase-multilingual-mpnet-base-v2 (768d)\n")
 
 
 async def fetch_units_without_embeddings(limit: int = 1000) -> List[Dict]:
@@ -36,16 +50,6 @@ async def fetch_units_without_embeddings(limit: int = 1000) -> List[Dict]:
     return result.data
 
 
-async def generate_embedding(text: str) -> List[float]:
-    """Generate 768d embedding for text."""
-    loop = asyncio.get_event_loop()
-    embeddings = await loop.run_in_executor(
-        None,
-        lambda: list(model.embed([text[:512]]))
-    )
-    return embeddings[0].tolist()
-
-
 async def update_embedding(unit_id: str, embedding: List[float]):
     """Update context unit with embedding."""
     embedding_str = '[' + ','.join(str(x) for x in embedding) + ']'
@@ -62,18 +66,23 @@ async def process_batch(units: List[Dict], batch_num: int, total_batches: int):
     print(f"Batch {batch_num}/{total_batches} ({len(units)} units)")
     print(f"{'='*60}")
 
-    for i, unit in enumerate(units, 1):
+    # Same title | summary text as generate_embedding (cache-compatible)
+    embeddings = await generate_embeddings_batch([
+        {"title": unit.get('title') or '', "summary": unit.get('summary')}
+        for unit in units
+    ])
+
+    for i, (unit, embedding) in enumerate(zip(units, embeddings), 1):
         unit_id = unit['id']
-        title = unit.get('title', '')
-        summary = unit.get('summary', '')
-        text = f"{title} | {summary}"
+        title = unit.get('title') or ''
 
         print(f"[{i}/{len(units)}] {title[:50]}...")
 
-        try:
-            # Generate embedding
-            embedding = await generate_embedding(text)
+        if not any(embedding):
+            print(f"  ✗ Failed: embedding generation error")
+            continue
 
+        try:
             # Update database
             await update_embedding(unit_id, embedding)
 
@@ -102,8 +111,11 @@ async def main():
         batch_num = (i // batch_size) + 1
         await process_batch(batch, batch_num, total_batches)
 
+    stats = get_embedding_cache_stats()
+
     print(f"\n{'='*60}")
     print(f"✓ COMPLETED: Regenerated {len(units)} embeddings")
+    print(f"  Cache: {stats['memory_hits'] + stats['disk_hits']} hits, {stats['misses']} misses")
     print(f"{'='*60}\n")
 
 
@@ -172,6 +172,19 @@ async def shutdown_event():
     """Run on application shutdown."""
     logger.info("server_stopping")
 
+    from utils.http_client import close_http_sessions
+    from utils.browser_pool import close_browser_pool
+    from utils.cpu_pool import shutdown_cpu_pool
+    from utils.usage_tracker import close_usage_tracker
+    from utils.tts_service import close_tts_service
+    from publishers.publisher_http import close_publisher_sessions
+    await close_usage_tracker()
+    await close_tts_service()
+    await close_publisher_sessions()
+    await close_http_sessions()
+    await close_browser_pool()
+    shutdown_cpu_pool()
+
 
 @app.get("/health")
 async def health_check() -> Dict[str, Any]:
@@ -179,11 +192,20 @@ async def health_check() -> Dict[str, Any]:
     Health check endpoint with memory stats.
 
     Returns:
-        Status, timestamp, and memory usage
+        Status, timestamp, memory usage and cache hit rates
     """
     import gc
     import psutil
     import os
+    from utils.embedding_cache import get_embedding_cache_stats
+    from utils.llm_cache import get_llm_cache_stats
+    from utils.config_cache import get_config_cache_stats
+    from utils.auth_cache import get_auth_cache_stats
+    from utils.derivative_cache import get_derivative_cache_stats
+    from utils.image_store import get_image_store_stats
+    from utils.duplicate_index import get_duplicate_index
+    from utils.crawl_scheduler import get_crawl_scheduler
+    from publishers.publisher_http import get_publisher_http_stats
     
     # Force garbage collection to free memory
     gc.collect()
@@ -191,6 +213,7 @@ async def health_check() -> Dict[str, Any]:
     # Get memory stats
     process = psutil.Process(os.getpid())
     memory_info = process.memory_info()
+    duplicate_index = get_duplicate_index()
     
     return {
         "status": "ok",
@@ -200,7 +223,19 @@ async def health_check() -> Dict[str, Any]:
         "memory": {
             "rss_mb": round(memory_info.rss / 1024 / 1024, 2),
             "vms_mb": round(memory_info.vms / 1024 / 1024, 2)
-        }
+        },
+        "caches": {
+            "embeddings": get_embedding_cache_stats(),
+            "llm": get_llm_cache_stats(),
+            "config": get_config_cache_stats(),
+            "auth": get_auth_cache_stats(),
+            "image_derivatives": get_derivative_cache_stats(),
+            "image_store": get_image_store_stats(),
+            "duplicate_index": duplicate_index.stats() if duplicate_index else None
+        },
+        "crawl_scheduler": get_crawl_scheduler().stats(),
+        "usage_tracker": get_usage_tracker().stats(),
+        "publishers": get_publisher_http_stats()
     }
 
 
@@ -1,15 +1,18 @@
 """Audio transcription with Whisper for semantika.
 
 Transcribes audio files to text using OpenAI Whisper.
+
+Async callers go through the transcription service (utils/transcription_service):
+Whisper runs in worker processes that keep the model loaded, so the event loop
+is never blocked. The synchronous methods load a local model on first use.
 """
 
 import os
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 import tempfile
 
-import whisper
-
 from utils.logger import get_logger
+from utils.transcription_service import get_transcription_service
 
 logger = get_logger("audio_transcriber")
 
@@ -19,20 +22,46 @@ class AudioTranscriber:
 
     def __init__(self, model_name: str = "base"):
         """
-        Initialize audio transcriber.
+        Initialize audio transcriber (no model is loaded here).
 
         Args:
             model_name: Whisper model size (tiny, base, small, medium, large)
         """
-        try:
-            import os
-            logger.info("loading_whisper_model", model=model_name)
-            download_root = os.getenv("WHISPER_CACHE_DIR", None)
-            self.model = whisper.load_model(model_name, download_root=download_root)
-            logger.info("whisper_model_loaded", model=model_name)
-        except Exception as e:
-            logger.error("whisper_model_load_failed", error=str(e))
-            raise
+        self.model_name = model_name
+        self._model = None
+
+    @property
+    def model(self):
+        """Local Whisper model for the synchronous methods (loaded on first use)."""
+        if self._model is None:
+            try:
+                import whisper
+
+                logger.info("loading_whisper_model", model=self.model_name)
+                download_root = os.getenv("WHISPER_CACHE_DIR", None)
+                self._model = whisper.load_model(self.model_name, download_root=download_root)
+                logger.info("whisper_model_loaded", model=self.model_name)
+            except Exception as e:
+                logger.error("whisper_model_load_failed", error=str(e))
+                raise
+        return self._model
+
+    async def transcribe_file_async(
+        self,
+        file_path: str,
+        language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Transcribe audio file in the transcription worker pool.
+
+        Args:
+            file_path: Path to audio file
+            language: Language code (e.g., 'es', 'en') or None for auto-detect
+
+        Returns:
+            Dict with transcription, detected language and duration (seconds)
+        """
+        return await get_transcription_service(self.model_name).transcribe(file_path, language=language)
 
     def transcribe_file(
         self,
@@ -141,7 +170,7 @@ class AudioTranscriber:
 
         try:
             # Transcribe
-            transcription = self.transcribe_file(file_path, language=language)
+            transcription = await self.transcribe_file_async(file_path, language=language)
 
             # Ingest
             pipeline = IngestPipeline(client_id=client_id)
@@ -11,6 +11,8 @@ from bs4 import BeautifulSoup
 
 from utils.logger import get_logger
 from utils.llm_client import get_llm_client
+from utils.http_client import get_http_session
+from utils.crawl_scheduler import get_crawl_scheduler
 
 logger = get_logger("discovery_connector")
 
@@ -47,24 +49,27 @@ class DiscoveryConnector:
         try:
             headers = {"User-Agent": self.user_agent}
             
-            async with aiohttp.ClientSession() as session:
+            session = await get_http_session()
+            crawl_scheduler = get_crawl_scheduler()
+            async with crawl_scheduler.slot(url):
                 async with session.get(
                     url,
                     headers=headers,
                     timeout=aiohttp.ClientTimeout(total=30),
                     allow_redirects=True
                 ) as response:
-                    
+                    crawl_scheduler.report(url, response.status, response.headers.get("Retry-After"))
+
                     if response.status != 200:
                         logger.warn("fetch_failed",
                             url=url,
                             status=response.status
                         )
                         return None
-                    
+
                     content = await response.text()
                     return content
-        
+    
         except Exception as e:
             logger.error("fetch_error", url=url, error=str(e))
             return None
@@ -17,8 +17,12 @@ from uuid import uuid4
 import asyncio
 import aiohttp
 
+from utils.config import settings
 from utils.logger import get_logger
 from utils.supabase_client import get_supabase_client
+from utils.http_client import get_http_session
+from utils.crawl_scheduler import get_crawl_scheduler
+from utils.cpu_pool import run_cpu
 from utils.llm_client import get_llm_client
 from utils.content_hasher import (
     normalize_html,
@@ -32,12 +36,13 @@ logger = get_logger("event_ingest")
 SIMHASH_SKIP_THRESHOLD = 0.95
 
 
-async def fetch_html(url: str, timeout: int = 30) -> Optional[str]:
-    """Fetch HTML content from URL.
+async def fetch_html(url: str, timeout: int = 30, company_id: Optional[str] = None) -> Optional[str]:
+    """Fetch HTML content from URL (inside a crawl scheduler slot).
 
     Args:
         url: URL to fetch
         timeout: Request timeout in seconds
+        company_id: Company UUID (fair scheduling across companies)
 
     Returns:
         HTML content or None if failed
@@ -50,8 +55,11 @@ async def fetch_html(url: str, timeout: int = 30) -> Optional[str]:
 
     try:
         timeout_config = aiohttp.ClientTimeout(total=timeout)
-        async with aiohttp.ClientSession(timeout=timeout_config) as session:
-            async with session.get(url, headers=headers) as response:
+        session = await get_http_session()
+        crawl_scheduler = get_crawl_scheduler()
+        async with crawl_scheduler.slot(url, company_id=company_id):
+            async with session.get(url, headers=headers, timeout=timeout_config) as response:
+                crawl_scheduler.report(url, response.status, response.headers.get("Retry-After"))
                 if response.status == 200:
                     html = await response.text()
                     logger.info("html_fetched", url=url, size=len(html))
@@ -441,15 +449,18 @@ async def process_single_source(
 
     try:
         # Step 1: Fetch HTML
-        html = await fetch_html(url)
+        html = await fetch_html(url, company_id=source.get('company_id'))
         if not html:
             result['error'] = 'fetch_failed'
             await update_source_hashes(supabase, source_id, '', 0, False, 0, 'fetch_failed')
             return result
 
         # Step 2: Check for meaningful changes
-        has_changed, new_hash, new_simhash, similarity = check_content_changed(
-            html, old_hash, old_simhash
+        # Normalization + SimHash are CPU-bound: run in the CPU pool
+        has_changed, new_hash, new_simhash, similarity = await run_cpu(
+            check_content_changed,
+            html, old_hash, old_simhash,
+            size_hint=len(html)
         )
 
         if not has_changed:
@@ -470,7 +481,7 @@ async def process_single_source(
             reason='content_changed'
         )
 
-        html_cleaned = clean_html_for_llm(html)
+        html_cleaned = await run_cpu(clean_html_for_llm, html, size_hint=len(html))
         events = await extract_events_from_html(html_cleaned, url, llm_client)
 
         # Add source metadata to events
@@ -516,7 +527,7 @@ async def ingest_events_for_area(
 
     Optimized flow:
     1. Load active sources
-    2. Process each source (with change detection)
+    2. Process sources concurrently (with change detection)
     3. For dates with new events:
        - No existing → save directly
        - Has existing → LLM merge
@@ -563,11 +574,18 @@ async def ingest_events_for_area(
 
     logger.info("event_sources_loaded", count=len(sources))
 
-    # Process each source
-    sources_results = []
-    for source in sources:
-        result = await process_single_source(source, supabase, llm_client)
-        sources_results.append(result)
+    # Process sources concurrently. The crawl scheduler only limits fetches;
+    # the semaphore also bounds the LLM extractions running for this area
+    semaphore = asyncio.Semaphore(max(1, settings.event_ingest_source_concurrency))
+
+    async def process_bounded(source: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await process_single_source(source, supabase, llm_client)
+
+    sources_results = await asyncio.gather(
+        *[process_bounded(source) for source in sources],
+        return_exceptions=True
+    )
 
     # Aggregate events by date across all sources
     all_events_by_date: Dict[str, List[Dict[str, Any]]] = {}
@@ -576,8 +594,15 @@ async def ingest_events_for_area(
     sources_success = 0
     total_events_extracted = 0
 
-    for result in sources_results:
-        if result['error']:
+    for source, result in zip(sources, sources_results):
+        if isinstance(result, BaseException):
+            sources_failed += 1
+            logger.error("source_processing_crashed",
+                source_id=source.get('id'),
+                source_name=source.get('source_name'),
+                error=str(result)
+            )
+        elif result['error']:
             sources_failed += 1
         elif result['skipped']:
             sources_skipped += 1
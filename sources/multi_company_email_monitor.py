@@ -9,7 +9,6 @@ Example routing:
 - p.demo@ekimen.ai → Demo company
 """
 
-import imaplib
 import email
 from email.header import decode_header
 from email.message import Message
@@ -22,11 +21,13 @@ from datetime import datetime
 from pathlib import Path
 
 from utils.logger import get_logger
-from utils.supabase_client import get_supabase_client
+from utils.supabase_client import execute_async, get_supabase_client
 from utils.unified_context_verifier import verify_novelty
 from utils.unified_context_ingester import ingest_context_unit
 from utils.source_metadata_schema import normalize_source_metadata
 from utils.email_image_processor import EmailImageProcessor
+from utils.image_store import get_image_store
+from utils.imap_session import ImapSession
 from .audio_transcriber import AudioTranscriber
 
 logger = get_logger("multi_company_email_monitor")
@@ -46,7 +47,11 @@ class MultiCompanyEmailMonitor:
         email_address: str,
         password: str,
         check_interval: int = 60,
-        mailbox: str = "INBOX"
+        mailbox: str = "INBOX",
+        idle_enabled: bool = True,
+        idle_timeout: int = 300,
+        max_concurrent_messages: int = 4,
+        reconnect_max_backoff: int = 300
     ):
         """
         Initialize multi-company email monitor.
@@ -56,8 +61,12 @@ class MultiCompanyEmailMonitor:
             imap_port: IMAP server port (usually 993 for SSL)
             email_address: Main email address (e.g., contact@ekimen.ai)
             password: Email password or app password
-            check_interval: Check interval in seconds
+            check_interval: Check interval in seconds (polling fallback without IDLE)
             mailbox: Mailbox to monitor (default: INBOX)
+            idle_enabled: Wait for new mail with IMAP IDLE instead of polling
+            idle_timeout: Max seconds per IDLE before re-checking the inbox
+            max_concurrent_messages: Emails processed in parallel
+            reconnect_max_backoff: Max seconds between reconnect attempts
         """
         self.imap_server = imap_server
         self.imap_port = imap_port
@@ -65,6 +74,13 @@ class MultiCompanyEmailMonitor:
         self.password = password
         self.check_interval = check_interval
         self.mailbox = mailbox
+        self.idle_enabled = idle_enabled
+        self.idle_timeout = idle_timeout
+        self.max_concurrent_messages = max(1, max_concurrent_messages)
+        self.reconnect_max_backoff = reconnect_max_backoff
+
+        # Persistent connection (IMAP commands run on its own thread)
+        self.session = ImapSession(imap_server, imap_port, email_address, password, mailbox=mailbox)
 
         # Initialize audio transcriber
         self.transcriber = AudioTranscriber(model_name="base")
@@ -76,28 +92,11 @@ class MultiCompanyEmailMonitor:
             "multi_company_email_monitor_initialized",
             server=imap_server,
             email=email_address,
-            check_interval=check_interval
+            check_interval=check_interval,
+            idle_enabled=idle_enabled,
+            max_concurrent_messages=self.max_concurrent_messages
         )
 
-    def _connect(self) -> imaplib.IMAP4_SSL:
-        """
-        Connect to IMAP server.
-
-        Returns:
-            IMAP connection
-        """
-        try:
-            mail = imaplib.IMAP4_SSL(self.imap_server, self.imap_port)
-            mail.login(self.email_address, self.password)
-            mail.select(self.mailbox)
-
-            logger.debug("imap_connected", server=self.imap_server)
-            return mail
-
-        except Exception as e:
-            logger.error("imap_connection_failed", error=str(e))
-            raise
-
     def _decode_filename(self, filename: str) -> str:
         """
         Decode MIME-encoded filename.
@@ -186,26 +185,20 @@ class MultiCompanyEmailMonitor:
                 return None
             
             # Get company
-            company_result = supabase.client.table("companies")\
-                .select("*")\
-                .eq("id", source["company_id"])\
-                .eq("is_active", True)\
-                .maybe_single()\
-                .execute()
-            
-            if not company_result.data:
+            company = await supabase.get_company_by_id(source["company_id"])
+            
+            if not company:
                 logger.warn("company_not_found", company_id=source["company_id"])
                 return None
             
-            company = company_result.data
-            
             # Get first active organization for this company
-            org_result = supabase.client.table("organizations")\
-                .select("*")\
-                .eq("company_id", company["id"])\
-                .eq("is_active", True)\
-                .limit(1)\
-                .execute()
+            org_result = await execute_async(
+                supabase.client.table("organizations")
+                .select("*")
+                .eq("company_id", company["id"])
+                .eq("is_active", True)
+                .limit(1)
+            )
             
             if not org_result.data:
                 logger.warn("no_organization_for_company", company_id=company["id"])
@@ -320,7 +313,7 @@ class MultiCompanyEmailMonitor:
                 }
                 
                 # Insert into press_context_units
-                db_result = supabase.client.table("press_context_units").insert(context_unit_data).execute()
+                db_result = await execute_async(supabase.client.table("press_context_units").insert(context_unit_data))
                 
                 logger.info(
                     "context_unit_saved_to_db",
@@ -432,13 +425,11 @@ class MultiCompanyEmailMonitor:
             )
 
             # Save to temporary file for transcription
-            with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1]) as tmp_file:
-                tmp_file.write(content)
-                tmp_path = tmp_file.name
+            tmp_path = await asyncio.to_thread(self._write_temp_file, content, os.path.splitext(filename)[1])
 
             try:
-                # Transcribe audio
-                transcription_result = self.transcriber.transcribe_file(tmp_path)
+                # Transcribe audio (worker process, loop stays free)
+                transcription_result = await self.transcriber.transcribe_file_async(tmp_path)
                 
                 if not transcription_result.get("text"):
                     logger.warn("empty_transcription", filename=filename)
@@ -492,7 +483,7 @@ class MultiCompanyEmailMonitor:
                     }
                     
                     # Insert into press_context_units
-                    db_result = supabase.client.table("press_context_units").insert(context_unit_data).execute()
+                    db_result = await execute_async(supabase.client.table("press_context_units").insert(context_unit_data))
                     
                     logger.info(
                         "audio_context_unit_saved_to_db",
@@ -701,9 +692,9 @@ class MultiCompanyEmailMonitor:
                     updated_metadata = metadata.copy()
                     updated_metadata["featured_image"] = featured_image
                     
-                    supabase.client.table("press_context_units").update({
+                    await execute_async(supabase.client.table("press_context_units").update({
                         "source_metadata": updated_metadata
-                    }).eq("id", final_context_id).execute()
+                    }).eq("id", final_context_id))
                     
                     logger.info("email_image_metadata_updated",
                         context_unit_id=final_context_id,
@@ -786,54 +777,43 @@ class MultiCompanyEmailMonitor:
         cached_images: List[Dict], 
         real_context_id: str
     ):
-        """Rename cached images with real context unit ID to unified cache format."""
+        """Re-key cached images with real context unit ID in the image store."""
         try:
-            # Unified cache directory path
-            unified_cache_dir = Path("/app/cache/images")
-            
+            store = get_image_store()
+
             for i, img in enumerate(cached_images):
-                old_path = Path(img["cache_path"])
-                if old_path.exists():
-                    # New filename: just UUID with extension (unified format)
-                    ext = old_path.suffix
-                    if i == 0:
-                        # First image gets just the UUID
-                        new_filename = f"{real_context_id}{ext}"
-                    else:
-                        # Additional images get _2, _3, etc.
-                        new_filename = f"{real_context_id}_{i+1}{ext}"
-                    
-                    new_path = unified_cache_dir / new_filename
-                    
-                    # Move file to unified cache directory
-                    old_path.rename(new_path)
-                    
-                    # Update metadata with unified path
+                old_key = Path(img["cache_path"]).stem
+                # First image gets just the UUID, additional images get _2, _3, etc.
+                new_key = real_context_id if i == 0 else f"{real_context_id}_{i+1}"
+
+                new_path = await asyncio.to_thread(store.rename, old_key, new_key)
+                if new_path:
+                    # Update metadata with store path
                     img["cache_path"] = str(new_path)
                     
             logger.info("cached_images_renamed_to_unified", 
                 context_unit_id=real_context_id,
-                count=len(cached_images),
-                cache_dir="/app/cache/images"
+                count=len(cached_images)
             )
             
         except Exception as e:
             logger.error("image_rename_error", error=str(e))
 
 
-    async def _process_email(self, mail: imaplib.IMAP4_SSL, email_id: bytes):
+    async def _process_email(self, email_body: bytes, email_id: bytes) -> bool:
         """
         Process a single email with multi-company routing.
 
         Args:
-            mail: IMAP connection
+            email_body: Raw RFC822 message
             email_id: Email ID
+
+        Returns:
+            True if the email should be marked as read
         """
         try:
-            # Fetch email
-            _, msg_data = mail.fetch(email_id, "(RFC822)")
-            email_body = msg_data[0][1]
-            message = email.message_from_bytes(email_body)
+            # MIME parsing/base64 decoding of large attachments stays off the loop
+            message = await asyncio.to_thread(email.message_from_bytes, email_body)
 
             # Get headers
             subject = self._decode_subject(message.get("Subject", "No Subject"))
@@ -857,8 +837,7 @@ class MultiCompanyEmailMonitor:
                     message="Email routing not configured for this address"
                 )
                 # Mark as read and skip
-                mail.store(email_id, "+FLAGS", "\\Seen")
-                return
+                return True
 
             company, organization, source = routing_result
 
@@ -919,13 +898,11 @@ class MultiCompanyEmailMonitor:
                         text_attachments.append(f"Archivo adjunto '{decoded_filename}':\n{text_content}")
                         
                     elif extension in self.AUDIO_EXTENSIONS:
-                        # Transcribe audio
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=extension) as tmp_file:
-                            tmp_file.write(content)
-                            tmp_path = tmp_file.name
+                        # Transcribe audio (file write off the loop, Whisper in a worker process)
+                        tmp_path = await asyncio.to_thread(self._write_temp_file, content, extension)
                         
                         try:
-                            transcription_result = self.transcriber.transcribe_file(tmp_path)
+                            transcription_result = await self.transcriber.transcribe_file_async(tmp_path)
                             if transcription_result.get("text"):
                                 audio_transcriptions.append(f"Transcripción del audio '{decoded_filename}':\n{transcription_result['text']}")
                         except Exception as e:
@@ -968,49 +945,93 @@ class MultiCompanyEmailMonitor:
                     raw_message=message
                 )
 
-            # Mark as read
-            mail.store(email_id, "+FLAGS", "\\Seen")
-
             logger.info("email_processed_multi_company", 
                 subject=subject,
                 company_code=company["company_code"]
             )
 
+            # Mark as read
+            return True
+
         except Exception as e:
             logger.error("email_processing_error_multi_company", 
                 error=str(e),
                 subject=subject if 'subject' in locals() else "unknown"
             )
+            return False
+
+    @staticmethod
+    def _write_temp_file(content: bytes, suffix: str) -> str:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+            tmp_file.write(content)
+            return tmp_file.name
+
+    async def _handle_email(self, email_id: bytes, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            try:
+                email_body = await self.session.fetch(email_id)
+                if email_body is None:
+                    logger.warn("email_fetch_empty", email_id=email_id.decode(errors="ignore"))
+                    return
+
+                if await self._process_email(email_body, email_id):
+                    await self.session.mark_seen(email_id)
+
+            except Exception as e:
+                logger.error("email_handling_error_multi_company",
+                    email_id=email_id.decode(errors="ignore"),
+                    error=str(e)
+                )
 
     async def check_inbox(self):
-        """Check inbox for new unread emails."""
-        try:
-            mail = self._connect()
+        """Check inbox for unread emails and process them concurrently.
 
-            # Search for unread emails
-            _, search_data = mail.search(None, "UNSEEN")
-            email_ids = search_data[0].split()
+        IMAP errors propagate so start() can reconnect with backoff.
+        """
+        email_ids = await self.session.search_unseen()
 
-            logger.info("inbox_checked_multi_company", unread_count=len(email_ids))
+        logger.info("inbox_checked_multi_company", unread_count=len(email_ids))
 
-            # Process each email
-            for email_id in email_ids:
-                await self._process_email(mail, email_id)
+        if not email_ids:
+            return
 
-            # Logout
-            mail.logout()
+        # IMAP commands are serialized on the session thread; routing, LLM
+        # enrichment, transcription and ingestion overlap across emails
+        semaphore = asyncio.Semaphore(self.max_concurrent_messages)
+        await asyncio.gather(*[self._handle_email(email_id, semaphore) for email_id in email_ids])
 
-        except Exception as e:
-            logger.error("inbox_check_error_multi_company", error=str(e))
+    async def _wait_for_mail(self) -> None:
+        """Block until new mail is likely (IDLE push, or the poll interval)."""
+        if self.idle_enabled:
+            new_mail = await self.session.idle(self.idle_timeout)
+            if new_mail is not None:
+                logger.debug("imap_idle_returned", new_mail=new_mail)
+                return
+            logger.warn("imap_idle_unsupported", server=self.imap_server)
+            self.idle_enabled = False
+
+        await asyncio.sleep(self.check_interval)
 
     async def start(self):
         """Start monitoring email inbox for multiple companies."""
-        logger.info("multi_company_email_monitor_started", email=self.email_address)
+        logger.info("multi_company_email_monitor_started",
+            email=self.email_address,
+            idle_enabled=self.idle_enabled
+        )
 
-        while True:
-            try:
-                await self.check_inbox()
-                await asyncio.sleep(self.check_interval)
-            except Exception as e:
-                logger.error("monitor_loop_error_multi_company", error=str(e))
-                await asyncio.sleep(self.check_interval)
\ No newline at end of file
+        backoff = 0
+        try:
+            while True:
+                try:
+                    await self.check_inbox()
+                    await self._wait_for_mail()
+                    backoff = 0
+                except Exception as e:
+                    backoff = min(max(5, backoff * 2), self.reconnect_max_backoff)
+                    logger.error("monitor_loop_error_multi_company",
+                        error=str(e),
+                        retry_in_seconds=backoff
+                    )
+                    await asyncio.sleep(backoff)
+        finally:
+            await self.session.close()
@@ -1,7 +1,8 @@
 """LangGraph workflow for intelligent web scraping with change detection.
 
 Workflow nodes:
-1. fetch_url - Download HTML content
+0. load_monitored_url - Load previous monitored_urls row (hashes, HTTP validators)
+1. fetch_url - Download HTML content (conditional GET; 304 → mark_not_modified → END)
 2. parse_content - Extract title, summary, text
 3. detect_changes - Multi-tier change detection
 4. extract_date - Multi-source date extraction
@@ -16,32 +17,34 @@ Supports:
 - Multi-noticia detection (one URL, multiple news items)
 """
 
-from typing import Dict, Any, List, Optional, TypedDict
+from typing import Callable, Dict, Any, List, Optional, TypedDict
 from datetime import datetime
 import asyncio
 import os
 
 from langgraph.graph import StateGraph, END
-from bs4 import BeautifulSoup
 import aiohttp
 
 from utils.logger import get_logger
+from utils.config import settings
 
 # Scraper engine configuration
 # Values: 'aiohttp' (default) or 'playwright'
 SCRAPER_ENGINE = os.getenv("SCRAPER_ENGINE", "aiohttp").lower()
 
-# Playwright browser instance (lazy loaded, reused across requests)
-_playwright_instance = None
-_browser_instance = None
 from utils.content_hasher import compute_content_hashes, normalize_html
+from utils.parsed_document import ParsedDocument, build_document, make_soup
+from utils.cpu_pool import run_cpu
 from utils.change_detector import get_change_detector
 from utils.date_extractor import extract_publication_date
 from utils.embedding_generator import generate_embedding
 from utils.context_unit_saver import save_from_scraping
-from utils.supabase_client import get_supabase_client
+from utils.supabase_client import get_supabase_client, execute_async
+from utils.http_client import get_http_session
+from utils.image_store import get_image_store
+from utils.crawl_scheduler import get_crawl_scheduler
+from utils.browser_pool import get_browser_pool
 from utils.llm_client import get_llm_client
-from utils.image_extractor import extract_featured_image
 from utils.geocoder import geocode_with_context
 
 logger = get_logger("scraper_workflow")
@@ -55,15 +58,10 @@ async def auto_cache_featured_image(context_unit_id: str, featured_image: Dict[s
         featured_image: Featured image metadata dict
     """
     try:
-        from pathlib import Path
-        
         image_url = featured_image.get("url")
         if not image_url:
             return
         
-        cache_dir = Path("/app/cache/images")
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        
         # Download and cache with ordinal suffix format
         timeout = aiohttp.ClientTimeout(total=10)  # Quick timeout for background caching
         headers = {
@@ -72,39 +70,41 @@ async def auto_cache_featured_image(context_unit_id: str, featured_image: Dict[s
             'Accept-Language': 'en-US,en;q=0.5'
         }
         
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(image_url, headers=headers) as response:
-                if response.status == 200:
-                    image_bytes = await response.read()
-                    content_type = response.headers.get("Content-Type", "image/jpeg")
-                    
-                    # Determine extension
-                    ext_map = {
-                        "image/jpeg": ".jpg",
-                        "image/png": ".png", 
-                        "image/webp": ".webp",
-                        "image/gif": ".gif",
-                        "image/bmp": ".bmp"
-                    }
-                    ext = ext_map.get(content_type, ".jpg")
-                    
-                    # Cache with ordinal suffix (always _0 for featured images)
-                    cache_file = cache_dir / f"{context_unit_id}_0{ext}"
-                    cache_file.write_bytes(image_bytes)
-                    
-                    logger.info("featured_image_auto_cached",
-                        context_unit_id=context_unit_id,
-                        image_url=image_url,
-                        size_bytes=len(image_bytes),
-                        cache_path=str(cache_file),
-                        extraction_source=featured_image.get("source", "unknown")
-                    )
-                else:
-                    logger.warn("featured_image_auto_cache_failed",
-                        context_unit_id=context_unit_id,
-                        image_url=image_url,
-                        status=response.status
-                    )
+        session = await get_http_session()
+        async with session.get(image_url, headers=headers, timeout=timeout) as response:
+            if response.status == 200:
+                image_bytes = await response.read()
+                content_type = response.headers.get("Content-Type", "image/jpeg")
+                
+                # Determine extension
+                ext_map = {
+                    "image/jpeg": ".jpg",
+                    "image/png": ".png", 
+                    "image/webp": ".webp",
+                    "image/gif": ".gif",
+                    "image/bmp": ".bmp"
+                }
+                ext = ext_map.get(content_type, ".jpg")
+                
+                # Cache with ordinal suffix (always _0 for featured images).
+                # Evictable: it can be downloaded again from image_url
+                cache_file = await asyncio.to_thread(
+                    get_image_store().put, f"{context_unit_id}_0", image_bytes, ext, True
+                )
+                
+                logger.info("featured_image_auto_cached",
+                    context_unit_id=context_unit_id,
+                    image_url=image_url,
+                    size_bytes=len(image_bytes),
+                    cache_path=str(cache_file),
+                    extraction_source=featured_image.get("source", "unknown")
+                )
+            else:
+                logger.warn("featured_image_auto_cache_failed",
+                    context_unit_id=context_unit_id,
+                    image_url=image_url,
+                    status=response.status
+                )
     except Exception as e:
         logger.warn("featured_image_auto_cache_error",
             context_unit_id=context_unit_id,
@@ -125,8 +125,12 @@ class ScraperState(TypedDict):
     # Fetch stage
     html: Optional[str]
     fetch_error: Optional[str]
+    not_modified: bool  # Server answered 304 to our conditional GET
+    http_etag: Optional[str]
+    http_last_modified: Optional[str]
     
     # Parse stage
+    document: Optional[ParsedDocument]  # Parsed once, shared by all nodes
     title: Optional[str]
     summary: Optional[str]
     content_items: List[Dict[str, Any]]  # For multi-noticia
@@ -134,6 +138,7 @@ class ScraperState(TypedDict):
     
     # Change detection stage
     old_monitored_url: Optional[Dict[str, Any]]
+    monitored_url_load_failed: bool  # Unknown whether the URL is new: skip the run
     change_info: Optional[Dict[str, Any]]
     should_process: bool
     
@@ -153,105 +158,166 @@ class ScraperState(TypedDict):
     error: Optional[str]
 
 
-async def _fetch_with_aiohttp(url: str) -> tuple[Optional[str], Optional[str]]:
-    """Fetch URL using aiohttp (fast, no JS rendering).
+async def _fetch_with_aiohttp_conditional(
+    url: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    company_id: Optional[str] = None
+) -> tuple[Optional[str], Optional[str], bool, Dict[str, Optional[str]]]:
+    """Fetch URL using aiohttp, sending If-None-Match / If-Modified-Since.
+
+    Runs inside a crawl scheduler slot (per-host limits, 429/503 backoff).
 
     Returns:
-        Tuple of (html, error)
+        Tuple of (html, error, not_modified, validators) where validators
+        holds the response ETag / Last-Modified headers
     """
-    import ssl
-    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    ssl_context.set_ciphers('DEFAULT@SECLEVEL=1')
-
-    connector = aiohttp.TCPConnector(ssl=ssl_context, limit=100)
-    async with aiohttp.ClientSession(connector=connector) as session:
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+    }
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+
+    # Shared pooled session (lenient TLS for municipal sites), reuses
+    # keep-alive connections across the article URLs of an index page
+    session = await get_http_session(verify_ssl=False)
+    crawl_scheduler = get_crawl_scheduler()
+    async with crawl_scheduler.slot(url, company_id=company_id):
         async with session.get(
             url,
             timeout=aiohttp.ClientTimeout(total=30),
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-            }
+            headers=headers
         ) as response:
+            crawl_scheduler.report(url, response.status, response.headers.get("Retry-After"))
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified")
+            }
+            if response.status == 304:
+                return None, None, True, validators
             if response.status != 200:
-                return None, f"HTTP {response.status}"
+                return None, f"HTTP {response.status}", False, validators
             html = await response.text()
-            return html, None
+            return html, None, False, validators
 
 
-async def _get_playwright_browser():
-    """Get or create persistent Playwright browser instance."""
-    global _playwright_instance, _browser_instance
-
-    if _browser_instance is None:
-        from playwright.async_api import async_playwright
-        _playwright_instance = await async_playwright().start()
-        _browser_instance = await _playwright_instance.chromium.launch(
-            headless=True,
-            args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-gpu'
-            ]
-        )
-        logger.info("playwright_browser_started")
+async def _fetch_with_aiohttp(url: str, company_id: Optional[str] = None) -> tuple[Optional[str], Optional[str]]:
+    """Fetch URL using aiohttp (fast, no JS rendering).
 
-    return _browser_instance
+    Returns:
+        Tuple of (html, error)
+    """
+    html, error, _, _ = await _fetch_with_aiohttp_conditional(url, company_id=company_id)
+    return html, error
 
 
-async def _fetch_with_playwright(url: str) -> tuple[Optional[str], Optional[str]]:
+async def _fetch_with_playwright(url: str, company_id: Optional[str] = None) -> tuple[Optional[str], Optional[str]]:
     """Fetch URL using Playwright (renders JavaScript).
 
+    Uses the warm browser-context pool (images/media/fonts blocked,
+    readiness condition instead of a fixed sleep).
+
     Returns:
         Tuple of (html, error)
     """
     try:
-        browser = await _get_playwright_browser()
-        page = await browser.new_page(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-        )
+        crawl_scheduler = get_crawl_scheduler()
 
-        try:
-            # Navigate and wait for network to be mostly idle
-            await page.goto(url, wait_until='networkidle', timeout=30000)
+        async with crawl_scheduler.slot(url, company_id=company_id):
+            html, status, headers = await get_browser_pool().render(url)
+            if status is not None:
+                crawl_scheduler.report(url, status, headers.get("retry-after"))
+            return html, None
 
-            # Extra wait for JS frameworks to render
-            await page.wait_for_timeout(2000)
+    except Exception as e:
+        return None, f"Playwright error: {str(e)}"
 
-            html = await page.content()
-            return html, None
 
-        finally:
-            await page.close()
+async def load_monitored_url(state: ScraperState) -> ScraperState:
+    """Load the existing monitored_urls row for this URL (Node 0).
+
+    Provides the stored ETag / Last-Modified to fetch_url and the previous
+    hashes to detect_changes.
+
+    Args:
+        state: Workflow state
+
+    Returns:
+        Updated state with old_monitored_url
+    """
+    url = state["url"]
+
+    try:
+        supabase = get_supabase_client()
+
+        result = await execute_async(supabase.client.table("monitored_urls").select(
+            "*"
+        ).eq("company_id", state["company_id"]).eq("url", url))
+
+        if result.data and len(result.data) > 0:
+            state["old_monitored_url"] = result.data[0]
+            logger.debug("found_existing_monitored_url",
+                url=url,
+                monitored_url_id=result.data[0]["id"]
+            )
 
     except Exception as e:
-        return None, f"Playwright error: {str(e)}"
+        # Without the row a known URL would look new: the LLM pipeline would
+        # run and the insert would fail on UNIQUE(company_id, url). Skip this
+        # run; the next scheduled one retries.
+        logger.error("load_monitored_url_error", url=url, error=str(e))
+        state["monitored_url_load_failed"] = True
+        state["error"] = f"Load monitored URL error: {str(e)}"
+
+    return state
 
 
 async def fetch_url(state: ScraperState) -> ScraperState:
     """Fetch URL content (Node 1).
 
     Uses SCRAPER_ENGINE env var to determine method:
-    - 'aiohttp': Fast HTTP requests (default)
+    - 'aiohttp': Fast HTTP requests (default), conditional GET when the
+      monitored URL has a stored ETag / Last-Modified
     - 'playwright': Headless browser with JS rendering
 
     Args:
         state: Workflow state
 
     Returns:
-        Updated state with HTML or error
+        Updated state with HTML, not_modified flag or error
     """
     url = state["url"]
+    old_monitored_url = state.get("old_monitored_url") or {}
 
     logger.info("fetch_url_start", url=url, engine=SCRAPER_ENGINE)
 
     try:
         if SCRAPER_ENGINE == "playwright":
-            html, error = await _fetch_with_playwright(url)
+            html, error = await _fetch_with_playwright(url, company_id=state["company_id"])
         else:
-            html, error = await _fetch_with_aiohttp(url)
+            etag = None
+            last_modified = None
+            if settings.scraper_conditional_get_enabled:
+                etag = old_monitored_url.get("http_etag")
+                last_modified = old_monitored_url.get("http_last_modified")
+
+            html, error, not_modified, validators = await _fetch_with_aiohttp_conditional(
+                url, etag=etag, last_modified=last_modified, company_id=state["company_id"]
+            )
+
+            if not_modified:
+                logger.info("fetch_url_not_modified",
+                    url=url,
+                    etag=etag,
+                    last_modified=last_modified
+                )
+                state["not_modified"] = True
+                return state
+
+            state["http_etag"] = validators.get("etag")
+            state["http_last_modified"] = validators.get("last_modified")
 
         if error:
             logger.error("fetch_url_failed", url=url, error=error, engine=SCRAPER_ENGINE)
@@ -307,14 +373,16 @@ async def parse_content(state: ScraperState) -> ScraperState:
         return state
     
     try:
-        soup = BeautifulSoup(html, 'html.parser')
+        # Views precomputed in the CPU pool for large pages
+        document = await build_document(html, url)
+        state["document"] = document
         
         if url_type == "article":
             # Extract single article content
-            await parse_article(state, soup)
+            await parse_article(state)
         else:
             # Extract article links from index
-            await parse_index(state, soup)
+            await parse_index(state)
         
         logger.info("parse_content_success",
             url=url,
@@ -332,69 +400,48 @@ async def parse_content(state: ScraperState) -> ScraperState:
         return state
 
 
-async def parse_article(state: ScraperState, soup: BeautifulSoup):
+async def parse_article(state: ScraperState):
     """Parse article page content using LLM.
     
     Detects if page contains multiple news items or single article.
     
     Args:
-        state: Workflow state
-        soup: BeautifulSoup object
+        state: Workflow state (with its ParsedDocument)
     """
     url = state["url"]
     html = state["html"]
+    document = state["document"]
     
     # Extract title
-    title_tag = soup.find('title')
-    page_title = title_tag.get_text(strip=True) if title_tag else "Untitled"
+    page_title = document.title
     
     # Extract main content (for hashing/change detection)
-    semantic_content_normalized = normalize_html(html)
+    semantic_content_normalized = normalize_html(html, document=document)
     
     # Extract full text for LLM (less aggressive cleanup)
-    # Remove only scripts, styles, nav, header, footer
-    soup_copy = BeautifulSoup(html, 'html.parser')
-    for tag in soup_copy(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-        tag.decompose()
-    full_text_for_llm = soup_copy.get_text(separator=' ', strip=True)
-    full_text_for_llm = ' '.join(full_text_for_llm.split())  # Normalize whitespace
-    
-    # Detect if this is a multi-noticia page (multiple news on same URL)
-    # Look for common news containers with stricter heuristics
-    news_blocks = soup.find_all(['article', 'div'], class_=lambda c: c and any(
-        keyword in str(c).lower() for keyword in ['noticia', 'news', 'post', 'item', 'entry']
-    ))
-    
-    # Filter blocks: Must have minimum content and heading
-    valid_blocks = []
-    for block in news_blocks:
-        block_text = block.get_text(separator=' ', strip=True)
-        has_heading = block.find(['h1', 'h2', 'h3', 'h4']) is not None
-        has_link = block.find('a', href=True) is not None
-        
-        # Valid multi-noticia block must:
-        # - Have 50-2000 chars (not too short, not full article)
-        # - Have a heading tag
-        # - Have a link (typical for index pages)
-        if 50 <= len(block_text) <= 2000 and has_heading and has_link:
-            valid_blocks.append(block)
+    # Skips only scripts, styles, nav, header, footer, aside
+    full_text_for_llm = document.llm_text
+    
+    # Detect if this is a multi-noticia page (multiple news on same URL).
+    # Blocks need 50-2000 chars, a heading and a link (see ParsedDocument.news_blocks)
+    news_blocks = document.news_blocks
     
     # Only treat as multi-noticia if we have 3+ valid blocks
     # (2 blocks could be article + sidebar, need 3+ to be confident it's an index)
-    if len(valid_blocks) >= 3:
+    if news_blocks["valid"] >= 3:
         logger.info("multi_noticia_detected", 
             url=url, 
-            blocks_found=len(news_blocks),
-            valid_blocks=len(valid_blocks)
+            blocks_found=news_blocks["candidates"],
+            valid_blocks=news_blocks["valid"]
         )
-        await parse_multi_noticia(state, valid_blocks, soup)
+        await parse_multi_noticia(state, news_blocks["blocks"])
     else:
         # Single article (or false positive multi-noticia)
-        if len(news_blocks) > 1:
+        if news_blocks["candidates"] > 1:
             logger.debug("multi_noticia_rejected_false_positive",
                 url=url,
-                blocks_found=len(news_blocks),
-                valid_blocks=len(valid_blocks),
+                blocks_found=news_blocks["candidates"],
+                valid_blocks=news_blocks["valid"],
                 reason="Not enough valid blocks or blocks too large (likely single article)"
             )
         await parse_single_article(state, page_title, semantic_content_normalized, full_text_for_llm)
@@ -479,8 +526,8 @@ async def parse_single_article(state: ScraperState, page_title: str, semantic_co
     
     # Extract featured image
     try:
-        soup = BeautifulSoup(state["html"], 'html.parser')
-        featured_image = extract_featured_image(soup, url)
+        document = state.get("document") or ParsedDocument(state["html"], url)
+        featured_image = document.featured_image(url)
         if featured_image:
             logger.debug("featured_image_extracted",
                 url=url,
@@ -534,8 +581,8 @@ async def parse_single_article(state: ScraperState, page_title: str, semantic_co
     )
 
 
-async def parse_multi_noticia(state: ScraperState, news_blocks, soup: BeautifulSoup):
-    """Parse multiple news items from same page."""
+async def parse_multi_noticia(state: ScraperState, news_blocks: List[Dict[str, Any]]):
+    """Parse multiple news items from same page (ParsedDocument.news_blocks)."""
     url = state["url"]
     company_id = state["company_id"]
     llm_client = get_llm_client()
@@ -544,19 +591,15 @@ async def parse_multi_noticia(state: ScraperState, news_blocks, soup: BeautifulS
     
     for i, block in enumerate(news_blocks[:10]):  # Limit to 10 news items
         try:
-            # Extract text from this block
-            block_text = block.get_text(separator=' ', strip=True)
+            block_text = block["text"]
             
             if len(block_text) < 50:  # Skip very short blocks
                 continue
             
-            # Extract date from this block
-            from utils.date_extractor import extract_from_css_selectors, extract_date_from_text
-            block_html = str(block)
-            block_soup = BeautifulSoup(block_html, 'html.parser')
+            from utils.date_extractor import extract_date_from_text
             
-            # Try CSS selectors first (time tags, .date classes)
-            dates_found = extract_from_css_selectors(block_soup)
+            # CSS selector dates of this block (time tags, .date classes)
+            dates_found = block["css_dates"]
             published_at = None
             date_source = None
             date_confidence = None
@@ -597,13 +640,8 @@ async def parse_multi_noticia(state: ScraperState, news_blocks, soup: BeautifulS
             
             # Quality gate: require valid title AND at least 2 atomic statements
             if title and title.lower() not in ["sin contenido noticioso", "no news content", ""] and len(atomic_statements) >= 2:
-                # Extract featured image after quality gate
-                featured_image = None
-                if len(atomic_statements) >= 2:
-                    try:
-                        featured_image = extract_featured_image(block_soup, url)
-                    except Exception:
-                        pass
+                # Featured image of the block (extracted with the block)
+                featured_image = block["featured_image"]
                 
                 content_items.append({
                     "position": len(content_items) + 1,
@@ -661,11 +699,10 @@ async def parse_multi_noticia(state: ScraperState, news_blocks, soup: BeautifulS
             reason="Too few valid items, treating as single article"
         )
         
-        # Get page title from soup
-        title_tag = soup.find('title')
-        page_title = title_tag.get_text(strip=True) if title_tag else "Untitled"
+        document = state["document"]
+        page_title = document.title
         
-        semantic_content = normalize_html(state["html"])
+        semantic_content = normalize_html(state["html"], document=document)
         await parse_single_article(state, page_title, semantic_content)
 
 
@@ -691,7 +728,8 @@ def extract_news_links_local(html: str, base_url: str) -> Dict[str, Any]:
     from urllib.parse import urljoin, urlparse
     import re
 
-    soup = BeautifulSoup(html, 'html.parser')
+    # Own tree: noise is removed with decompose()
+    soup = make_soup(html)
 
     # Remove noise: nav, footer, sidebar, header, scripts, styles
     for tag in soup(['script', 'style', 'nav', 'footer', 'aside', 'header']):
@@ -884,14 +922,13 @@ def extract_news_links_local(html: str, base_url: str) -> Dict[str, Any]:
     return {"articles": unique_articles[:15]}  # Return max 15 articles
 
 
-async def parse_index(state: ScraperState, soup: BeautifulSoup):
+async def parse_index(state: ScraperState):
     """Parse index page to extract article links, then scrape them.
 
     Uses local heuristics first (FREE), falls back to LLM only if needed.
 
     Args:
         state: Workflow state
-        soup: BeautifulSoup object
     """
     url = state["url"]
     html = state["html"]
@@ -907,7 +944,8 @@ async def parse_index(state: ScraperState, soup: BeautifulSoup):
         # STEP 1: Try LOCAL extraction first (FREE, no LLM tokens)
         logger.info("parse_index_trying_local_extraction", url=url)
 
-        result = extract_news_links_local(html, url)
+        # CPU-bound on large index pages: runs in the CPU pool
+        result = await run_cpu(extract_news_links_local, html, url, size_hint=len(html))
         articles = result.get("articles", [])
         extraction_method = "local"
 
@@ -955,6 +993,15 @@ async def parse_index(state: ScraperState, soup: BeautifulSoup):
         # Limit to 10 most recent
         articles = articles[:10]
 
+        # Drop links already scraped/ingested BEFORE fetching + LLM enrichment
+        links_found = len(articles)
+        old_monitored_url = state.get("old_monitored_url") or {}
+        articles = await filter_known_index_articles(
+            articles=articles,
+            company_id=company_id,
+            monitored_url_id=old_monitored_url.get("id")
+        )
+
         logger.info("index_links_extracted",
             url=url,
             articles_found=len(articles),
@@ -966,10 +1013,13 @@ async def parse_index(state: ScraperState, soup: BeautifulSoup):
         )
 
         if not articles:
-            logger.warn("no_articles_found_in_index",
-                url=url,
-                result=result
-            )
+            if links_found:
+                logger.info("index_no_new_articles", url=url, links_found=links_found)
+            else:
+                logger.warn("no_articles_found_in_index",
+                    url=url,
+                    result=result
+                )
             state["content_items"] = []
             return
 
@@ -1010,6 +1060,90 @@ async def parse_index(state: ScraperState, soup: BeautifulSoup):
         state["content_items"] = []
 
 
+def _normalize_title(title: Optional[str]) -> str:
+    """Lowercase + collapse whitespace for title comparison."""
+    return " ".join((title or "").lower().split())
+
+
+def _url_variants(url: str) -> List[str]:
+    """URL with and without trailing slash (both forms appear in stored metadata)."""
+    stripped = url.rstrip("/")
+    return [stripped, stripped + "/"]
+
+
+async def filter_known_index_articles(
+    articles: List[Dict[str, Any]],
+    company_id: str,
+    monitored_url_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Remove index links that were already processed (pre-enrichment dedup).
+
+    Checked before fetching/enriching, so unchanged index polls cost no LLM calls:
+    - press_context_units: exact article URL (source_metadata->>url)
+    - url_content_units: title already stored for this monitored_url
+
+    Args:
+        articles: List of {"title": "...", "url": "...", "date": "..."}
+        company_id: Company UUID
+        monitored_url_id: Index monitored_url UUID (None on first scrape)
+
+    Returns:
+        Articles not seen before (on error, the input list unchanged)
+    """
+    if not articles:
+        return articles
+
+    try:
+        supabase = get_supabase_client()
+
+        urls = sorted({
+            variant
+            for article in articles if article.get("url")
+            for variant in _url_variants(article["url"])
+        })
+
+        known_urls = set()
+        if urls:
+            result = await execute_async(supabase.client.table("press_context_units").select(
+                "source_metadata->>url"
+            ).eq("company_id", company_id).in_("source_metadata->>url", urls))
+            known_urls = {
+                row.get("url").rstrip("/") for row in (result.data or []) if row.get("url")
+            }
+
+        known_titles = set()
+        if monitored_url_id:
+            result = await execute_async(supabase.client.table("url_content_units").select(
+                "title"
+            ).eq("monitored_url_id", monitored_url_id))
+            known_titles = {_normalize_title(row.get("title")) for row in (result.data or [])}
+            known_titles.discard("")
+
+        new_articles = [
+            article for article in articles
+            if (article.get("url") or "").rstrip("/") not in known_urls
+            and _normalize_title(article.get("title")) not in known_titles
+        ]
+
+        logger.info("index_articles_prefiltered",
+            company_id=company_id,
+            monitored_url_id=monitored_url_id,
+            total_links=len(articles),
+            known_links=len(articles) - len(new_articles),
+            new_links=len(new_articles)
+        )
+
+        return new_articles
+
+    except Exception as e:
+        # Safer to enrich a duplicate than to miss new content
+        logger.warn("index_prefilter_error",
+            company_id=company_id,
+            error=str(e)
+        )
+        return articles
+
+
 async def scrape_articles_from_index(
     articles: List[Dict[str, Any]],
     company_id: str,
@@ -1097,9 +1231,9 @@ async def scrape_articles_from_index(
                 
                 # Fetch article HTML using same engine as index
                 if SCRAPER_ENGINE == "playwright":
-                    article_html, fetch_error = await _fetch_with_playwright(article_url)
+                    article_html, fetch_error = await _fetch_with_playwright(article_url, company_id=company_id)
                 else:
-                    article_html, fetch_error = await _fetch_with_aiohttp(article_url)
+                    article_html, fetch_error = await _fetch_with_aiohttp(article_url, company_id=company_id)
 
                 if fetch_error or not article_html:
                     logger.warn("article_fetch_failed",
@@ -1110,10 +1244,11 @@ async def scrape_articles_from_index(
                     return None
                 
                 # Parse with LLM via unified enricher
-                from utils.content_hasher import normalize_html
                 from utils.unified_content_enricher import enrich_content
                 
-                semantic_content = normalize_html(article_html)
+                # Parse article HTML once for text, image and date extraction
+                article_document = await build_document(article_html, article_url)
+                semantic_content = normalize_html(article_html, document=article_document)
                 
                 result = await enrich_content(
                     raw_text=semantic_content,
@@ -1158,8 +1293,7 @@ async def scrape_articles_from_index(
                 featured_image = None
                 if len(atomic_statements) >= 2:
                     try:
-                        article_soup = BeautifulSoup(article_html, 'html.parser')
-                        featured_image = extract_featured_image(article_soup, article_url)
+                        featured_image = article_document.featured_image()
                     except Exception:
                         pass
                 
@@ -1183,20 +1317,20 @@ async def scrape_articles_from_index(
                         )
                 
                 # Extract publication date from article content
-                from utils.date_extractor import extract_from_meta_tags, extract_from_css_selectors, extract_date_from_text
+                from utils.date_extractor import extract_from_meta_tags, extract_date_from_text
                 from datetime import timedelta
 
                 published_at = None
                 date_source = None
 
                 # Try meta tags first (highest confidence)
-                meta_dates = extract_from_meta_tags(article_soup)
+                meta_dates = extract_from_meta_tags(None, meta=article_document.meta)
                 if meta_dates:
                     published_at, date_source, _ = meta_dates[0]
 
                 # Try CSS selectors (time tags, .date classes)
                 if not published_at:
-                    css_dates = extract_from_css_selectors(article_soup)
+                    css_dates = article_document.css_dates
                     if css_dates:
                         published_at, date_source, _ = css_dates[0]
 
@@ -1306,20 +1440,14 @@ async def detect_changes(state: ScraperState) -> ScraperState:
     try:
         supabase = get_supabase_client()
         
-        # Check if URL already monitored
-        result = supabase.client.table("monitored_urls").select(
-            "*"
-        ).eq("company_id", company_id).eq("url", url).execute()
-        
-        old_monitored_url = None
-        if result.data and len(result.data) > 0:
-            old_monitored_url = result.data[0]
-            logger.debug("found_existing_monitored_url", 
-                url=url, 
-                monitored_url_id=old_monitored_url["id"]
-            )
-        
-        state["old_monitored_url"] = old_monitored_url
+        # Loaded by load_monitored_url (Node 0)
+        old_monitored_url = state.get("old_monitored_url")
+        if state.get("monitored_url_load_failed"):
+            # Never treat a URL as new when its row could not be read
+            logger.warn("detect_changes_skipped_load_failed", url=url)
+            state["change_info"] = {"change_type": "unknown", "requires_processing": False}
+            state["should_process"] = False
+            return state
         
         # Index pages: Check individual scraped articles instead of index HTML
         # Use url_type to detect index pages (not len(content_items) which may be 0-1 after quality gate)
@@ -1329,13 +1457,13 @@ async def detect_changes(state: ScraperState) -> ScraperState:
             # Index page: Check individual scraped articles instead of index HTML
             # Compute hash of index HTML for monitored_urls tracking
             from utils.content_hasher import compute_content_hashes
-            new_hash, new_simhash = compute_content_hashes(html=state["html"])
+            new_hash, new_simhash = compute_content_hashes(html=state["html"], document=state.get("document"))
             
             if old_monitored_url:
                 # Get existing url_content_units for this monitored_url
-                existing_units = supabase.client.table("url_content_units").select(
+                existing_units = await execute_async(supabase.client.table("url_content_units").select(
                     "title, content_hash"
-                ).eq("monitored_url_id", old_monitored_url["id"]).execute()
+                ).eq("monitored_url_id", old_monitored_url["id"]))
                 
                 existing_titles = {u["title"] for u in (existing_units.data or [])}
                 new_items = [item for item in content_items if item.get("title") not in existing_titles]
@@ -1385,6 +1513,7 @@ async def detect_changes(state: ScraperState) -> ScraperState:
             change_info = await detector.detect_change(
                 old_content=old_monitored_url,
                 new_html=state["html"],
+                document=state.get("document"),
                 new_title=state.get("title"),
                 new_summary=state.get("summary"),
                 company_id=company_id,
@@ -1430,7 +1559,8 @@ async def extract_date(state: ScraperState) -> ScraperState:
             html=html,
             url=url,
             title=title,
-            use_llm_fallback=True
+            use_llm_fallback=True,
+            document=state.get("document")
         )
         
         if date_info["published_at"]:
@@ -1478,6 +1608,30 @@ async def filter_content(state: ScraperState) -> ScraperState:
     return state
 
 
+HTTP_VALIDATOR_COLUMNS = ("http_etag", "http_last_modified")
+
+
+async def _write_monitored_url(
+    write: Callable[[Dict[str, Any]], Any],
+    data: Dict[str, Any],
+    scope: Callable[[Any], Any] = lambda query: query
+) -> Any:
+    """Insert/update a monitored_urls row, without the HTTP validator columns
+    if the database does not have them yet (migration 013 not applied)."""
+    try:
+        return await execute_async(scope(write(data)))
+    except Exception as e:
+        missing = [column for column in HTTP_VALIDATOR_COLUMNS if column in data and column in str(e)]
+        if not missing:
+            raise
+        logger.warn("monitored_url_http_validators_unsupported",
+            error=str(e),
+            message="Apply migration 013 or set SCRAPER_CONDITIONAL_GET_ENABLED=false"
+        )
+        data = {key: value for key, value in data.items() if key not in HTTP_VALIDATOR_COLUMNS}
+        return await execute_async(scope(write(data)))
+
+
 async def save_monitored_url(state: ScraperState) -> ScraperState:
     """Save or update monitored_url (Node 6).
     
@@ -1509,7 +1663,7 @@ async def save_monitored_url(state: ScraperState) -> ScraperState:
             "url": url,
             "url_type": state["url_type"],
             "title": state.get("title"),
-            "semantic_content": normalize_html(state["html"])[:10000],
+            "semantic_content": normalize_html(state["html"], document=state.get("document"))[:10000],
             "content_hash": change_info.get("new_hash"),
             "simhash": change_info.get("new_simhash"),
             "published_at": state.get("published_at"),
@@ -1519,15 +1673,22 @@ async def save_monitored_url(state: ScraperState) -> ScraperState:
             "status": "active",
             "updated_at": datetime.utcnow().isoformat()
         }
+
+        # HTTP validators for the next conditional GET (migration 013)
+        if settings.scraper_conditional_get_enabled and SCRAPER_ENGINE != "playwright":
+            monitored_url_data["http_etag"] = state.get("http_etag")
+            monitored_url_data["http_last_modified"] = state.get("http_last_modified")
         
         # Upsert (insert or update)
         old_monitored_url = state.get("old_monitored_url")
         
         if old_monitored_url:
             # Update existing
-            result = supabase.client.table("monitored_urls").update(
-                monitored_url_data
-            ).eq("id", old_monitored_url["id"]).execute()
+            result = await _write_monitored_url(
+                supabase.client.table("monitored_urls").update,
+                monitored_url_data,
+                lambda query: query.eq("id", old_monitored_url["id"])
+            )
             
             monitored_url_id = old_monitored_url["id"]
             logger.info("monitored_url_updated", 
@@ -1538,9 +1699,10 @@ async def save_monitored_url(state: ScraperState) -> ScraperState:
             # Insert new
             monitored_url_data["created_at"] = datetime.utcnow().isoformat()
             
-            result = supabase.client.table("monitored_urls").insert(
+            result = await _write_monitored_url(
+                supabase.client.table("monitored_urls").insert,
                 monitored_url_data
-            ).execute()
+            )
             
             if result.data and len(result.data) > 0:
                 monitored_url_id = result.data[0]["id"]
@@ -1621,10 +1783,10 @@ async def save_url_content(state: ScraperState) -> ScraperState:
                 "updated_at": datetime.utcnow().isoformat()
             }
             
-            result = supabase.client.table("url_content_units").upsert(
+            result = await execute_async(supabase.client.table("url_content_units").upsert(
                 url_content_data,
                 on_conflict="monitored_url_id,content_position"
-            ).execute()
+            ))
             
             if result.data and len(result.data) > 0:
                 url_content_unit_id = result.data[0]["id"]
@@ -1745,11 +1907,66 @@ async def ingest_to_context(state: ScraperState) -> ScraperState:
         return state
 
 
+async def mark_not_modified(state: ScraperState) -> ScraperState:
+    """Record a 304 Not Modified poll (Node 1b).
+
+    Only bumps last_scraped_at: the stored hashes and validators are still valid.
+
+    Args:
+        state: Workflow state
+
+    Returns:
+        Updated state
+    """
+    url = state["url"]
+    old_monitored_url = state.get("old_monitored_url")
+
+    state["change_info"] = {
+        "change_type": "not_modified",
+        "requires_processing": False,
+        "detection_tier": 0
+    }
+    state["should_process"] = False
+
+    if not old_monitored_url:
+        return state
+
+    state["monitored_url_id"] = old_monitored_url["id"]
+
+    try:
+        supabase = get_supabase_client()
+        now = datetime.utcnow().isoformat()
+
+        await execute_async(supabase.client.table("monitored_urls").update({
+            "last_scraped_at": now,
+            "updated_at": now
+        }).eq("id", old_monitored_url["id"]))
+
+        logger.info("monitored_url_not_modified",
+            url=url,
+            monitored_url_id=old_monitored_url["id"]
+        )
+
+    except Exception as e:
+        logger.error("mark_not_modified_error", url=url, error=str(e))
+
+    return state
+
+
 # Conditional routing
+def should_continue_after_load(state: ScraperState) -> str:
+    """Route after loading the monitored URL."""
+    if state.get("monitored_url_load_failed"):
+        return "end"
+    return "fetch_url"
+
+
 def should_continue_after_fetch(state: ScraperState) -> str:
     """Route after fetch."""
     if state.get("fetch_error"):
         return "end"
+    if state.get("not_modified"):
+        return "mark_not_modified"
     return "parse_content"
 
 
@@ -1790,7 +2007,9 @@ def build_scraper_workflow() -> StateGraph:
     workflow = StateGraph(ScraperState)
     
     # Add nodes
+    workflow.add_node("load_monitored_url", load_monitored_url)
     workflow.add_node("fetch_url", fetch_url)
+    workflow.add_node("mark_not_modified", mark_not_modified)
     workflow.add_node("parse_content", parse_content)
     workflow.add_node("detect_changes", detect_changes)
     workflow.add_node("extract_date", extract_date)
@@ -1800,17 +2019,29 @@ def build_scraper_workflow() -> StateGraph:
     workflow.add_node("ingest_to_context", ingest_to_context)
     
     # Set entry point
-    workflow.set_entry_point("fetch_url")
+    workflow.set_entry_point("load_monitored_url")
     
     # Add edges
+    workflow.add_conditional_edges(
+        "load_monitored_url",
+        should_continue_after_load,
+        {
+            "fetch_url": "fetch_url",
+            "end": END
+        }
+    )
+
     workflow.add_conditional_edges(
         "fetch_url",
         should_continue_after_fetch,
         {
             "parse_content": "parse_content",
+            "mark_not_modified": "mark_not_modified",
             "end": END
         }
     )
+
+    workflow.add_edge("mark_not_modified", END)
     
     workflow.add_conditional_edges(
         "parse_content",
@@ -1884,11 +2115,16 @@ async def scrape_url(
         "url_type": url_type,
         "html": None,
         "fetch_error": None,
+        "not_modified": False,
+        "http_etag": None,
+        "http_last_modified": None,
+        "document": None,
         "title": None,
         "summary": None,
         "content_items": [],
         "parse_error": None,
         "old_monitored_url": None,
+        "monitored_url_load_failed": False,
         "change_info": None,
         "should_process": False,
         "published_at": None,
@@ -1906,6 +2142,8 @@ async def scrape_url(
     try:
         final_state = await workflow.ainvoke(initial_state)
         final_state["workflow_end"] = datetime.utcnow().isoformat()
+        # Parsed tree is only needed inside the workflow (not serializable, large)
+        final_state["document"] = None
         
         logger.info("scrape_url_completed",
             url=url,
@@ -0,0 +1,14 @@
+-- Migration: 013_monitored_urls_http_validators
+-- Description: Store HTTP cache validators (ETag / Last-Modified) per monitored URL
+-- Date: 2026-10-16
+--
+-- The scraper sends If-None-Match / If-Modified-Since on the next poll and
+-- short-circuits the whole workflow on 304 Not Modified (no download, no
+-- HTML normalization, no hashing).
+
+ALTER TABLE monitored_urls
+ADD COLUMN IF NOT EXISTS http_etag TEXT,
+ADD COLUMN IF NOT EXISTS http_last_modified TEXT;
+
+COMMENT ON COLUMN monitored_urls.http_etag IS 'ETag response header from the last 200 fetch (sent as If-None-Match)';
+COMMENT ON COLUMN monitored_urls.http_last_modified IS 'Last-Modified response header from the last 200 fetch (sent as If-Modified-Since)';
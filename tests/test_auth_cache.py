@@ -0,0 +1,67 @@
+"""Unit tests for auth_cache module.
+
+Tests API key caching (positive and negative) and invalidation on key regeneration.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from utils import auth_cache
+from utils.auth_cache import api_key_fingerprint, invalidate_company_clients
+from utils.config_cache import ConfigCache
+from utils.supabase_client import SupabaseClient
+
+
+CLIENT = {"client_id": "cl-1", "company_id": "co-1", "client_name": "Demo", "is_active": True}
+
+
+@pytest.fixture
+def supabase():
+    cache = ConfigCache(
+        {"api_key": 60, "jwt_user": 60, "company_client": 60},
+        negative_ttls={"api_key": 60}
+    )
+    client = SupabaseClient.__new__(SupabaseClient)
+    client.client = MagicMock()
+    with patch.object(auth_cache, "_auth_cache", cache):
+        yield client, cache
+
+
+def test_fingerprint_does_not_contain_key():
+    """Keys are cached by SHA256, never by the raw value."""
+    fingerprint = api_key_fingerprint("ekm-secret")
+    assert "ekm-secret" not in fingerprint
+    assert len(fingerprint) == 64
+
+
+@pytest.mark.asyncio
+async def test_valid_and_invalid_keys_hit_db_once(supabase):
+    """Repeated lookups of a valid or unknown key are served from memory."""
+    client, cache = supabase
+    responses = {"ekm-good": [CLIENT], "ekm-bad": []}
+
+    async def execute(query):
+        key = client.client.table.return_value.select.return_value.eq.call_args.args[1]
+        return MagicMock(data=responses[key])
+
+    with patch("utils.supabase_client.execute_async", new=AsyncMock(side_effect=execute)) as db:
+        for _ in range(3):
+            assert (await client.get_client_by_api_key("ekm-good"))["client_id"] == "cl-1"
+            assert await client.get_client_by_api_key("ekm-bad") is None
+
+    assert db.await_count == 2
+    assert cache.stats()["api_key"]["hits"] == 4
+
+
+@pytest.mark.asyncio
+async def test_regeneration_invalidates_company_keys(supabase):
+    """invalidate_company_clients drops the cached client of the old key."""
+    client, cache = supabase
+
+    with patch("utils.supabase_client.execute_async", new=AsyncMock(return_value=MagicMock(data=[CLIENT]))):
+        await client.get_client_by_api_key("ekm-old")
+
+    invalidate_company_clients("co-1")
+
+    with patch("utils.supabase_client.execute_async", new=AsyncMock(return_value=MagicMock(data=[]))):
+        assert await client.get_client_by_api_key("ekm-old") is None
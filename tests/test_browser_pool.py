@@ -0,0 +1,119 @@
+"""Unit tests for browser_pool module.
+
+Tests context reset between renders and discarding contexts of a crashed
+browser, with fake Playwright objects.
+"""
+
+import asyncio
+
+import pytest
+from utils.browser_pool import BrowserPool
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+        self.url = None
+
+    def is_closed(self):
+        return self.closed
+
+    async def evaluate(self, script):
+        pass
+
+    async def goto(self, url, **kwargs):
+        self.url = url
+        return None
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.cookies_cleared = 0
+        self.permissions_cleared = 0
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage()
+
+    async def clear_cookies(self):
+        self.cookies_cleared += 1
+
+    async def clear_permissions(self):
+        self.permissions_cleared += 1
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = self
+
+    async def launch(self, **kwargs):
+        return FakeBrowser()
+
+
+async def started_pool(size=2):
+    pool = BrowserPool(pool_size=size)
+    pool._browser = FakeBrowser()
+    pool._idle = [await pool._new_context() for _ in range(size)]
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_release_resets_context():
+    """A released context has no cookies, permissions or page state left."""
+    pool = await started_pool(size=1)
+
+    pooled = await pool._acquire()
+    page = await pooled.get_page()
+    await page.goto("https://example.com/")
+    await pool._release(pooled)
+
+    assert pool._idle == [pooled]
+    assert page.url == "about:blank"
+    assert (pooled.context.cookies_cleared, pooled.context.permissions_cleared) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_dead_browser_contexts_are_dropped_while_in_use():
+    """Idle contexts of a crashed browser go at once; in-flight ones are not reused."""
+    pool = await started_pool(size=2)
+    pool._playwright = FakePlaywright()
+    dead = pool._browser
+    pooled = await pool._acquire()
+    idle_context = pool._idle[0].context
+
+    dead.connected = False
+    waiter = asyncio.create_task(pool._acquire())
+    await asyncio.sleep(0)
+
+    # Dropped although a render is still in flight
+    assert idle_context.closed and pool._idle == [] and not waiter.done()
+
+    await pool._release(pooled)
+    replacement = await asyncio.wait_for(waiter, 1)
+
+    assert pooled.context.closed
+    assert replacement.browser is pool._browser is not dead
+    assert pool._restarts == 1
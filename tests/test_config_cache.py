@@ -0,0 +1,82 @@
+"""Unit tests for config_cache module.
+
+Tests read-through caching, single-flight loads, TTL expiry and invalidation.
+"""
+
+import asyncio
+
+import pytest
+from utils.config_cache import ConfigCache
+
+
+@pytest.mark.asyncio
+async def test_read_through_and_invalidate_company():
+    """Second read is a hit; invalidate_company forces a reload."""
+    cache = ConfigCache({"company": 60, "company_settings": 60})
+    loads = 0
+
+    async def load():
+        nonlocal loads
+        loads += 1
+        return {"autogenerate_max": loads}
+
+    assert await cache.get_or_load("company_settings", "c1", load) == {"autogenerate_max": 1}
+    assert await cache.get_or_load("company_settings", "c1", load) == {"autogenerate_max": 1}
+
+    cache.invalidate_company("c1")
+    assert await cache.get_or_load("company_settings", "c1", load) == {"autogenerate_max": 2}
+
+    stats = cache.stats()["company_settings"]
+    assert (stats["hits"], stats["misses"], stats["invalidations"]) == (1, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    """Callers missing the same key wait for a single query."""
+    cache = ConfigCache({"email_routing": 60})
+    loads = 0
+
+    async def load():
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        return None
+
+    results = await asyncio.gather(*[
+        cache.get_or_load("email_routing", "p.demo@ekimen.ai", load) for _ in range(5)
+    ])
+
+    assert results == [None] * 5
+    assert loads == 1
+    # "Not found" is cached as well
+    assert cache.get("email_routing", "p.demo@ekimen.ai") == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_errors_and_expired_entries_are_not_served():
+    """Loader errors propagate uncached; expired entries reload."""
+    cache = ConfigCache({"company": -1})
+
+    async def failing():
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("company", "c1", failing)
+
+    async def load():
+        return {"id": "c1"}
+
+    await cache.get_or_load("company", "c1", load)
+    assert cache.get("company", "c1") == (False, None)
+
+
+def test_invalidate_source_drops_not_found_routes():
+    """A source change also clears addresses cached as "not found"."""
+    cache = ConfigCache({"email_routing": 60})
+    cache.set("email_routing", "a@ekimen.ai", {"sources": {"source_id": "s1"}})
+    cache.set("email_routing", "b@ekimen.ai", None)
+
+    cache.invalidate_source("s1")
+
+    assert cache.get("email_routing", "a@ekimen.ai") == (False, None)
+    assert cache.get("email_routing", "b@ekimen.ai") == (False, None)
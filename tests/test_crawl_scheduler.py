@@ -0,0 +1,125 @@
+"""Unit tests for crawl_scheduler module.
+
+Tests per-host limits, 429/503 backoff and fair round-robin across companies.
+"""
+
+import asyncio
+
+import pytest
+from utils.crawl_scheduler import (
+    CrawlScheduler,
+    HostBackoffError,
+    crawl_host,
+    parse_retry_after
+)
+
+
+class TestHelpers:
+    """Test host keys and Retry-After parsing."""
+
+    def test_crawl_host_strips_www(self):
+        """www. and case do not create separate hosts."""
+        assert crawl_host("https://WWW.Vitoria-Gasteiz.org/noticias") == "vitoria-gasteiz.org"
+
+    def test_parse_retry_after(self):
+        """Seconds form is parsed, garbage is ignored."""
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("not-a-date") is None
+        assert parse_retry_after(None) is None
+
+
+@pytest.mark.asyncio
+async def test_per_host_concurrency_limit():
+    """No more than max_per_host requests run on one host at a time."""
+    scheduler = CrawlScheduler(max_concurrency=10, max_per_host=2, min_host_interval=0)
+    running = 0
+    peak = 0
+
+    async def fetch(i):
+        nonlocal running, peak
+        async with scheduler.slot(f"https://example.org/{i}"):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*[fetch(i) for i in range(6)])
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_backoff_fails_fast_when_too_long():
+    """A 429 with a long Retry-After blocks the host beyond max_backoff_wait."""
+    scheduler = CrawlScheduler(min_host_interval=0, max_backoff_wait=5)
+
+    async with scheduler.slot("https://example.org/a"):
+        scheduler.report("https://example.org/a", 429, "600")
+
+    with pytest.raises(HostBackoffError):
+        async with scheduler.slot("https://example.org/b"):
+            pass
+
+    # Other hosts are unaffected
+    async with scheduler.slot("https://other.org/"):
+        pass
+    assert scheduler.stats()["backoffs"] == 1
+
+
+@pytest.mark.asyncio
+async def test_round_robin_across_companies():
+    """When saturated, queued requests alternate between companies."""
+    scheduler = CrawlScheduler(max_concurrency=1, max_per_host=10, min_host_interval=0)
+    order = []
+    release = asyncio.Event()
+
+    async def hold():
+        async with scheduler.slot("https://blocker.org/", company_id="c0"):
+            await release.wait()
+
+    async def fetch(company_id, i):
+        async with scheduler.slot(f"https://{company_id}-{i}.org/", company_id=company_id):
+            order.append(company_id)
+
+    blocker = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(fetch("a", i)) for i in range(3)]
+    tasks += [asyncio.create_task(fetch("b", i)) for i in range(3)]
+    await asyncio.sleep(0.01)
+
+    release.set()
+    await asyncio.gather(blocker, *tasks)
+    assert order == ["a", "b", "a", "b", "a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_host_spacing_counts_from_global_grant():
+    """Time queued for a global slot does not count as host spacing."""
+    scheduler = CrawlScheduler(max_concurrency=1, max_per_host=2, min_host_interval=0.05)
+    starts = []
+
+    async def fetch(url, hold):
+        async with scheduler.slot(url):
+            starts.append((url, asyncio.get_running_loop().time()))
+            await asyncio.sleep(hold)
+
+    blocker = asyncio.create_task(fetch("https://other.org/x", 0.1))
+    await asyncio.sleep(0)
+    await asyncio.gather(fetch("https://example.org/a", 0), fetch("https://example.org/b", 0))
+    await blocker
+
+    example = [t for url, t in starts if "example.org" in url]
+    assert example[1] - example[0] >= 0.045
+
+
+@pytest.mark.asyncio
+async def test_idle_hosts_are_pruned(monkeypatch):
+    """Hosts without requests in flight or backoff are forgotten."""
+    monkeypatch.setattr("utils.crawl_scheduler.HOST_PRUNE_EVERY", 1)
+    scheduler = CrawlScheduler(min_host_interval=0)
+
+    async with scheduler.slot("https://a.org/"):
+        pass
+    async with scheduler.slot("https://b.org/"):
+        scheduler.report("https://b.org/", 429, "30")
+
+    assert set(scheduler._hosts) == {"b.org"}
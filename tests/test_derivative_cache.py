@@ -0,0 +1,68 @@
+"""Unit tests for derivative_cache module.
+
+Tests key stability, LRU eviction and that publication variants are reused
+across media bundles instead of being re-encoded.
+"""
+
+import io
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+from publishers.publication_executor import MediaBundle
+from utils.derivative_cache import DerivativeCache, derivative_key, source_digest
+from utils.image_transformer import ImageTransformer
+
+
+def jpeg_bytes():
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 32), (200, 100, 50)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def test_key_depends_on_source_and_params():
+    """Parameter order doesn't matter; source bytes and values do."""
+    digest = source_digest(b"image")
+    assert derivative_key(digest, w=300, format="webp") == derivative_key(digest, format="webp", w=300)
+    assert derivative_key(digest, w=300) != derivative_key(digest, w=600)
+    assert derivative_key(digest, w=300) != derivative_key(source_digest(b"other"), w=300)
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    """Oldest files go first; lookups refresh recency; recent files are kept."""
+    cache = DerivativeCache(str(tmp_path), max_bytes=250)
+    for key in ("a" * 64, "b" * 64, "c" * 64):
+        cache.store(key, "jpeg", b"x" * 100)
+    old = time.time() - 3600
+    for index, key in enumerate(("a" * 64, "b" * 64, "c" * 64)):
+        os.utime(cache.path_for(key, "jpeg"), (old + index, old + index))
+
+    assert cache.lookup("a" * 64, "jpeg") is not None  # now the most recent
+    assert cache.prune() == 1
+    assert cache.lookup("b" * 64, "jpeg") is None
+    assert cache.lookup("a" * 64, "jpeg") and cache.lookup("c" * 64, "jpeg")
+    assert cache.prune() == 0
+
+
+@pytest.mark.asyncio
+async def test_bundles_reuse_cached_variants(tmp_path):
+    """A second bundle for the same image skips the encode; close() keeps the file."""
+    cache = DerivativeCache(str(tmp_path / "derivatives"), max_bytes=10 * 1024 * 1024)
+    original = ImageTransformer.encode_for_publication
+
+    with patch.object(ImageTransformer, "encode_for_publication", wraps=original) as encode:
+        first = MediaBundle("img-1", jpeg_bytes(), cache)
+        path = await first.variant_path("twitter")
+        await first.close()
+
+        second = MediaBundle("img-1", jpeg_bytes(), cache)
+        assert await second.variant_path("twitter") == path
+        # Same output settings as wordpress: shares the file too
+        assert await second.variant_path("default") == await second.variant_path("wordpress")
+        await second.close()
+
+    assert encode.call_count == 2
+    assert cache.owns(path) and os.path.exists(path)
+    assert cache.stats()["hits"] == 2
@@ -0,0 +1,95 @@
+"""Unit tests for duplicate_index module.
+
+Tests the flat index search, warm-up merging of local inserts, the
+incremental sync that picks up inserts from other processes and the paged
+fetch through execute_async.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from utils.duplicate_index import CompanyVectorIndex, DuplicateIndex
+
+
+def vector(seed, dim=768):
+    return np.random.default_rng(seed).standard_normal(dim).tolist()
+
+
+def row(unit_id, seed, minutes_ago=0):
+    created_at = datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)
+    return {"id": unit_id, "title": unit_id, "embedding": vector(seed), "created_at": created_at.isoformat()}
+
+
+def test_search_threshold_and_window():
+    """Exact matches are found, dissimilar vectors and rows outside the window are not."""
+    index = CompanyVectorIndex(capacity=1)
+    index.add("old", "Old", vector(1), created_at=100.0)
+    index.add("new", "New", vector(2), created_at=200.0)
+
+    assert len(index) == 2  # Grew past the initial capacity
+    assert index.search(vector(2), 0.98)["id"] == "new"
+    assert index.search(vector(3), 0.98) is None
+    assert index.search(vector(1), 0.98, min_created_at=150.0) is None
+    assert not index.add("new", "New", vector(2))
+
+
+@pytest.mark.asyncio
+async def test_warm_keeps_inserts_made_while_loading():
+    """Units added during the first warm-up survive the snapshot."""
+    duplicate_index = DuplicateIndex()
+
+    async def fetch(company_id, since):
+        return [row("db-1", 1, minutes_ago=5)]
+
+    with patch.object(duplicate_index, "_fetch_recent", side_effect=fetch):
+        assert not duplicate_index.is_warm("c1")
+        duplicate_index.record_cold_fallback("c1")
+        duplicate_index.add("c1", "local-1", "Local", vector(2))
+        await duplicate_index._warming["c1"]
+
+    assert duplicate_index.is_warm("c1")
+    assert duplicate_index.find_duplicate("c1", vector(1), 0.98)["id"] == "db-1"
+    assert duplicate_index.find_duplicate("c1", vector(2), 0.98)["id"] == "local-1"
+    assert duplicate_index.stats()["entries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_picks_up_other_process_inserts():
+    """After sync_seconds, rows inserted elsewhere become visible without a full re-warm."""
+    duplicate_index = DuplicateIndex(sync_seconds=0)
+    rows = [row("db-1", 1, minutes_ago=5)]
+
+    async def fetch(company_id, since):
+        return list(rows)
+
+    with patch.object(duplicate_index, "_fetch_recent", side_effect=fetch):
+        await duplicate_index.warm("c1")
+        rows.append(row("other-process", 2))
+
+        assert duplicate_index.find_duplicate("c1", vector(2), 0.98) is None
+        assert duplicate_index.is_warm("c1")  # Schedules the sync
+        await duplicate_index._warming["c1"]
+
+    assert duplicate_index.find_duplicate("c1", vector(2), 0.98)["id"] == "other-process"
+    stats = duplicate_index.stats()
+    assert (stats["warmups"], stats["syncs"], stats["entries"]) == (1, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_fetch_recent_pages_through_execute_async():
+    """Full pages keep paging on the Supabase pool; the result is capped at max_entries."""
+    duplicate_index = DuplicateIndex(max_entries=1200)
+    pages = []
+
+    async def execute(query):
+        pages.append(query)
+        return MagicMock(data=[row(f"{len(pages)}-{i}", i) for i in range(500)])
+
+    with patch("utils.supabase_client.get_supabase_client"), \
+            patch("utils.supabase_client.execute_async", execute):
+        rows = await duplicate_index._fetch_recent("c1", "2026-01-01T00:00:00+00:00")
+
+    assert len(pages) == 3
+    assert len(rows) == 1200 and rows[-1]["id"] == "3-199"
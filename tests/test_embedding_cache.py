@@ -0,0 +1,78 @@
+"""Unit tests for embedding_cache module.
+
+Tests the two-tier (memory LRU + SQLite) content-addressed embedding cache.
+"""
+
+import pytest
+from utils.embedding_cache import EmbeddingCache, embedding_cache_key
+
+
+MODEL = "sentence-transformers/paraphrase-multilingual-mpnet-base-v2"
+
+
+class TestEmbeddingCacheKey:
+    """Test cache key derivation."""
+
+    def test_key_depends_on_model(self):
+        """Same text with different models must not collide."""
+        assert embedding_cache_key("a | b", MODEL) != embedding_cache_key("a | b", "other-model")
+
+    def test_key_is_exact_text(self):
+        """Key uses the exact joined text (no normalization)."""
+        assert embedding_cache_key("Título | Resumen", MODEL) != embedding_cache_key("título | resumen", MODEL)
+
+
+class TestEmbeddingCache:
+    """Test EmbeddingCache tiers and stats."""
+
+    def test_miss_then_memory_hit(self):
+        """First lookup misses, lookup after set hits memory tier."""
+        cache = EmbeddingCache(memory_size=10, db_path=None)
+
+        assert cache.get("texto", MODEL) is None
+        cache.set("texto", MODEL, [0.5, -0.25, 1.0])
+
+        assert cache.get("texto", MODEL) == [0.5, -0.25, 1.0]
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["memory_hits"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_lru_eviction(self):
+        """Oldest entry is evicted when memory tier is full."""
+        cache = EmbeddingCache(memory_size=2, db_path=None)
+        cache.set("a", MODEL, [1.0])
+        cache.set("b", MODEL, [2.0])
+        cache.get("a", MODEL)  # "a" becomes most recent
+        cache.set("c", MODEL, [3.0])
+
+        assert cache.get("b", MODEL) is None
+        assert cache.get("a", MODEL) == [1.0]
+        assert cache.get("c", MODEL) == [3.0]
+
+    def test_disk_tier_survives_memory_clear(self, tmp_path):
+        """Vectors persisted to SQLite are served after memory is dropped."""
+        db_path = str(tmp_path / "embeddings.sqlite3")
+        cache = EmbeddingCache(memory_size=10, db_path=db_path)
+        cache.set("texto", MODEL, [0.5, -0.25, 1.0])
+        cache.clear_memory()
+
+        assert cache.get("texto", MODEL) == [0.5, -0.25, 1.0]
+        assert cache.stats()["disk_hits"] == 1
+
+        # A fresh instance (new process) reads the same file
+        reopened = EmbeddingCache(memory_size=10, db_path=db_path)
+        assert reopened.get("texto", MODEL) == pytest.approx([0.5, -0.25, 1.0])
+
+    def test_batch_lookup_mixes_tiers(self, tmp_path):
+        """get_many serves memory, disk and misses in order; set_many persists the batch."""
+        db_path = str(tmp_path / "embeddings.sqlite3")
+        cache = EmbeddingCache(memory_size=10, db_path=db_path)
+        cache.set_many([("a", [1.0]), ("b", [2.0])], MODEL)
+        cache.clear_memory()
+        cache.set("c", MODEL, [3.0])
+
+        assert cache.get_many(["a", "c", "x", "b"], MODEL) == [[1.0], [3.0], None, [2.0]]
+        stats = cache.stats()
+        assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) == (1, 2, 1)
+        assert stats["writes"] == 3
@@ -0,0 +1,73 @@
+"""Unit tests for embedding_generator module.
+
+Tests the EmbeddingBatcher micro-batching queue with a stubbed batch
+embedder: coalescing, early flush, error propagation and short results.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from utils.embedding_generator import EmbeddingBatcher, generate_embeddings_fastembed_batch
+
+
+def fake_embed(texts):
+    return [[float(len(text))] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch():
+    """Requests inside the window go to a single embed call, results in order."""
+    batcher = EmbeddingBatcher(max_batch_size=10, window_ms=10)
+
+    with patch("utils.embedding_generator.generate_embeddings_fastembed_batch",
+               AsyncMock(side_effect=fake_embed)) as embed:
+        results = await asyncio.gather(*[batcher.embed("x" * n) for n in (1, 2, 3)])
+
+    assert results == [[1.0], [2.0], [3.0]]
+    embed.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_before_window():
+    """Reaching max_batch_size flushes without waiting for the timer."""
+    batcher = EmbeddingBatcher(max_batch_size=2, window_ms=60000)
+
+    with patch("utils.embedding_generator.generate_embeddings_fastembed_batch",
+               AsyncMock(side_effect=fake_embed)):
+        results = await asyncio.wait_for(asyncio.gather(batcher.embed("a"), batcher.embed("bb")), 1)
+
+    assert results == [[1.0], [2.0]]
+
+
+@pytest.mark.asyncio
+async def test_errors_and_short_results_fail_every_waiter():
+    """No caller is left pending when the batch fails or returns too few vectors."""
+    batcher = EmbeddingBatcher(max_batch_size=10, window_ms=1)
+
+    with patch("utils.embedding_generator.generate_embeddings_fastembed_batch",
+               AsyncMock(side_effect=RuntimeError("model down"))):
+        with pytest.raises(RuntimeError, match="model down"):
+            await batcher.embed("a")
+
+    with patch("utils.embedding_generator.generate_embeddings_fastembed_batch",
+               AsyncMock(return_value=[[1.0]])):
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True), 1
+        )
+
+    assert results[0] == [1.0]
+    assert isinstance(results[1], RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_short_model_output():
+    """A model returning fewer vectors than texts raises instead of caching partial results."""
+    class ShortModel:
+        def embed(self, texts, batch_size):
+            return iter([])
+
+    with patch("utils.embedding_generator.settings.embedding_cache_enabled", False), \
+            patch("utils.embedding_generator.get_fastembed_model", return_value=ShortModel()):
+        with pytest.raises(RuntimeError, match="0 embeddings for 2 texts"):
+            await generate_embeddings_fastembed_batch(["a", "b"])
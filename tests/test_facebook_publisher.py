@@ -100,15 +100,14 @@ class TestFacebookPublisherAsync:
             'link': 'https://facebook.com/testpage'
         }
 
-        with patch('aiohttp.ClientSession') as mock_session:
+        with patch('publishers.publisher_http.PublisherSessionPool.get_session', new_callable=AsyncMock) as mock_session:
             mock_resp = AsyncMock()
             mock_resp.status = 200
             mock_resp.json = AsyncMock(return_value=mock_response)
 
             mock_session_instance = MagicMock()
-            mock_session_instance.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_resp)))
-            mock_session.return_value.__aenter__ = AsyncMock(return_value=mock_session_instance)
-            mock_session.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_session_instance.request = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_resp)))
+            mock_session.return_value = mock_session_instance
 
             result = await facebook_publisher.test_connection()
 
@@ -125,15 +124,14 @@ class TestFacebookPublisherAsync:
             }
         }
 
-        with patch('aiohttp.ClientSession') as mock_session:
+        with patch('publishers.publisher_http.PublisherSessionPool.get_session', new_callable=AsyncMock) as mock_session:
             mock_resp = AsyncMock()
             mock_resp.status = 401
             mock_resp.json = AsyncMock(return_value=mock_error)
 
             mock_session_instance = MagicMock()
-            mock_session_instance.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_resp)))
-            mock_session.return_value.__aenter__ = AsyncMock(return_value=mock_session_instance)
-            mock_session.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_session_instance.request = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_resp)))
+            mock_session.return_value = mock_session_instance
 
             result = await facebook_publisher.test_connection()
 
@@ -226,15 +224,14 @@ class TestFacebookOAuth:
             'expires_in': 5184000
         }
 
-        with patch('aiohttp.ClientSession') as mock_session:
+        with patch('publishers.publisher_http.PublisherSessionPool.get_session', new_callable=AsyncMock) as mock_session:
             mock_resp = AsyncMock()
             mock_resp.status = 200
             mock_resp.json = AsyncMock(return_value=mock_response)
 
             mock_session_instance = MagicMock()
-            mock_session_instance.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_resp)))
-            mock_session.return_value.__aenter__ = AsyncMock(return_value=mock_session_instance)
-            mock_session.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_session_instance.request = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_resp)))
+            mock_session.return_value = mock_session_instance
 
             result = await FacebookPublisher.exchange_code_for_token(
                 app_id='test_app',
@@ -257,15 +254,14 @@ class TestFacebookOAuth:
             }
         }
 
-        with patch('aiohttp.ClientSession') as mock_session:
+        with patch('publishers.publisher_http.PublisherSessionPool.get_session', new_callable=AsyncMock) as mock_session:
             mock_resp = AsyncMock()
             mock_resp.status = 400
             mock_resp.json = AsyncMock(return_value=mock_error)
 
             mock_session_instance = MagicMock()
-            mock_session_instance.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_resp)))
-            mock_session.return_value.__aenter__ = AsyncMock(return_value=mock_session_instance)
-            mock_session.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_session_instance.request = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_resp)))
+            mock_session.return_value = mock_session_instance
 
             result = await FacebookPublisher.exchange_code_for_token(
                 app_id='test_app',
@@ -297,15 +293,14 @@ class TestFacebookOAuth:
             ]
         }
 
-        with patch('aiohttp.ClientSession') as mock_session:
+        with patch('publishers.publisher_http.PublisherSessionPool.get_session', new_callable=AsyncMock) as mock_session:
             mock_resp = AsyncMock()
             mock_resp.status = 200
             mock_resp.json = AsyncMock(return_value=mock_response)
 
             mock_session_instance = MagicMock()
-            mock_session_instance.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_resp)))
-            mock_session.return_value.__aenter__ = AsyncMock(return_value=mock_session_instance)
-            mock_session.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_session_instance.request = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_resp)))
+            mock_session.return_value = mock_session_instance
 
             result = await FacebookPublisher.get_user_pages('test_token')
 
@@ -321,15 +316,14 @@ class TestFacebookOAuth:
             'name': 'Test User'
         }
 
-        with patch('aiohttp.ClientSession') as mock_session:
+        with patch('publishers.publisher_http.PublisherSessionPool.get_session', new_callable=AsyncMock) as mock_session:
             mock_resp = AsyncMock()
             mock_resp.status = 200
             mock_resp.json = AsyncMock(return_value=mock_response)
 
             mock_session_instance = MagicMock()
-            mock_session_instance.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_resp)))
-            mock_session.return_value.__aenter__ = AsyncMock(return_value=mock_session_instance)
-            mock_session.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_session_instance.request = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_resp)))
+            mock_session.return_value = mock_session_instance
 
             result = await FacebookPublisher.get_user_info('test_token')
 
@@ -0,0 +1,80 @@
+"""Unit tests for image_store module.
+
+Tests sharded storage and group listing, lazy and batched migration of
+legacy flat files, and that eviction only touches re-downloadable images.
+"""
+
+import io
+import time
+
+from PIL import Image
+from utils.image_store import ImageStore
+
+
+def jpeg_bytes(size=(64, 32)):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 100, 50)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def test_put_get_and_list_group(tmp_path):
+    """Files land in shards; groups are ordered by numeric index only."""
+    store = ImageStore(str(tmp_path))
+    store.import_legacy()  # Nothing flat: legacy probes are skipped from now on
+
+    for index in (10, 2, 0):
+        store.put(f"cu_{index}", jpeg_bytes(), ".jpg")
+    store.put("cu_cover", jpeg_bytes(), ".jpg")
+    store.put("cux_0", jpeg_bytes(), ".jpg")
+
+    record = store.get("cu_2")
+    assert record.path == store.path_for("cu_2", ".jpg") and record.path.is_file()
+    assert (record.width, record.height, record.mime) == (64, 32, "image/jpeg")
+    assert [r.key for r in store.list_group("cu")] == ["cu_0", "cu_2", "cu_10"]
+
+    # Replacing with another extension removes the old file
+    old_path = record.path
+    store.put("cu_2", b"not-an-image", "png")
+    assert not old_path.exists() and store.get("cu_2").path.suffix == ".png"
+
+    assert store.rename("cu_10", "other_0") is not None
+    assert store.get("cu_10") is None and store.read("other_0") == jpeg_bytes()
+    assert store.get("../etc/passwd") is None
+
+
+def test_legacy_files_are_adopted(tmp_path):
+    """Flat files move into shards on access and through import_legacy()."""
+    (tmp_path / "abc.png").write_bytes(jpeg_bytes())
+    (tmp_path / "cu_1.jpg").write_bytes(jpeg_bytes())
+    (tmp_path / "cu_0.webp").write_bytes(jpeg_bytes())
+    (tmp_path / "other.jpg").write_bytes(jpeg_bytes())
+    store = ImageStore(str(tmp_path))
+
+    assert store.get("abc").path == store.path_for("abc", ".png")
+    assert not (tmp_path / "abc.png").exists()
+    assert [r.path.suffix for r in store.list_group("cu")] == [".webp", ".jpg"]
+
+    assert store.import_legacy(batch=10) == 1
+    assert store.stats() == {"images": 4, "size_mb": 0.0, "evictable": 0, "legacy_pending": False}
+
+
+def test_evict_respects_age_size_and_evictable(tmp_path):
+    """Expired and least recently used evictable images go; uploads stay."""
+    store = ImageStore(str(tmp_path), max_age_days=30)
+    data = jpeg_bytes()
+    store.put("upload", data, ".jpg")
+    for key in ("old", "a", "b"):
+        store.put(key, data, ".jpg", evictable=True)
+
+    db = store._db()
+    now = time.time()
+    for key, age_days in (("upload", 90), ("old", 60), ("a", 2), ("b", 1)):
+        db.execute("UPDATE images SET last_access = ? WHERE key = ?", (now - age_days * 86400, key))
+
+    assert store.evict() == 1
+    assert store.get("old") is None and store.get("upload") is not None
+
+    store.max_bytes = len(data) * 2
+    assert store.evict() == 1
+    assert store.get("a") is None and store.get("b") is not None
+    assert store.evict() == 0
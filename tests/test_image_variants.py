@@ -0,0 +1,102 @@
+"""Unit tests for image_variants module.
+
+Tests query resolution and Accept negotiation, conditional request
+matching and that variants are rendered once and then served from cache.
+"""
+
+import io
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+from utils.derivative_cache import DerivativeCache
+from utils.image_variants import (
+    etag_matches,
+    file_etag,
+    render_variant,
+    resolve_variant,
+    variant_etag,
+    variant_path,
+)
+
+
+def png_bytes(size=(1000, 500), mode="RGBA"):
+    buffer = io.BytesIO()
+    Image.new(mode, size, (10, 20, 30, 128) if mode == "RGBA" else (10, 20, 30)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_resolve_variant():
+    """Sizes snap up the ladder; auto negotiates from Accept; originals pass through."""
+    assert resolve_variant(None, None, None, "image/webp", ".jpg") is None
+    assert resolve_variant(300, None, "gif", None, ".gif") is None
+
+    spec = resolve_variant(300, None, None, "image/webp,image/*", ".jpg")
+    assert (spec.width, spec.height, spec.format, spec.negotiated) == (320, None, "webp", True)
+    assert resolve_variant(300, None, None, "image/*", ".png").format == "png"
+    assert resolve_variant(300, None, None, "image/*", ".jpg").media_type == "image/jpeg"
+
+    explicit = resolve_variant(None, 100000, "jpg", "image/webp", ".png")
+    assert (explicit.height, explicit.format, explicit.negotiated) == (2048, "jpeg", False)
+    assert [resolve_variant(w, None, "webp", None, ".jpg").width for w in (1, 161, 700)] == [160, 320, 1280]
+
+
+def test_render_variant_fits_box_without_upscaling():
+    """Aspect ratio is kept, transparency is flattened for JPEG."""
+    with Image.open(io.BytesIO(render_variant(png_bytes(), 320, 320, "jpeg"))) as img:
+        assert (img.format, img.mode, img.size) == ("JPEG", "RGB", (320, 160))
+    with Image.open(io.BytesIO(render_variant(png_bytes((100, 50)), 320, None, "webp"))) as img:
+        assert (img.format, img.size) == ("WEBP", (100, 50))
+
+
+def test_etag_matches():
+    """Lists, weak prefixes and * are honoured."""
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
+
+
+@pytest.mark.asyncio
+async def test_variant_rendered_once_and_etag_tracks_source(tmp_path):
+    """The ETag needs no render; the second request is a cache hit; rewriting the source changes the ETag."""
+    source = tmp_path / "img.png"
+    source.write_bytes(png_bytes())
+    cache = DerivativeCache(str(tmp_path / "derivatives"), max_bytes=10 * 1024 * 1024)
+    spec = resolve_variant(300, None, "webp", None, ".png")
+
+    with patch("utils.image_variants.get_derivative_cache", return_value=cache):
+        # Known before rendering, so If-None-Match can be answered first
+        early_etag = await variant_etag(source, spec)
+        assert cache.stats()["stores"] == 0
+
+        path, media_type, etag = await variant_path(source, spec)
+        again = await variant_path(source, spec)
+
+        assert etag == early_etag
+
+        assert again == (path, media_type, etag)
+        assert media_type == "image/webp" and cache.owns(str(path))
+        assert cache.stats()["stores"] == 1 and cache.stats()["hits"] == 1
+
+        original_etag = file_etag(source)
+        source.write_bytes(png_bytes((800, 400)))
+        assert (await variant_path(source, spec))[2] != etag
+        assert file_etag(source) != original_etag
+
+
+@pytest.mark.asyncio
+async def test_undecodable_source_falls_back_with_the_announced_etag(tmp_path):
+    """The original is served under the variant ETag, so If-None-Match can match it."""
+    source = tmp_path / "broken.jpg"
+    source.write_bytes(b"not an image")
+    cache = DerivativeCache(str(tmp_path / "derivatives"), max_bytes=10 * 1024 * 1024)
+    spec = resolve_variant(300, None, "webp", None, ".jpg")
+
+    with patch("utils.image_variants.get_derivative_cache", return_value=cache):
+        announced = await variant_etag(source, spec)
+        path, media_type, etag = await variant_path(source, spec)
+
+    assert (path, media_type) == (source, "image/jpeg")
+    assert etag == announced
+    assert etag_matches(announced, etag)
@@ -0,0 +1,185 @@
+"""Unit tests for imap_session module and the email monitor loop.
+
+Tests the IMAP IDLE implementation and reconnects against a local fake
+IMAP server, and the monitor's backoff and mark-as-seen rules with a
+stubbed session.
+"""
+
+import asyncio
+import imaplib
+import socketserver
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sources.multi_company_email_monitor import MultiCompanyEmailMonitor
+from utils import imap_session
+from utils.imap_session import ImapSession
+
+
+class FakeImapHandler(socketserver.StreamRequestHandler):
+    """Minimal IMAP4rev1 server: one scripted reply per command."""
+
+    def send(self, data: bytes) -> None:
+        self.wfile.write(data)
+        self.wfile.flush()
+
+    def handle(self):
+        server = self.server
+        capabilities = b"IMAP4rev1 IDLE" if server.idle_supported else b"IMAP4rev1"
+        self.send(b"* OK fake server ready\r\n")
+
+        for line in self.rfile:
+            tag, _, rest = line.strip().partition(b" ")
+            command = rest.split(b" ")[0].upper()
+
+            if command == b"CAPABILITY":
+                self.send(b"* CAPABILITY " + capabilities + b"\r\n" + tag + b" OK done\r\n")
+            elif command == b"LOGIN":
+                server.logins += 1
+                self.send(tag + b" OK logged in\r\n")
+            elif command == b"SELECT":
+                self.send(b"* 2 EXISTS\r\n" + tag + b" OK [READ-WRITE] selected\r\n")
+            elif command == b"SEARCH":
+                if server.failing_searches:
+                    server.failing_searches -= 1
+                    self.send(tag + b" BAD search failed\r\n")
+                else:
+                    self.send(b"* SEARCH 1 2\r\n" + tag + b" OK done\r\n")
+            elif command == b"IDLE":
+                # Continuation and any untagged data go out in a single write
+                self.send(server.idle_reply)
+                if self.rfile.readline().strip().upper() == b"DONE":
+                    self.send(tag + b" OK IDLE terminated\r\n")
+            elif command == b"LOGOUT":
+                self.send(b"* BYE\r\n" + tag + b" OK bye\r\n")
+                return
+            else:
+                self.send(tag + b" OK done\r\n")
+
+
+class FakeImapServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeImapHandler)
+        self.idle_supported = True
+        self.idle_reply = b"+ idling\r\n"
+        self.failing_searches = 0
+        self.logins = 0
+
+
+@pytest.fixture
+def imap_server():
+    server = FakeImapServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    # Plain TCP instead of TLS; everything else is the production code path
+    with patch.object(imap_session.imaplib, "IMAP4_SSL", imaplib.IMAP4), \
+            patch.object(imap_session, "IDLE_POLL_SECONDS", 0.05):
+        yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_session(server):
+    host, port = server.server_address
+    return ImapSession(host, port, "user", "secret", timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_idle_sees_exists_sent_with_the_continuation(imap_server):
+    """An EXISTS already buffered with "+ idling" ends IDLE at once."""
+    imap_server.idle_reply = b"+ idling\r\n* 3 EXISTS\r\n"
+    session = make_session(imap_server)
+    try:
+        assert await session.idle(5) is True
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_timeout_and_missing_capability(imap_server):
+    """No untagged data means False after the timeout; no IDLE capability means None."""
+    session = make_session(imap_server)
+    try:
+        assert await session.idle(0.2) is False
+    finally:
+        await session.close()
+
+    imap_server.idle_supported = False
+    session = make_session(imap_server)
+    try:
+        assert await session.idle(5) is None
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_imap_error_drops_connection_and_next_call_reconnects(imap_server):
+    """A failed command closes the connection; the following one logs in again."""
+    imap_server.failing_searches = 1
+    session = make_session(imap_server)
+    try:
+        with pytest.raises(imaplib.IMAP4.error):
+            await session.search_unseen()
+        assert session._conn is None
+
+        assert await session.search_unseen() == [b"1", b"2"]
+        assert imap_server.logins == 2
+    finally:
+        await session.close()
+
+
+def make_monitor():
+    with patch("sources.multi_company_email_monitor.AudioTranscriber"), \
+            patch("sources.multi_company_email_monitor.EmailImageProcessor"):
+        monitor = MultiCompanyEmailMonitor("imap.example.com", 993, "contact@ekimen.ai", "secret")
+    monitor.session = MagicMock(
+        search_unseen=AsyncMock(return_value=[b"1", b"2", b"3"]),
+        fetch=AsyncMock(side_effect=lambda email_id: b"raw " + email_id),
+        mark_seen=AsyncMock(),
+        close=AsyncMock()
+    )
+    return monitor
+
+
+@pytest.mark.asyncio
+async def test_start_backs_off_and_resets_after_a_good_cycle():
+    """Backoff doubles on consecutive errors and starts over after a clean cycle."""
+    monitor = make_monitor()
+    monitor.check_inbox = AsyncMock(side_effect=[OSError("down"), OSError("down"), None, OSError("down")])
+    monitor._wait_for_mail = AsyncMock()
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 3:
+            raise asyncio.CancelledError
+
+    with patch("sources.multi_company_email_monitor.asyncio.sleep", fake_sleep):
+        with pytest.raises(asyncio.CancelledError):
+            await monitor.start()
+
+    assert sleeps == [5, 10, 5]
+    monitor._wait_for_mail.assert_awaited_once()
+    monitor.session.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_email_is_not_marked_seen():
+    """Only emails processed successfully get the \\Seen flag."""
+    monitor = make_monitor()
+    outcomes = {b"1": True, b"2": False, b"3": RuntimeError("ingest failed")}
+
+    async def process(email_body, email_id):
+        outcome = outcomes[email_id]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monitor._process_email = process
+    await monitor.check_inbox()
+
+    assert [call.args[0] for call in monitor.session.mark_seen.await_args_list] == [b"1"]
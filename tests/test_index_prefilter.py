@@ -0,0 +1,93 @@
+"""Unit tests for the index pre-filter in scraper_workflow.
+
+Tests filter_known_index_articles against a stubbed Supabase query:
+trailing-slash URL matching, title normalization and the fallback to the
+unfiltered list when the query fails.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sources.scraper_workflow import filter_known_index_articles
+
+
+class FakeQuery:
+    """Records the filters of a PostgREST query chain."""
+
+    def __init__(self, table):
+        self.table = table
+        self.filters = {}
+
+    def select(self, columns):
+        return self
+
+    def eq(self, column, value):
+        self.filters[column] = [value]
+        return self
+
+    def in_(self, column, values):
+        self.filters[column] = list(values)
+        return self
+
+
+class FakeDatabase:
+    def __init__(self, stored_urls=(), stored_titles=(), error=None):
+        self.stored_urls = stored_urls
+        self.stored_titles = stored_titles
+        self.error = error
+        self.queries = []
+        self.client = MagicMock()
+        self.client.table.side_effect = FakeQuery
+
+    async def execute(self, query):
+        self.queries.append(query)
+        if self.error:
+            raise self.error
+        if query.table == "press_context_units":
+            requested = query.filters["source_metadata->>url"]
+            return MagicMock(data=[{"url": url} for url in self.stored_urls if url in requested])
+        return MagicMock(data=[{"title": title} for title in self.stored_titles])
+
+
+async def run_filter(database, articles, monitored_url_id=None):
+    with patch("sources.scraper_workflow.get_supabase_client", return_value=database), \
+            patch("sources.scraper_workflow.execute_async", database.execute):
+        return await filter_known_index_articles(articles, "company-1", monitored_url_id)
+
+
+ARTICLES = [
+    {"title": "Pleno municipal", "url": "https://example.com/news/pleno"},
+    {"title": "Nueva  PISCINA\n cubierta", "url": "https://example.com/news/piscina/"},
+    {"title": "Fiestas de agosto", "url": "https://example.com/news/fiestas"},
+]
+
+
+@pytest.mark.asyncio
+async def test_urls_match_with_or_without_trailing_slash():
+    """Stored URLs are found whichever form the index link or the row uses."""
+    database = FakeDatabase(stored_urls=["https://example.com/news/pleno/", "https://example.com/news/piscina"])
+
+    result = await run_filter(database, ARTICLES)
+
+    assert [article["title"] for article in result] == ["Fiestas de agosto"]
+    assert len(database.queries) == 1  # No title lookup without monitored_url_id
+
+
+@pytest.mark.asyncio
+async def test_titles_are_normalized_per_monitored_url():
+    """Case and whitespace differences do not hide an already stored title."""
+    database = FakeDatabase(stored_titles=["nueva piscina cubierta", None, "  "])
+
+    result = await run_filter(database, ARTICLES, monitored_url_id="monitored-1")
+
+    assert [article["title"] for article in result] == ["Pleno municipal", "Fiestas de agosto"]
+    assert database.queries[1].filters == {"monitored_url_id": ["monitored-1"]}
+
+
+@pytest.mark.asyncio
+async def test_query_error_returns_the_unfiltered_list():
+    """A failing lookup must not drop new content."""
+    database = FakeDatabase(error=RuntimeError("connection reset"))
+
+    assert await run_filter(database, ARTICLES, monitored_url_id="monitored-1") == ARTICLES
+    assert await run_filter(database, []) == []
@@ -0,0 +1,75 @@
+"""Unit tests for llm_cache module.
+
+Tests keys, TTL expiry, the SQLite tier, disk trimming and per-operation stats.
+"""
+
+from utils import llm_cache
+from utils.llm_cache import LLMCache, llm_cache_key
+
+
+MODEL = "llama-3.3-70b-versatile"
+RESULT = {"title": "Título", "summary": "Resumen", "tags": ["a"], "atomic_statements": []}
+
+
+def test_key_depends_on_model_and_prompt_version():
+    """Changing the model or prompt version invalidates entries."""
+    key = llm_cache_key("analyze_atomic", MODEL, "1", "texto")
+    assert key != llm_cache_key("analyze_atomic", "other-model", "1", "texto")
+    assert key != llm_cache_key("analyze_atomic", MODEL, "2", "texto")
+
+
+def test_hit_returns_copy_and_counts_per_operation():
+    """Callers may mutate a hit without corrupting the cache."""
+    cache = LLMCache(memory_size=10, db_path=None)
+    assert cache.get("analyze_atomic", MODEL, "1", "texto") is None
+    cache.set("analyze_atomic", MODEL, "1", "texto", RESULT)
+
+    hit = cache.get("analyze_atomic", MODEL, "1", "texto")
+    hit["tags"].append("mutated")
+
+    assert cache.get("analyze_atomic", MODEL, "1", "texto") == RESULT
+    stats = cache.stats()
+    assert stats["operations"]["analyze_atomic"] == {"hits": 2, "misses": 1, "hit_rate": 0.6667}
+
+
+def test_expired_entries_miss(tmp_path):
+    """Entries past their TTL are not served from either tier."""
+    cache = LLMCache(memory_size=10, db_path=str(tmp_path / "llm.sqlite3"), ttl_seconds=-1)
+    cache.set("extract_events", MODEL, "1", "html", {"events": []})
+
+    assert cache.get("extract_events", MODEL, "1", "html") is None
+
+
+def test_disk_tier_trimmed_to_max_entries(tmp_path, monkeypatch):
+    """Oldest disk rows are evicted beyond max_disk_entries."""
+    monkeypatch.setattr(llm_cache, "PRUNE_EVERY", 3)
+    db_path = str(tmp_path / "llm.sqlite3")
+    cache = LLMCache(memory_size=0, db_path=db_path, max_disk_entries=2)
+
+    for i in range(3):
+        cache.set("generate_image_prompt", MODEL, "1", f"texto {i}", {"image_prompt": str(i)})
+    cache.flush()
+
+    assert cache.get("generate_image_prompt", MODEL, "1", "texto 0") is None
+    assert cache.get("generate_image_prompt", MODEL, "1", "texto 2") == {"image_prompt": "2"}
+    assert cache.stats()["evicted"] == 1
+
+
+def test_writes_are_queued_and_flushed_in_one_batch(tmp_path, monkeypatch):
+    """Queued rows are served before the flush and reach disk together."""
+    monkeypatch.setattr(llm_cache, "WRITE_BATCH_SIZE", 2)
+    db_path = str(tmp_path / "llm.sqlite3")
+    cache = LLMCache(memory_size=0, db_path=db_path)
+
+    cache.set("analyze_atomic", MODEL, "1", "a", RESULT)
+    assert not cache.flush_due()
+    assert cache.get("analyze_atomic", MODEL, "1", "a") == RESULT
+    assert LLMCache(memory_size=0, db_path=db_path).get("analyze_atomic", MODEL, "1", "a") is None
+
+    cache.set("analyze_atomic", MODEL, "1", "b", RESULT)
+    assert cache.flush_due()
+    assert cache.flush() == 2
+    assert cache.stats()["pending_writes"] == 0
+
+    reopened = LLMCache(memory_size=0, db_path=db_path)
+    assert reopened.get("analyze_atomic", MODEL, "1", "b") == RESULT
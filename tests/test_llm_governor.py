@@ -0,0 +1,72 @@
+"""Unit tests for llm_governor module.
+
+Tests token estimation, in-flight caps and requests/tokens per minute windows.
+"""
+
+import asyncio
+
+import pytest
+from utils import llm_governor
+from utils.llm_governor import ProviderGovernor, estimate_tokens
+
+
+def test_estimate_tokens_handles_message_shapes():
+    """Strings, dict messages and objects with .content are counted."""
+
+    class Message:
+        content = "x" * 400
+
+    assert estimate_tokens("x" * 40) == 11
+    assert estimate_tokens([{"role": "user", "content": "x" * 40}, Message()]) == 11 + 101
+    assert estimate_tokens(None) == 0
+
+
+@pytest.mark.asyncio
+async def test_in_flight_cap():
+    """No more than max_in_flight calls run at once."""
+    governor = ProviderGovernor("groq", max_in_flight=2)
+    running = 0
+    peak = 0
+
+    async def call():
+        nonlocal running, peak
+        async with governor.slot(10):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*[call() for _ in range(6)])
+    assert peak == 2
+    assert governor.stats()["requests"] == 6
+
+
+@pytest.mark.asyncio
+async def test_requests_per_minute_window(monkeypatch):
+    """Calls beyond the RPM limit wait until the window frees a slot."""
+    monkeypatch.setattr(llm_governor, "WINDOW_SECONDS", 0.05)
+    governor = ProviderGovernor("groq", requests_per_minute=2)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for _ in range(3):
+        async with governor.slot():
+            pass
+
+    assert loop.time() - start >= 0.04
+    assert governor.stats()["waited"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tokens_per_minute_uses_real_usage(monkeypatch):
+    """Reported usage replaces the estimate when checking the TPM budget."""
+    monkeypatch.setattr(llm_governor, "WINDOW_SECONDS", 0.05)
+    governor = ProviderGovernor("groq", tokens_per_minute=1000)
+
+    async with governor.slot(100) as lease:
+        lease.tokens = 950
+
+    async with governor.slot(100):
+        pass
+
+    assert governor.stats()["waited"] == 1
@@ -0,0 +1,57 @@
+"""Unit tests for parsed_document module.
+
+Tests that large pages get every view the scraper reads from the CPU pool
+(no parse on the event loop) and the multi-noticia block detection.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from utils.cpu_pool import shutdown_cpu_pool
+from utils.parsed_document import ParsedDocument, build_document
+
+BLOCK = (
+    '<div class="noticia-item"><h2>Titular {i}</h2>'
+    '<time datetime="2024-03-0{i}">hace poco</time>'
+    '<p>{body}</p><a href="/n/{i}">Leer</a></div>'
+)
+
+
+def multi_noticia_html(blocks=3):
+    body = "Texto de la noticia con bastante contenido. " * 3
+    items = "".join(BLOCK.format(i=i + 1, body=body) for i in range(blocks))
+    return (
+        '<html><head><title>Portada</title>'
+        '<meta property="article:published_time" content="2024-03-01T10:00:00Z"></head>'
+        f'<body><main>{items}</main><div class="sidebar-item">corto</div></body></html>'
+    )
+
+
+def test_news_blocks():
+    """Only blocks with heading, link and 50-2000 chars are valid."""
+    views = ParsedDocument(multi_noticia_html(), "https://example.com/").news_blocks
+
+    assert (views["candidates"], views["valid"]) == (4, 3)
+    first = views["blocks"][0]
+    assert first["text"].startswith("Titular 1")
+    assert first["css_dates"][0][0].day == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["thread", "process"])
+async def test_large_pages_are_not_parsed_on_the_loop(mode):
+    """Views come from the pool (spawned workers in process mode)."""
+    html = multi_noticia_html()
+
+    with patch("utils.cpu_pool.settings.cpu_offload_mode", mode), \
+            patch("utils.cpu_pool.settings.cpu_offload_min_bytes", 10):
+        try:
+            document = await build_document(html, "https://example.com/")
+        finally:
+            shutdown_cpu_pool()
+
+    assert document.title == "Portada"
+    assert document.news_blocks["valid"] == 3
+    assert document.css_dates and document.meta["article:published_time"]
+    assert document.normalized_text and document.llm_text
+    assert document._soup is None
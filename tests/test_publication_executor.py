@@ -0,0 +1,81 @@
+"""Unit tests for publication_executor module.
+
+Tests per-platform concurrency limits, result ordering and that a media
+bundle transforms each platform variant only once.
+"""
+
+import asyncio
+import io
+import os
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+from publishers.publication_executor import MediaBundle, PublicationExecutor
+from utils.image_store import ImageStore
+from utils.image_transformer import ImageTransformer
+
+
+def jpeg_bytes():
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 32), (200, 100, 50)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_respects_platform_limits():
+    """Targets run concurrently but never above their platform limit."""
+    executor = PublicationExecutor({"twitter": 1, "facebook": 2})
+    running = {"twitter": 0, "facebook": 0}
+    peak = {"twitter": 0, "facebook": 0}
+
+    async def publish(target):
+        platform = target["platform_type"]
+        running[platform] += 1
+        peak[platform] = max(peak[platform], running[platform])
+        await asyncio.sleep(0.01)
+        running[platform] -= 1
+        if target["id"] == "boom":
+            raise RuntimeError("boom")
+        return target["id"]
+
+    targets = [
+        {"id": "t1", "platform_type": "twitter"},
+        {"id": "f1", "platform_type": "facebook"},
+        {"id": "t2", "platform_type": "twitter"},
+        {"id": "f2", "platform_type": "facebook"},
+        {"id": "boom", "platform_type": "facebook"},
+    ]
+    results = await executor.fan_out(targets, lambda target: target["platform_type"], publish)
+
+    assert results[:4] == ["t1", "f1", "t2", "f2"]
+    assert isinstance(results[4], RuntimeError)
+    assert peak == {"twitter": 1, "facebook": 2}
+
+
+@pytest.mark.asyncio
+async def test_bundle_transforms_each_platform_once(tmp_path):
+    """Concurrent requests for a variant share one transformation; close() cleans up."""
+    with patch("publishers.publication_executor.get_image_store", return_value=ImageStore(str(tmp_path))), \
+            patch("publishers.publication_executor.get_derivative_cache", return_value=None):
+        (tmp_path / "img-1.jpg").write_bytes(jpeg_bytes())
+        bundle = await MediaBundle.load("img-1")
+
+    original = ImageTransformer.transform_for_publication
+    with patch.object(ImageTransformer, "transform_for_publication", wraps=original) as transform:
+        paths = await asyncio.gather(*(bundle.variant_path("twitter") for _ in range(3)))
+        wordpress = await bundle.variant_path("wordpress")
+
+    assert len(set(paths)) == 1
+    assert wordpress.endswith(".webp") and paths[0].endswith(".jpeg")
+    assert transform.call_count == 2
+
+    await bundle.close()
+    assert not os.path.exists(paths[0]) and not os.path.exists(wordpress)
+
+
+@pytest.mark.asyncio
+async def test_empty_bundle_has_no_variants():
+    """Articles without image publish without temp files."""
+    bundle = await MediaBundle.load(None)
+    assert await bundle.variant_path("twitter") is None
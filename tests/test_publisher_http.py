@@ -0,0 +1,97 @@
+"""Unit tests for publisher_http module.
+
+Runs a local aiohttp server to test retries (Retry-After, non-idempotent
+POSTs, per-attempt bodies) and the per-platform metrics.
+"""
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from publishers.publisher_http import PublisherSessionPool, parse_retry_after
+
+
+@pytest_asyncio.fixture
+async def server():
+    calls = {"flaky": 0, "broken": 0, "upload": 0}
+
+    async def flaky(request):
+        calls["flaky"] += 1
+        if calls["flaky"] < 3:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.json_response({"ok": True})
+
+    async def broken(request):
+        calls["broken"] += 1
+        return web.Response(status=500)
+
+    async def upload(request):
+        calls["upload"] += 1
+        form = await request.post()
+        if calls["upload"] == 1:
+            return web.Response(status=503)
+        return web.json_response({"size": len(form["media"].file.read())})
+
+    app = web.Application()
+    app.router.add_get("/flaky", flaky)
+    app.router.add_route("*", "/broken", broken)
+    app.router.add_post("/upload", upload)
+
+    test_server = TestServer(app)
+    await test_server.start_server()
+    test_server.calls = calls
+    yield test_server
+    await test_server.close()
+
+
+def test_parse_retry_after():
+    """Delta-seconds and HTTP dates are supported; garbage is ignored."""
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.asyncio
+async def test_retries_429_and_records_metrics(server):
+    """429s are retried after Retry-After; only idempotent requests retry 500."""
+    pool = PublisherSessionPool(max_retries=3, backoff_seconds=0)
+
+    async with pool.request("twitter", "GET", str(server.make_url("/flaky"))) as response:
+        assert response.status == 200
+        assert await response.json() == {"ok": True}
+
+    async with pool.request("twitter", "POST", str(server.make_url("/broken"))) as response:
+        assert response.status == 500
+    assert server.calls["broken"] == 1
+
+    async with pool.request("twitter", "GET", str(server.make_url("/broken"))) as response:
+        assert response.status == 500
+    assert server.calls["broken"] == 5
+
+    stats = pool.stats()["twitter"]
+    assert stats["requests"] == 8
+    assert stats["retries"] == 5
+    assert stats["statuses"] == {"4xx": 2, "2xx": 1, "5xx": 5}
+    assert stats["p95_ms"] >= stats["avg_ms"] > 0
+
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_callable_body_is_rebuilt_per_attempt(server):
+    """A FormData factory is called again for the retried POST."""
+    pool = PublisherSessionPool(max_retries=1, backoff_seconds=0)
+
+    def form():
+        form_data = aiohttp.FormData()
+        form_data.add_field("media", b"x" * 10, filename="image.jpg")
+        return form_data
+
+    async with pool.request("facebook", "POST", str(server.make_url("/upload")), data=form) as response:
+        assert response.status == 200
+        assert await response.json() == {"size": 10}
+    assert server.calls["upload"] == 2
+
+    await pool.close()
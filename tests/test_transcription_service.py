@@ -0,0 +1,65 @@
+"""Unit tests for transcription_service module.
+
+Tests silence-aware chunking and in-order streaming of chunk results.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+from utils import transcription_service
+from utils.transcription_service import SAMPLE_RATE, TranscriptionService, split_audio
+
+
+def tone(seconds, amplitude=0.3):
+    return np.full(int(seconds * SAMPLE_RATE), amplitude, dtype=np.float32)
+
+
+def silence(seconds):
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+def test_split_cuts_at_quiet_frame():
+    """Chunks end at the pause near the boundary, not at the exact length."""
+    audio = np.concatenate([tone(52), silence(1), tone(40)])
+    chunks = split_audio(audio, chunk_seconds=60)
+
+    assert len(chunks) == 2
+    assert 52 <= chunks[0][1] <= 53
+    assert chunks[1] == (chunks[0][1], 93.0)
+
+
+def test_split_drops_silence_and_merges_short_tail():
+    """Silent chunks are skipped and a tiny tail joins the previous chunk."""
+    audio = np.concatenate([tone(20), silence(40), tone(20)])
+    assert split_audio(audio, chunk_seconds=30) == [(0.0, 30.0), (60.0, 80.0)]
+
+    assert split_audio(tone(65), chunk_seconds=30) == [(0.0, 30.0), (30.0, 65.0)]
+    assert split_audio(silence(10), chunk_seconds=30) == []
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_in_order_and_fixes_language(monkeypatch):
+    """Later chunks reuse the language detected on the first one."""
+    service = TranscriptionService(workers=2, chunk_seconds=30)
+    calls = []
+
+    async def fake_run(func, *args):
+        if func is transcription_service._plan_chunks:
+            return {"duration": 90.0, "chunks": [(0.0, 30.0), (30.0, 60.0), (60.0, 90.0)]}
+        file_path, start, end, language = args
+        calls.append(language)
+        # Later chunks finish first
+        await asyncio.sleep(0.01 * (3 - start / 30))
+        return {"text": f"t{int(start)}", "language": language or "es", "audio_seconds": end - start, "elapsed_seconds": 1.0}
+
+    monkeypatch.setattr(service, "_run", fake_run)
+
+    chunks = [chunk async for chunk in service.transcribe_stream("audio.mp3")]
+    assert [chunk["text"] for chunk in chunks] == ["t0", "t30", "t60"]
+    assert calls == [None, "es", "es"]
+
+    result = await service.transcribe("audio.mp3")
+    assert result["text"] == "t0 t30 t60"
+    assert result["duration"] == 90.0
+    assert service.stats()["audio_seconds"] == 180.0
@@ -0,0 +1,75 @@
+"""Unit tests for tts_service module.
+
+Uses a fake Piper executable to test sentence streaming, worker reuse and
+the content-addressed cache.
+"""
+
+import stat
+import sys
+import wave
+
+import pytest
+from utils.tts_service import TTSService, split_sentences, wav_header
+
+FAKE_PIPER = '''#!{python}
+import json, sys, wave
+args = sys.argv[1:]
+if "--output_raw" in args:
+    for line in sys.stdin:
+        sys.stdout.buffer.write(b"\\x01\\x00" * 100)
+        sys.stdout.buffer.flush()
+    sys.exit(0)
+for line in sys.stdin:
+    request = json.loads(line)
+    with wave.open(request["output_file"], "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(b"\\x01\\x00" * len(request["text"]))
+    print(request["output_file"], flush=True)
+'''
+
+
+@pytest.fixture
+def piper(tmp_path):
+    path = tmp_path / "piper"
+    path.write_text(FAKE_PIPER.format(python=sys.executable))
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+def test_split_sentences():
+    """Sentences split on punctuation; long ones are cut at commas."""
+    assert split_sentences("Hola. ¿Qué tal?\nBien") == ["Hola.", "¿Qué tal?", "Bien"]
+    long = ", ".join(["palabra"] * 100)
+    assert all(len(part) <= 400 for part in split_sentences(long))
+
+
+@pytest.mark.asyncio
+async def test_stream_caches_and_reuses_worker(piper, tmp_path):
+    """Sentences stream after a WAV header and the result is cached."""
+    service = TTSService(piper, str(tmp_path / "voice.onnx"), workers=1, cache_dir=str(tmp_path / "cache"))
+    text = "Primera frase. Segunda frase más larga."
+
+    chunks = [chunk async for chunk in service.synthesize(text, 1.3)]
+    assert chunks[0] == wav_header(16000)
+    assert [len(chunk) for chunk in chunks[1:]] == [2 * len("Primera frase."), 2 * len("Segunda frase más larga.")]
+    assert service.stats()["workers_started"] == 1
+
+    path = service.cached_path(text, 1.3)
+    assert path is not None
+    with wave.open(path, "rb") as wav:
+        assert wav.readframes(wav.getnframes()) == b"".join(chunks[1:])
+    assert service.cached_path(text, 1.0) is None
+
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_oneshot_mode_streams_raw_output(piper, tmp_path):
+    """Without persistent workers, Piper's raw output is streamed as is."""
+    service = TTSService(piper, str(tmp_path / "voice.onnx"), persistent=False, cache_dir=None)
+
+    chunks = [chunk async for chunk in service.synthesize("Una. Dos.", 1.0)]
+    assert len(b"".join(chunks[1:])) == 400
+    assert service.stats()["workers_started"] == 1
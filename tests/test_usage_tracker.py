@@ -0,0 +1,106 @@
+"""Unit tests for usage_tracker buffering.
+
+Tests size-triggered bulk flushes, close() flushing and requeue on failure.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from postgrest.exceptions import APIError
+from utils.usage_tracker import UsageTracker
+
+
+def make_tracker(**kwargs):
+    with patch("utils.usage_tracker.get_supabase_client", return_value=MagicMock()):
+        return UsageTracker(**kwargs)
+
+
+async def track(tracker, operation="analyze_atomic"):
+    return await tracker.track(
+        model="groq/llama-3.3-70b-versatile",
+        operation=operation,
+        input_tokens=100,
+        output_tokens=50,
+        company_id="company-1"
+    )
+
+
+def inserted_batches(supabase_mock):
+    return [call.args[0] for call in supabase_mock.client.table.return_value.insert.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_batch_size_triggers_bulk_insert():
+    """Reaching batch_size writes one bulk insert without waiting for the interval."""
+    tracker = make_tracker(batch_size=3, flush_interval=60)
+
+    with patch("utils.usage_tracker.execute_async", new=AsyncMock()) as execute:
+        for _ in range(3):
+            assert await track(tracker) == ""
+        await asyncio.sleep(0.01)
+
+        assert execute.await_count == 1
+        assert [len(batch) for batch in inserted_batches(tracker.supabase)] == [3]
+        await tracker.close()
+
+    assert tracker.stats()["written"] == 3
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_remaining_records():
+    """Records below batch_size are written on close()."""
+    tracker = make_tracker(batch_size=50, flush_interval=60)
+
+    with patch("utils.usage_tracker.execute_async", new=AsyncMock()) as execute:
+        await track(tracker)
+        await track(tracker, operation="tts_synthesize")
+        assert execute.await_count == 0
+
+        await tracker.close()
+
+    assert execute.await_count == 1
+    assert tracker.stats()["buffered"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_requeues_records():
+    """A failed insert keeps the records for the next flush."""
+    tracker = make_tracker(batch_size=50, flush_interval=60)
+
+    with patch("utils.usage_tracker.execute_async", new=AsyncMock(side_effect=Exception("down"))):
+        await track(tracker)
+        assert await tracker.flush() == 0
+
+    assert tracker.stats()["buffered"] == 1
+
+    with patch("utils.usage_tracker.execute_async", new=AsyncMock()):
+        await tracker.close()
+
+    stats = tracker.stats()
+    assert stats["written"] == 1
+    assert stats["failed_flushes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rejected_batch_drops_only_bad_rows():
+    """A constraint error retries rows one by one; later records are not held back."""
+    tracker = make_tracker(batch_size=50, flush_interval=60)
+    insert = tracker.supabase.client.table.return_value.insert
+    fk_error = APIError({"message": "violates foreign key constraint", "code": "23503"})
+
+    async def execute(query):
+        rows = insert.call_args.args[0]
+        rows = rows if isinstance(rows, list) else [rows]
+        if any(row["operation"] == "bad" for row in rows):
+            raise fk_error
+
+    with patch("utils.usage_tracker.execute_async", new=AsyncMock(side_effect=execute)):
+        await track(tracker, operation="good")
+        await track(tracker, operation="bad")
+        await track(tracker, operation="good")
+        assert await tracker.flush() == 2
+        await tracker.close()
+
+    stats = tracker.stats()
+    assert (stats["buffered"], stats["rejected"], stats["written"]) == (0, 1, 2)
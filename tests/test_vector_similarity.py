@@ -0,0 +1,72 @@
+"""Unit tests for vector_similarity module.
+
+Tests top-k ordering and thresholds of EmbeddingMatrix, zero vectors,
+pgvector string input and the empty matrix.
+"""
+
+import pytest
+from utils.vector_similarity import EmbeddingMatrix, cosine_similarity, find_similar, to_vector
+
+
+CANDIDATES = [
+    [1.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0],
+    [1.0, 1.0, 0.0],
+    [-1.0, 0.0, 0.0],
+]
+
+
+def test_top_k_orders_by_score():
+    """argpartition path (k < n) and full sort path (k >= n) agree on ordering."""
+    matrix = EmbeddingMatrix(CANDIDATES)
+
+    top = matrix.top_k([1.0, 0.1, 0.0], k=2)
+    assert [index for index, _ in top] == [0, 2]
+    assert top[0][1] > top[1][1]
+
+    everything = matrix.top_k([1.0, 0.1, 0.0], k=10)
+    assert [index for index, _ in everything] == [0, 2, 1, 3]
+    assert everything[-1][1] == pytest.approx(-0.995, abs=1e-3)
+
+    assert matrix.top_k([1.0, 0.1, 0.0], k=10, threshold=0.5) == everything[:2]
+    assert matrix.top_k([1.0, 0.0, 0.0], k=0) == []
+
+
+def test_above_threshold_keeps_original_order():
+    """Indices come back in candidate order, not score order."""
+    matrix = EmbeddingMatrix(CANDIDATES)
+
+    assert matrix.above_threshold([1.0, 1.0, 0.0], 0.7) == [0, 1, 2]
+    assert matrix.above_threshold([1.0, 1.0, 0.0], 0.99) == [2]
+    assert find_similar([0.0, 1.0, 0.0], CANDIDATES, threshold=0.99) == [1]
+    assert find_similar([0.0, 1.0, 0.0], [], threshold=0.5) == []
+
+
+def test_zero_vectors_score_zero():
+    """A zero row or a zero query gives 0.0 instead of NaN."""
+    matrix = EmbeddingMatrix([[0.0, 0.0, 0.0], [3.0, 4.0, 0.0]])
+
+    scores = matrix.scores([3.0, 4.0, 0.0])
+    assert scores.tolist() == pytest.approx([0.0, 1.0])
+    assert matrix.scores([0.0, 0.0, 0.0]).tolist() == [0.0, 0.0]
+    assert cosine_similarity([0.0, 0.0], [1.0, 0.0]) == 0.0
+
+
+def test_pgvector_strings():
+    """PostgREST vector strings are parsed like lists, alone or mixed with lists."""
+    assert to_vector("[0.5,-1,2]").tolist() == [0.5, -1.0, 2.0]
+
+    matrix = EmbeddingMatrix(["[1,0,0]", [0.0, 1.0, 0.0]])
+    assert matrix.top_k("[0,1,0]", k=1) == [(1, pytest.approx(1.0))]
+    assert cosine_similarity("[1,2,3]", [1.0, 2.0, 3.0]) == pytest.approx(1.0)
+
+
+def test_empty_matrix():
+    """No candidates: empty scores and results, shape taken from dim."""
+    matrix = EmbeddingMatrix([], dim=768)
+
+    assert len(matrix) == 0
+    assert matrix.matrix.shape == (0, 768)
+    assert matrix.scores([1.0] * 768).size == 0
+    assert matrix.top_k([1.0] * 768, k=3) == []
+    assert matrix.above_threshold([1.0] * 768, 0.0) == []
@@ -0,0 +1,81 @@
+"""In-process authentication cache (API keys and JWT users).
+
+Every authenticated request used to query Supabase: clients by api_key for
+API keys (REST and MCP), users by auth_user_id for JWTs, plus clients by
+company_id in get_auth_context. Those rows are cached here in a ConfigCache
+(utils/config_cache) with short TTLs:
+
+- api_key: SHA256(api_key) -> clients row, any status (raw keys are never
+  kept in memory as keys). Unknown keys are cached for
+  AUTH_CACHE_NEGATIVE_TTL_SECONDS so key-guessing does not reach the DB.
+- jwt_user: auth_user_id -> users row. The JWT signature and expiry are
+  still verified on every request.
+- company_client: company_id -> active clients row (JWT auth context)
+
+POST /integrations/regenerate-key calls invalidate_company_clients(), so the
+old key stops working in this process immediately; other processes (the
+other workers, the MCP server) keep accepting it for up to
+AUTH_CACHE_TTL_SECONDS (15 s by default). The same bound applies to
+deactivating a user or client, which happens in Supabase directly and is
+never seen by this cache: keep the TTL short.
+
+Usage:
+    client = await get_auth_cache().get_or_load("api_key", api_key_fingerprint(key), load)
+    invalidate_company_clients(company_id)
+"""
+
+import hashlib
+from typing import Any, Dict, Optional
+
+from .config import settings
+from .config_cache import ConfigCache
+from .logger import get_logger
+
+logger = get_logger("auth_cache")
+
+
+def api_key_fingerprint(api_key: str) -> str:
+    """Cache key for an API key (SHA256 hex)."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+# Global cache instance
+_auth_cache: Optional[ConfigCache] = None
+
+
+def get_auth_cache() -> ConfigCache:
+    """Get or create auth cache singleton (no namespaces if disabled)."""
+    global _auth_cache
+
+    if _auth_cache is None:
+        ttls = {}
+        if settings.auth_cache_enabled:
+            ttls = {
+                "api_key": settings.auth_cache_ttl_seconds,
+                "jwt_user": settings.auth_cache_ttl_seconds,
+                "company_client": settings.auth_cache_ttl_seconds
+            }
+        _auth_cache = ConfigCache(
+            ttls,
+            max_entries=settings.auth_cache_max_entries,
+            negative_ttls={"api_key": settings.auth_cache_negative_ttl_seconds}
+        )
+        logger.info("auth_cache_initialized",
+            ttls=ttls,
+            negative_ttl_seconds=settings.auth_cache_negative_ttl_seconds
+        )
+
+    return _auth_cache
+
+
+def invalidate_company_clients(company_id: str) -> None:
+    """Drop cached clients (and their API keys) of a company."""
+    cache = get_auth_cache()
+    cache.invalidate("company_client", company_id)
+    dropped = cache.invalidate_where("api_key", lambda client: client.get("company_id") == company_id)
+    logger.debug("auth_cache_company_invalidated", company_id=company_id, api_keys=dropped)
+
+
+def get_auth_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters for the auth cache."""
+    return get_auth_cache().stats()
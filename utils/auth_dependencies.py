@@ -6,8 +6,9 @@ Provides unified authentication supporting both JWT tokens and API keys.
 from typing import Dict, Optional
 from fastapi import Header, HTTPException, Depends
 
+from utils.auth_cache import get_auth_cache
 from utils.logger import get_logger
-from utils.supabase_client import get_supabase_client
+from utils.supabase_client import get_supabase_client, execute_async
 from utils.supabase_auth import get_current_user_from_jwt
 
 logger = get_logger("auth")
@@ -159,22 +160,25 @@ async def get_auth_context(
         company_id = user["company_id"]
         supabase = get_supabase_client()
 
-        # Find client associated with this company
-        result = supabase.client.table("clients")\
-            .select("client_id, client_name, is_active, created_at")\
-            .eq("company_id", company_id)\
-            .eq("is_active", True)\
-            .limit(1)\
-            .execute()
+        # Find client associated with this company (cached, see utils/auth_cache)
+        async def load():
+            result = await execute_async(
+                supabase.client.table("clients")
+                .select("client_id, client_name, is_active, created_at")
+                .eq("company_id", company_id)
+                .eq("is_active", True)
+                .limit(1)
+            )
+            return result.data[0] if result.data else None
+
+        client_data = await get_auth_cache().get_or_load("company_client", company_id, load)
 
-        if not result.data:
+        if not client_data:
             logger.warn("no_client_for_company", company_id=company_id, user_email=user.get("email"))
             raise HTTPException(
                 status_code=403,
                 detail=f"No active client found for company. Please contact support."
             )
-
-        client_data = result.data[0]
         logger.debug("auth_context_jwt",
             user_id=user.get("id"),
             company_id=company_id,
@@ -0,0 +1,306 @@
+"""Pool of warm Playwright browser contexts for JS-rendered scraping.
+
+The previous approach opened a new page on one global browser, waited for
+networkidle plus a fixed 2 s sleep and downloaded every image, font and
+stylesheet. This pool instead provides:
+
+- PLAYWRIGHT_POOL_SIZE warm browser contexts, one reusable page each
+  (also the cap on concurrent renders)
+- Request interception that aborts PLAYWRIGHT_BLOCK_RESOURCES types
+  (default: image, media, font)
+- Readiness condition instead of the fixed sleep: PLAYWRIGHT_READY_SELECTOR
+  if set, otherwise networkidle, both capped at PLAYWRIGHT_READY_TIMEOUT_MS
+  (a timeout is not an error: the HTML rendered so far is returned)
+- Automatic browser restart after PLAYWRIGHT_MAX_PAGES_PER_BROWSER renders
+  to bound Chromium memory growth (waits for in-flight renders to finish)
+- Isolation between renders: on release the context's cookies, permissions
+  and the last origin's local/session storage are cleared and the page goes
+  to about:blank; a context that fails the reset is replaced. Contexts of a
+  crashed browser are discarded at once, not handed out again
+
+Usage:
+    pool = get_browser_pool()
+    html, status, headers = await pool.render(url)
+
+Call close_browser_pool() on shutdown.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import settings
+from .logger import get_logger
+
+logger = get_logger("browser_pool")
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu'
+]
+
+
+class _PooledContext:
+    """A browser context plus its reusable page."""
+
+    def __init__(self, context: Any, browser: Any):
+        self.context = context
+        self.browser = browser
+        self.page: Any = None
+
+    async def get_page(self) -> Any:
+        if self.page is None or self.page.is_closed():
+            self.page = await self.context.new_page()
+        return self.page
+
+    async def reset(self) -> None:
+        """Forget what the last site left behind (storage, cookies, permissions, DOM)."""
+        if self.page is not None and not self.page.is_closed():
+            try:
+                await self.page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+            except Exception:
+                pass  # Opaque origins (about:blank, error pages) have no storage
+            await self.page.goto("about:blank")
+        await self.context.clear_cookies()
+        await self.context.clear_permissions()
+
+
+class BrowserPool:
+    """Warm browser contexts with resource blocking and periodic restart."""
+
+    def __init__(
+        self,
+        pool_size: int = 3,
+        max_pages_per_browser: int = 200,
+        blocked_resource_types: Optional[List[str]] = None
+    ):
+        """
+        Initialize pool (browser starts lazily on first render).
+
+        Args:
+            pool_size: Number of contexts = max concurrent renders
+            max_pages_per_browser: Renders before the browser is restarted
+            blocked_resource_types: Playwright resource types to abort
+        """
+        self.pool_size = max(1, pool_size)
+        self.max_pages_per_browser = max(1, max_pages_per_browser)
+        self.blocked_resource_types = set(blocked_resource_types or [])
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._idle: List[_PooledContext] = []
+        self._in_use = 0
+        self._pages_rendered = 0
+        self._restart_pending = False
+        self._restarts = 0
+        self._cond: Optional[asyncio.Condition] = None
+
+    def _condition(self) -> asyncio.Condition:
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    async def _block_resources(self, route: Any) -> None:
+        if route.request.resource_type in self.blocked_resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _new_context(self) -> _PooledContext:
+        context = await self._browser.new_context(user_agent=USER_AGENT)
+        if self.blocked_resource_types:
+            await context.route("**/*", self._block_resources)
+        return _PooledContext(context, self._browser)
+
+    async def _start_locked(self) -> None:
+        """(Re)launch the browser and warm the contexts. Caller holds the lock."""
+        await self._stop_locked()
+
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+            self._playwright = await async_playwright().start()
+
+        self._browser = await self._playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+        self._idle = [await self._new_context() for _ in range(self.pool_size)]
+        self._pages_rendered = 0
+        self._restart_pending = False
+
+        logger.info("playwright_browser_started",
+            pool_size=self.pool_size,
+            max_pages_per_browser=self.max_pages_per_browser,
+            blocked_resource_types=sorted(self.blocked_resource_types),
+            restarts=self._restarts
+        )
+
+    async def _close_contexts(self, contexts: List[_PooledContext]) -> None:
+        for pooled in contexts:
+            try:
+                await pooled.context.close()
+            except Exception:
+                pass
+
+    async def _stop_locked(self) -> None:
+        contexts, self._idle = self._idle, []
+        await self._close_contexts(contexts)
+
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.warn("playwright_browser_close_error", error=str(e))
+            self._browser = None
+
+    async def _acquire(self) -> _PooledContext:
+        cond = self._condition()
+        async with cond:
+            while True:
+                browser_dead = self._browser is None or not self._browser.is_connected()
+                if browser_dead and self._idle:
+                    # Contexts of a crashed browser are unusable: never hand them out
+                    # while in-flight renders finish
+                    dead, self._idle = self._idle, []
+                    await self._close_contexts(dead)
+                if browser_dead and self._in_use == 0:
+                    if self._browser is not None:
+                        self._restarts += 1
+                    await self._start_locked()
+                elif self._restart_pending and self._in_use == 0:
+                    self._restarts += 1
+                    logger.info("playwright_browser_restarting",
+                        pages_rendered=self._pages_rendered
+                    )
+                    await self._start_locked()
+
+                if not self._restart_pending and self._idle:
+                    self._in_use += 1
+                    return self._idle.pop()
+
+                await cond.wait()
+
+    async def _release(self, pooled: _PooledContext) -> None:
+        # The next render may be another company's source: it must not see
+        # this site's session. A context that cannot be reset is recycled.
+        reusable = pooled.browser is self._browser and pooled.browser.is_connected()
+        if reusable:
+            try:
+                await pooled.reset()
+            except Exception as e:
+                logger.debug("playwright_context_reset_failed", error=str(e))
+                reusable = False
+        if not reusable:
+            await self._close_contexts([pooled])
+
+        cond = self._condition()
+        async with cond:
+            self._in_use -= 1
+            self._pages_rendered += 1
+            if self._pages_rendered >= self.max_pages_per_browser:
+                self._restart_pending = True
+            if pooled.browser is self._browser and self._browser.is_connected():
+                try:
+                    self._idle.append(pooled if reusable else await self._new_context())
+                except Exception as e:
+                    # Rebuild the pool once in-flight renders finish, rather than shrink it
+                    logger.warn("playwright_context_create_error", error=str(e))
+                    self._restart_pending = True
+            cond.notify_all()
+
+    async def render(
+        self,
+        url: str,
+        ready_selector: Optional[str] = None,
+        timeout_ms: Optional[int] = None
+    ) -> Tuple[str, Optional[int], Dict[str, str]]:
+        """Render url and return (html, status, response_headers).
+
+        Args:
+            url: Page URL
+            ready_selector: CSS selector signalling the page is rendered
+                (defaults to PLAYWRIGHT_READY_SELECTOR, else networkidle)
+            timeout_ms: Navigation timeout (defaults to PLAYWRIGHT_NAVIGATION_TIMEOUT_MS)
+        """
+        ready_selector = ready_selector or settings.playwright_ready_selector or None
+        timeout_ms = timeout_ms or settings.playwright_navigation_timeout_ms
+
+        pooled = await self._acquire()
+        try:
+            page = await pooled.get_page()
+            response = await page.goto(
+                url,
+                wait_until=settings.playwright_wait_until,
+                timeout=timeout_ms
+            )
+
+            try:
+                if ready_selector:
+                    await page.wait_for_selector(ready_selector, timeout=settings.playwright_ready_timeout_ms)
+                else:
+                    await page.wait_for_load_state("networkidle", timeout=settings.playwright_ready_timeout_ms)
+            except Exception:
+                # Readiness is best-effort: use whatever has rendered
+                logger.debug("playwright_ready_timeout", url=url, ready_selector=ready_selector)
+
+            html = await page.content()
+            status = response.status if response is not None else None
+            headers = response.headers if response is not None else {}
+            return html, status, headers
+
+        except Exception:
+            # Page may be in a broken state: drop it, the context creates a new one
+            if pooled.page is not None:
+                try:
+                    await pooled.page.close()
+                except Exception:
+                    pass
+                pooled.page = None
+            raise
+
+        finally:
+            await self._release(pooled)
+
+    async def close(self) -> None:
+        """Close browser and Playwright (call on shutdown)."""
+        async with self._condition():
+            await self._stop_locked()
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool usage counters."""
+        return {
+            "running": self._browser is not None,
+            "pool_size": self.pool_size,
+            "in_use": self._in_use,
+            "pages_since_restart": self._pages_rendered,
+            "restarts": self._restarts
+        }
+
+
+# Global pool instance
+_browser_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get or create browser pool singleton."""
+    global _browser_pool
+
+    if _browser_pool is None:
+        blocked = [
+            t.strip() for t in settings.playwright_block_resources.split(",") if t.strip()
+        ]
+        _browser_pool = BrowserPool(
+            pool_size=settings.playwright_pool_size,
+            max_pages_per_browser=settings.playwright_max_pages_per_browser,
+            blocked_resource_types=blocked
+        )
+
+    return _browser_pool
+
+
+async def close_browser_pool() -> None:
+    """Close the browser pool if it was started."""
+    if _browser_pool is not None:
+        await _browser_pool.close()
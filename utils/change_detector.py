@@ -16,10 +16,9 @@ from .content_hasher import (
     detect_change_tier,
     compare_content
 )
-from .embedding_generator import (
-    generate_embedding,
-    cosine_similarity
-)
+from .embedding_generator import generate_embedding
+from .parsed_document import ParsedDocument
+from .vector_similarity import cosine_similarity
 from .logger import get_logger
 
 logger = get_logger("change_detector")
@@ -59,7 +58,8 @@ class ChangeDetector:
         new_title: Optional[str] = None,
         new_summary: Optional[str] = None,
         company_id: Optional[str] = None,
-        url: Optional[str] = None
+        url: Optional[str] = None,
+        document: Optional[ParsedDocument] = None
     ) -> Dict[str, Any]:
         """Detect change type using multi-tier strategy.
         
@@ -71,6 +71,7 @@ class ChangeDetector:
             new_summary: New content summary (for embedding)
             company_id: Company UUID for logging
             url: URL being checked
+            document: Already parsed document for new_html (reuses its hashes)
             
         Returns:
             Dict with:
@@ -93,7 +94,8 @@ class ChangeDetector:
             old_content=old_content,
             new_html=new_html,
             new_text=new_text,
-            simhash_threshold=self.simhash_threshold
+            simhash_threshold=self.simhash_threshold,
+            document=document
         )
         
         change_type = hash_result["change_type"]
@@ -14,6 +14,10 @@ class Settings(BaseSettings):
     supabase_url: str = Field(..., description="Supabase project URL")
     supabase_key: str = Field(..., description="Supabase service role key")
     supabase_jwt_secret: str = Field(default="", description="Supabase JWT secret for token verification")
+    supabase_max_concurrency: int = Field(
+        default=16,
+        description="Max Supabase queries running concurrently off the event loop"
+    )
 
     # Qdrant Configuration
     qdrant_url: str = Field(
@@ -62,6 +66,112 @@ class Settings(BaseSettings):
         description="Model for micro-edits and quick commands (groq_fast | fast | haiku)"
     )
 
+    # LLM Rate Governor (per provider, 0 = unlimited)
+    llm_openrouter_rpm: int = Field(
+        default=300,
+        description="Max OpenRouter requests per minute"
+    )
+    llm_openrouter_tpm: int = Field(
+        default=0,
+        description="Max OpenRouter tokens per minute (0 = unlimited)"
+    )
+    llm_openrouter_max_in_flight: int = Field(
+        default=10,
+        description="Max concurrent OpenRouter calls"
+    )
+    llm_groq_rpm: int = Field(
+        default=30,
+        description="Max Groq requests per minute"
+    )
+    llm_groq_tpm: int = Field(
+        default=60000,
+        description="Max Groq tokens per minute"
+    )
+    llm_groq_max_in_flight: int = Field(
+        default=5,
+        description="Max concurrent Groq calls"
+    )
+    llm_batch_concurrency: int = Field(
+        default=5,
+        description="Max items enriched concurrently by enrich_content_batch"
+    )
+
+    # LLM Result Cache (deterministic temperature-0 operations)
+    llm_cache_enabled: bool = Field(
+        default=True,
+        description="Cache analyze_atomic/context unit/event/image prompt results by input hash"
+    )
+    llm_cache_ttl_seconds: int = Field(
+        default=259200,
+        description="Lifetime of cached LLM results (seconds)"
+    )
+    llm_cache_memory_size: int = Field(
+        default=2000,
+        description="Max LLM results kept in the in-process LRU tier"
+    )
+    llm_cache_path: str = Field(
+        default="/app/cache/llm/llm_cache.sqlite3",
+        description="SQLite file for the on-disk LLM cache (empty = memory only)"
+    )
+    llm_cache_max_disk_entries: int = Field(
+        default=50000,
+        description="Max LLM results kept on disk (oldest evicted first)"
+    )
+
+    # LLM Usage Tracker (buffered llm_usage writes)
+    usage_tracker_buffered: bool = Field(
+        default=True,
+        description="Buffer llm_usage records and bulk insert them from a background task"
+    )
+    usage_tracker_batch_size: int = Field(
+        default=50,
+        description="Buffered usage records that trigger an immediate flush"
+    )
+    usage_tracker_flush_interval_seconds: float = Field(
+        default=5.0,
+        description="Max seconds a usage record waits in the buffer"
+    )
+    usage_tracker_max_buffer: int = Field(
+        default=5000,
+        description="Max usage records kept while the database is unavailable"
+    )
+
+    # Config Cache (companies, settings, email routing)
+    config_cache_enabled: bool = Field(
+        default=True,
+        description="Cache company rows, company settings and email routing per process"
+    )
+    config_cache_company_ttl_seconds: float = Field(
+        default=60.0,
+        description="TTL for cached company rows and settings"
+    )
+    config_cache_email_routing_ttl_seconds: float = Field(
+        default=300.0,
+        description="TTL for cached email routing rules"
+    )
+    config_cache_max_entries: int = Field(
+        default=5000,
+        description="Max cached entries per namespace"
+    )
+
+    # Auth Cache (API keys, JWT users)
+    auth_cache_enabled: bool = Field(
+        default=True,
+        description="Cache API key and JWT user lookups per process"
+    )
+    auth_cache_ttl_seconds: float = Field(
+        default=15.0,
+        description="TTL for cached clients and users (max delay for key rotation and deactivation in other processes)"
+    )
+    auth_cache_negative_ttl_seconds: float = Field(
+        default=10.0,
+        description="TTL for cached unknown API keys"
+    )
+    auth_cache_max_entries: int = Field(
+        default=10000,
+        description="Max cached entries per auth namespace"
+    )
+
     # Groq Configuration
     groq_api_key: str = Field(
         default="",
@@ -138,12 +248,296 @@ class Settings(BaseSettings):
         description="Threshold for duplicate detection"
     )
 
+    # Embedding Configuration
+    embedding_batch_size: int = Field(
+        default=32,
+        description="Max texts per FastEmbed forward pass (micro-batching)"
+    )
+    embedding_batch_window_ms: int = Field(
+        default=5,
+        description="Milliseconds to wait for concurrent embedding calls to coalesce"
+    )
+    embedding_cache_enabled: bool = Field(
+        default=True,
+        description="Cache embeddings by SHA256(model + text)"
+    )
+    embedding_cache_memory_size: int = Field(
+        default=10000,
+        description="Max embeddings kept in the in-process LRU tier"
+    )
+    embedding_cache_path: str = Field(
+        default="/app/cache/embeddings/embeddings.sqlite3",
+        description="SQLite file for the on-disk embedding cache (empty = memory only)"
+    )
+
+    # Local duplicate index (in-process semantic dedup at ingest)
+    duplicate_index_enabled: bool = Field(
+        default=False,
+        description="Answer ingest duplicate checks from an in-process vector index"
+    )
+    duplicate_index_window_days: int = Field(
+        default=30,
+        description="Days of press_context_units kept in the duplicate index"
+    )
+    duplicate_index_refresh_minutes: int = Field(
+        default=30,
+        description="Re-warm a company index from the DB after this many minutes"
+    )
+    duplicate_index_sync_seconds: int = Field(
+        default=60,
+        description="Load units inserted by other processes after this many seconds (max staleness)"
+    )
+    duplicate_index_max_entries: int = Field(
+        default=50000,
+        description="Max embeddings loaded per company"
+    )
+
     # TTL Configuration
     data_ttl_days: int = Field(
         default=30,
         description="Days before non-special data is deleted"
     )
 
+    # Outbound HTTP pool (scraping, discovery, geocoding, PDFs)
+    http_pool_limit: int = Field(
+        default=100,
+        description="Max open connections in the shared HTTP pool"
+    )
+    http_pool_limit_per_host: int = Field(
+        default=8,
+        description="Max open connections per host in the shared HTTP pool"
+    )
+    http_dns_cache_ttl: int = Field(
+        default=300,
+        description="Seconds to cache DNS lookups"
+    )
+    http_keepalive_timeout: int = Field(
+        default=30,
+        description="Seconds to keep idle connections alive"
+    )
+
+    # Scraper Configuration
+    scraper_conditional_get_enabled: bool = Field(
+        default=False,
+        description="Send If-None-Match/If-Modified-Since for monitored URLs (enable after migration 013)"
+    )
+
+    # Playwright Browser Pool (SCRAPER_ENGINE=playwright)
+    playwright_pool_size: int = Field(
+        default=3,
+        description="Warm browser contexts (= max concurrent renders)"
+    )
+    playwright_max_pages_per_browser: int = Field(
+        default=200,
+        description="Renders before the browser is restarted (bounds memory growth)"
+    )
+    playwright_block_resources: str = Field(
+        default="image,media,font",
+        description="Comma-separated Playwright resource types to abort"
+    )
+    playwright_wait_until: str = Field(
+        default="domcontentloaded",
+        description="page.goto wait_until (commit, domcontentloaded, load, networkidle)"
+    )
+    playwright_ready_selector: str = Field(
+        default="",
+        description="CSS selector that marks a page as rendered (empty = wait for networkidle)"
+    )
+    playwright_ready_timeout_ms: int = Field(
+        default=5000,
+        description="Max wait for the readiness condition (HTML is taken anyway)"
+    )
+    playwright_navigation_timeout_ms: int = Field(
+        default=30000,
+        description="page.goto timeout"
+    )
+
+    # CPU Offload (HTML normalization, SimHash, link extraction)
+    cpu_offload_mode: str = Field(
+        default="process",
+        description="Where CPU-bound parse/hash work runs: process, thread or inline"
+    )
+    cpu_offload_workers: int = Field(
+        default=0,
+        description="Process pool size (0 = cpu_count - 1, max 4)"
+    )
+    cpu_offload_min_bytes: int = Field(
+        default=50000,
+        description="Inputs smaller than this run inline (pickling costs more than parsing)"
+    )
+
+    # Image store (sharded originals + SQLite index)
+    image_store_dir: str = Field(
+        default="/app/cache/images",
+        description="Image store root (legacy flat files in it are migrated into shards)"
+    )
+    image_store_max_gb: float = Field(
+        default=20.0,
+        description="Size budget; least recently used re-downloadable images are evicted (0 = unbounded)"
+    )
+    image_store_max_age_days: float = Field(
+        default=0,
+        description="Evict re-downloadable images not accessed for this many days (0 = never)"
+    )
+    image_store_maintenance_interval_minutes: int = Field(
+        default=60,
+        description="Interval of the scheduler's legacy import and eviction job"
+    )
+
+    # Derivative image cache (publication variants, ?w=/?h=/?format= variants)
+    image_derivative_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse transformed publication images across retries and re-publications"
+    )
+    image_derivative_cache_dir: str = Field(
+        default="/app/cache/images/derivatives",
+        description="Directory of cached derived images"
+    )
+    image_derivative_cache_max_mb: int = Field(
+        default=1000,
+        description="Derivative cache size limit (least recently used files are evicted)"
+    )
+    image_variant_sizes: str = Field(
+        default="160,320,640,1280,2048",
+        description="Size ladder for ?w=/?h= on the image endpoints (requests snap up; the largest is the cap)"
+    )
+
+    # Publication fan-out (per-platform limits shared by all articles)
+    publication_article_concurrency: int = Field(
+        default=4,
+        description="Scheduled articles published concurrently"
+    )
+    publication_wordpress_concurrency: int = Field(
+        default=4,
+        description="Max concurrent WordPress publications"
+    )
+    publication_twitter_concurrency: int = Field(
+        default=2,
+        description="Max concurrent Twitter publications"
+    )
+    publication_facebook_concurrency: int = Field(
+        default=2,
+        description="Max concurrent Facebook publications"
+    )
+    publication_linkedin_concurrency: int = Field(
+        default=2,
+        description="Max concurrent LinkedIn publications"
+    )
+
+    # Publisher HTTP (per-platform pooled sessions, retries on 429/5xx)
+    publisher_http_timeout_seconds: float = Field(
+        default=60,
+        description="Total timeout per publisher request (media uploads included)"
+    )
+    publisher_http_connect_timeout_seconds: float = Field(
+        default=10,
+        description="Connect timeout per publisher request"
+    )
+    publisher_http_limit_per_host: int = Field(
+        default=10,
+        description="Max open connections per platform host"
+    )
+    publisher_http_max_retries: int = Field(
+        default=3,
+        description="Retries on 429/5xx and connection errors (0 = disabled)"
+    )
+    publisher_http_backoff_seconds: float = Field(
+        default=1.0,
+        description="Base of the exponential retry backoff"
+    )
+    publisher_http_max_retry_after_seconds: float = Field(
+        default=60,
+        description="Longer Retry-After values fail the request instead of waiting"
+    )
+
+    # TTS (Piper)
+    tts_piper_binary: str = Field(
+        default="/app/piper/piper",
+        description="Piper executable"
+    )
+    tts_voice_model: str = Field(
+        default="/app/models/es_ES-carlfm-x_low.onnx",
+        description="Piper voice model (.onnx, with .onnx.json next to it)"
+    )
+    tts_workers: int = Field(
+        default=2,
+        description="Max Piper processes (concurrent sentence syntheses)"
+    )
+    tts_persistent_workers: bool = Field(
+        default=True,
+        description="Keep Piper processes with the voice loaded between requests"
+    )
+    tts_sentence_timeout_seconds: float = Field(
+        default=15.0,
+        description="Max seconds to synthesize one sentence"
+    )
+    tts_cache_enabled: bool = Field(
+        default=True,
+        description="Cache synthesized audio on disk by (voice, rate, text)"
+    )
+    tts_cache_dir: str = Field(
+        default="/app/cache/tts",
+        description="Directory for cached TTS WAV files"
+    )
+    tts_cache_max_mb: int = Field(
+        default=500,
+        description="TTS cache size limit (least recently used files removed first)"
+    )
+
+    # Transcription (Whisper worker processes)
+    transcription_model: str = Field(
+        default="base",
+        description="Default Whisper model size (tiny, base, small, medium, large)"
+    )
+    transcription_workers: int = Field(
+        default=1,
+        description="Transcription worker processes (each loads its own model)"
+    )
+    transcription_backend: str = Field(
+        default="whisper",
+        description="Transcription backend: whisper or faster_whisper (CTranslate2, optional)"
+    )
+    transcription_compute_type: str = Field(
+        default="int8",
+        description="faster_whisper compute type on CPU (int8, int8_float32, float32)"
+    )
+    transcription_chunk_seconds: float = Field(
+        default=60.0,
+        description="Audio chunk length for streamed transcription (0 = whole file)"
+    )
+
+    # Crawl Scheduler (global + per-host politeness limits)
+    crawl_max_concurrency: int = Field(
+        default=16,
+        description="Max crawl requests in flight across all companies"
+    )
+    crawl_max_per_host: int = Field(
+        default=2,
+        description="Max crawl requests in flight per domain"
+    )
+    crawl_min_host_interval_ms: int = Field(
+        default=1000,
+        description="Min milliseconds between request starts on the same domain"
+    )
+    crawl_backoff_base_seconds: float = Field(
+        default=30.0,
+        description="First backoff after 429/503 without Retry-After (doubles per failure)"
+    )
+    crawl_backoff_max_seconds: float = Field(
+        default=900.0,
+        description="Max backoff for a domain after repeated 429/503"
+    )
+    crawl_max_backoff_wait_seconds: float = Field(
+        default=60.0,
+        description="Longest backoff a request waits out before failing fast"
+    )
+
+    # Event ingest
+    event_ingest_source_concurrency: int = Field(
+        default=4,
+        description="Event sources processed at once per area (each runs an LLM extraction)"
+    )
+
     # Server Configuration
     api_host: str = Field(default="0.0.0.0", description="API host")
     api_port: int = Field(default=8000, description="API port")
@@ -228,6 +622,22 @@ class Settings(BaseSettings):
         default="INBOX",
         description="IMAP folder to monitor"
     )
+    imap_idle_enabled: bool = Field(
+        default=True,
+        description="Use IMAP IDLE push instead of polling every imap_listener_interval"
+    )
+    imap_idle_timeout_seconds: int = Field(
+        default=300,
+        description="Max seconds per IDLE before re-checking the inbox"
+    )
+    imap_max_concurrent_messages: int = Field(
+        default=4,
+        description="Emails processed in parallel by the IMAP listener"
+    )
+    imap_reconnect_max_backoff_seconds: int = Field(
+        default=300,
+        description="Max seconds between IMAP reconnect attempts"
+    )
 
     # SMTP Configuration (for sending emails - optional)
     smtp_host: str = Field(
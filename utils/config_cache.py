@@ -0,0 +1,221 @@
+"""Read-through TTL cache for config-like Supabase rows.
+
+Company rows, companies.settings and email routing rules change rarely but
+are read on hot paths (every social hook generation, every routed email,
+every daily generation run). ConfigCache keeps them per process with a TTL
+per namespace:
+
+- company: companies row by id (get_company_by_id)
+- company_settings: companies.settings by id
+- email_routing: email_routing rule (with source) by address
+
+Misses are loaded once even under concurrency (callers waiting for the same
+key share one query), and "not found" results are cached too. Writers call
+invalidate_company() after changing a company (PATCH .../settings does)
+and invalidate_source() after changing a source or routing rule; other
+processes (scheduler) pick up the change when the TTL expires.
+
+Usage:
+    cache = get_config_cache()
+    settings = await cache.get_or_load("company_settings", company_id, load_settings)
+
+    get_config_cache().invalidate_company(company_id)
+    get_config_cache().invalidate_source(source_id)
+    get_config_cache_stats()  # hits/misses/invalidations per namespace
+"""
+
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .config import settings
+from .logger import get_logger
+
+logger = get_logger("config_cache")
+
+COMPANY_NAMESPACES = ("company", "company_settings")
+
+
+class ConfigCache:
+    """Per-namespace TTL cache with single-flight loading."""
+
+    def __init__(
+        self,
+        ttls: Dict[str, float],
+        max_entries: int = 5000,
+        negative_ttls: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialize config cache.
+
+        Args:
+            ttls: TTL in seconds per namespace (unknown namespaces are not cached)
+            max_entries: Max entries per namespace (oldest evicted first)
+            negative_ttls: TTL for None ("not found") values per namespace
+                (defaults to the namespace TTL)
+        """
+        self.ttls = dict(ttls)
+        self.negative_ttls = dict(negative_ttls or {})
+        self.max_entries = max(1, max_entries)
+        self._entries: Dict[str, "OrderedDict[str, Tuple[float, Any]]"] = {
+            namespace: OrderedDict() for namespace in self.ttls
+        }
+        self._loading: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._stats: Dict[str, Dict[str, int]] = {
+            namespace: {"hits": 0, "misses": 0, "invalidations": 0, "load_errors": 0}
+            for namespace in self.ttls
+        }
+
+    def get(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """Return (found, value) for a fresh entry."""
+        entries = self._entries.get(namespace)
+        if entries is None:
+            return False, None
+
+        entry = entries.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] <= time.monotonic():
+            del entries[key]
+            return False, None
+
+        entries.move_to_end(key)
+        return True, copy.deepcopy(entry[1])
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Store a value for the namespace TTL."""
+        entries = self._entries.get(namespace)
+        if entries is None:
+            return
+
+        ttl = self.ttls[namespace]
+        if value is None:
+            ttl = self.negative_ttls.get(namespace, ttl)
+
+        entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value or load, cache and return it.
+
+        Loader exceptions propagate and are not cached.
+        """
+        if namespace not in self._entries:
+            return await loader()
+
+        found, value = self.get(namespace, key)
+        if found:
+            self._stats[namespace]["hits"] += 1
+            return value
+
+        self._stats[namespace]["misses"] += 1
+
+        pending = self._loading.get((namespace, key))
+        if pending is not None:
+            return copy.deepcopy(await asyncio.shield(pending))
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[(namespace, key)] = future
+        try:
+            value = await loader()
+        except Exception as e:
+            self._stats[namespace]["load_errors"] += 1
+            future.set_exception(e)
+            # Waiters re-raise; mark retrieved so an unawaited future doesn't warn
+            future.exception()
+            raise
+        else:
+            self.set(namespace, key, value)
+            future.set_result(value)
+            return copy.deepcopy(value)
+        finally:
+            del self._loading[(namespace, key)]
+
+    def invalidate(self, namespace: str, key: Optional[str] = None) -> None:
+        """Drop one key (or the whole namespace)."""
+        entries = self._entries.get(namespace)
+        if entries is None:
+            return
+
+        if key is None:
+            entries.clear()
+        else:
+            entries.pop(key, None)
+        self._stats[namespace]["invalidations"] += 1
+
+    def invalidate_where(self, namespace: str, predicate: Callable[[Any], bool]) -> int:
+        """Drop entries whose value matches predicate. Returns entries dropped."""
+        entries = self._entries.get(namespace)
+        if entries is None:
+            return 0
+
+        keys = [key for key, (_, value) in entries.items() if value is not None and predicate(value)]
+        for key in keys:
+            del entries[key]
+        if keys:
+            self._stats[namespace]["invalidations"] += 1
+        return len(keys)
+
+    def invalidate_company(self, company_id: str) -> None:
+        """Drop every cached view of a company after it changed."""
+        for namespace in COMPANY_NAMESPACES:
+            self.invalidate(namespace, company_id)
+        logger.debug("config_cache_company_invalidated", company_id=company_id)
+
+    def invalidate_source(self, source_id: str) -> None:
+        """Drop cached email routing after a source (or routing rule) changed.
+
+        The whole namespace goes: reactivating a source also changes
+        addresses cached as "not found", which carry no source id.
+        """
+        self.invalidate("email_routing")
+        logger.debug("config_cache_source_invalidated", source_id=source_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters, hit rate and size per namespace."""
+        result = {}
+        for namespace, counters in self._stats.items():
+            lookups = counters["hits"] + counters["misses"]
+            result[namespace] = {
+                **counters,
+                "entries": len(self._entries[namespace]),
+                "ttl_seconds": self.ttls[namespace],
+                "hit_rate": round(counters["hits"] / lookups, 4) if lookups else 0.0
+            }
+        return result
+
+
+# Global cache instance
+_config_cache: Optional[ConfigCache] = None
+
+
+def get_config_cache() -> ConfigCache:
+    """Get or create config cache singleton (no namespaces if disabled)."""
+    global _config_cache
+
+    if _config_cache is None:
+        ttls = {}
+        if settings.config_cache_enabled:
+            ttls = {
+                "company": settings.config_cache_company_ttl_seconds,
+                "company_settings": settings.config_cache_company_ttl_seconds,
+                "email_routing": settings.config_cache_email_routing_ttl_seconds
+            }
+        _config_cache = ConfigCache(ttls, max_entries=settings.config_cache_max_entries)
+        logger.info("config_cache_initialized", ttls=ttls)
+
+    return _config_cache
+
+
+def get_config_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters for the config cache."""
+    return get_config_cache().stats()
@@ -9,14 +9,18 @@ Implements multi-tier hash strategy:
 import hashlib
 import re
 from typing import Optional, Tuple
-from bs4 import BeautifulSoup
 
 from .logger import get_logger
+from .parsed_document import ParsedDocument
 
 logger = get_logger("content_hasher")
 
 
-def normalize_html(html: str, min_acceptable_length: int = 300) -> str:
+def normalize_html(
+    html: str,
+    min_acceptable_length: int = 300,
+    document: Optional[ParsedDocument] = None
+) -> str:
     """Extract semantic content from HTML, removing noise.
     
     Removes:
@@ -30,72 +34,16 @@ def normalize_html(html: str, min_acceptable_length: int = 300) -> str:
     Args:
         html: Raw HTML content
         min_acceptable_length: Minimum acceptable normalized length (default 300)
+        document: Already parsed document for this HTML (avoids re-parsing)
         
     Returns:
         Normalized plain text content
     """
     try:
-        soup = BeautifulSoup(html, 'html.parser')
+        if document is None:
+            document = ParsedDocument(html)
         
-        # Remove script, style, navigation, ads
-        for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe']):
-            tag.decompose()
-        
-        # Remove elements with ad-related classes/ids
-        ad_patterns = ['ad', 'advertisement', 'sponsor', 'promo', 'banner', 'popup']
-        for pattern in ad_patterns:
-            for element in soup.find_all(class_=re.compile(pattern, re.I)):
-                element.decompose()
-            for element in soup.find_all(id=re.compile(pattern, re.I)):
-                element.decompose()
-        
-        # Extract text
-        text = soup.get_text(separator=' ', strip=True)
-        
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        # If normalized content is too short, try gentler extraction
-        if len(text) < min_acceptable_length:
-            logger.warn("html_normalization_too_aggressive",
-                original_length=len(html),
-                normalized_length=len(text),
-                threshold=min_acceptable_length,
-                message="Normalized content too short, trying fallback extraction"
-            )
-            
-            # Fallback: Try to extract main content only
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Look for article or main content containers
-            content_containers = (
-                soup.find('article') or
-                soup.find('main') or
-                soup.find(class_=re.compile(r'(content|article|post|entry)', re.I)) or
-                soup.find(id=re.compile(r'(content|article|post|entry)', re.I))
-            )
-            
-            if content_containers:
-                # Remove noise from container
-                for tag in content_containers(['script', 'style', 'nav', 'aside', 'iframe']):
-                    tag.decompose()
-                
-                text = content_containers.get_text(separator=' ', strip=True)
-                text = re.sub(r'\s+', ' ', text).strip()
-                
-                logger.info("html_normalization_fallback_success",
-                    original_length=len(html),
-                    normalized_length=len(text),
-                    container_found=content_containers.name
-                )
-            else:
-                # Last resort: simple tag removal
-                logger.warn("html_normalization_fallback_failed",
-                    message="No content container found, using simple tag removal"
-                )
-                text = re.sub(r'<[^>]+>', ' ', html)
-                text = re.sub(r'\s+', ' ', text).strip()
+        text = document.normalize(min_acceptable_length)
         
         logger.debug("html_normalized", 
             original_length=len(html),
@@ -237,17 +185,23 @@ def simhash_similarity(hash1: int, hash2: int, hash_bits: int = 64) -> float:
 
 def compute_content_hashes(
     html: Optional[str] = None,
-    text: Optional[str] = None
+    text: Optional[str] = None,
+    document: Optional[ParsedDocument] = None
 ) -> Tuple[str, int]:
     """Compute both SHA256 and SimHash for content.
     
     Args:
         html: Raw HTML content (preferred)
         text: Plain text content (if HTML not available)
+        document: Already parsed document for html (hashes cached on it)
         
     Returns:
         Tuple of (sha256_hash, simhash)
     """
+    if html and document is not None:
+        # Cached per document (precomputed in the CPU pool for large pages)
+        return document.content_hashes
+    
     if html:
         # Extract semantic content from HTML
         semantic_content = normalize_html(html)
@@ -258,7 +212,18 @@ def compute_content_hashes(
         logger.warn("no_content_provided_for_hashing")
         return ("", 0)
     
-    # Compute both hashes
+    return hash_semantic_content(semantic_content)
+
+
+def hash_semantic_content(semantic_content: str) -> Tuple[str, int]:
+    """Compute SHA256 and SimHash of already-normalized content.
+    
+    Args:
+        semantic_content: Output of normalize_html (or plain text)
+        
+    Returns:
+        Tuple of (sha256_hash, simhash)
+    """
     sha256_hash = compute_sha256(semantic_content)
     simhash = compute_simhash(semantic_content)
     
@@ -349,7 +314,8 @@ def compare_content(
     old_content: Optional[dict],
     new_html: Optional[str] = None,
     new_text: Optional[str] = None,
-    simhash_threshold: float = 0.95
+    simhash_threshold: float = 0.95,
+    document: Optional[ParsedDocument] = None
 ) -> dict:
     """Compare old and new content using multi-tier hashing.
     
@@ -358,6 +324,7 @@ def compare_content(
         new_html: New HTML content
         new_text: New plain text content
         simhash_threshold: Similarity threshold
+        document: Already parsed document for new_html
         
     Returns:
         Dict with:
@@ -368,7 +335,7 @@ def compare_content(
         - new_simhash: SimHash value
     """
     # Compute new hashes
-    new_hash, new_simhash = compute_content_hashes(html=new_html, text=new_text)
+    new_hash, new_simhash = compute_content_hashes(html=new_html, text=new_text, document=document)
     
     # Get old hashes
     old_hash = old_content.get("content_hash") if old_content else None
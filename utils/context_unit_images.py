@@ -1,5 +1,6 @@
 """Context unit image processing and caching."""
 
+import asyncio
 import os
 import re
 import base64
@@ -9,6 +10,7 @@ from typing import List, Dict, Any, Optional
 import imghdr
 from PIL import Image, ImageFile
 
+from utils.image_store import get_image_store
 from utils.logger import get_logger
 
 logger = get_logger("context_unit_images")
@@ -250,9 +252,7 @@ class ContextUnitImageProcessor:
             )
             images = images[:ContextUnitImageProcessor.MAX_IMAGES]
         
-        cache_dir = Path("/app/cache/images")
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        
+        store = get_image_store()
         saved_paths = []
         
         for i, image_data in enumerate(images):
@@ -294,12 +294,10 @@ class ContextUnitImageProcessor:
                     logger.warn("image_validation_failed", index=i, context_unit_id=context_unit_id)
                     continue
                 
-                # Save to cache directory
-                cache_filename = f"{context_unit_id}_{i}{extension}"
-                cache_path = cache_dir / cache_filename
-                
-                with open(cache_path, "wb") as f:
-                    f.write(image_bytes)
+                # Save to image store
+                cache_path = await asyncio.to_thread(
+                    store.put, f"{context_unit_id}_{i}", image_bytes, extension
+                )
                 
                 saved_paths.append(str(cache_path))
                 
@@ -338,15 +336,7 @@ def get_context_unit_image_path(context_unit_id: str, index: int = 0) -> Optiona
     Returns:
         Path to cached image file or None if not found
     """
-    cache_dir = Path("/app/cache/images")
-    
-    # Try different extensions
-    for ext in ContextUnitImageProcessor.IMAGE_EXTENSIONS:
-        cache_path = cache_dir / f"{context_unit_id}_{index}{ext}"
-        if cache_path.exists():
-            return cache_path
-    
-    return None
+    return get_image_store().path(f"{context_unit_id}_{index}")
 
 
 def list_context_unit_images(context_unit_id: str) -> List[Path]:
@@ -356,26 +346,6 @@ def list_context_unit_images(context_unit_id: str) -> List[Path]:
         context_unit_id: UUID of context unit
         
     Returns:
-        List of paths to cached image files
+        List of paths to cached image files, ordered by index
     """
-    cache_dir = Path("/app/cache/images")
-    pattern = f"{context_unit_id}_*"
-    
-    # Find all matching files
-    matching_files = []
-    for file_path in cache_dir.glob(pattern):
-        # Check if it's an image file
-        if file_path.suffix.lower() in ContextUnitImageProcessor.IMAGE_EXTENSIONS:
-            matching_files.append(file_path)
-    
-    # Sort by index (extract number after underscore)
-    def get_index(path: Path) -> int:
-        try:
-            name_part = path.stem  # filename without extension
-            index_part = name_part.split('_')[-1]  # part after last underscore
-            return int(index_part)
-        except (ValueError, IndexError):
-            return 999  # Put malformed names at the end
-    
-    matching_files.sort(key=get_index)
-    return matching_files
\ No newline at end of file
+    return [record.path for record in get_image_store().list_group(context_unit_id)]
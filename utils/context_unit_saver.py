@@ -12,10 +12,12 @@ All sources generate embeddings and check for duplicates before saving.
 
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+import asyncio
 import uuid
 
 from .supabase_client import get_supabase_client
-from .embedding_generator import generate_embedding, cosine_similarity
+from .embedding_generator import generate_embedding
+from .image_store import get_image_store
 from .logger import get_logger
 from .source_metadata_schema import normalize_source_metadata
 
@@ -537,7 +539,6 @@ async def update_image_count(context_unit_id: str) -> Dict[str, Any]:
         Dict with success status and count
     """
     try:
-        from pathlib import Path
         supabase = get_supabase_client()
         
         # Get featured_image from metadata
@@ -554,16 +555,9 @@ async def update_image_count(context_unit_id: str) -> Dict[str, Any]:
         # Count featured_image (0 or 1)
         featured_count = 1 if source_metadata.get("featured_image") else 0
         
-        # Count manual images on disk
-        cache_dir = Path("/app/cache/images")
-        manual_count = 0
-        
-        if cache_dir.exists():
-            for ext in [".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp"]:
-                # Count files matching pattern: {context_unit_id}_{index}.ext
-                pattern = f"{context_unit_id}_*{ext}"
-                matching_files = list(cache_dir.glob(pattern))
-                manual_count += len(matching_files)
+        # Count manual images in the image store ({context_unit_id}_{index})
+        manual_images = await asyncio.to_thread(get_image_store().list_group, context_unit_id)
+        manual_count = len(manual_images)
         
         total_count = featured_count + manual_count
         
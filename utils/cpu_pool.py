@@ -0,0 +1,106 @@
+"""Off-loop execution for CPU-bound parsing and hashing.
+
+HTML normalization, SimHash, local index link extraction and event HTML
+cleanup are pure CPU work. Run directly on the asyncio loop of the scheduler
+process, one 2 MB page freezes every other source job and the IMAP loop.
+
+run_cpu() executes such a function according to CPU_OFFLOAD_MODE:
+- "process" (default): ProcessPoolExecutor with CPU_OFFLOAD_WORKERS workers
+  (0 = cpu_count - 1, max 4), so scrape bursts use the host's cores
+- "thread": default thread pool (frees the loop, still bound by the GIL)
+- "inline": call directly on the loop (previous behaviour)
+
+Inputs smaller than CPU_OFFLOAD_MIN_BYTES always run inline: pickling a
+small page costs more than parsing it.
+
+Functions sent to the pool must be module-level (picklable) and must not
+touch the event loop, Supabase or other process-local clients. Workers are
+spawned, not forked: by the time the pool starts, the parent already runs
+executor threads (Supabase, ONNX), and forking a threaded process can copy
+locks held by those threads.
+
+Usage:
+    result = await run_cpu(extract_news_links_local, html, url, size_hint=len(html))
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Optional
+
+from .config import settings
+from .logger import get_logger
+
+logger = get_logger("cpu_pool")
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _worker_count() -> int:
+    if settings.cpu_offload_workers > 0:
+        return settings.cpu_offload_workers
+    return max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+def get_cpu_executor() -> Optional[Executor]:
+    """Executor for CPU_OFFLOAD_MODE (None = default thread pool or inline)."""
+    global _process_pool
+
+    if settings.cpu_offload_mode != "process":
+        return None
+
+    if _process_pool is None:
+        workers = _worker_count()
+        _process_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.info("cpu_process_pool_created", workers=workers)
+
+    return _process_pool
+
+
+def should_offload(size_hint: int) -> bool:
+    """True if an input of size_hint bytes/chars should leave the loop."""
+    return settings.cpu_offload_mode != "inline" and size_hint >= settings.cpu_offload_min_bytes
+
+
+async def run_cpu(func: Callable[..., Any], *args: Any, size_hint: int = 0, **kwargs: Any) -> Any:
+    """Run a CPU-bound function off the event loop (see module docstring).
+
+    Args:
+        func: Module-level function
+        *args: Positional arguments (must be picklable in process mode)
+        size_hint: Input size used for the inline threshold
+        **kwargs: Keyword arguments
+
+    Returns:
+        func(*args, **kwargs)
+    """
+    global _process_pool
+
+    if not should_offload(size_hint):
+        return func(*args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    call = partial(func, *args, **kwargs)
+
+    try:
+        return await loop.run_in_executor(get_cpu_executor(), call)
+    except BrokenProcessPool as e:
+        # A worker died (OOM kill, segfault in a C parser): rebuild the pool next time
+        logger.error("cpu_process_pool_broken", function=func.__name__, error=str(e))
+        _process_pool = None
+        return func(*args, **kwargs)
+
+
+def shutdown_cpu_pool() -> None:
+    """Stop worker processes (call on shutdown)."""
+    global _process_pool
+
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
@@ -0,0 +1,324 @@
+"""Central per-host politeness scheduler for all crawling.
+
+Scraper fetches (monitored URLs, index articles, pool checker), event source
+fetches and discovery fetches all acquire a crawl slot before hitting the
+network. The scheduler enforces:
+
+- Global concurrency: CRAWL_MAX_CONCURRENCY requests in flight
+- Per-host concurrency: CRAWL_MAX_PER_HOST requests in flight per domain
+- Per-host rate limit: CRAWL_MIN_HOST_INTERVAL_MS between request starts
+- Backoff on 429/503: Retry-After when the server sends it, otherwise
+  exponential (CRAWL_BACKOFF_BASE_SECONDS doubling up to
+  CRAWL_BACKOFF_MAX_SECONDS); reset on the next successful response
+- Fairness: when the global limit is reached, waiting requests are granted
+  round-robin across companies, so one company with 50 index links cannot
+  starve the others
+
+A request to a host that is backing off for longer than
+CRAWL_MAX_BACKOFF_WAIT_SECONDS fails fast with HostBackoffError instead of
+blocking the caller (scheduled jobs retry on their next run).
+
+The per-host start time is reserved only once the global slot is granted,
+so time spent queued for a global slot never counts as host spacing. Idle
+hosts (no request in flight, no pending backoff) are evicted every
+HOST_PRUNE_EVERY requests.
+
+Usage:
+    scheduler = get_crawl_scheduler()
+    async with scheduler.slot(url, company_id=company_id):
+        async with session.get(url) as response:
+            scheduler.report(url, response.status, response.headers.get("Retry-After"))
+            ...
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+from urllib.parse import urlparse
+
+from .config import settings
+from .logger import get_logger
+
+logger = get_logger("crawl_scheduler")
+
+BACKOFF_STATUSES = (429, 503)
+DEFAULT_COMPANY = "_default"
+HOST_PRUNE_EVERY = 256
+
+
+def crawl_host(url: str) -> str:
+    """Host key used for per-domain limits (lowercase, without www.)."""
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostBackoffError(Exception):
+    """Raised when a host is backing off for longer than the caller may wait."""
+    pass
+
+
+class _HostState:
+    """Concurrency, pacing and backoff state for one host."""
+
+    def __init__(self, max_per_host: int):
+        self.semaphore = asyncio.Semaphore(max_per_host)
+        self.users = 0
+        self.next_start = 0.0
+        self.backoff_until = 0.0
+        self.failures = 0
+
+
+class CrawlScheduler:
+    """Global + per-host crawl limits with fair round-robin across companies."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        max_per_host: int = 2,
+        min_host_interval: float = 1.0,
+        backoff_base: float = 30.0,
+        backoff_max: float = 900.0,
+        max_backoff_wait: float = 60.0
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrency: Max requests in flight overall
+            max_per_host: Max requests in flight per host
+            min_host_interval: Min seconds between request starts on a host
+            backoff_base: First backoff (seconds) after 429/503 without Retry-After
+            backoff_max: Backoff cap (seconds)
+            max_backoff_wait: Longest backoff a request waits out before failing
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_per_host = max(1, max_per_host)
+        self.min_host_interval = max(0.0, min_host_interval)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_backoff_wait = max_backoff_wait
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._hosts: Dict[str, _HostState] = {}
+        self._active = 0
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {}
+        self._rotation: Deque[str] = deque()
+        self._stats = {"requests": 0, "waited": 0, "backoffs": 0}
+
+    def _ensure_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Semaphores/futures can't be shared across event loops
+            self._reset()
+            self._loop = loop
+
+    def _host(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(self.max_per_host)
+            self._hosts[host] = state
+        return state
+
+    def _prune_hosts(self) -> None:
+        """Forget hosts with nothing in flight, no pacing and no backoff to remember."""
+        now = time.monotonic()
+        idle = [
+            host for host, state in self._hosts.items()
+            if state.users == 0
+            and state.next_start <= now
+            # Keep failure counts while the exponential backoff could still escalate
+            and state.backoff_until + (self.backoff_max if state.failures else 0) <= now
+        ]
+        for host in idle:
+            del self._hosts[host]
+
+    # Global slots (fair across companies)
+
+    async def _acquire_global(self, company_id: str) -> None:
+        if self._active < self.max_concurrency and not self._rotation:
+            self._active += 1
+            return
+
+        self._stats["waited"] += 1
+        future = asyncio.get_running_loop().create_future()
+        queue = self._waiters.setdefault(company_id, deque())
+        if not queue:
+            self._rotation.append(company_id)
+        queue.append(future)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was handed over just before cancellation
+                self._release_global()
+            else:
+                self._drop_waiter(company_id, future)
+            raise
+
+    def _drop_waiter(self, company_id: str, future: asyncio.Future) -> None:
+        queue = self._waiters.get(company_id)
+        if queue is None:
+            return
+        try:
+            queue.remove(future)
+        except ValueError:
+            pass
+        if not queue:
+            del self._waiters[company_id]
+            try:
+                self._rotation.remove(company_id)
+            except ValueError:
+                pass
+
+    def _release_global(self) -> None:
+        # Hand the slot to the next company in rotation (active count unchanged)
+        while self._rotation:
+            company_id = self._rotation.popleft()
+            queue = self._waiters.get(company_id)
+            while queue:
+                future = queue.popleft()
+                if not future.done():
+                    future.set_result(None)
+                    if queue:
+                        self._rotation.append(company_id)
+                    else:
+                        del self._waiters[company_id]
+                    return
+            self._waiters.pop(company_id, None)
+
+        self._active -= 1
+
+    # Per-host pacing
+
+    async def _wait_for_host(self, host: str, state: _HostState, reserve: bool) -> None:
+        while True:
+            now = time.monotonic()
+            start_at = max(state.next_start, state.backoff_until)
+            if start_at <= now:
+                if reserve:
+                    state.next_start = now + self.min_host_interval
+                return
+            if state.backoff_until - now > self.max_backoff_wait:
+                raise HostBackoffError(
+                    f"{host} backing off for {int(state.backoff_until - now)}s"
+                )
+            await asyncio.sleep(start_at - now)
+
+    @asynccontextmanager
+    async def slot(self, url: str, company_id: Optional[str] = None) -> AsyncIterator[None]:
+        """Hold a crawl slot for url while the request runs."""
+        self._ensure_loop()
+        host = crawl_host(url)
+        state = self._host(host)
+        state.users += 1
+
+        try:
+            async with state.semaphore:
+                # Wait out pacing/backoff without holding a global slot, then
+                # reserve the host start once the global slot is granted
+                await self._wait_for_host(host, state, reserve=False)
+                await self._acquire_global(company_id or DEFAULT_COMPANY)
+                try:
+                    await self._wait_for_host(host, state, reserve=True)
+                except BaseException:
+                    self._release_global()
+                    raise
+                self._stats["requests"] += 1
+                try:
+                    yield
+                finally:
+                    self._release_global()
+        finally:
+            state.users -= 1
+            if self._stats["requests"] % HOST_PRUNE_EVERY == 0:
+                self._prune_hosts()
+
+    def report(self, url: str, status: int, retry_after: Optional[str] = None) -> None:
+        """Record a response status (429/503 trigger host backoff)."""
+        if self._loop is None:
+            return
+        host = crawl_host(url)
+        state = self._hosts.get(host)
+        if state is None:
+            # Reported after the host was pruned: only a backoff is worth recording
+            if status not in BACKOFF_STATUSES:
+                return
+            state = self._host(host)
+
+        if status in BACKOFF_STATUSES:
+            state.failures += 1
+            delay = parse_retry_after(retry_after)
+            if delay is None:
+                delay = self.backoff_base * (2 ** (state.failures - 1))
+            delay = min(delay, self.backoff_max)
+            state.backoff_until = max(state.backoff_until, time.monotonic() + delay)
+            self._stats["backoffs"] += 1
+            logger.warn("crawl_host_backoff",
+                host=host,
+                status=status,
+                delay_seconds=round(delay, 1),
+                consecutive_failures=state.failures
+            )
+        elif status < 500 and state.failures:
+            state.failures = 0
+            state.backoff_until = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters plus current load."""
+        now = time.monotonic()
+        return {
+            **self._stats,
+            "active": self._active,
+            "queued": sum(len(queue) for queue in self._waiters.values()),
+            "hosts": len(self._hosts),
+            "hosts_backing_off": sum(1 for s in self._hosts.values() if s.backoff_until > now)
+        }
+
+
+# Global scheduler instance
+_crawl_scheduler: Optional[CrawlScheduler] = None
+
+
+def get_crawl_scheduler() -> CrawlScheduler:
+    """Get or create crawl scheduler singleton."""
+    global _crawl_scheduler
+
+    if _crawl_scheduler is None:
+        _crawl_scheduler = CrawlScheduler(
+            max_concurrency=settings.crawl_max_concurrency,
+            max_per_host=settings.crawl_max_per_host,
+            min_host_interval=settings.crawl_min_host_interval_ms / 1000,
+            backoff_base=settings.crawl_backoff_base_seconds,
+            backoff_max=settings.crawl_backoff_max_seconds,
+            max_backoff_wait=settings.crawl_max_backoff_wait_seconds
+        )
+        logger.info("crawl_scheduler_initialized",
+            max_concurrency=settings.crawl_max_concurrency,
+            max_per_host=settings.crawl_max_per_host,
+            min_host_interval_ms=settings.crawl_min_host_interval_ms
+        )
+
+    return _crawl_scheduler
@@ -13,11 +13,12 @@ Strategy: Extract dates from all sources, take the OLDEST (avoids detecting rede
 import re
 import json
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Tuple
+from typing import Any, Optional, List, Dict, Tuple
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 
 from .logger import get_logger
+from .parsed_document import ParsedDocument
 
 logger = get_logger("date_extractor")
 
@@ -159,11 +160,15 @@ def parse_date_string(date_str: str) -> Optional[datetime]:
     return None
 
 
-def extract_from_meta_tags(soup: BeautifulSoup) -> List[Tuple[datetime, str, float]]:
+def extract_from_meta_tags(
+    soup: Optional[BeautifulSoup],
+    meta: Optional[Dict[str, str]] = None
+) -> List[Tuple[datetime, str, float]]:
     """Extract dates from HTML meta tags (95% confidence).
     
     Args:
-        soup: BeautifulSoup object
+        soup: BeautifulSoup object (unused when meta is given)
+        meta: Pre-collected {name/property: content} (ParsedDocument.meta)
         
     Returns:
         List of (datetime, source, confidence) tuples
@@ -185,14 +190,18 @@ def extract_from_meta_tags(soup: BeautifulSoup) -> List[Tuple[datetime, str, flo
     ]
     
     for name in meta_names:
-        # Try property attribute
-        tag = soup.find('meta', property=name)
-        if not tag:
-            # Try name attribute
-            tag = soup.find('meta', attrs={'name': name})
+        if meta is not None:
+            content = meta.get(name)
+        else:
+            # Try property attribute
+            tag = soup.find('meta', property=name)
+            if not tag:
+                # Try name attribute
+                tag = soup.find('meta', attrs={'name': name})
+            content = tag.get('content') if tag else None
         
-        if tag and tag.get('content'):
-            dt = parse_date_string(tag['content'])
+        if content:
+            dt = parse_date_string(content)
             if dt and dt <= now:
                 dates.append((dt, 'meta_tag', 0.95))
                 logger.debug("date_from_meta_tag",
@@ -208,11 +217,15 @@ def extract_from_meta_tags(soup: BeautifulSoup) -> List[Tuple[datetime, str, flo
     return dates
 
 
-def extract_from_jsonld(soup: BeautifulSoup) -> List[Tuple[datetime, str, float]]:
+def extract_from_jsonld(
+    soup: Optional[BeautifulSoup],
+    blocks: Optional[List[Any]] = None
+) -> List[Tuple[datetime, str, float]]:
     """Extract dates from JSON-LD structured data (95% confidence).
     
     Args:
-        soup: BeautifulSoup object
+        soup: BeautifulSoup object (unused when blocks is given)
+        blocks: Pre-parsed JSON-LD blocks (ParsedDocument.jsonld)
         
     Returns:
         List of (datetime, source, confidence) tuples
@@ -220,13 +233,17 @@ def extract_from_jsonld(soup: BeautifulSoup) -> List[Tuple[datetime, str, float]
     dates = []
     now = datetime.now()
     
-    # Find all JSON-LD script tags
-    jsonld_scripts = soup.find_all('script', type='application/ld+json')
+    if blocks is None:
+        # Find all JSON-LD script tags
+        blocks = []
+        for script in soup.find_all('script', type='application/ld+json'):
+            try:
+                blocks.append(json.loads(script.string))
+            except (json.JSONDecodeError, TypeError) as e:
+                logger.debug("jsonld_parse_error", error=str(e))
     
-    for script in jsonld_scripts:
+    for data in blocks:
         try:
-            data = json.loads(script.string)
-            
             # Handle both single objects and arrays
             if isinstance(data, list):
                 items = data
@@ -249,7 +266,7 @@ def extract_from_jsonld(soup: BeautifulSoup) -> List[Tuple[datetime, str, float]
                                 key=key,
                                 date=dt.isoformat()
                             )
-        except (json.JSONDecodeError, TypeError, AttributeError) as e:
+        except (TypeError, AttributeError) as e:
             logger.debug("jsonld_parse_error", error=str(e))
             continue
     
@@ -516,7 +533,8 @@ async def extract_publication_date(
     html: str,
     url: str,
     title: Optional[str] = None,
-    use_llm_fallback: bool = True
+    use_llm_fallback: bool = True,
+    document: Optional[ParsedDocument] = None
 ) -> Dict[str, any]:
     """Extract publication date from all available sources.
     
@@ -531,6 +549,7 @@ async def extract_publication_date(
         url: Page URL
         title: Page title (for LLM fallback)
         use_llm_fallback: Use LLM if other methods fail
+        document: Already parsed document for html (avoids re-parsing)
         
     Returns:
         Dict with:
@@ -541,8 +560,9 @@ async def extract_publication_date(
     """
     logger.debug("extract_publication_date_start", url=url)
 
-    # Parse HTML
-    soup = BeautifulSoup(html, 'html.parser')
+    # Views of the scraper's document (precomputed off the loop for large pages)
+    if document is None:
+        document = ParsedDocument(html, url)
 
     # Cutoff for "recent" dates (30 days - last month's content)
     recent_cutoff = datetime.now() - timedelta(days=30)
@@ -555,21 +575,21 @@ async def extract_publication_date(
     all_dates = []
 
     # 1. Meta tags (95% confidence)
-    all_dates.extend(extract_from_meta_tags(soup))
+    all_dates.extend(extract_from_meta_tags(None, meta=document.meta))
 
     # 2. JSON-LD (95% confidence)
-    all_dates.extend(extract_from_jsonld(soup))
+    all_dates.extend(extract_from_jsonld(None, blocks=document.jsonld))
 
     # 3. URL patterns (80% confidence)
     all_dates.extend(extract_from_url(url))
 
     # 4. CSS selectors (75% confidence)
-    all_dates.extend(extract_from_css_selectors(soup))
+    all_dates.extend(document.css_dates)
 
     # 5. Flexible pattern matching (70% confidence) - before LLM
     if not filter_recent(all_dates):
         # Only try flexible if no recent structured dates found
-        text_content = soup.get_text(separator=' ', strip=True)[:5000]
+        text_content = document.text[:5000]
         all_dates.extend(extract_flexible_date(text_content))
 
     # Filter to only recent dates before deciding on LLM
@@ -0,0 +1,181 @@
+"""Content-addressed cache for derived images (publication variants).
+
+ImageTransformer.transform_for_publication reruns the whole PIL pipeline
+(RGB conversion, brand and uniqueness tweaks, LANCZOS resize, WebP/JPEG
+encode) on every publish, although the output only depends on the source
+bytes and the transformation parameters. Republishing a backlog after a
+platform outage re-encoded every image per platform. This module provides:
+
+- derivative_key(): SHA-256 over the source digest and the parameters
+  (plus DERIVATIVE_VERSION, bumped when the pipeline changes), so the same
+  image published again, retried or re-uploaded under another article maps
+  to the same file
+- DerivativeCache: files under IMAGE_DERIVATIVE_CACHE_DIR sharded by key
+  prefix, atomic writes (temp file + os.replace, safe with server and
+  scheduler sharing the directory) and size-bounded LRU eviction by mtime
+  (lookups touch the file). Files used in the last MIN_EVICTION_AGE_SECONDS
+  are never evicted, so a path handed to a publisher stays valid during
+  the upload.
+
+Usage:
+    cache = get_derivative_cache()
+    key = derivative_key(source_digest(image_data), platform=..., quality=...)
+    path = cache.lookup(key, "webp")
+    if path is None:
+        path = cache.store(key, "webp", encoded_bytes)
+
+Paths returned by the cache are owned by it: callers must not delete them
+(see owns()). Blocking calls; run them with asyncio.to_thread().
+"""
+
+import hashlib
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .config import settings
+from .logger import get_logger
+
+logger = get_logger("derivative_cache")
+
+DERIVATIVE_VERSION = 1
+PRUNE_EVERY = 50
+MIN_EVICTION_AGE_SECONDS = 600
+
+
+def source_digest(image_data: bytes) -> str:
+    """SHA-256 of the source image bytes."""
+    return hashlib.sha256(image_data).hexdigest()
+
+
+def derivative_key(digest: str, **params: Any) -> str:
+    """Cache key for a derivative of the source with the given parameters."""
+    payload = json.dumps(
+        {"v": DERIVATIVE_VERSION, "source": digest, "params": params},
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DerivativeCache:
+    """Sharded, size-bounded file cache of derived images."""
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Root directory (created on first store)
+            max_bytes: Size budget enforced every PRUNE_EVERY stores
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._writes_since_prune = 0
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evicted": 0}
+
+    def path_for(self, key: str, ext: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.{ext.lstrip('.')}"
+
+    def owns(self, path: Optional[str]) -> bool:
+        """True if path lives in the cache (must not be deleted by callers)."""
+        if not path:
+            return False
+        return Path(path).resolve().is_relative_to(self.cache_dir.resolve())
+
+    def lookup(self, key: str, ext: str) -> Optional[str]:
+        """Path of the cached derivative, or None."""
+        path = self.path_for(key, ext)
+        try:
+            os.utime(path)  # Recently used files survive pruning
+        except OSError:
+            self._stats["misses"] += 1
+            return None
+        self._stats["hits"] += 1
+        return str(path)
+
+    def store(self, key: str, ext: str, data: bytes) -> str:
+        """Atomically write a derivative and return its path."""
+        path = self.path_for(key, ext)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._stats["stores"] += 1
+
+        self._writes_since_prune += 1
+        if self._writes_since_prune >= PRUNE_EVERY:
+            self.prune()
+        return str(path)
+
+    def prune(self) -> int:
+        """Delete least recently used derivatives until the cache fits max_bytes."""
+        self._writes_since_prune = 0
+        files = []
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        cutoff = time.time() - MIN_EVICTION_AGE_SECONDS
+        removed = 0
+        for mtime, size, path in sorted(files):
+            if total <= self.max_bytes or mtime > cutoff:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+
+        if removed:
+            self._stats["evicted"] += removed
+            logger.info("derivative_cache_pruned", removed=removed, size_bytes=total)
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+            "max_mb": round(self.max_bytes / 1024 / 1024, 1)
+        }
+
+
+# Global cache instance
+_derivative_cache: Optional[DerivativeCache] = None
+
+
+def get_derivative_cache() -> Optional[DerivativeCache]:
+    """Get or create the derivative cache singleton (None if disabled)."""
+    global _derivative_cache
+
+    if not settings.image_derivative_cache_enabled:
+        return None
+
+    if _derivative_cache is None:
+        _derivative_cache = DerivativeCache(
+            settings.image_derivative_cache_dir,
+            settings.image_derivative_cache_max_mb * 1024 * 1024
+        )
+        logger.info("derivative_cache_initialized",
+            cache_dir=settings.image_derivative_cache_dir,
+            max_mb=settings.image_derivative_cache_max_mb
+        )
+
+    return _derivative_cache
+
+
+def get_derivative_cache_stats() -> Optional[Dict[str, Any]]:
+    """Cache stats for /health (None until first use or if disabled)."""
+    return _derivative_cache.stats() if _derivative_cache else None
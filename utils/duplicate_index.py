@@ -0,0 +1,374 @@
+"""In-process vector index for semantic duplicate detection at ingest.
+
+Every ingest_context_unit() call used to do a blocking
+search_context_units_by_vector RPC (threshold 0.92/0.98, limit 1) only to
+find near-duplicates. This module keeps, per company, the normalized
+embeddings of the last N days of press_context_units in memory so the
+check is a single matrix-vector product.
+
+Lifecycle:
+1. First lookup for a company → index is cold → caller uses the RPC and a
+   background warm-up loads recent embeddings from press_context_units
+2. Successful inserts are added with add()
+3. Every duplicate_index_sync_seconds a background sync loads the rows
+   created since the last sync (inserts made by other processes)
+4. Indexes older than duplicate_index_refresh_minutes are re-warmed in the
+   background (drops deleted units); the old index keeps answering meanwhile
+
+Staleness: the index is per process (API server and scheduler each keep
+their own), so a unit inserted by another process is invisible here for up
+to duplicate_index_sync_seconds. A near-duplicate ingested elsewhere within
+that window is saved, the same outcome as two concurrent RPC checks.
+
+Index type: exact flat scan over normalized float32 (capacity-doubling
+buffer). Per-company windows are a few thousand rows, where a flat scan
+takes microseconds and never misses a neighbour, so HNSW/IVF is not worth
+the extra dependency here.
+
+Enabled with DUPLICATE_INDEX_ENABLED=true.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+import numpy as np
+
+from .config import settings
+from .logger import get_logger
+from .vector_similarity import to_vector
+
+logger = get_logger("duplicate_index")
+
+WARM_PAGE_SIZE = 500
+# Syncs re-read this much before the previous one (clock skew, slow commits)
+SYNC_OVERLAP_SECONDS = 30
+
+
+def _parse_timestamp(value: Optional[str]) -> float:
+    """Parse Supabase ISO timestamp to epoch seconds (now if missing)."""
+    if not value:
+        return datetime.now(timezone.utc).timestamp()
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    except ValueError:
+        return datetime.now(timezone.utc).timestamp()
+
+
+class CompanyVectorIndex:
+    """Flat index of normalized embeddings for one company."""
+
+    def __init__(self, dim: int = 768, capacity: int = 1024):
+        self.dim = dim
+        self._vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self._created = np.zeros(capacity, dtype=np.float64)
+        self._ids: List[str] = []
+        self._titles: List[Optional[str]] = []
+        self._id_set: Set[str] = set()
+        self.warmed_at: float = 0.0
+        self.synced_at: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, unit_id: str) -> bool:
+        return unit_id in self._id_set
+
+    def add(
+        self,
+        unit_id: str,
+        title: Optional[str],
+        embedding: Any,
+        created_at: Optional[float] = None
+    ) -> bool:
+        """Add a normalized embedding. Returns False if skipped."""
+        if unit_id in self._id_set:
+            return False
+
+        vector = to_vector(embedding)
+        if vector.shape[0] != self.dim:
+            return False
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return False
+
+        size = len(self._ids)
+        if size == self._vectors.shape[0]:
+            self._grow()
+
+        self._vectors[size] = vector / norm
+        self._created[size] = created_at if created_at is not None else datetime.now(timezone.utc).timestamp()
+        self._ids.append(unit_id)
+        self._titles.append(title)
+        self._id_set.add(unit_id)
+        return True
+
+    def _grow(self) -> None:
+        capacity = max(1, self._vectors.shape[0]) * 2
+        vectors = np.zeros((capacity, self.dim), dtype=np.float32)
+        created = np.zeros(capacity, dtype=np.float64)
+        size = len(self._ids)
+        vectors[:size] = self._vectors[:size]
+        created[:size] = self._created[:size]
+        self._vectors = vectors
+        self._created = created
+
+    def search(
+        self,
+        embedding: Any,
+        threshold: float,
+        min_created_at: float = 0.0
+    ) -> Optional[Dict[str, Any]]:
+        """Best match with similarity >= threshold, or None."""
+        size = len(self._ids)
+        if size == 0:
+            return None
+
+        query = to_vector(embedding)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return None
+
+        scores = self._vectors[:size] @ (query / norm)
+        if min_created_at:
+            scores[self._created[:size] < min_created_at] = -1.0
+
+        best = int(np.argmax(scores))
+        similarity = float(scores[best])
+        if similarity < threshold:
+            return None
+
+        return {
+            "id": self._ids[best],
+            "title": self._titles[best],
+            "similarity": similarity
+        }
+
+    def entries_after(self, unit_ids: Set[str]) -> List[Dict[str, Any]]:
+        """Entries not in unit_ids (used to merge local inserts into a re-warm)."""
+        return [
+            {
+                "id": unit_id,
+                "title": self._titles[i],
+                "embedding": self._vectors[i],
+                "created_at": float(self._created[i])
+            }
+            for i, unit_id in enumerate(self._ids)
+            if unit_id not in unit_ids
+        ]
+
+
+class DuplicateIndex:
+    """Per-company registry of CompanyVectorIndex with background warm-up."""
+
+    def __init__(
+        self,
+        window_days: int = 30,
+        refresh_minutes: int = 30,
+        max_entries: int = 50000,
+        sync_seconds: int = 60
+    ):
+        self.window_days = window_days
+        self.refresh_seconds = refresh_minutes * 60
+        self.sync_seconds = sync_seconds
+        self.max_entries = max_entries
+        self._indexes: Dict[str, CompanyVectorIndex] = {}
+        self._warming: Dict[str, asyncio.Task] = {}
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._stats = {"local_hits": 0, "local_misses": 0, "cold_fallbacks": 0, "warmups": 0, "syncs": 0}
+
+    def _window_start(self) -> float:
+        return (datetime.now(timezone.utc) - timedelta(days=self.window_days)).timestamp()
+
+    def is_warm(self, company_id: str) -> bool:
+        """True if lookups for this company can be answered locally."""
+        index = self._indexes.get(company_id)
+        if index is None:
+            return False
+
+        # Stale indexes keep answering while a refresh runs in background
+        now = datetime.now(timezone.utc).timestamp()
+        if now - index.warmed_at > self.refresh_seconds:
+            self.schedule_warm(company_id)
+        elif now - index.synced_at > self.sync_seconds:
+            self.schedule_sync(company_id)
+        return True
+
+    def find_duplicate(
+        self,
+        company_id: str,
+        embedding: List[float],
+        threshold: float
+    ) -> Optional[Dict[str, Any]]:
+        """Local duplicate lookup (call is_warm() first)."""
+        index = self._indexes.get(company_id)
+        if index is None:
+            return None
+
+        match = index.search(embedding, threshold, min_created_at=self._window_start())
+        self._stats["local_hits" if match else "local_misses"] += 1
+        return match
+
+    def add(self, company_id: str, unit_id: str, title: Optional[str], embedding: List[float]) -> None:
+        """Register a freshly inserted context unit."""
+        index = self._indexes.get(company_id)
+        if index is not None:
+            index.add(unit_id, title, embedding)
+        elif company_id in self._warming:
+            # First warm-up still running: its snapshot may miss this row
+            self._pending.setdefault(company_id, []).append({
+                "id": unit_id,
+                "title": title,
+                "embedding": embedding,
+                "created_at": None
+            })
+
+    def record_cold_fallback(self, company_id: str) -> None:
+        """Count an RPC fallback and start warming the company index."""
+        self._stats["cold_fallbacks"] += 1
+        self.schedule_warm(company_id)
+
+    def schedule_warm(self, company_id: str) -> None:
+        """Start a background warm-up for company_id (no-op if one is running)."""
+        self._schedule(company_id, self.warm)
+
+    def schedule_sync(self, company_id: str) -> None:
+        """Start a background sync for company_id (no-op if a job is running)."""
+        self._schedule(company_id, self.sync)
+
+    def _schedule(self, company_id: str, job: Callable[[str], Awaitable[None]]) -> None:
+        task = self._warming.get(company_id)
+        if task is not None and not task.done():
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._warming[company_id] = loop.create_task(job(company_id))
+
+    async def warm(self, company_id: str) -> None:
+        """Load the last window_days of embeddings for company_id."""
+        start = datetime.now(timezone.utc)
+        since = (start - timedelta(days=self.window_days)).isoformat()
+
+        try:
+            rows = await self._fetch_recent(company_id, since)
+        except Exception as e:
+            self._pending.pop(company_id, None)
+            logger.error("duplicate_index_warm_failed", company_id=company_id, error=str(e))
+            return
+
+        index = CompanyVectorIndex()
+        for row in rows:
+            if row.get("embedding"):
+                index.add(row["id"], row.get("title"), row["embedding"], _parse_timestamp(row.get("created_at")))
+
+        # Keep inserts made by this process while the query was running
+        previous = self._indexes.get(company_id)
+        local_entries = previous.entries_after(index._id_set) if previous is not None else []
+        local_entries.extend(self._pending.pop(company_id, []))
+        for entry in local_entries:
+            index.add(entry["id"], entry["title"], entry["embedding"], entry["created_at"])
+
+        index.warmed_at = index.synced_at = start.timestamp()
+        self._indexes[company_id] = index
+        self._stats["warmups"] += 1
+
+        logger.info("duplicate_index_warmed",
+            company_id=company_id,
+            entries=len(index),
+            window_days=self.window_days,
+            duration_ms=int((datetime.now(timezone.utc) - start).total_seconds() * 1000)
+        )
+
+    async def sync(self, company_id: str) -> None:
+        """Add rows created since the last sync (inserted by other processes)."""
+        index = self._indexes.get(company_id)
+        if index is None:
+            return
+
+        start = datetime.now(timezone.utc).timestamp()
+        since = datetime.fromtimestamp(index.synced_at - SYNC_OVERLAP_SECONDS, tz=timezone.utc).isoformat()
+
+        try:
+            rows = await self._fetch_recent(company_id, since)
+        except Exception as e:
+            logger.warn("duplicate_index_sync_failed", company_id=company_id, error=str(e))
+            return
+
+        added = 0
+        for row in rows:
+            if row.get("embedding") and index.add(row["id"], row.get("title"), row["embedding"], _parse_timestamp(row.get("created_at"))):
+                added += 1
+
+        index.synced_at = start
+        self._stats["syncs"] += 1
+        if added:
+            logger.debug("duplicate_index_synced", company_id=company_id, added=added)
+
+    async def _fetch_recent(self, company_id: str, since: str) -> List[Dict[str, Any]]:
+        """Rows since `since`, newest first, paged on the bounded Supabase pool."""
+        from .supabase_client import execute_async, get_supabase_client
+
+        supabase = get_supabase_client()
+        rows: List[Dict[str, Any]] = []
+        offset = 0
+
+        while len(rows) < self.max_entries:
+            result = await execute_async(
+                supabase.client.table("press_context_units")
+                .select("id, title, embedding, created_at")
+                .eq("company_id", company_id)
+                .gte("created_at", since)
+                .not_.is_("embedding", "null")
+                .order("created_at", desc=True)
+                .range(offset, offset + WARM_PAGE_SIZE - 1)
+            )
+
+            page = result.data or []
+            rows.extend(page)
+            if len(page) < WARM_PAGE_SIZE:
+                break
+            offset += WARM_PAGE_SIZE
+
+        return rows[:self.max_entries]
+
+    def stats(self) -> Dict[str, Any]:
+        """Lookup counters and index sizes."""
+        return {
+            **self._stats,
+            "companies": len(self._indexes),
+            "entries": sum(len(index) for index in self._indexes.values())
+        }
+
+
+# Global index instance
+_duplicate_index: Optional[DuplicateIndex] = None
+
+
+def get_duplicate_index() -> Optional[DuplicateIndex]:
+    """Get duplicate index singleton (None if disabled)."""
+    global _duplicate_index
+
+    if not settings.duplicate_index_enabled:
+        return None
+
+    if _duplicate_index is None:
+        _duplicate_index = DuplicateIndex(
+            window_days=settings.duplicate_index_window_days,
+            refresh_minutes=settings.duplicate_index_refresh_minutes,
+            max_entries=settings.duplicate_index_max_entries,
+            sync_seconds=settings.duplicate_index_sync_seconds
+        )
+        logger.info("duplicate_index_initialized",
+            window_days=settings.duplicate_index_window_days,
+            refresh_minutes=settings.duplicate_index_refresh_minutes,
+            sync_seconds=settings.duplicate_index_sync_seconds
+        )
+
+    return _duplicate_index
@@ -1,5 +1,6 @@
 """Email image extraction and caching for semantika."""
 
+import asyncio
 import os
 import re
 import base64
@@ -12,6 +13,7 @@ import ssl
 from urllib.parse import urljoin
 
 from utils.logger import get_logger
+from utils.image_store import ImageStore, get_image_store
 from utils.image_extractor import is_valid_image_url
 
 logger = get_logger("email_image_processor")
@@ -29,10 +31,9 @@ class EmailImageProcessor:
     # Max images to process per email
     MAX_IMAGES = 3
     
-    def __init__(self, cache_dir: str = "/app/cache/images"):
-        """Initialize with unified cache directory (same for all image sources)."""
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    def __init__(self, store: Optional[ImageStore] = None):
+        """Initialize with the image store (same for all image sources)."""
+        self.store = store or get_image_store()
     
     async def process_email_images(
         self, 
@@ -223,12 +224,10 @@ class EmailImageProcessor:
             else:
                 ext = ".jpg"
             
-            # Create cache file path directly with UUID (no suffix needed)
-            cache_filename = f"{context_unit_id}{ext}"
-            cache_path = self.cache_dir / cache_filename
-            
-            # Write to disk
-            cache_path.write_bytes(image_data["data"])
+            # Keyed directly by UUID (no suffix needed)
+            cache_path = await asyncio.to_thread(
+                self.store.put, context_unit_id, image_data["data"], ext
+            )
             
             logger.debug("image_cached",
                 cache_path=str(cache_path),
@@ -0,0 +1,227 @@
+"""Content-addressed embedding cache (memory LRU + SQLite on disk).
+
+The same title+summary strings get embedded over and over (ingestion,
+change detection, pool re-ingestion, regenerate_all_embeddings). This cache
+turns those repeats into a lookup instead of an ONNX forward pass.
+
+Key: SHA256(model_name + "\\0" + text), where text is the exact
+" | ".join([title, summary]) string passed to the embedder.
+
+Tiers:
+1. In-process LRU (OrderedDict, embedding_cache_memory_size entries)
+2. SQLite file (embedding_cache_path), vectors stored as float32 blobs
+
+Disk access is blocking: from async code use the batch methods in a
+thread, so a batch costs one thread hop, one SELECT (per DISK_CHUNK_SIZE
+keys) and one commit instead of a query and a commit per text on the loop.
+
+Usage:
+    cache = get_embedding_cache()
+    vectors = await asyncio.to_thread(cache.get_many, texts, model_name)
+    ...
+    await asyncio.to_thread(cache.set_many, [(text, vector), ...], model_name)
+
+    vector = cache.get(text, model_name)      # sync callers
+    cache.set(text, model_name, vector)
+
+    get_embedding_cache_stats()  # hits/misses per tier
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import settings
+from .logger import get_logger
+
+logger = get_logger("embedding_cache")
+
+# Keys per SELECT ... IN (...) (SQLite caps bound parameters)
+DISK_CHUNK_SIZE = 500
+
+
+def embedding_cache_key(text: str, model_name: str) -> str:
+    """Build the cache key for a text embedded with a given model."""
+    return hashlib.sha256(f"{model_name}\0{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache: in-memory LRU backed by SQLite."""
+
+    def __init__(self, memory_size: int = 10000, db_path: Optional[str] = None):
+        """
+        Initialize embedding cache.
+
+        Args:
+            memory_size: Max entries kept in the in-process LRU
+            db_path: SQLite file for the disk tier (None disables it)
+        """
+        self.memory_size = max(0, memory_size)
+        self.db_path = db_path
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "disk_errors": 0,
+        }
+
+        if db_path:
+            self._open_db()
+
+    def _open_db(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            # Used from the event loop and the fastembed executor threads
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " key TEXT PRIMARY KEY,"
+                " model TEXT NOT NULL,"
+                " dim INTEGER NOT NULL,"
+                " vector BLOB NOT NULL,"
+                " created_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+            logger.info("embedding_cache_disk_opened", path=self.db_path)
+        except Exception as e:
+            logger.warn("embedding_cache_disk_unavailable", path=self.db_path, error=str(e))
+            self._conn = None
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        if self.memory_size == 0:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, text: str, model_name: str) -> Optional[List[float]]:
+        """Return cached embedding or None."""
+        return self.get_many([text], model_name)[0]
+
+    def get_many(self, texts: List[str], model_name: str) -> List[Optional[List[float]]]:
+        """Cached embeddings for texts (None for misses), one disk query per chunk."""
+        keys = [embedding_cache_key(text, model_name) for text in texts]
+        results: List[Optional[List[float]]] = [None] * len(keys)
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    results[i] = list(vector)
+
+            missing = [i for i, vector in enumerate(results) if vector is None]
+            if missing and self._conn is not None:
+                rows: Dict[str, bytes] = {}
+                try:
+                    for start in range(0, len(missing), DISK_CHUNK_SIZE):
+                        chunk = list({keys[i] for i in missing[start:start + DISK_CHUNK_SIZE]})
+                        rows.update(self._conn.execute(
+                            f"SELECT key, vector FROM embeddings WHERE key IN ({', '.join('?' * len(chunk))})",
+                            chunk
+                        ).fetchall())
+                except sqlite3.Error as e:
+                    self._stats["disk_errors"] += 1
+                    logger.warn("embedding_cache_read_error", error=str(e))
+
+                for i in missing:
+                    blob = rows.get(keys[i])
+                    if blob is None:
+                        continue
+                    values = array("f")
+                    values.frombytes(blob)
+                    vector = values.tolist()
+                    self._remember(keys[i], vector)
+                    self._stats["disk_hits"] += 1
+                    results[i] = list(vector)
+
+            self._stats["misses"] += sum(1 for vector in results if vector is None)
+
+        return results
+
+    def set(self, text: str, model_name: str, vector: List[float]) -> None:
+        """Store an embedding in both tiers."""
+        self.set_many([(text, vector)], model_name)
+
+    def set_many(self, items: List[Tuple[str, List[float]]], model_name: str) -> None:
+        """Store (text, vector) pairs in both tiers with a single disk commit."""
+        if not items:
+            return
+
+        rows = []
+        now = time.time()
+        with self._lock:
+            for text, vector in items:
+                key = embedding_cache_key(text, model_name)
+                self._remember(key, list(vector))
+                rows.append((key, model_name, len(vector), array("f", vector).tobytes(), now))
+            self._stats["writes"] += len(items)
+
+            if self._conn is not None:
+                try:
+                    with self._conn:  # One transaction for the whole batch
+                        self._conn.executemany(
+                            "INSERT OR REPLACE INTO embeddings (key, model, dim, vector, created_at)"
+                            " VALUES (?, ?, ?, ?, ?)",
+                            rows
+                        )
+                except sqlite3.Error as e:
+                    self._stats["disk_errors"] += 1
+                    logger.warn("embedding_cache_write_error", error=str(e))
+
+    def clear_memory(self) -> None:
+        """Drop the in-process tier (disk tier is kept)."""
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and tier sizes."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_enabled"] = self._conn is not None
+
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        )
+        return stats
+
+
+# Global cache instance
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get or create embedding cache singleton."""
+    global _embedding_cache
+
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache(
+            memory_size=settings.embedding_cache_memory_size,
+            db_path=settings.embedding_cache_path or None
+        )
+        logger.info("embedding_cache_initialized",
+            memory_size=settings.embedding_cache_memory_size,
+            disk_path=settings.embedding_cache_path or None
+        )
+
+    return _embedding_cache
+
+
+def get_embedding_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters for the embedding cache."""
+    return get_embedding_cache().stats()
@@ -31,6 +31,20 @@ Combina title + summary en un solo texto:
 - Para deduplicación semántica (threshold 0.98)
 - Para búsqueda por vector (/search endpoint)
 
+MICRO-BATCHING
+--------------
+Las llamadas concurrentes a generate_embedding_fastembed() se agrupan durante
+unos milisegundos (embedding_batch_window_ms) y se resuelven con una sola
+llamada model.embed(textos, batch_size=N). ONNX rinde mucho más por texto en
+batch que con listas de un solo elemento. generate_embeddings_batch() usa
+directamente el camino batch sin pasar por la cola.
+
+CACHÉ
+-----
+Los textos ya embebidos se sirven desde utils/embedding_cache.py (LRU en
+memoria + SQLite en disco, clave SHA256(modelo + texto)). Solo los textos
+que fallan la caché llegan a ONNX.
+
 ¿POR QUÉ IMPORTANTE?
 --------------------
 - ✅ Búsqueda semántica precisa (entiende significado, no solo palabras)
@@ -48,16 +62,20 @@ embedding = await generate_embedding(
 # Returns: [0.123, -0.456, 0.789, ...] (768 floats)
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Set
 import asyncio
 from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor
 
+from . import vector_similarity
 from .config import settings
+from .embedding_cache import get_embedding_cache
 from .logger import get_logger
 
 logger = get_logger("embedding_generator")
 
+FASTEMBED_MODEL_NAME = "sentence-transformers/paraphrase-multilingual-mpnet-base-v2"
+
 # Global FastEmbed model instance
 _fastembed_model = None
 
@@ -79,7 +97,7 @@ def get_fastembed_model():
             # 768 dimensions - Optimized for 50+ languages
             cache_dir = os.getenv("FASTEMBED_CACHE_PATH", None)
             _fastembed_model = TextEmbedding(
-                model_name="sentence-transformers/paraphrase-multilingual-mpnet-base-v2",
+                model_name=FASTEMBED_MODEL_NAME,
                 cache_dir=cache_dir
             )
 
@@ -108,31 +126,176 @@ def get_embedding_executor():
     return _embedding_executor
 
 
-async def generate_embedding_fastembed(text: str) -> List[float]:
-    """Generate embedding using local FastEmbed.
+async def generate_embeddings_fastembed_batch(texts: List[str]) -> List[List[float]]:
+    """Generate embeddings for several texts with a single FastEmbed call.
 
     Args:
-        text: Text to embed (title + summary recommended)
+        texts: Texts to embed (each truncated to 512 chars)
 
     Returns:
-        768-dimensional embedding vector (multilingual model)
+        List of 768-dimensional embedding vectors, same order as texts
 
     Raises:
         Exception: If embedding generation fails
     """
-    try:
+    if not texts:
+        return []
+
+    results: List[Optional[List[float]]] = [None] * len(texts)
+    cache = get_embedding_cache() if settings.embedding_cache_enabled else None
+
+    # Serve repeated texts from cache, only embed the misses (SQLite off the loop)
+    if cache is not None:
+        results = await asyncio.to_thread(cache.get_many, texts, FASTEMBED_MODEL_NAME)
+    missing = [i for i, vector in enumerate(results) if vector is None]
+
+    if missing:
         model = get_fastembed_model()
         executor = get_embedding_executor()
-        
+        batch_size = max(1, settings.embedding_batch_size)
+        truncated = [texts[i][:512] for i in missing]  # Limit to 512 chars
+
         # FastEmbed is sync, run in dedicated thread pool (max_workers=2)
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         embeddings = await loop.run_in_executor(
             executor,  # Use our limited executor instead of default
-            lambda: list(model.embed([text[:512]]))  # Limit to 512 chars
+            lambda: list(model.embed(truncated, batch_size=batch_size))
         )
-        
-        embedding = embeddings[0].tolist()
-        
+        if len(embeddings) != len(missing):
+            raise RuntimeError(f"FastEmbed returned {len(embeddings)} embeddings for {len(missing)} texts")
+
+        for i, embedding in zip(missing, embeddings):
+            results[i] = embedding.tolist()
+        if cache is not None:
+            await asyncio.to_thread(
+                cache.set_many,
+                [(texts[i], results[i]) for i in missing],
+                FASTEMBED_MODEL_NAME
+            )
+
+    logger.debug("fastembed_batch_generated",
+        count=len(texts),
+        embedded=len(missing),
+        cached=len(texts) - len(missing)
+    )
+
+    return results
+
+
+class EmbeddingBatcher:
+    """Micro-batching queue for FastEmbed.
+
+    Concurrent single-text requests (ingester, context_unit_saver, /search)
+    are collected for up to window_ms and embedded together in one
+    model.embed() call. A batch is flushed early when it reaches
+    max_batch_size.
+    """
+
+    def __init__(self, max_batch_size: int, window_ms: int):
+        self.max_batch_size = max(1, max_batch_size)
+        self.window_seconds = max(0, window_ms) / 1000.0
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def embed(self, text: str) -> List[float]:
+        """Queue a text and wait for its embedding."""
+        loop = asyncio.get_running_loop()
+
+        # Scripts call asyncio.run() more than once: never mix loops
+        if self._loop is not loop:
+            self._loop = loop
+            self._pending = []
+            self._flush_handle = None
+
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_seconds, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = self._loop.create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        texts = [text for text, _ in batch]
+
+        try:
+            embeddings = await generate_embeddings_fastembed_batch(texts)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+
+        # A short result must not leave callers waiting forever
+        if len(embeddings) < len(batch):
+            error = RuntimeError(f"Embedding batch returned {len(embeddings)} results for {len(batch)} texts")
+            for _, future in batch[len(embeddings):]:
+                if not future.done():
+                    future.set_exception(error)
+
+        if len(batch) > 1:
+            logger.debug("embedding_micro_batch_flushed", batch_size=len(batch))
+
+
+_embedding_batcher: Optional[EmbeddingBatcher] = None
+
+
+def get_embedding_batcher() -> EmbeddingBatcher:
+    """Get or initialize the global embedding micro-batcher."""
+    global _embedding_batcher
+
+    if _embedding_batcher is None:
+        _embedding_batcher = EmbeddingBatcher(
+            max_batch_size=settings.embedding_batch_size,
+            window_ms=settings.embedding_batch_window_ms
+        )
+        logger.info("embedding_batcher_initialized",
+            max_batch_size=_embedding_batcher.max_batch_size,
+            window_ms=settings.embedding_batch_window_ms
+        )
+
+    return _embedding_batcher
+
+
+async def generate_embedding_fastembed(text: str) -> List[float]:
+    """Generate embedding using local FastEmbed.
+
+    Requests are coalesced with other concurrent calls by the
+    micro-batcher (see EmbeddingBatcher).
+
+    Args:
+        text: Text to embed (title + summary recommended)
+
+    Returns:
+        768-dimensional embedding vector (multilingual model)
+
+    Raises:
+        Exception: If embedding generation fails
+    """
+    try:
+        embedding = await get_embedding_batcher().embed(text)
+
         logger.debug("fastembed_embedding_generated", 
             text_length=len(text),
             embedding_dim=len(embedding)
@@ -190,6 +353,14 @@ async def generate_embedding_openai(text: str) -> List[float]:
         raise
 
 
+def _build_embedding_text(title: str, summary: Optional[str] = None) -> str:
+    """Combine title + summary into the text that gets embedded."""
+    text_parts = [title]
+    if summary:
+        text_parts.append(summary)
+    return " | ".join(text_parts)
+
+
 async def generate_embedding(
     title: str,
     summary: Optional[str] = None,
@@ -217,10 +388,7 @@ async def generate_embedding(
         Exception: If all methods fail
     """
     # Combine title + summary (optimal balance)
-    text_parts = [title]
-    if summary:
-        text_parts.append(summary)
-    text = " | ".join(text_parts)
+    text = _build_embedding_text(title, summary)
     
     logger.debug("generate_embedding_start",
         company_id=company_id,
@@ -297,8 +465,29 @@ async def generate_embeddings_batch(
         List of 768-dimensional embedding vectors
     """
     logger.debug("batch_embedding_start", count=len(items), force_openai=force_openai)
-    
-    # Generate embeddings concurrently
+
+    if not items:
+        return []
+
+    # Primary path: one batched FastEmbed call for all items
+    if not force_openai:
+        texts = [
+            _build_embedding_text(item.get("title", ""), item.get("summary"))
+            for item in items
+        ]
+        try:
+            embeddings = await generate_embeddings_fastembed_batch(texts)
+            logger.info("batch_embedding_completed",
+                total=len(items),
+                successful=len(items),
+                failed=0,
+                method="fastembed_batch"
+            )
+            return embeddings
+        except Exception as e:
+            logger.warn("fastembed_batch_failed_falling_back_per_item", error=str(e))
+
+    # Fallback: generate embeddings one by one (with OpenAI fallback per item)
     tasks = [
         generate_embedding(
             title=item.get("title", ""),
@@ -337,7 +526,9 @@ async def generate_embeddings_batch(
 
 def cosine_similarity(embedding1: List[float], embedding2: List[float]) -> float:
     """Calculate cosine similarity between two embeddings.
-    
+
+    Thin wrapper over utils.vector_similarity (NumPy).
+
     Args:
         embedding1: First embedding vector
         embedding2: Second embedding vector
@@ -345,20 +536,7 @@ def cosine_similarity(embedding1: List[float], embedding2: List[float]) -> float
     Returns:
         Similarity score (0.0 to 1.0)
     """
-    import math
-    
-    # Dot product
-    dot_product = sum(a * b for a, b in zip(embedding1, embedding2))
-    
-    # Magnitudes
-    magnitude1 = math.sqrt(sum(a * a for a in embedding1))
-    magnitude2 = math.sqrt(sum(b * b for b in embedding2))
-    
-    # Cosine similarity
-    if magnitude1 == 0 or magnitude2 == 0:
-        return 0.0
-    
-    return dot_product / (magnitude1 * magnitude2)
+    return vector_similarity.cosine_similarity(embedding1, embedding2)
 
 
 async def find_similar_embeddings(
@@ -367,6 +545,9 @@ async def find_similar_embeddings(
     threshold: float = 0.95
 ) -> List[int]:
     """Find indices of embeddings similar to query.
+
+    Candidates are scored with a single matrix-vector product
+    (see utils.vector_similarity.EmbeddingMatrix).
     
     Args:
         query_embedding: Query embedding vector
@@ -376,16 +557,9 @@ async def find_similar_embeddings(
     Returns:
         List of indices of similar embeddings
     """
-    similar_indices = []
-    
-    for i, candidate in enumerate(candidate_embeddings):
-        similarity = cosine_similarity(query_embedding, candidate)
-        if similarity >= threshold:
-            similar_indices.append(i)
-            logger.debug("similar_embedding_found", 
-                index=i, 
-                similarity=round(similarity, 4)
-            )
+    similar_indices = vector_similarity.find_similar(
+        query_embedding, candidate_embeddings, threshold
+    )
     
     logger.info("similarity_search_completed",
         candidates=len(candidate_embeddings),
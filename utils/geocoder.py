@@ -17,12 +17,12 @@ Usage:
 """
 
 import asyncio
-import aiohttp
 from typing import Optional, Dict, List
 from datetime import datetime
 
 from utils.logger import get_logger
 from utils.supabase_client import get_supabase_client
+from utils.http_client import get_http_session
 
 logger = get_logger("geocoder")
 
@@ -258,37 +258,37 @@ async def query_nominatim(location: str, country_hint: Optional[str] = None) ->
             "User-Agent": "Semantika/1.0 (info@ekimen.ai)"  # Required by Nominatim
         }
         
-        async with aiohttp.ClientSession() as session:
-            url = "https://nominatim.openstreetmap.org/search"
+        session = await get_http_session()
+        url = "https://nominatim.openstreetmap.org/search"
+        
+        async with session.get(url, headers=headers, params=params) as resp:
+            if resp.status != 200:
+                logger.error("nominatim_error", 
+                    status=resp.status,
+                    location=location
+                )
+                return None
+            
+            data = await resp.json()
             
-            async with session.get(url, headers=headers, params=params) as resp:
-                if resp.status != 200:
-                    logger.error("nominatim_error", 
-                        status=resp.status,
-                        location=location
-                    )
-                    return None
+            if data:
+                result = {
+                    "lat": float(data[0]["lat"]),
+                    "lon": float(data[0]["lon"]),
+                    "display_name": data[0].get("display_name", location),
+                    "country": data[0].get("address", {}).get("country_code", "").upper()
+                }
                 
-                data = await resp.json()
+                logger.info("nominatim_success", 
+                    location=location,
+                    result_name=result["display_name"][:80]
+                )
                 
-                if data:
-                    result = {
-                        "lat": float(data[0]["lat"]),
-                        "lon": float(data[0]["lon"]),
-                        "display_name": data[0].get("display_name", location),
-                        "country": data[0].get("address", {}).get("country_code", "").upper()
-                    }
-                    
-                    logger.info("nominatim_success", 
-                        location=location,
-                        result_name=result["display_name"][:80]
-                    )
-                    
-                    return result
-                else:
-                    logger.warn("nominatim_no_results", location=location)
-                    return None
-    
+                return result
+            else:
+                logger.warn("nominatim_no_results", location=location)
+                return None
+
     except Exception as e:
         logger.error("nominatim_error", 
             location=location,
@@ -0,0 +1,132 @@
+"""Process-wide pooled HTTP sessions for outbound fetching.
+
+Scraping, discovery, geocoding and PDF downloads used to build a new SSL
+context, TCPConnector and ClientSession for every URL, so an index page with
+20+ article links paid a TLS handshake per link. This module keeps
+long-lived aiohttp sessions instead:
+
+- Keep-alive connection pool (HTTP_POOL_LIMIT total, HTTP_POOL_LIMIT_PER_HOST
+  per host)
+- DNS cache (HTTP_DNS_CACHE_TTL seconds)
+- gzip/deflate always, brotli when the Brotli package is installed
+
+Two sessions are kept:
+- verify_ssl=True: normal certificate verification (APIs, Nominatim, PDFs)
+- verify_ssl=False: lenient TLS (no verification, SECLEVEL=1) for municipal
+  websites with broken certificates or legacy ciphers
+
+Usage:
+    session = await get_http_session(verify_ssl=False)
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+        html = await response.text()
+
+Sessions are bound to the running event loop and recreated if the loop
+changes (e.g. scripts calling asyncio.run() twice). Call
+close_http_sessions() on shutdown.
+"""
+
+import asyncio
+import ssl
+from typing import Dict, Optional
+
+import aiohttp
+
+from .config import settings
+from .logger import get_logger
+
+logger = get_logger("http_client")
+
+try:
+    import brotli  # noqa: F401  (enables aiohttp br decoding)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+
+
+def _lenient_ssl_context() -> ssl.SSLContext:
+    """SSL context that accepts self-signed certs and legacy ciphers."""
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    ssl_context.set_ciphers('DEFAULT@SECLEVEL=1')
+    return ssl_context
+
+
+class HttpSessionPool:
+    """Owns the long-lived aiohttp sessions for one event loop."""
+
+    def __init__(self):
+        self._sessions: Dict[bool, aiohttp.ClientSession] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _build_session(self, verify_ssl: bool) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            ssl=None if verify_ssl else _lenient_ssl_context(),
+            limit=settings.http_pool_limit,
+            limit_per_host=settings.http_pool_limit_per_host,
+            ttl_dns_cache=settings.http_dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=settings.http_keepalive_timeout,
+            enable_cleanup_closed=True
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=DEFAULT_TIMEOUT,
+            headers={"Accept-Encoding": ACCEPT_ENCODING}
+        )
+
+    async def get_session(self, verify_ssl: bool = True) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use."""
+        loop = asyncio.get_running_loop()
+
+        if self._loop is not loop:
+            # Sessions can't be shared across event loops
+            self._sessions = {}
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+        session = self._sessions.get(verify_ssl)
+        if session is not None and not session.closed:
+            return session
+
+        async with self._lock:
+            session = self._sessions.get(verify_ssl)
+            if session is None or session.closed:
+                session = self._build_session(verify_ssl)
+                self._sessions[verify_ssl] = session
+                logger.info("http_session_created",
+                    verify_ssl=verify_ssl,
+                    limit=settings.http_pool_limit,
+                    limit_per_host=settings.http_pool_limit_per_host
+                )
+
+        return session
+
+    async def close(self) -> None:
+        """Close all sessions (call on shutdown)."""
+        sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            if not session.closed:
+                await session.close()
+        if sessions:
+            logger.info("http_sessions_closed", count=len(sessions))
+
+
+# Global pool instance
+_http_pool = HttpSessionPool()
+
+
+async def get_http_session(verify_ssl: bool = True) -> aiohttp.ClientSession:
+    """Get the shared pooled aiohttp session.
+
+    Do not close the returned session; use it with `async with session.get(...)`.
+    """
+    return await _http_pool.get_session(verify_ssl)
+
+
+async def close_http_sessions() -> None:
+    """Close pooled sessions (server/scheduler shutdown)."""
+    await _http_pool.close()
@@ -9,7 +9,7 @@ Extraction priority:
 Returns standardized image metadata for source_metadata.featured_image
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import json
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
@@ -21,13 +21,15 @@ logger = get_logger("image_extractor")
 
 def extract_featured_image(
     soup: BeautifulSoup,
-    page_url: str
+    page_url: str,
+    jsonld_blocks: Optional[List[Any]] = None
 ) -> Optional[Dict[str, Any]]:
     """Extract featured image with cascading fallback.
     
     Args:
-        soup: BeautifulSoup parsed HTML
+        soup: BeautifulSoup parsed HTML (or a Tag for a page fragment)
         page_url: Page URL (for relative URL resolution)
+        jsonld_blocks: Pre-parsed JSON-LD blocks (ParsedDocument.jsonld)
         
     Returns:
         {
@@ -50,7 +52,7 @@ def extract_featured_image(
         return twitter_image
     
     # Priority 3: JSON-LD Schema.org
-    jsonld_image = extract_jsonld_image(soup, page_url)
+    jsonld_image = extract_jsonld_image(soup, page_url, jsonld_blocks)
     if jsonld_image:
         return jsonld_image
     
@@ -161,7 +163,11 @@ def extract_twitter_image(soup: BeautifulSoup, page_url: str) -> Optional[Dict[s
     return result
 
 
-def extract_jsonld_image(soup: BeautifulSoup, page_url: str) -> Optional[Dict[str, Any]]:
+def extract_jsonld_image(
+    soup: BeautifulSoup,
+    page_url: str,
+    jsonld_blocks: Optional[List[Any]] = None
+) -> Optional[Dict[str, Any]]:
     """Extract image from JSON-LD Schema.org markup.
     
     Example HTML:
@@ -177,29 +183,27 @@ def extract_jsonld_image(soup: BeautifulSoup, page_url: str) -> Optional[Dict[st
         }
         </script>
     """
-    jsonld_scripts = soup.find_all('script', type='application/ld+json')
-    
-    for script in jsonld_scripts:
-        if not script.string:
-            continue
-        
-        try:
-            data = json.loads(script.string)
-            
-            # Handle array of objects
-            if isinstance(data, list):
-                for item in data:
-                    image_data = extract_image_from_jsonld_object(item, page_url)
-                    if image_data:
-                        return image_data
-            else:
-                image_data = extract_image_from_jsonld_object(data, page_url)
+    if jsonld_blocks is None:
+        jsonld_blocks = []
+        for script in soup.find_all('script', type='application/ld+json'):
+            if not script.string:
+                continue
+            try:
+                jsonld_blocks.append(json.loads(script.string))
+            except json.JSONDecodeError as e:
+                logger.debug("jsonld_parse_error", error=str(e))
+    
+    for data in jsonld_blocks:
+        # Handle array of objects
+        if isinstance(data, list):
+            for item in data:
+                image_data = extract_image_from_jsonld_object(item, page_url)
                 if image_data:
                     return image_data
-                    
-        except json.JSONDecodeError as e:
-            logger.debug("jsonld_parse_error", error=str(e))
-            continue
+        else:
+            image_data = extract_image_from_jsonld_object(data, page_url)
+            if image_data:
+                return image_data
     
     return None
 
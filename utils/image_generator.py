@@ -1,22 +1,20 @@
 """Image generation using Fal.ai FLUX.1 [schnell] model.
 
 Generates photorealistic, conceptual images from prompts.
-Images are cached permanently in /app/cache/images/.
+Images are cached permanently in the image store (utils/image_store).
 """
 
 import os
 import fal_client
-from pathlib import Path
 from typing import Optional, Dict, Any
 import aiohttp
 import asyncio
 from utils.logger import get_logger
+from utils.image_store import get_image_store
 
 logger = get_logger("image_generator")
 
 FAL_API_KEY = os.getenv("FAL_AI_API_KEY")
-CACHE_DIR = Path("/app/cache/images")
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 # Configure fal_client with API key
 if FAL_API_KEY:
@@ -65,8 +63,9 @@ async def generate_image_from_prompt(
         }
     
     # Check cache
-    cached_path = CACHE_DIR / f"{context_unit_id}.jpg"
-    if cached_path.exists() and not force_regenerate:
+    store = get_image_store()
+    cached_path = await asyncio.to_thread(store.path, context_unit_id)
+    if cached_path and cached_path.suffix == ".jpg" and not force_regenerate:
         logger.info("image_cache_hit", 
             context_unit_id=context_unit_id,
             cached_path=str(cached_path)
@@ -115,7 +114,7 @@ async def generate_image_from_prompt(
             async with session.get(image_url) as response:
                 if response.status == 200:
                     image_data = await response.read()
-                    cached_path.write_bytes(image_data)
+                    cached_path = await asyncio.to_thread(store.put, context_unit_id, image_data, ".jpg")
                     
                     generation_time_ms = (asyncio.get_event_loop().time() - start_time) * 1000
                     
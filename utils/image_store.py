@@ -0,0 +1,399 @@
+"""Sharded image store with a SQLite index and eviction.
+
+All images used to live flat in /app/cache/images as {uuid}{ext} or
+{context_unit_id}_{index}{ext}. Every lookup stat'ed up to six candidate
+names, listing a context unit's images globbed the whole directory, and
+nothing was ever deleted. This module provides:
+
+- Hash-sharded layout: store/{sha1[:2]}/{sha1[2:4]}/{key}{ext}, so no
+  directory grows past a few hundred entries
+- index.sqlite3 (WAL, shared by server and scheduler): key -> path, mime,
+  size, dimensions, last access. get() is one primary-key lookup and
+  list_group() one range scan
+- Eviction (evict()): entries marked evictable (re-downloadable featured
+  images) older than IMAGE_STORE_MAX_AGE_DAYS since last access, then least
+  recently used until the store fits IMAGE_STORE_MAX_GB. Uploads, generated
+  and email images are never evicted
+- Legacy migration: flat files are adopted (moved into their shard) on
+  first access, and import_legacy() drains the rest in batches. Once the
+  flat directory is empty the legacy probes are skipped entirely
+
+Keys are the old file stems ({uuid}, {uuid}_{index}); groups are the part
+before the last underscore (a context unit's images).
+
+Usage:
+    store = get_image_store()
+    path = await asyncio.to_thread(store.put, f"{context_unit_id}_0", data, ".jpg")
+    record = await asyncio.to_thread(store.get, image_id)   # ImageRecord or None
+    images = await asyncio.to_thread(store.list_group, context_unit_id)
+
+Blocking calls (SQLite + disk); use asyncio.to_thread() from async code.
+The scheduler runs maintenance() hourly.
+"""
+
+import hashlib
+import io
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from .config import settings
+from .logger import get_logger
+
+logger = get_logger("image_store")
+
+IMAGE_EXTENSIONS = [".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp"]
+MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+    ".bmp": "image/bmp"
+}
+KEY_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
+# last_access is only rewritten when older than this (reads stay read-only)
+ACCESS_RESOLUTION_SECONDS = 3600
+LEGACY_BATCH = 5000
+LEGACY_RECHECK_SECONDS = 300
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    mime TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    width INTEGER,
+    height INTEGER,
+    evictable INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS images_eviction ON images (evictable, last_access);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+@dataclass
+class ImageRecord:
+    """Index entry of a stored image."""
+    key: str
+    path: Path
+    mime: str
+    size: int
+    width: Optional[int]
+    height: Optional[int]
+    evictable: bool
+    last_access: float
+
+
+def _dimensions(data: bytes) -> Tuple[Optional[int], Optional[int]]:
+    try:
+        with Image.open(io.BytesIO(data)) as img:  # Reads the header only
+            return img.size
+    except Exception:
+        return None, None
+
+
+def _group_index(key: str, group: str) -> Optional[int]:
+    suffix = key[len(group) + 1:]
+    return int(suffix) if suffix.isdigit() else None
+
+
+class ImageStore:
+    """Image files under sharded directories, indexed in SQLite."""
+
+    def __init__(self, root_dir: str, max_bytes: int = 0, max_age_days: float = 0):
+        """
+        Initialize store.
+
+        Args:
+            root_dir: Cache root (legacy flat files live directly in it)
+            max_bytes: Size budget for evict() (0 = unbounded)
+            max_age_days: Evictable entries unused for longer are deleted (0 = never)
+        """
+        self.root_dir = Path(root_dir)
+        self.store_dir = self.root_dir / "store"
+        self.index_path = self.root_dir / "index.sqlite3"
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self._local = threading.local()
+        self._legacy_done = False
+        self._legacy_checked_at = float("-inf")
+
+    # Index
+
+    def _db(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.root_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.index_path), timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def _record(self, row: sqlite3.Row) -> ImageRecord:
+        return ImageRecord(
+            key=row["key"],
+            path=Path(row["path"]),
+            mime=row["mime"],
+            size=row["size"],
+            width=row["width"],
+            height=row["height"],
+            evictable=bool(row["evictable"]),
+            last_access=row["last_access"]
+        )
+
+    def _legacy_pending(self) -> bool:
+        # The migration may be finished by the other process: re-check now and then
+        if not self._legacy_done and time.monotonic() - self._legacy_checked_at > LEGACY_RECHECK_SECONDS:
+            row = self._db().execute("SELECT value FROM meta WHERE name = 'legacy_imported'").fetchone()
+            self._legacy_done = row is not None
+            self._legacy_checked_at = time.monotonic()
+        return not self._legacy_done
+
+    # Files
+
+    def path_for(self, key: str, ext: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.store_dir / digest[:2] / digest[2:4] / f"{key}{ext}"
+
+    def _index(self, key: str, path: Path, data: Optional[bytes], evictable: bool) -> ImageRecord:
+        if data is None:
+            data = path.read_bytes()
+        ext = path.suffix.lower()
+        width, height = _dimensions(data)
+        now = time.time()
+        db = self._db()
+        previous = db.execute("SELECT path FROM images WHERE key = ?", (key,)).fetchone()
+        db.execute(
+            "INSERT OR REPLACE INTO images (key, path, mime, size, width, height, evictable, created_at, last_access) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, str(path), MIME_TYPES.get(ext, "image/jpeg"), len(data), width, height, int(evictable), now, now)
+        )
+        if previous and previous["path"] != str(path):
+            # Same key stored with another extension
+            try:
+                os.remove(previous["path"])
+            except OSError:
+                pass
+        return ImageRecord(key, path, MIME_TYPES.get(ext, "image/jpeg"), len(data), width, height, evictable, now)
+
+    def put(self, key: str, data: bytes, ext: str, evictable: bool = False) -> Path:
+        """Store (or replace) an image atomically and return its path."""
+        if not KEY_PATTERN.match(key):
+            raise ValueError(f"Invalid image key: {key}")
+        ext = f".{ext.lower().lstrip('.')}" if ext else ".jpg"
+
+        path = self.path_for(key, ext)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._index(key, path, data, evictable)
+
+        if self._legacy_pending():
+            # A stale flat file would otherwise be adopted over this one later
+            for legacy_ext in IMAGE_EXTENSIONS:
+                legacy_path = self.root_dir / f"{key}{legacy_ext}"
+                if legacy_path.is_file():
+                    legacy_path.unlink(missing_ok=True)
+        return path
+
+    def _adopt(self, key: str) -> Optional[ImageRecord]:
+        """Move a legacy flat file for key into its shard."""
+        for ext in IMAGE_EXTENSIONS:
+            legacy_path = self.root_dir / f"{key}{ext}"
+            if not legacy_path.is_file():
+                continue
+            path = self.path_for(key, ext)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.replace(legacy_path, path)
+            except FileNotFoundError:
+                # Adopted concurrently by the other process
+                row = self._db().execute("SELECT * FROM images WHERE key = ?", (key,)).fetchone()
+                return self._record(row) if row else None
+            return self._index(key, path, None, evictable=False)
+        return None
+
+    def get(self, key: str) -> Optional[ImageRecord]:
+        """Index entry for key (adopting a legacy flat file), or None."""
+        if not KEY_PATTERN.match(key):
+            return None
+
+        db = self._db()
+        row = db.execute("SELECT * FROM images WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            record = self._record(row)
+            if not record.path.is_file():
+                db.execute("DELETE FROM images WHERE key = ?", (key,))
+                return None
+            now = time.time()
+            if now - record.last_access > ACCESS_RESOLUTION_SECONDS:
+                db.execute("UPDATE images SET last_access = ? WHERE key = ?", (now, key))
+                record.last_access = now
+            return record
+
+        if self._legacy_pending():
+            return self._adopt(key)
+        return None
+
+    def path(self, key: str) -> Optional[Path]:
+        record = self.get(key)
+        return record.path if record else None
+
+    def read(self, key: str) -> Optional[bytes]:
+        record = self.get(key)
+        if record is None:
+            return None
+        try:
+            return record.path.read_bytes()
+        except OSError:
+            return None
+
+    def list_group(self, group: str) -> List[ImageRecord]:
+        """Images keyed {group}_{n}, ordered by n."""
+        if not KEY_PATTERN.match(group):
+            return []
+
+        if self._legacy_pending():
+            for legacy_path in self.root_dir.glob(f"{group}_*"):
+                if legacy_path.suffix.lower() in IMAGE_EXTENSIONS and _group_index(legacy_path.stem, group) is not None:
+                    self._adopt(legacy_path.stem)
+
+        # "`" sorts right after "_": a primary-key range scan instead of LIKE
+        rows = self._db().execute(
+            "SELECT * FROM images WHERE key >= ? AND key < ?",
+            (f"{group}_", f"{group}`")
+        ).fetchall()
+        records = [self._record(row) for row in rows if _group_index(row["key"], group) is not None]
+        return sorted(records, key=lambda record: _group_index(record.key, group))
+
+    def rename(self, old_key: str, new_key: str) -> Optional[Path]:
+        """Re-key an image (e.g. temporary id -> context unit id)."""
+        record = self.get(old_key)
+        if record is None:
+            return None
+        data = record.path.read_bytes()
+        path = self.put(new_key, data, record.path.suffix, record.evictable)
+        self.delete(old_key)
+        return path
+
+    def delete(self, key: str) -> bool:
+        db = self._db()
+        row = db.execute("SELECT path FROM images WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return False
+        db.execute("DELETE FROM images WHERE key = ?", (key,))
+        Path(row["path"]).unlink(missing_ok=True)
+        return True
+
+    # Maintenance
+
+    def import_legacy(self, batch: int = LEGACY_BATCH) -> int:
+        """Adopt up to batch flat files; marks the migration done when none are left."""
+        if not self._legacy_pending():
+            return 0
+
+        adopted = 0
+        remaining = False
+        with os.scandir(self.root_dir) as entries:
+            for entry in entries:
+                name, ext = os.path.splitext(entry.name)
+                if ext.lower() not in IMAGE_EXTENSIONS or not entry.is_file() or not KEY_PATTERN.match(name):
+                    continue
+                if adopted >= batch:
+                    remaining = True
+                    break
+                if self._adopt(name):
+                    adopted += 1
+
+        if not remaining:
+            self._db().execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('legacy_imported', ?)", (str(time.time()),))
+            self._legacy_done = True
+        if adopted:
+            logger.info("image_store_legacy_imported", adopted=adopted, done=not remaining)
+        return adopted
+
+    def evict(self) -> int:
+        """Apply the age and size limits to evictable entries."""
+        db = self._db()
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM images").fetchone()[0]
+        cutoff = time.time() - self.max_age_days * 86400 if self.max_age_days > 0 else None
+        victims: List[Tuple[str, str]] = []
+
+        # Least recently used first: expired entries, then whatever exceeds the budget
+        for row in db.execute("SELECT key, path, size, last_access FROM images WHERE evictable = 1 ORDER BY last_access").fetchall():
+            expired = cutoff is not None and row["last_access"] < cutoff
+            over_budget = self.max_bytes > 0 and total > self.max_bytes
+            if not (expired or over_budget):
+                break
+            victims.append((row["key"], row["path"]))
+            total -= row["size"]
+
+        for key, path in victims:
+            db.execute("DELETE FROM images WHERE key = ?", (key,))
+            Path(path).unlink(missing_ok=True)
+
+        if victims:
+            logger.info("image_store_evicted", removed=len(victims))
+        return len(victims)
+
+    def maintenance(self) -> Dict[str, int]:
+        """Legacy import batch plus eviction (scheduled hourly)."""
+        return {"legacy_imported": self.import_legacy(), "evicted": self.evict()}
+
+    def stats(self) -> Dict[str, Any]:
+        row = self._db().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(evictable), 0) FROM images"
+        ).fetchone()
+        return {
+            "images": row[0],
+            "size_mb": round(row[1] / 1024 / 1024, 1),
+            "evictable": row[2],
+            "legacy_pending": self._legacy_pending()
+        }
+
+
+# Global store instance
+_image_store: Optional[ImageStore] = None
+
+
+def get_image_store() -> ImageStore:
+    """Get or create the image store singleton."""
+    global _image_store
+
+    if _image_store is None:
+        _image_store = ImageStore(
+            settings.image_store_dir,
+            max_bytes=int(settings.image_store_max_gb * 1024 * 1024 * 1024),
+            max_age_days=settings.image_store_max_age_days
+        )
+        logger.info("image_store_initialized",
+            root_dir=settings.image_store_dir,
+            max_gb=settings.image_store_max_gb,
+            max_age_days=settings.image_store_max_age_days
+        )
+
+    return _image_store
+
+
+def get_image_store_stats() -> Optional[Dict[str, Any]]:
+    """Store stats for /health (None until first use)."""
+    return _image_store.stats() if _image_store else None
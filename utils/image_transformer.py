@@ -5,12 +5,12 @@ before publishing to external platforms.
 """
 
 import io
-import os
 import hashlib
 import tempfile
 from typing import Tuple, Optional
 from PIL import Image, ImageEnhance, ImageFilter
 from pathlib import Path
+from utils.image_store import get_image_store
 from utils.logger import get_logger
 
 logger = get_logger("image_transformer")
@@ -62,6 +62,65 @@ class ImageTransformer:
         }
     }
     
+    @staticmethod
+    def platform_settings(platform: str) -> dict:
+        """Output settings for a platform (default settings if unknown)."""
+        return ImageTransformer.PLATFORM_SETTINGS.get(
+            platform,
+            ImageTransformer.PLATFORM_SETTINGS["default"]
+        )
+    
+    @staticmethod
+    def encode_for_publication(
+        image_data: bytes,
+        platform: str = "wordpress",
+        image_uuid: str = None
+    ) -> bytes:
+        """
+        Run the publication pipeline and return the encoded image.
+        
+        Deterministic per (image_data, platform settings, image_uuid), which
+        is what lets utils/derivative_cache reuse the result.
+        
+        Args:
+            image_data: Raw image bytes
+            platform: Target platform ("wordpress", "twitter", etc.)
+            image_uuid: Image UUID for deterministic transformations
+            
+        Returns:
+            Encoded image bytes in platform_settings(platform)["format"]
+            
+        Raises:
+            Exception: If the image cannot be decoded or encoded
+        """
+        settings = ImageTransformer.platform_settings(platform)
+        
+        # Load image
+        with Image.open(io.BytesIO(image_data)) as img:
+            # Convert to RGB if necessary (handles RGBA, P, etc.)
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            
+            # Apply transformations
+            transformed_img = ImageTransformer._apply_brand_transformations(img, image_uuid)
+            transformed_img = ImageTransformer._apply_uniqueness_transformations(transformed_img, image_uuid)
+            transformed_img = ImageTransformer._resize_for_platform(transformed_img, settings)
+            
+            save_kwargs = {
+                "format": settings["format"].upper(),
+                "quality": settings["quality"],
+                "optimize": True,
+            }
+            
+            # WebP specific optimizations
+            if settings["format"].lower() == "webp":
+                save_kwargs["method"] = 6  # Best compression method
+                save_kwargs["lossless"] = False
+            
+            output = io.BytesIO()
+            transformed_img.save(output, **save_kwargs)
+            return output.getvalue()
+    
     @staticmethod
     def transform_for_publication(
         image_data: bytes,
@@ -87,60 +146,31 @@ class ImageTransformer:
                 input_size_kb=round(len(image_data) / 1024, 2)
             )
             
-            # Load image
-            with Image.open(io.BytesIO(image_data)) as img:
-                # Convert to RGB if necessary (handles RGBA, P, etc.)
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Get platform settings
-                settings = ImageTransformer.PLATFORM_SETTINGS.get(
-                    platform, 
-                    ImageTransformer.PLATFORM_SETTINGS["default"]
-                )
-                
-                # Apply transformations
-                transformed_img = ImageTransformer._apply_brand_transformations(img, image_uuid)
-                transformed_img = ImageTransformer._apply_uniqueness_transformations(transformed_img, image_uuid)
-                transformed_img = ImageTransformer._resize_for_platform(transformed_img, settings)
-                
-                # Create temporary file
-                file_extension = f".{settings['format'].lower()}"
-                temp_file = tempfile.NamedTemporaryFile(
-                    suffix=file_extension,
-                    delete=False  # Don't auto-delete, caller will handle cleanup
-                )
+            settings = ImageTransformer.platform_settings(platform)
+            encoded = ImageTransformer.encode_for_publication(image_data, platform, image_uuid)
+            
+            # Create temporary file
+            file_extension = f".{settings['format'].lower()}"
+            with tempfile.NamedTemporaryFile(
+                suffix=file_extension,
+                delete=False  # Don't auto-delete, caller will handle cleanup
+            ) as temp_file:
+                temp_file.write(encoded)
                 temp_path = temp_file.name
-                temp_file.close()  # Close handle so PIL can write to it
-                
-                # Save to temporary file
-                save_kwargs = {
-                    "format": settings["format"].upper(),
-                    "quality": settings["quality"],
-                    "optimize": True,
-                }
-                
-                # WebP specific optimizations
-                if settings["format"].lower() == "webp":
-                    save_kwargs["method"] = 6  # Best compression method
-                    save_kwargs["lossless"] = False
-                
-                transformed_img.save(temp_path, **save_kwargs)
-                
-                # Get file size for logging
-                temp_size_kb = round(os.path.getsize(temp_path) / 1024, 2)
-                
-                logger.info("image_transformation_success",
-                    platform=platform,
-                    image_uuid=image_uuid,
-                    input_size_kb=round(len(image_data) / 1024, 2),
-                    output_size_kb=temp_size_kb,
-                    compression_ratio=round(len(image_data) / (temp_size_kb * 1024), 2) if temp_size_kb > 0 else 0,
-                    output_format=settings["format"],
-                    temp_file_path=temp_path
-                )
-                
-                return temp_path
+            
+            temp_size_kb = round(len(encoded) / 1024, 2)
+            
+            logger.info("image_transformation_success",
+                platform=platform,
+                image_uuid=image_uuid,
+                input_size_kb=round(len(image_data) / 1024, 2),
+                output_size_kb=temp_size_kb,
+                compression_ratio=round(len(image_data) / (temp_size_kb * 1024), 2) if temp_size_kb > 0 else 0,
+                output_format=settings["format"],
+                temp_file_path=temp_path
+            )
+            
+            return temp_path
                 
         except Exception as e:
             logger.error("image_transformation_failed",
@@ -231,16 +261,8 @@ class ImageTransformer:
     
     @staticmethod
     def get_cache_path(image_uuid: str) -> Optional[Path]:
-        """Get the cache path for an image UUID."""
-        cache_dir = Path("/app/cache/images")
-        
-        # Try different extensions
-        for ext in ['.jpg', '.jpeg', '.png', '.webp', '.gif']:
-            cache_path = cache_dir / f"{image_uuid}{ext}"
-            if cache_path.exists():
-                return cache_path
-        
-        return None
+        """Get the image store path for an image UUID."""
+        return get_image_store().path(image_uuid)
     
     @staticmethod
     def read_cached_image(image_uuid: str) -> Optional[bytes]:
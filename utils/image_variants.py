@@ -0,0 +1,243 @@
+"""Responsive image variants for the image endpoints.
+
+The image endpoints used to return the full-size original for every
+request, so list views downloaded multi-megabyte files to show 300 px
+thumbnails. This module provides the framework-independent parts of
+resizing and conditional requests:
+
+- VariantSpec / resolve_variant(): ?w=, ?h= and ?format= parsing.
+  Dimensions snap up to the IMAGE_VARIANT_SIZES ladder (capped at its
+  largest size), so an unauthenticated caller cannot make the server render
+  and store arbitrary sizes: at most len(ladder)^2 boxes per image and
+  format. format=auto (or a resize without format) negotiates AVIF/WebP from
+  the Accept header and falls back to JPEG/PNG.
+- render_variant(): EXIF-aware fit-within-box resize (never upscales) and
+  encode. It is CPU-bound, so run it with utils/cpu_pool.run_cpu.
+- variant_path(): renders through utils/derivative_cache, keyed by the
+  source identity (path, size, mtime) and the spec. Repeated requests only
+  stat the source.
+- variant_etag(): the ETag variant_path() returns, derived from the source
+  identity and the spec without rendering, so a matching If-None-Match is
+  answered before any work.
+- file_etag() / etag_matches(): strong ETags and If-None-Match evaluation
+  for 304 responses.
+
+Usage:
+    spec = resolve_variant(w, h, format, request.headers.get("accept"), source.suffix)
+    if etag_matches(request.headers.get("if-none-match"), await variant_etag(source, spec)):
+        ...  # 304
+    path, media_type, etag = await variant_path(source, spec)
+"""
+
+import asyncio
+import hashlib
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+from PIL import Image, ImageOps, features
+
+from .config import settings
+from .cpu_pool import run_cpu
+from .derivative_cache import derivative_key, get_derivative_cache
+from .logger import get_logger
+
+logger = get_logger("image_variants")
+
+VARIANT_QUALITY = {"jpeg": 82, "webp": 80, "avif": 60, "png": None}
+
+MEDIA_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+    ".gif": "image/gif",
+    ".bmp": "image/bmp",
+    ".svg": "image/svg+xml"
+}
+
+AVIF_SUPPORTED = features.check("avif") or False
+
+
+@dataclass(frozen=True)
+class VariantSpec:
+    """Requested output: bounding box (None = unconstrained) and format."""
+    width: Optional[int]
+    height: Optional[int]
+    format: str
+    negotiated: bool = False
+
+    @property
+    def extension(self) -> str:
+        return "jpg" if self.format == "jpeg" else self.format
+
+    @property
+    def media_type(self) -> str:
+        return MEDIA_TYPES[f".{self.extension}"]
+
+
+def media_type_for(path: Path) -> str:
+    return MEDIA_TYPES.get(path.suffix.lower(), "image/jpeg")
+
+
+def variant_sizes() -> Tuple[int, ...]:
+    """IMAGE_VARIANT_SIZES as an ascending tuple."""
+    return tuple(sorted({int(size) for size in settings.image_variant_sizes.split(",") if size.strip()}))
+
+
+def _snap(value: Optional[int]) -> Optional[int]:
+    if not value:
+        return None
+    sizes = variant_sizes()
+    return next((size for size in sizes if size >= value), sizes[-1])
+
+
+def _negotiate(accept: Optional[str], source_suffix: str) -> str:
+    accept = (accept or "").lower()
+    if AVIF_SUPPORTED and "image/avif" in accept:
+        return "avif"
+    if "image/webp" in accept:
+        return "webp"
+    # Keep transparency for PNG/GIF sources on clients without WebP
+    return "png" if source_suffix.lower() in (".png", ".gif") else "jpeg"
+
+
+def resolve_variant(
+    width: Optional[int],
+    height: Optional[int],
+    format: Optional[str],
+    accept: Optional[str],
+    source_suffix: str
+) -> Optional[VariantSpec]:
+    """Variant for the query parameters, or None to serve the original.
+
+    Animated GIFs and SVGs are always served as is.
+    """
+    if not (width or height or format):
+        return None
+    if source_suffix.lower() in (".svg", ".gif"):
+        return None
+
+    fmt = (format or "auto").lower()
+    if fmt == "jpg":
+        fmt = "jpeg"
+    if fmt == "avif" and not AVIF_SUPPORTED:
+        fmt = "auto"
+    negotiated = fmt == "auto"
+    if negotiated:
+        fmt = _negotiate(accept, source_suffix)
+
+    return VariantSpec(_snap(width), _snap(height), fmt, negotiated)
+
+
+def render_variant(image_data: bytes, width: Optional[int], height: Optional[int], fmt: str) -> bytes:
+    """Resize image_data to fit (width, height) and encode it as fmt."""
+    with Image.open(io.BytesIO(image_data)) as img:
+        img = ImageOps.exif_transpose(img)
+        if width or height:
+            box = (width or img.width, height or img.height)
+            if img.width > box[0] or img.height > box[1]:
+                img.thumbnail(box, Image.Resampling.LANCZOS)
+
+        if fmt == "jpeg" and img.mode != "RGB":
+            if img.mode in ("RGBA", "LA", "P"):
+                img = img.convert("RGBA")
+                background = Image.new("RGB", img.size, (255, 255, 255))
+                background.paste(img, mask=img.getchannel("A"))
+                img = background
+            else:
+                img = img.convert("RGB")
+        elif img.mode not in ("RGB", "RGBA", "L", "LA"):
+            img = img.convert("RGBA")
+
+        save_kwargs = {"format": fmt.upper()}
+        if fmt in ("jpeg", "png"):
+            save_kwargs["optimize"] = True
+        quality = VARIANT_QUALITY.get(fmt)
+        if quality:
+            save_kwargs["quality"] = quality
+        if fmt == "webp":
+            save_kwargs["method"] = 4
+
+        output = io.BytesIO()
+        img.save(output, **save_kwargs)
+        return output.getvalue()
+
+
+def _source_identity(path: Path) -> str:
+    stat = path.stat()
+    return f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def file_etag(path: Path) -> str:
+    """Strong ETag for a file (changes whenever it is rewritten)."""
+    return '"' + hashlib.sha256(_source_identity(path).encode()).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match evaluation (weak comparison, as RFC 9110 requires)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def _variant_key(identity: str, spec: VariantSpec) -> str:
+    return derivative_key(identity, width=spec.width, height=spec.height, format=spec.format)
+
+
+async def variant_etag(source: Path, spec: VariantSpec) -> str:
+    """ETag that variant_path() returns for (source, spec), without rendering."""
+    if get_derivative_cache() is None:
+        return await asyncio.to_thread(file_etag, source)
+    identity = await asyncio.to_thread(_source_identity, source)
+    return f'"{_variant_key(identity, spec)[:32]}"'
+
+
+async def variant_path(source: Path, spec: VariantSpec) -> Tuple[Path, str, str]:
+    """(path, media_type, etag) of the variant, rendering it on a cache miss.
+
+    Falls back to the original when the derivative cache is disabled or the
+    source cannot be decoded. The fallback keeps the ETag variant_etag()
+    announced, so revalidating an undecodable source still gets a 304.
+    """
+    cache = get_derivative_cache()
+    if cache is None:
+        return source, media_type_for(source), await asyncio.to_thread(file_etag, source)
+
+    identity = await asyncio.to_thread(_source_identity, source)
+    key = _variant_key(identity, spec)
+    etag = f'"{key[:32]}"'
+
+    cached = await asyncio.to_thread(cache.lookup, key, spec.extension)
+    if cached:
+        return Path(cached), spec.media_type, etag
+
+    image_data = await asyncio.to_thread(source.read_bytes)
+    try:
+        encoded = await run_cpu(
+            render_variant,
+            image_data,
+            spec.width,
+            spec.height,
+            spec.format,
+            size_hint=len(image_data)
+        )
+    except Exception as e:
+        logger.warn("image_variant_render_failed", source=str(source), error=str(e))
+        return source, media_type_for(source), etag
+
+    path = await asyncio.to_thread(cache.store, key, spec.extension, encoded)
+    logger.debug("image_variant_rendered",
+        source=source.name,
+        width=spec.width,
+        height=spec.height,
+        format=spec.format,
+        input_kb=round(len(image_data) / 1024, 1),
+        output_kb=round(len(encoded) / 1024, 1)
+    )
+    return Path(path), spec.media_type, etag
@@ -0,0 +1,203 @@
+"""Persistent IMAP session with IDLE, driven from asyncio.
+
+imaplib is blocking and not thread-safe, so ImapSession confines one
+IMAP4_SSL connection to a dedicated worker thread: every command runs there
+(serialized), and the event loop only awaits the result. The session:
+
+- Connects lazily and stays logged in between checks (no reconnect per poll)
+- Drops the connection on any IMAP/socket error; the next call reconnects
+- Implements IMAP IDLE (RFC 2177) on top of imaplib (Python < 3.14 has no
+  idle()): idle(timeout) returns True as soon as the server pushes an
+  untagged response (EXISTS/RECENT), False on timeout, None if the server
+  does not support IDLE (caller falls back to polling)
+
+Usage:
+    session = ImapSession(host, port, user, password, mailbox="INBOX")
+    email_ids = await session.search_unseen()
+    raw = await session.fetch(email_ids[0])
+    await session.mark_seen(email_ids[0])
+    new_mail = await session.idle(300)
+    await session.close()
+"""
+
+import asyncio
+import imaplib
+import select
+import ssl
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, List, Optional
+
+from .logger import get_logger
+
+logger = get_logger("imap_session")
+
+# How often the IDLE wait checks the socket (bounds close() latency)
+IDLE_POLL_SECONDS = 1.0
+
+
+class ImapSession:
+    """One persistent IMAP connection owned by a single worker thread."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        mailbox: str = "INBOX",
+        timeout: float = 60.0
+    ):
+        """
+        Initialize session (connects on first use).
+
+        Args:
+            host: IMAP server
+            port: IMAP SSL port (usually 993)
+            user: Login
+            password: Password or app password
+            mailbox: Mailbox to select
+            timeout: Socket timeout for regular commands (seconds)
+        """
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.mailbox = mailbox
+        self.timeout = timeout
+        self._conn: Optional[imaplib.IMAP4_SSL] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="imap")
+        self._closing = False
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(self._guarded, func, *args))
+
+    def _guarded(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run func on the IMAP thread; drop the connection if it fails."""
+        try:
+            return func(*args)
+        except (imaplib.IMAP4.abort, imaplib.IMAP4.error, OSError):
+            self._disconnect()
+            raise
+
+    # Blocking operations (IMAP thread only)
+
+    def _connection(self) -> imaplib.IMAP4_SSL:
+        if self._conn is None:
+            conn = imaplib.IMAP4_SSL(self.host, self.port, timeout=self.timeout)
+            conn.login(self.user, self.password)
+            conn.select(self.mailbox)
+            self._conn = conn
+            logger.info("imap_connected", server=self.host, mailbox=self.mailbox)
+        return self._conn
+
+    def _disconnect(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            conn.logout()
+        except Exception:
+            try:
+                conn.shutdown()
+            except Exception:
+                pass
+
+    def _search_unseen(self) -> List[bytes]:
+        _, data = self._connection().search(None, "UNSEEN")
+        return data[0].split() if data and data[0] else []
+
+    def _fetch(self, email_id: bytes) -> Optional[bytes]:
+        _, data = self._connection().fetch(email_id, "(RFC822)")
+        for item in data or []:
+            if isinstance(item, tuple) and len(item) == 2:
+                return item[1]
+        return None
+
+    def _mark_seen(self, email_id: bytes) -> None:
+        self._connection().store(email_id, "+FLAGS", "\\Seen")
+
+    @staticmethod
+    def _line_ready(conn: imaplib.IMAP4) -> bool:
+        """True if a response can be read without waiting for the socket.
+
+        imaplib reads through a buffered file: bytes that arrived with the
+        previous line (e.g. "* 3 EXISTS" in the same write as "+ idling") sit
+        in that buffer, where neither select() nor SSL pending() sees them.
+        A non-blocking peek returns them (or whatever TLS/socket data is
+        already there) and never sets the file's timed-out state.
+        """
+        sock = conn.sock
+        previous = sock.gettimeout()
+        sock.settimeout(0)
+        try:
+            return bool(conn.file.peek(1))
+        except (BlockingIOError, ssl.SSLWantReadError):
+            return False
+        finally:
+            sock.settimeout(previous)
+
+    def _idle(self, timeout: float) -> Optional[bool]:
+        conn = self._connection()
+        if "IDLE" not in conn.capabilities:
+            return None
+
+        tag = conn._new_tag()
+        conn.send(tag + b" IDLE\r\n")
+        response = conn.readline()
+        if not response.startswith(b"+"):
+            raise imaplib.IMAP4.error(f"IDLE rejected: {response!r}")
+
+        new_mail = False
+        remaining = timeout
+        try:
+            while remaining > 0 and not self._closing:
+                wait = min(IDLE_POLL_SECONDS, remaining)
+                if self._line_ready(conn) or select.select([conn.sock], [], [], wait)[0]:
+                    line = conn.readline()
+                    if not line:
+                        raise imaplib.IMAP4.abort("connection closed during IDLE")
+                    if line.startswith(b"*"):
+                        logger.debug("imap_idle_event", line=line.strip()[:80].decode(errors="ignore"))
+                        new_mail = b"EXISTS" in line or b"RECENT" in line
+                        if new_mail:
+                            break
+                    continue
+                remaining -= wait
+        finally:
+            conn.send(b"DONE\r\n")
+            while True:
+                line = conn.readline()
+                if not line:
+                    raise imaplib.IMAP4.abort("connection closed ending IDLE")
+                if line.startswith(tag):
+                    break
+
+        return new_mail
+
+    # Async API
+
+    async def search_unseen(self) -> List[bytes]:
+        """IDs of unread messages in the mailbox."""
+        return await self._call(self._search_unseen)
+
+    async def fetch(self, email_id: bytes) -> Optional[bytes]:
+        """Full RFC822 message (marks it \\Seen on most servers, as before)."""
+        return await self._call(self._fetch, email_id)
+
+    async def mark_seen(self, email_id: bytes) -> None:
+        """Set the \\Seen flag."""
+        await self._call(self._mark_seen, email_id)
+
+    async def idle(self, timeout: float) -> Optional[bool]:
+        """Wait for new mail via IDLE (True = new mail, False = timeout, None = unsupported)."""
+        return await self._call(self._idle, timeout)
+
+    async def close(self) -> None:
+        """Logout and stop the IMAP thread."""
+        self._closing = True
+        try:
+            await self._call(self._disconnect)
+        finally:
+            self._executor.shutdown(wait=False)
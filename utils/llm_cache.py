@@ -0,0 +1,320 @@
+"""Content-hash keyed cache for deterministic (temperature 0) LLM results.
+
+Byte-identical inputs reach the LLM surprisingly often: pool re-ingestion,
+retries after DB failures, the same press release arriving by email and by
+scraping, event_ingest re-extracting an unchanged agenda page. This cache
+returns the previous parsed result instead of calling the provider again.
+A hit never reaches the provider, so no tokens are tracked for it.
+
+Key: SHA256(operation + model + prompt_version + payload), where payload is
+the exact prompt input (formatted messages or chain variables). Bump the
+operation's prompt version in LLM_CACHE_PROMPT_VERSIONS (llm_client) when a
+prompt changes in a way its input does not capture.
+
+Tiers:
+1. In-process LRU (OrderedDict, llm_cache_memory_size entries)
+2. SQLite file (llm_cache_path), results stored as JSON
+
+Entries expire after llm_cache_ttl_seconds. The disk tier is trimmed to
+llm_cache_max_disk_entries (oldest first) every PRUNE_EVERY writes.
+
+Disk access is blocking, so async callers go through asyncio.to_thread.
+set() only updates memory and queues the row; flush() writes queued rows
+in one transaction. Callers flush when flush_due() (WRITE_BATCH_SIZE rows
+or WRITE_FLUSH_SECONDS old), and an atexit hook flushes the rest, so a
+crash loses at most one batch of cache entries.
+
+Only successful results should be stored: fallbacks returned after an
+error must not be cached.
+
+Usage:
+    cache = get_llm_cache()
+    result = await asyncio.to_thread(cache.get, "analyze_atomic", model, version, payload)
+    if result is None:
+        result = ...
+        cache.set("analyze_atomic", model, version, payload, result)
+        if cache.flush_due():
+            await asyncio.to_thread(cache.flush)
+
+    get_llm_cache_stats()  # hits/misses per operation
+"""
+
+import atexit
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import settings
+from .logger import get_logger
+
+logger = get_logger("llm_cache")
+
+PRUNE_EVERY = 500
+WRITE_BATCH_SIZE = 20
+WRITE_FLUSH_SECONDS = 5.0
+
+
+def llm_cache_key(operation: str, model: str, prompt_version: str, payload: str) -> str:
+    """Build the cache key for one LLM input."""
+    raw = f"{operation}\0{model}\0{prompt_version}\0{payload}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """Two-tier LLM result cache: in-memory LRU backed by SQLite, with TTL."""
+
+    def __init__(
+        self,
+        memory_size: int = 2000,
+        db_path: Optional[str] = None,
+        ttl_seconds: float = 259200,
+        max_disk_entries: int = 50000
+    ):
+        """
+        Initialize LLM cache.
+
+        Args:
+            memory_size: Max entries kept in the in-process LRU
+            db_path: SQLite file for the disk tier (None disables it)
+            ttl_seconds: Entry lifetime
+            max_disk_entries: Max rows kept in the disk tier
+        """
+        self.memory_size = max(0, memory_size)
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_entries = max(1, max_disk_entries)
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes_since_prune = 0
+        # key -> row not yet written to disk (also served by get())
+        self._pending: "OrderedDict[str, Tuple[str, str, str, str, float, float]]" = OrderedDict()
+        self._pending_since: Optional[float] = None
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "writes": 0,
+            "evicted": 0,
+            "disk_errors": 0,
+        }
+        self._operations: Dict[str, Dict[str, int]] = {}
+
+        if db_path:
+            self._open_db()
+
+    def _open_db(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_results ("
+                " key TEXT PRIMARY KEY,"
+                " operation TEXT NOT NULL,"
+                " model TEXT NOT NULL,"
+                " result TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_results_created ON llm_results (created_at)"
+            )
+            self._conn.commit()
+            logger.info("llm_cache_disk_opened", path=self.db_path)
+        except Exception as e:
+            logger.warn("llm_cache_disk_unavailable", path=self.db_path, error=str(e))
+            self._conn = None
+
+    def _remember(self, key: str, expires_at: float, result: Any) -> None:
+        if self.memory_size == 0:
+            return
+        self._memory[key] = (expires_at, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+            self._stats["evicted"] += 1
+
+    def _count(self, operation: str, outcome: str) -> None:
+        counters = self._operations.setdefault(operation, {"hits": 0, "misses": 0})
+        counters[outcome] += 1
+
+    def get(self, operation: str, model: str, prompt_version: str, payload: str) -> Optional[Any]:
+        """Return a cached result (deep copy) or None."""
+        key = llm_cache_key(operation, model, prompt_version, payload)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    self._count(operation, "hits")
+                    return copy.deepcopy(entry[1])
+                del self._memory[key]
+                self._stats["expired"] += 1
+
+            pending = self._pending.get(key)
+            if pending is not None and pending[5] > now:
+                result = json.loads(pending[3])
+                self._remember(key, pending[5], result)
+                self._stats["memory_hits"] += 1
+                self._count(operation, "hits")
+                return copy.deepcopy(result)
+
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT result, expires_at FROM llm_results WHERE key = ? AND expires_at > ?",
+                        (key, now)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    self._stats["disk_errors"] += 1
+                    logger.warn("llm_cache_read_error", error=str(e))
+                    row = None
+
+                if row is not None:
+                    result = json.loads(row[0])
+                    self._remember(key, row[1], result)
+                    self._stats["disk_hits"] += 1
+                    self._count(operation, "hits")
+                    return copy.deepcopy(result)
+
+            self._stats["misses"] += 1
+            self._count(operation, "misses")
+            return None
+
+    def set(self, operation: str, model: str, prompt_version: str, payload: str, result: Any) -> None:
+        """Store a successful result in memory and queue it for the disk tier (see flush)."""
+        key = llm_cache_key(operation, model, prompt_version, payload)
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+
+        try:
+            serialized = json.dumps(result, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.debug("llm_cache_unserializable", operation=operation, error=str(e))
+            return
+
+        with self._lock:
+            self._remember(key, expires_at, json.loads(serialized))
+            self._stats["writes"] += 1
+
+            if self._conn is not None:
+                self._pending[key] = (key, operation, model, serialized, now, expires_at)
+                self._pending.move_to_end(key)
+                if self._pending_since is None:
+                    self._pending_since = time.monotonic()
+
+    def flush_due(self) -> bool:
+        """True when queued disk writes should be flushed."""
+        since = self._pending_since
+        return since is not None and (
+            len(self._pending) >= WRITE_BATCH_SIZE or time.monotonic() - since >= WRITE_FLUSH_SECONDS
+        )
+
+    def flush(self) -> int:
+        """Write queued rows in one transaction (blocking). Returns rows written."""
+        with self._lock:
+            if not self._pending or self._conn is None:
+                return 0
+            rows: List[Tuple[str, str, str, str, float, float]] = list(self._pending.values())
+            self._pending.clear()
+            self._pending_since = None
+
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO llm_results"
+                        " (key, operation, model, result, created_at, expires_at)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        rows
+                    )
+                self._writes_since_prune += len(rows)
+                if self._writes_since_prune >= PRUNE_EVERY:
+                    self._prune_disk(time.time())
+            except sqlite3.Error as e:
+                self._stats["disk_errors"] += 1
+                logger.warn("llm_cache_write_error", error=str(e), rows=len(rows))
+                return 0
+
+        return len(rows)
+
+    def _prune_disk(self, now: float) -> None:
+        """Drop expired rows and trim to max_disk_entries. Caller holds the lock."""
+        self._writes_since_prune = 0
+        expired = self._conn.execute(
+            "DELETE FROM llm_results WHERE expires_at <= ?", (now,)
+        ).rowcount
+        trimmed = self._conn.execute(
+            "DELETE FROM llm_results WHERE key IN ("
+            " SELECT key FROM llm_results ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,)
+        ).rowcount
+        self._conn.commit()
+        self._stats["evicted"] += max(0, trimmed)
+
+        if expired or trimmed:
+            logger.info("llm_cache_disk_pruned", expired=expired, trimmed=trimmed)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters (total and per operation) and tier sizes."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            stats["pending_writes"] = len(self._pending)
+            stats["disk_enabled"] = self._conn is not None
+            operations = {name: dict(counters) for name, counters in self._operations.items()}
+
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        )
+        for counters in operations.values():
+            total = counters["hits"] + counters["misses"]
+            counters["hit_rate"] = round(counters["hits"] / total, 4) if total else 0.0
+        stats["operations"] = operations
+        return stats
+
+
+# Global cache instance
+_llm_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Get or create LLM cache singleton (None if disabled)."""
+    global _llm_cache
+
+    if not settings.llm_cache_enabled:
+        return None
+
+    if _llm_cache is None:
+        _llm_cache = LLMCache(
+            memory_size=settings.llm_cache_memory_size,
+            db_path=settings.llm_cache_path or None,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            max_disk_entries=settings.llm_cache_max_disk_entries
+        )
+        atexit.register(_llm_cache.flush)
+        logger.info("llm_cache_initialized",
+            memory_size=settings.llm_cache_memory_size,
+            disk_path=settings.llm_cache_path or None,
+            ttl_seconds=settings.llm_cache_ttl_seconds
+        )
+
+    return _llm_cache
+
+
+def get_llm_cache_stats() -> Optional[Dict[str, Any]]:
+    """Hit/miss counters for the LLM cache (None if disabled)."""
+    cache = get_llm_cache()
+    return cache.stats() if cache else None
@@ -4,6 +4,8 @@ Handles LLM interactions for guardrails, extraction, and aggregation.
 Supports OpenRouter, Groq, and future providers with automatic cost tracking.
 """
 
+import asyncio
+import json
 from typing import Optional, List, Dict, Any
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser, StrOutputParser
@@ -11,10 +13,43 @@ from langchain_core.runnables import RunnableSequence
 
 from .config import settings
 from .logger import get_logger
+from .llm_cache import get_llm_cache
 from .llm_registry import get_llm_registry
 
 logger = get_logger("llm_client")
 
+# Prompt versions for the LLM result cache (utils/llm_cache).
+# Bump an entry when its prompt changes in a way the cached input does not capture.
+LLM_CACHE_PROMPT_VERSIONS = {
+    "analyze_atomic": "1",
+    "generate_context_unit": "1",
+    "generate_image_prompt": "1",
+    "extract_events": "1",
+}
+
+
+def _messages_payload(messages) -> str:
+    """Serialize formatted prompt messages for the LLM cache key."""
+    return json.dumps([[m.type, m.content] for m in messages], ensure_ascii=False)
+
+
+async def _cache_get(operation: str, model: str, payload: str) -> Optional[Any]:
+    cache = get_llm_cache()
+    if cache is None:
+        return None
+    result = await asyncio.to_thread(cache.get, operation, model, LLM_CACHE_PROMPT_VERSIONS[operation], payload)
+    if result is not None:
+        logger.debug("llm_cache_hit", operation=operation, model=model)
+    return result
+
+
+async def _cache_set(operation: str, model: str, payload: str, result: Any) -> None:
+    cache = get_llm_cache()
+    if cache is not None:
+        cache.set(operation, model, LLM_CACHE_PROMPT_VERSIONS[operation], payload, result)
+        if cache.flush_due():
+            await asyncio.to_thread(cache.flush)
+
 
 def _log_llm_error(operation: str, error: Exception):
     """Log LLM errors with special handling for credit/quota issues.
@@ -467,7 +502,6 @@ JSON de salida:
                 config=config
             )
             
-            import json
             result = json.loads(response.content)
             logger.debug("analyze_completed", title_length=len(result.get("title", "")))
             return result
@@ -485,7 +519,6 @@ JSON de salida:
 
         Uses Groq Llama 3.3 70B (fast and free) for scraping tasks.
         """
-        import json
 
         try:
             # Use configured analyzer model
@@ -502,10 +535,13 @@ JSON de salida:
                 slice_length=min(len(text), 8000)
             )
 
-            response = await provider.ainvoke(
-                self.analyze_atomic_chain.first.format_messages(text=text[:8000]),
-                config=config
-            )
+            messages = self.analyze_atomic_chain.first.format_messages(text=text[:8000])
+            cache_payload = _messages_payload(messages)
+            cached = await _cache_get("analyze_atomic", provider.model_name, cache_payload)
+            if cached is not None:
+                return cached
+
+            response = await provider.ainvoke(messages, config=config)
 
             logger.info("analyze_atomic_groq_response_received",
                 response_length=len(response.content),
@@ -537,6 +573,7 @@ JSON de salida:
                 has_summary=bool(result.get("summary")),
                 provider="fast"
             )
+            await _cache_set("analyze_atomic", provider.model_name, cache_payload, result)
             return result
         except json.JSONDecodeError as e:
             logger.error("analyze_atomic_json_error",
@@ -611,7 +648,6 @@ JSON de salida:
         This method is no longer used but kept for backward compatibility.
         Use search_original_source() instead which delegates to discovery_search module.
         """
-        import json
         
         try:
             # Get SYSTEM organization ID if not provided
@@ -746,7 +782,6 @@ Si NO encuentras fuente pública original, devuelve: {{"sources": []}}"""
             # Clean HTML: remove scripts, styles to maximize useful content
             from bs4 import BeautifulSoup
             from datetime import datetime
-            import json
             
             # Get current date for dynamic prompt
             today = datetime.utcnow().strftime("%Y-%m-%d")
@@ -1217,6 +1252,13 @@ Respond with ONLY the prompt text (no JSON, no markdown, no explanation).""")
             # Truncate content to avoid token overflow
             content_preview = content[:2000] if len(content) > 2000 else content
 
+            cache_payload = _messages_payload(
+                image_prompt_template.format_messages(title=title, content=content_preview)
+            )
+            cached = await _cache_get("generate_image_prompt", self.llm_fast.model_name, cache_payload)
+            if cached is not None:
+                return cached
+
             prompt_text = await image_prompt_chain.ainvoke({
                 "title": title,
                 "content": content_preview
@@ -1229,7 +1271,10 @@ Respond with ONLY the prompt text (no JSON, no markdown, no explanation).""")
                        title=title[:50], 
                        prompt_length=len(prompt_text))
 
-            return {"image_prompt": prompt_text}
+            result = {"image_prompt": prompt_text}
+            if prompt_text:
+                await _cache_set("generate_image_prompt", self.llm_fast.model_name, cache_payload, result)
+            return result
 
         except Exception as e:
             _log_llm_error("generate_image_prompt", e)
@@ -1258,15 +1303,10 @@ Respond with ONLY the prompt text (no JSON, no markdown, no explanation).""")
             from utils.supabase_client import get_supabase_client
             supabase = get_supabase_client()
 
-            result = supabase.client.table("companies")\
-                .select("settings")\
-                .eq("id", company_id)\
-                .single()\
-                .execute()
+            company_settings = await supabase.get_company_settings(company_id)
 
-            if result.data and result.data.get("settings"):
-                settings = result.data["settings"]
-                custom_prompts = settings.get("social_hook_prompts", {})
+            if company_settings:
+                custom_prompts = company_settings.get("social_hook_prompts", {})
 
                 # Merge with defaults (custom overrides default)
                 return {
@@ -1558,14 +1598,17 @@ Respond in JSON:
                     'client_id': client_id
                 }
 
-            response = await provider.ainvoke(
-                context_unit_prompt.format_messages(text=text[:12000]),
-                config=config
-            )
+            messages = context_unit_prompt.format_messages(text=text[:12000])
+            cache_payload = _messages_payload(messages)
+            cached = await _cache_get("generate_context_unit", provider.model_name, cache_payload)
+            if cached is not None:
+                return cached
+
+            response = await provider.ainvoke(messages, config=config)
 
-            import json
             result = json.loads(response.content)
             logger.debug("context_unit_generated", statements_count=len(result.get("atomic_statements", [])))
+            await _cache_set("generate_context_unit", provider.model_name, cache_payload, result)
             return result
         except Exception as e:
             _log_llm_error("generate_context_unit", e)
@@ -1648,7 +1691,6 @@ Formato exacto:
                 config=config
             )
 
-            import json
             import re
             try:
                 # Extract JSON from markdown code blocks if present
@@ -1745,6 +1787,17 @@ Formato exacto:
                 "base_url": base_url
             }
 
+            # Relative dates only depend on the day, so the clock time is not
+            # part of the cache key (same page + same day = same events)
+            cache_payload = json.dumps({
+                "today_date": context["today_date"],
+                "base_url": base_url,
+                "html": context["html"]
+            }, ensure_ascii=False)
+            cached = await _cache_get("extract_events", self.llm_sonnet.model_name, cache_payload)
+            if cached is not None:
+                return cached
+
             result = await self.extract_events_chain.ainvoke(context)
 
             events = result.get("events", [])
@@ -1753,6 +1806,7 @@ Formato exacto:
                 base_url=base_url
             )
 
+            await _cache_set("extract_events", self.llm_sonnet.model_name, cache_payload, result)
             return result
 
         except Exception as e:
@@ -1781,7 +1835,6 @@ Formato exacto:
         Returns:
             Dict with 'events' list containing merged event data
         """
-        import json
 
         try:
             context = {
@@ -0,0 +1,192 @@
+"""Per-provider LLM rate governor.
+
+Concurrent LLM work (enrich_content_batch, multi-noticia pages, parallel
+scrapes) shares one governor per provider (OpenRouter, Groq), owned by
+LLMRegistry. Before each call a provider acquires a slot, which enforces:
+
+- In-flight cap: LLM_<PROVIDER>_MAX_IN_FLIGHT concurrent calls
+- Requests per minute: LLM_<PROVIDER>_RPM over a sliding 60 s window
+- Tokens per minute: LLM_<PROVIDER>_TPM over the same window, using an
+  estimate of the prompt (chars / 4) that is replaced by the real total
+  once the response reports usage
+
+A limit of 0 disables it. Callers wait (never fail) until the window has
+room; a single call larger than the whole TPM budget is let through once
+the window is empty so it cannot block forever.
+
+Only provider.ainvoke() is governed; chains built on get_runnable() bypass
+the governor.
+
+Usage:
+    governor = get_llm_registry().governor("groq")
+    async with governor.slot(estimate_tokens(messages)) as lease:
+        response = await client.ainvoke(messages)
+        lease.tokens = usage.total_tokens
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from .logger import get_logger
+
+logger = get_logger("llm_governor")
+
+WINDOW_SECONDS = 60.0
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(messages: Any) -> int:
+    """Rough prompt token count (chars / 4) for strings, LangChain or dict messages."""
+    if messages is None:
+        return 0
+    if isinstance(messages, str):
+        return len(messages) // CHARS_PER_TOKEN + 1
+    if isinstance(messages, dict):
+        return estimate_tokens(messages.get("content"))
+    if isinstance(messages, (list, tuple)):
+        return sum(estimate_tokens(message) for message in messages)
+    content = getattr(messages, "content", None)
+    if content is not None:
+        return estimate_tokens(content)
+    return len(str(messages)) // CHARS_PER_TOKEN + 1
+
+
+class Lease:
+    """One request in the sliding window (tokens updated after the response)."""
+
+    __slots__ = ("started", "tokens")
+
+    def __init__(self, started: float, tokens: int):
+        self.started = started
+        self.tokens = tokens
+
+
+class ProviderGovernor:
+    """Requests/minute, tokens/minute and in-flight limits for one provider."""
+
+    def __init__(
+        self,
+        provider: str,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        max_in_flight: int = 0
+    ):
+        """
+        Initialize governor.
+
+        Args:
+            provider: Provider name ('openrouter', 'groq')
+            requests_per_minute: Max call starts per 60 s (0 = unlimited)
+            tokens_per_minute: Max tokens per 60 s (0 = unlimited)
+            max_in_flight: Max concurrent calls (0 = unlimited)
+        """
+        self.provider = provider
+        self.requests_per_minute = max(0, requests_per_minute)
+        self.tokens_per_minute = max(0, tokens_per_minute)
+        self.max_in_flight = max(0, max_in_flight)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._window: Deque[Lease] = deque()
+        self._in_flight = 0
+        self._semaphore = asyncio.Semaphore(self.max_in_flight) if self.max_in_flight else None
+        self._admission = asyncio.Lock()
+        self._stats = {"requests": 0, "waited": 0, "wait_seconds": 0.0}
+
+    def _ensure_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Locks/semaphores can't be shared across event loops
+            self._reset()
+            self._loop = loop
+
+    def _prune(self, now: float) -> None:
+        while self._window and now - self._window[0].started >= WINDOW_SECONDS:
+            self._window.popleft()
+
+    def _window_tokens(self) -> int:
+        return sum(lease.tokens for lease in self._window)
+
+    def _delay(self, tokens: int, now: float) -> float:
+        """Seconds until a call of `tokens` fits in the window (0 = now)."""
+        self._prune(now)
+        if not self._window:
+            return 0.0
+
+        if self.requests_per_minute and len(self._window) >= self.requests_per_minute:
+            index = len(self._window) - self.requests_per_minute
+            return self._window[index].started + WINDOW_SECONDS - now
+
+        if self.tokens_per_minute:
+            excess = self._window_tokens() + tokens - self.tokens_per_minute
+            if excess > 0:
+                # Wait until enough of the oldest leases have expired
+                for lease in self._window:
+                    excess -= lease.tokens
+                    if excess <= 0:
+                        return lease.started + WINDOW_SECONDS - now
+                return self._window[-1].started + WINDOW_SECONDS - now
+
+        return 0.0
+
+    async def _admit(self, tokens: int) -> Lease:
+        # One admission at a time keeps waiting callers in FIFO order
+        async with self._admission:
+            waited = 0.0
+            while True:
+                now = time.monotonic()
+                delay = self._delay(tokens, now)
+                if delay <= 0:
+                    break
+                if not waited:
+                    self._stats["waited"] += 1
+                    logger.debug("llm_governor_waiting",
+                        provider=self.provider,
+                        delay_seconds=round(delay, 2),
+                        window_requests=len(self._window),
+                        window_tokens=self._window_tokens()
+                    )
+                await asyncio.sleep(delay)
+                waited += delay
+
+            self._stats["wait_seconds"] += waited
+            lease = Lease(time.monotonic(), tokens)
+            self._window.append(lease)
+            return lease
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int = 0) -> AsyncIterator[Lease]:
+        """Hold a call slot; set lease.tokens to the real usage when known."""
+        self._ensure_loop()
+
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+        try:
+            lease = await self._admit(estimated_tokens)
+            self._in_flight += 1
+            self._stats["requests"] += 1
+            try:
+                yield lease
+            finally:
+                self._in_flight -= 1
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Limits, counters and current window load."""
+        self._prune(time.monotonic())
+        return {
+            **self._stats,
+            "wait_seconds": round(self._stats["wait_seconds"], 2),
+            "in_flight": self._in_flight,
+            "window_requests": len(self._window),
+            "window_tokens": self._window_tokens(),
+            "rpm_limit": self.requests_per_minute,
+            "tpm_limit": self.tokens_per_minute,
+            "max_in_flight": self.max_in_flight
+        }
@@ -5,12 +5,15 @@ This module provides:
 - Consistent interface across OpenRouter, Groq, and future providers
 - Automatic usage tracking with cost calculation
 - Model pricing from database
+- Per-provider rate limiting (governor assigned by LLMRegistry)
 """
 
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
+from utils.llm_governor import Lease, ProviderGovernor, estimate_tokens
 from utils.logger import get_logger
 from utils.supabase_client import get_supabase_client
 from utils.usage_tracker import get_usage_tracker
@@ -68,6 +71,21 @@ class LLMProvider(ABC):
         self.model_alias = model_alias
         self._model_info: Optional[ModelInfo] = None
         self._client = None  # LangChain client instance
+        self.governor: Optional[ProviderGovernor] = None  # Set by LLMRegistry
+    
+    @asynccontextmanager
+    async def _rate_limit(self, messages):
+        """Hold a governor slot for one call (no limits if no governor).
+        
+        Yields:
+            Lease whose `tokens` should be set to the real usage
+        """
+        if self.governor is None:
+            yield Lease(0.0, 0)
+            return
+        
+        async with self.governor.slot(estimate_tokens(messages)) as lease:
+            yield lease
     
     async def _load_model_info(self) -> ModelInfo:
         """Load model pricing from database.
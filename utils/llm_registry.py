@@ -1,6 +1,11 @@
-"""Central registry for all LLM providers and models."""
+"""Central registry for all LLM providers and models.
 
-from typing import Dict, Optional
+Also owns one ProviderGovernor per provider (openrouter, groq) so that all
+models of a provider share its rate limits (see utils/llm_governor).
+"""
+
+from typing import Any, Dict, Optional
+from utils.llm_governor import ProviderGovernor
 from utils.providers.openrouter_provider import OpenRouterProvider
 from utils.providers.groq_provider import GroqProvider
 from utils.providers.groq_compound_provider import GroqCompoundProvider
@@ -16,7 +21,22 @@ class LLMRegistry:
     def __init__(self):
         """Initialize registry with all configured models."""
         self._providers: Dict[str, any] = {}
+        self._governors: Dict[str, ProviderGovernor] = {
+            'openrouter': ProviderGovernor(
+                'openrouter',
+                requests_per_minute=settings.llm_openrouter_rpm,
+                tokens_per_minute=settings.llm_openrouter_tpm,
+                max_in_flight=settings.llm_openrouter_max_in_flight
+            ),
+            'groq': ProviderGovernor(
+                'groq',
+                requests_per_minute=settings.llm_groq_rpm,
+                tokens_per_minute=settings.llm_groq_tpm,
+                max_in_flight=settings.llm_groq_max_in_flight
+            )
+        }
         self._initialize_providers()
+        self._attach_governors()
     
     def _initialize_providers(self):
         """Initialize all LLM providers."""
@@ -63,6 +83,26 @@ class LLMRegistry:
             models=list(self._providers.keys())
         )
     
+    def _attach_governors(self):
+        """Give each provider the shared governor of its provider family."""
+        for provider in self._providers.values():
+            provider.governor = self._governors.get(provider.get_provider_name())
+    
+    def governor(self, provider_name: str) -> Optional[ProviderGovernor]:
+        """Get the rate governor shared by all models of a provider.
+        
+        Args:
+            provider_name: 'openrouter' or 'groq'
+            
+        Returns:
+            ProviderGovernor, or None if the provider is not governed
+        """
+        return self._governors.get(provider_name)
+    
+    def governor_stats(self) -> Dict[str, Any]:
+        """Current load and limits per provider."""
+        return {name: governor.stats() for name, governor in self._governors.items()}
+    
     def get(self, alias: str):
         """Get LLM provider by alias.
         
@@ -0,0 +1,310 @@
+"""Parse-once document model shared across the scraper pipeline.
+
+A scraped page used to be parsed with BeautifulSoup(html, 'html.parser')
+by parse_content, normalize_html (twice on its fallback path), the LLM text
+cleanup, the date extractor and the image extractor. ParsedDocument parses
+it once with lxml and exposes cached, read-only views instead:
+
+- soup: the pristine tree (never mutated; consumers must not decompose())
+- title: <title> text
+- normalized_text: same output as normalize_html() (hashing/change detection)
+- llm_text: lighter cleanup used as LLM input
+- text: full page text
+- meta: {name/property (lowercase): content} for <meta> tags
+- jsonld: parsed JSON-LD blocks
+- featured_image(): cached image_extractor cascade
+- content_hashes: (sha256, simhash) of normalized_text
+- css_dates: date_extractor CSS selector dates of the whole page
+- news_blocks: multi-noticia candidates (text, CSS dates, image per block)
+
+For large pages, build_document() computes these views in the CPU pool
+(utils/cpu_pool) and seeds them. The scraper pipeline only reads views, so
+the event loop never parses those pages; .soup stays available for other
+callers and parses lazily on first access.
+
+Noise removal is done by skipping subtrees while collecting text, not by
+decompose(), so one tree serves every view. Consumers that really need a
+mutated tree (extract_news_links_local) call fresh_soup(), which is an lxml
+parse of the same HTML.
+
+Usage:
+    document = await build_document(html, url)
+    state["document"] = document
+    text = document.normalized_text
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+from .logger import get_logger
+
+logger = get_logger("parsed_document")
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+NOISE_TAGS = frozenset(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe'])
+LLM_NOISE_TAGS = frozenset(['script', 'style', 'nav', 'header', 'footer', 'aside'])
+CONTAINER_NOISE_TAGS = frozenset(['script', 'style', 'nav', 'aside', 'iframe'])
+AD_PATTERN = re.compile('ad|advertisement|sponsor|promo|banner|popup', re.I)
+CONTENT_PATTERN = re.compile(r'(content|article|post|entry)', re.I)
+NEWS_BLOCK_KEYWORDS = ('noticia', 'news', 'post', 'item', 'entry')
+MAX_NEWS_BLOCKS = 10
+
+_UNSET = object()
+
+
+def make_soup(html: str) -> BeautifulSoup:
+    """Parse HTML with the fastest available parser (lxml, else html.parser)."""
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def _is_ad(tag: Tag) -> bool:
+    classes = tag.get('class') or []
+    if isinstance(classes, str):
+        classes = [classes]
+    if any(AD_PATTERN.search(c) for c in classes):
+        return True
+    element_id = tag.get('id')
+    return bool(element_id and AD_PATTERN.search(element_id))
+
+
+def collect_text(root: Tag, skip: Optional[Callable[[Tag], bool]] = None) -> str:
+    """get_text(' ', strip=True) of root, skipping subtrees where skip(tag) is True."""
+    parts: List[str] = []
+    stack = list(reversed(list(root.children)))
+
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Tag):
+            if skip is not None and skip(node):
+                continue
+            stack.extend(reversed(list(node.children)))
+        elif type(node) in (NavigableString, CData):
+            text = node.strip()
+            if text:
+                parts.append(text)
+
+    return ' '.join(parts)
+
+
+def _collapse(text: str) -> str:
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+class ParsedDocument:
+    """One parsed HTML page with lazily computed, cached views."""
+
+    def __init__(self, html: str, url: Optional[str] = None):
+        self.html = html
+        self.url = url
+        self._soup: Optional[BeautifulSoup] = None
+        self._cache: Dict[str, Any] = {}
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """Pristine parsed tree (read-only)."""
+        if self._soup is None:
+            self._soup = make_soup(self.html)
+        return self._soup
+
+    def fresh_soup(self) -> BeautifulSoup:
+        """A separate tree that the caller may mutate."""
+        return make_soup(self.html)
+
+    def _cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        value = self._cache.get(key, _UNSET)
+        if value is _UNSET:
+            value = compute()
+            self._cache[key] = value
+        return value
+
+    @property
+    def title(self) -> str:
+        def compute():
+            title_tag = self.soup.find('title')
+            return title_tag.get_text(strip=True) if title_tag else "Untitled"
+        return self._cached("title", compute)
+
+    @property
+    def text(self) -> str:
+        """Full page text (whitespace-normalized)."""
+        return self._cached("text", lambda: _collapse(self.soup.get_text(separator=' ', strip=True)))
+
+    @property
+    def llm_text(self) -> str:
+        """Text without scripts, styles, nav, header, footer, aside."""
+        return self._cached("llm_text", lambda: _collapse(
+            collect_text(self.soup, lambda tag: tag.name in LLM_NOISE_TAGS)
+        ))
+
+    def normalize(self, min_acceptable_length: int = 300) -> str:
+        """Semantic text for hashing (see content_hasher.normalize_html)."""
+        key = f"normalized:{min_acceptable_length}"
+        return self._cached(key, lambda: self._normalize(min_acceptable_length))
+
+    @property
+    def normalized_text(self) -> str:
+        return self.normalize()
+
+    def _normalize(self, min_acceptable_length: int) -> str:
+        text = _collapse(collect_text(
+            self.soup, lambda tag: tag.name in NOISE_TAGS or _is_ad(tag)
+        ))
+
+        if len(text) >= min_acceptable_length:
+            return text
+
+        logger.warn("html_normalization_too_aggressive",
+            original_length=len(self.html),
+            normalized_length=len(text),
+            threshold=min_acceptable_length,
+            message="Normalized content too short, trying fallback extraction"
+        )
+
+        # Fallback: main content container only
+        container = (
+            self.soup.find('article') or
+            self.soup.find('main') or
+            self.soup.find(class_=CONTENT_PATTERN) or
+            self.soup.find(id=CONTENT_PATTERN)
+        )
+
+        if container:
+            text = _collapse(collect_text(container, lambda tag: tag.name in CONTAINER_NOISE_TAGS))
+            logger.info("html_normalization_fallback_success",
+                original_length=len(self.html),
+                normalized_length=len(text),
+                container_found=container.name
+            )
+            return text
+
+        logger.warn("html_normalization_fallback_failed",
+            message="No content container found, using simple tag removal"
+        )
+        return _collapse(re.sub(r'<[^>]+>', ' ', self.html))
+
+    @property
+    def meta(self) -> Dict[str, str]:
+        """<meta> content by name/property (lowercase keys, first occurrence wins)."""
+        def compute():
+            meta: Dict[str, str] = {}
+            for tag in self.soup.find_all('meta'):
+                content = tag.get('content')
+                if not content:
+                    continue
+                for attr in ('property', 'name'):
+                    key = tag.get(attr)
+                    if key:
+                        meta.setdefault(key.lower(), content)
+            return meta
+        return self._cached("meta", compute)
+
+    @property
+    def jsonld(self) -> List[Any]:
+        """Parsed JSON-LD blocks (invalid blocks skipped)."""
+        def compute():
+            blocks = []
+            for script in self.soup.find_all('script', type='application/ld+json'):
+                if not script.string:
+                    continue
+                try:
+                    blocks.append(json.loads(script.string))
+                except (json.JSONDecodeError, TypeError) as e:
+                    logger.debug("jsonld_parse_error", error=str(e))
+            return blocks
+        return self._cached("jsonld", compute)
+
+    @property
+    def css_dates(self) -> List[Tuple[Any, str, float]]:
+        """(datetime, source, confidence) from date CSS selectors (date_extractor)."""
+        from .date_extractor import extract_from_css_selectors
+        return self._cached("css_dates", lambda: extract_from_css_selectors(self.soup))
+
+    @property
+    def news_blocks(self) -> Dict[str, Any]:
+        """Multi-noticia detection.
+
+        Returns:
+            {"candidates": number of news-like containers, "valid": number
+            of valid ones, "blocks": the first MAX_NEWS_BLOCKS valid blocks as
+            {"text", "css_dates", "featured_image"}}. A valid block has
+            50-2000 chars, a heading and a link.
+        """
+        return self._cached("news_blocks", self._news_blocks)
+
+    def _news_blocks(self) -> Dict[str, Any]:
+        from .date_extractor import extract_from_css_selectors
+        from .image_extractor import extract_featured_image
+
+        candidates = self.soup.find_all(['article', 'div'], class_=lambda c: c and any(
+            keyword in str(c).lower() for keyword in NEWS_BLOCK_KEYWORDS
+        ))
+
+        blocks = []
+        for block in candidates:
+            block_text = block.get_text(separator=' ', strip=True)
+            if not 50 <= len(block_text) <= 2000:
+                continue
+            if block.find(['h1', 'h2', 'h3', 'h4']) is None or block.find('a', href=True) is None:
+                continue
+            try:
+                featured_image = extract_featured_image(block, self.url or "")
+            except Exception:
+                featured_image = None
+            blocks.append({
+                "text": block_text,
+                "css_dates": extract_from_css_selectors(block),
+                "featured_image": featured_image
+            })
+
+        return {"candidates": len(candidates), "blocks": blocks[:MAX_NEWS_BLOCKS], "valid": len(blocks)}
+
+    @property
+    def content_hashes(self) -> Tuple[str, int]:
+        """(sha256, simhash) of normalized_text (see content_hasher)."""
+        from .content_hasher import hash_semantic_content
+        return self._cached("content_hashes", lambda: hash_semantic_content(self.normalized_text))
+
+    def export_views(self) -> Dict[str, Any]:
+        """Compute the commonly used views (picklable dict, no tree)."""
+        self.title, self.text, self.llm_text, self.normalized_text
+        self.meta, self.jsonld, self.content_hashes
+        self.css_dates, self.news_blocks
+        self.featured_image()
+        return dict(self._cache)
+
+    def seed_views(self, views: Dict[str, Any]) -> None:
+        """Install views computed elsewhere (another process)."""
+        self._cache.update(views)
+
+    def featured_image(self, page_url: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Featured image via the image_extractor cascade (cached)."""
+        from .image_extractor import extract_featured_image
+
+        page_url = page_url or self.url or ""
+        return self._cached(
+            f"featured_image:{page_url}",
+            lambda: extract_featured_image(self.soup, page_url, jsonld_blocks=self.jsonld)
+        )
+
+
+def compute_document_views(html: str, url: Optional[str] = None) -> Dict[str, Any]:
+    """Parse html and return its views (CPU pool entry point)."""
+    return ParsedDocument(html, url).export_views()
+
+
+async def build_document(html: str, url: Optional[str] = None) -> ParsedDocument:
+    """Create a ParsedDocument, precomputing views off the loop for large pages."""
+    from .cpu_pool import run_cpu, should_offload
+
+    document = ParsedDocument(html, url)
+    if should_offload(len(html)):
+        document.seed_views(await run_cpu(compute_document_views, html, url, size_hint=len(html)))
+    return document
@@ -13,6 +13,7 @@ import pdfplumber
 
 from .logger import get_logger
 from .llm_client import LLMClient
+from .http_client import get_http_session
 
 logger = get_logger("pdf_extractor")
 
@@ -63,49 +64,49 @@ class PDFExtractor:
             
             timeout = aiohttp.ClientTimeout(total=self.timeout_seconds)
             
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url) as response:
-                    
-                    # Check status code
-                    if response.status != 200:
-                        error_msg = f"HTTP {response.status}"
-                        logger.warn("pdf_download_failed", url=url, error=error_msg)
-                        return (None, error_msg)
-                    
-                    # Check content type
-                    content_type = response.headers.get('Content-Type', '')
-                    if 'pdf' not in content_type.lower() and 'octet-stream' not in content_type.lower():
-                        logger.warn("pdf_download_wrong_content_type",
-                            url=url,
-                            content_type=content_type
-                        )
-                    
-                    # Check content length
-                    content_length = response.headers.get('Content-Length')
-                    if content_length and int(content_length) > self.max_size_bytes:
-                        error_msg = f"File too large: {int(content_length) / 1024 / 1024:.1f}MB (max {self.max_size_mb}MB)"
-                        logger.warn("pdf_download_too_large", url=url, error=error_msg)
-                        return (None, error_msg)
-                    
-                    # Read content with size limit
-                    pdf_bytes = await response.read()
-                    
-                    # Final size check
-                    if len(pdf_bytes) > self.max_size_bytes:
-                        error_msg = f"Downloaded file too large: {len(pdf_bytes) / 1024 / 1024:.1f}MB"
-                        logger.warn("pdf_download_too_large_after_read",
-                            url=url,
-                            error=error_msg
-                        )
-                        return (None, error_msg)
-                    
-                    logger.info("pdf_download_success",
+            session = await get_http_session()
+            async with session.get(url, timeout=timeout) as response:
+                
+                # Check status code
+                if response.status != 200:
+                    error_msg = f"HTTP {response.status}"
+                    logger.warn("pdf_download_failed", url=url, error=error_msg)
+                    return (None, error_msg)
+                
+                # Check content type
+                content_type = response.headers.get('Content-Type', '')
+                if 'pdf' not in content_type.lower() and 'octet-stream' not in content_type.lower():
+                    logger.warn("pdf_download_wrong_content_type",
                         url=url,
-                        size_kb=len(pdf_bytes) / 1024
+                        content_type=content_type
                     )
-                    
-                    return (pdf_bytes, None)
-        
+                
+                # Check content length
+                content_length = response.headers.get('Content-Length')
+                if content_length and int(content_length) > self.max_size_bytes:
+                    error_msg = f"File too large: {int(content_length) / 1024 / 1024:.1f}MB (max {self.max_size_mb}MB)"
+                    logger.warn("pdf_download_too_large", url=url, error=error_msg)
+                    return (None, error_msg)
+                
+                # Read content with size limit
+                pdf_bytes = await response.read()
+                
+                # Final size check
+                if len(pdf_bytes) > self.max_size_bytes:
+                    error_msg = f"Downloaded file too large: {len(pdf_bytes) / 1024 / 1024:.1f}MB"
+                    logger.warn("pdf_download_too_large_after_read",
+                        url=url,
+                        error=error_msg
+                    )
+                    return (None, error_msg)
+                
+                logger.info("pdf_download_success",
+                    url=url,
+                    size_kb=len(pdf_bytes) / 1024
+                )
+                
+                return (pdf_bytes, None)
+    
         except aiohttp.ClientError as e:
             error_msg = f"Network error: {str(e)}"
             logger.error("pdf_download_network_error", url=url, error=error_msg)
@@ -79,18 +79,21 @@ class GroqCompoundProvider(LLMProvider):
         # Load model info for cost calculation
         await self._load_model_info()
 
-        # Call Groq Compound
+        # Call Groq Compound (rate-limited with the other Groq models)
         # Web search is automatic - no tools array needed
-        response = await self._client.chat.completions.create(
-            model=self.model_name,
-            messages=messages,
-            temperature=config.get('temperature', 0.0),
-            max_tokens=config.get('max_tokens', 2048)
-        )
+        async with self._rate_limit(messages) as lease:
+            response = await self._client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                temperature=config.get('temperature', 0.0),
+                max_tokens=config.get('max_tokens', 2048)
+            )
 
         # Extract and track usage
+        usage = self._extract_usage(response)
+        if usage:
+            lease.tokens = usage.total_tokens
         if tracking_config:
-            usage = self._extract_usage(response)
             if usage:
                 # Web search cost: average between basic ($0.005) and advanced ($0.008)
                 search_cost = tracking_config.get('web_search_cost', 0.0065)
@@ -63,13 +63,15 @@ class GroqProvider(LLMProvider):
         # Load model info for cost calculation
         await self._load_model_info()
         
-        # Call LLM
-        response = await self._client.ainvoke(messages, config)
+        # Call LLM (rate-limited per provider)
+        async with self._rate_limit(messages) as lease:
+            response = await self._client.ainvoke(messages, config)
         
         # Extract and track usage
-        if tracking_config:
-            usage = self._extract_usage(response)
-            if usage:
+        usage = self._extract_usage(response)
+        if usage:
+            lease.tokens = usage.total_tokens
+            if tracking_config:
                 await self._track_usage(usage, tracking_config)
         
         return response
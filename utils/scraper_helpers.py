@@ -11,6 +11,7 @@ from datetime import datetime
 import uuid
 
 from .supabase_client import get_supabase_client
+from .config_cache import get_config_cache
 from .logger import get_logger
 
 logger = get_logger("scraper_helpers")
@@ -190,6 +191,7 @@ async def update_scraping_source_config(
         ).eq("source_id", source_id).execute()
         
         if update_result.data:
+            get_config_cache().invalidate_source(source_id)
             logger.info("scraping_source_updated", source_id=source_id)
             return {
                 "success": True,
@@ -10,8 +10,9 @@ from fastapi import HTTPException, Header
 import jwt
 from jwt import PyJWKClient
 
+from utils.auth_cache import get_auth_cache
 from utils.config import settings
-from utils.supabase_client import get_supabase_client
+from utils.supabase_client import get_supabase_client, execute_async
 from utils.logger import get_logger
 
 logger = get_logger("supabase_auth")
@@ -65,9 +66,12 @@ class SupabaseAuth:
             logger.error("jwt_verification_error", error=str(e))
             raise HTTPException(status_code=401, detail="Authentication failed")
 
-    def get_user_from_token(self, token: str) -> Dict[str, Any]:
+    async def get_user_from_token(self, token: str) -> Dict[str, Any]:
         """Get user information from JWT token.
 
+        The signature/expiry check runs every time; the users row is cached
+        per auth_user_id (see utils/auth_cache).
+
         Args:
             token: JWT token
 
@@ -86,18 +90,22 @@ class SupabaseAuth:
 
         # Get user from database
         supabase = get_supabase_client()
-        result = supabase.client.table("users")\
-            .select("id, auth_user_id, email, name, company_id, organization_id, role, is_active")\
-            .eq("auth_user_id", auth_user_id)\
-            .maybe_single()\
-            .execute()
 
-        if not result.data:
+        async def load():
+            result = await execute_async(
+                supabase.client.table("users")
+                .select("id, auth_user_id, email, name, company_id, organization_id, role, is_active")
+                .eq("auth_user_id", auth_user_id)
+                .limit(1)
+            )
+            return result.data[0] if result.data else None
+
+        user = await get_auth_cache().get_or_load("jwt_user", auth_user_id, load)
+
+        if not user:
             logger.warn("user_not_found_for_jwt", auth_user_id=auth_user_id)
             raise HTTPException(status_code=404, detail="User not found")
 
-        user = result.data
-
         if not user.get("is_active"):
             raise HTTPException(status_code=403, detail="User account is inactive")
 
@@ -155,4 +163,4 @@ async def get_current_user_from_jwt(
     token = parts[1]
 
     auth = get_supabase_auth()
-    return auth.get_user_from_token(token)
+    return await auth.get_user_from_token(token)
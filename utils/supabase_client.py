@@ -1,17 +1,61 @@
 """Supabase client for semantika.
 
 Handles all interactions with Supabase database for configuration management.
+
+The supabase-py PostgREST builders are synchronous, so calling execute()
+directly inside an async handler stalls the whole event loop until the query
+returns. Run queries through execute_async() instead: it offloads execute()
+to a bounded thread pool (SUPABASE_MAX_CONCURRENCY workers). All workers share
+the single SupabaseClient and therefore its pooled httpx connections.
+
+    result = await execute_async(
+        supabase.client.table("press_articles").select("*").eq("id", article_id)
+    )
 """
 
 from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
 from supabase import create_client, Client
+import asyncio
 import secrets
 
+from .auth_cache import api_key_fingerprint, get_auth_cache
 from .config import settings
+from .config_cache import get_config_cache
 from .logger import get_logger
 
 logger = get_logger("supabase_client")
 
+# Bounded thread pool for blocking PostgREST calls
+_db_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """Get or initialize thread pool executor for Supabase queries."""
+    global _db_executor
+
+    if _db_executor is None:
+        _db_executor = ThreadPoolExecutor(
+            max_workers=settings.supabase_max_concurrency,
+            thread_name_prefix="supabase"
+        )
+        logger.info("supabase_executor_initialized", max_workers=settings.supabase_max_concurrency)
+
+    return _db_executor
+
+
+async def execute_async(query: Any) -> Any:
+    """Run a PostgREST query builder without blocking the event loop.
+
+    Args:
+        query: Any supabase-py builder (table().select()..., rpc(...), etc.)
+
+    Returns:
+        The APIResponse returned by the builder's execute()
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_db_executor(), query.execute)
+
 
 class SupabaseClient:
     """Supabase client wrapper for semantika configuration."""
@@ -43,11 +87,11 @@ class SupabaseClient:
             Client data or None if not found
         """
         try:
-            response = self.client.table("clients").select("*").eq("api_key", api_key).eq("is_active", True).execute()
+            client = await self.get_client_record_by_api_key(api_key)
 
-            if response.data and len(response.data) > 0:
+            if client and client.get("is_active"):
                 logger.debug("client_found", api_key_prefix=api_key[:10])
-                return response.data[0]
+                return client
             else:
                 logger.warn("client_not_found", api_key_prefix=api_key[:10])
                 return None
@@ -56,10 +100,29 @@ class SupabaseClient:
             logger.error("get_client_error", error=str(e))
             return None
 
+    async def get_client_record_by_api_key(self, api_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the clients row for an API key, active or not (cached, see auth_cache).
+
+        Args:
+            api_key: Client API key
+
+        Returns:
+            Client row or None if no client has this key
+
+        Raises:
+            Exception: On database errors (not cached)
+        """
+        async def load():
+            response = await execute_async(self.client.table("clients").select("*").eq("api_key", api_key).limit(1))
+            return response.data[0] if response.data else None
+
+        return await get_auth_cache().get_or_load("api_key", api_key_fingerprint(api_key), load)
+
     async def get_client_by_id(self, client_id: str) -> Optional[Dict[str, Any]]:
         """Get client by ID."""
         try:
-            response = self.client.table("clients").select("*").eq("client_id", client_id).execute()
+            response = await execute_async(self.client.table("clients").select("*").eq("client_id", client_id))
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error("get_client_by_id_error", error=str(e), client_id=client_id)
@@ -89,7 +152,7 @@ class SupabaseClient:
             if email:
                 client_data["email"] = email
 
-            response = self.client.table("clients").insert(client_data).execute()
+            response = await execute_async(self.client.table("clients").insert(client_data))
 
             if response.data and len(response.data) > 0:
                 created_client = response.data[0]
@@ -109,7 +172,7 @@ class SupabaseClient:
     async def list_clients(self) -> List[Dict[str, Any]]:
         """List all clients."""
         try:
-            response = self.client.table("clients").select("client_id, client_name, email, is_active, created_at").execute()
+            response = await execute_async(self.client.table("clients").select("client_id, client_name, email, is_active, created_at"))
             return response.data or []
         except Exception as e:
             logger.error("list_clients_error", error=str(e))
@@ -127,7 +190,7 @@ class SupabaseClient:
             if is_active is not None:
                 query = query.eq("is_active", is_active)
 
-            response = query.execute()
+            response = await execute_async(query)
             return response.data or []
 
         except Exception as e:
@@ -137,7 +200,7 @@ class SupabaseClient:
     async def get_all_active_tasks(self) -> List[Dict[str, Any]]:
         """Get all active tasks for scheduling."""
         try:
-            response = self.client.table("tasks").select("*").eq("is_active", True).execute()
+            response = await execute_async(self.client.table("tasks").select("*").eq("is_active", True))
             return response.data or []
         except Exception as e:
             logger.error("get_all_tasks_error", error=str(e))
@@ -164,7 +227,7 @@ class SupabaseClient:
                 "config": config or {}
             }
 
-            response = self.client.table("tasks").insert(task_data).execute()
+            response = await execute_async(self.client.table("tasks").insert(task_data))
 
             if response.data and len(response.data) > 0:
                 created_task = response.data[0]
@@ -186,7 +249,7 @@ class SupabaseClient:
     async def get_task_by_id(self, task_id: str, company_id: str) -> Optional[Dict[str, Any]]:
         """Get task by ID within a company."""
         try:
-            response = self.client.table("tasks").select("*").eq("task_id", task_id).eq("company_id", company_id).execute()
+            response = await execute_async(self.client.table("tasks").select("*").eq("task_id", task_id).eq("company_id", company_id))
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error("get_task_by_id_error", error=str(e), task_id=task_id, company_id=company_id)
@@ -195,7 +258,7 @@ class SupabaseClient:
     async def delete_task(self, task_id: str, company_id: str) -> bool:
         """Delete a task (soft delete - sets is_active to False) within a company."""
         try:
-            response = self.client.table("tasks").update({"is_active": False}).eq("task_id", task_id).eq("company_id", company_id).execute()
+            response = await execute_async(self.client.table("tasks").update({"is_active": False}).eq("task_id", task_id).eq("company_id", company_id))
 
             if response.data and len(response.data) > 0:
                 logger.info("task_deleted", task_id=task_id, company_id=company_id)
@@ -210,7 +273,7 @@ class SupabaseClient:
     async def update_task_last_run(self, task_id: str, last_run_timestamp: str) -> bool:
         """Update task's last_run timestamp."""
         try:
-            response = self.client.table("tasks").update({"last_run": last_run_timestamp}).eq("task_id", task_id).execute()
+            response = await execute_async(self.client.table("tasks").update({"last_run": last_run_timestamp}).eq("task_id", task_id))
 
             if response.data and len(response.data) > 0:
                 logger.debug("task_last_run_updated", task_id=task_id, last_run=last_run_timestamp)
@@ -261,7 +324,7 @@ class SupabaseClient:
                 "workflow_code": workflow_code
             }
             
-            result = self.client.table("executions").insert(execution_data).execute()
+            result = await execute_async(self.client.table("executions").insert(execution_data))
             
             if result.data and len(result.data) > 0:
                 execution_id = result.data[0]["execution_id"]
@@ -295,7 +358,7 @@ class SupabaseClient:
             if source_type:
                 query = query.eq("source_type", source_type)
             
-            response = query.execute()
+            response = await execute_async(query)
             return response.data or []
             
         except Exception as e:
@@ -303,52 +366,61 @@ class SupabaseClient:
             return []
 
     async def get_email_routing_for_address(self, email_address: str) -> Optional[Dict[str, Any]]:
-        """Find which source handles a specific email address."""
+        """Find which source handles a specific email address (cached, see config_cache)."""
         try:
-            # First try exact match
-            exact_match = self.client.table("email_routing")\
-                .select("*, sources!inner(*)")\
-                .eq("email_pattern", email_address)\
-                .eq("pattern_type", "exact")\
-                .eq("sources.is_active", True)\
-                .order("priority", desc=True)\
-                .limit(1)\
-                .execute()
-            
-            if exact_match.data:
-                return exact_match.data[0]
-            
-            # Try pattern matching (prefix, domain, etc.)
-            # This could be enhanced with more sophisticated pattern matching
-            domain = email_address.split('@')[1] if '@' in email_address else ""
-            
-            domain_match = self.client.table("email_routing")\
-                .select("*, sources!inner(*)")\
-                .eq("email_pattern", f"@{domain}")\
-                .eq("pattern_type", "domain")\
-                .eq("sources.is_active", True)\
-                .order("priority", desc=True)\
-                .limit(1)\
-                .execute()
-            
-            if domain_match.data:
-                return domain_match.data[0]
-            
-            return None
-            
+            return await get_config_cache().get_or_load(
+                "email_routing",
+                email_address,
+                lambda: self._load_email_routing(email_address)
+            )
         except Exception as e:
             logger.error("get_email_routing_error", email=email_address, error=str(e))
             return None
 
+    async def _load_email_routing(self, email_address: str) -> Optional[Dict[str, Any]]:
+        # First try exact match
+        exact_match = await execute_async(
+            self.client.table("email_routing")
+            .select("*, sources!inner(*)")
+            .eq("email_pattern", email_address)
+            .eq("pattern_type", "exact")
+            .eq("sources.is_active", True)
+            .order("priority", desc=True)
+            .limit(1)
+        )
+        
+        if exact_match.data:
+            return exact_match.data[0]
+        
+        # Try pattern matching (prefix, domain, etc.)
+        # This could be enhanced with more sophisticated pattern matching
+        domain = email_address.split('@')[1] if '@' in email_address else ""
+        
+        domain_match = await execute_async(
+            self.client.table("email_routing")
+            .select("*, sources!inner(*)")
+            .eq("email_pattern", f"@{domain}")
+            .eq("pattern_type", "domain")
+            .eq("sources.is_active", True)
+            .order("priority", desc=True)
+            .limit(1)
+        )
+        
+        if domain_match.data:
+            return domain_match.data[0]
+        
+        return None
+
     async def get_scheduled_sources(self) -> List[Dict[str, Any]]:
         """Get all sources that need scheduled execution."""
         try:
-            response = self.client.table("sources")\
-                .select("*")\
-                .eq("is_active", True)\
-                .in_("source_type", ["scraping", "api", "system"])\
-                .not_.is_("schedule_config", "null")\
-                .execute()
+            response = await execute_async(
+                self.client.table("sources")
+                .select("*")
+                .eq("is_active", True)
+                .in_("source_type", ["scraping", "api", "system"])
+                .not_.is_("schedule_config", "null")
+            )
             
             return response.data or []
             
@@ -366,17 +438,17 @@ class SupabaseClient:
         try:
             # Use SQL functions for incrementing
             if success:
-                response = self.client.rpc('increment_source_stats', {
+                response = await execute_async(self.client.rpc('increment_source_stats', {
                     'source_id': source_id,
                     'success': True,
                     'items_processed': items_processed
-                }).execute()
+                }))
             else:
-                response = self.client.rpc('increment_source_stats', {
+                response = await execute_async(self.client.rpc('increment_source_stats', {
                     'source_id': source_id,
                     'success': False,
                     'items_processed': 0
-                }).execute()
+                }))
             
             return len(response.data) > 0
             
@@ -391,11 +463,12 @@ class SupabaseClient:
     async def get_company_by_email_alias(self, email_alias: str) -> Optional[Dict[str, Any]]:
         """Get company by email alias in settings."""
         try:
-            response = self.client.table("companies")\
-                .select("*")\
-                .contains("settings", {"email_alias": email_alias})\
-                .eq("is_active", True)\
-                .execute()
+            response = await execute_async(
+                self.client.table("companies")
+                .select("*")
+                .contains("settings", {"email_alias": email_alias})
+                .eq("is_active", True)
+            )
 
             if response.data and len(response.data) > 0:
                 logger.debug("company_found_by_email", email_alias=email_alias, company_id=response.data[0]["id"])
@@ -409,14 +482,29 @@ class SupabaseClient:
             return None
 
     async def get_company_by_id(self, company_id: str) -> Optional[Dict[str, Any]]:
-        """Get company by ID."""
-        try:
-            response = self.client.table("companies").select("*").eq("id", company_id).eq("is_active", True).execute()
+        """Get active company by ID (cached, see config_cache)."""
+        async def load():
+            response = await execute_async(self.client.table("companies").select("*").eq("id", company_id).eq("is_active", True))
             return response.data[0] if response.data else None
+
+        try:
+            return await get_config_cache().get_or_load("company", company_id, load)
         except Exception as e:
             logger.error("get_company_by_id_error", error=str(e), company_id=company_id)
             return None
 
+    async def get_company_settings(self, company_id: str) -> Dict[str, Any]:
+        """Get companies.settings by ID ({} if missing; cached, see config_cache)."""
+        async def load():
+            response = await execute_async(self.client.table("companies").select("settings").eq("id", company_id))
+            return (response.data[0].get("settings") if response.data else None) or {}
+
+        try:
+            return await get_config_cache().get_or_load("company_settings", company_id, load)
+        except Exception as e:
+            logger.error("get_company_settings_error", error=str(e), company_id=company_id)
+            return {}
+
     # ============================================
     # API CREDENTIALS
     # ============================================
@@ -424,7 +512,7 @@ class SupabaseClient:
     async def get_credentials(self, client_id: str, service_name: str) -> Optional[Dict[str, Any]]:
         """Get API credentials for a service."""
         try:
-            response = self.client.table("api_credentials").select("credentials").eq("client_id", client_id).eq("service_name", service_name).execute()
+            response = await execute_async(self.client.table("api_credentials").select("credentials").eq("client_id", client_id).eq("service_name", service_name))
 
             if response.data and len(response.data) > 0:
                 return response.data[0]["credentials"]
@@ -469,7 +557,7 @@ class SupabaseClient:
                 "status": "completed"
             }
 
-            response = self.client.table("press_context_units").insert(data).execute()
+            response = await execute_async(self.client.table("press_context_units").insert(data))
 
             if response.data and len(response.data) > 0:
                 created_unit = response.data[0]
@@ -494,13 +582,14 @@ class SupabaseClient:
     ) -> List[Dict[str, Any]]:
         """Get context units for a company."""
         try:
-            response = self.client.table("press_context_units")\
-                .select("*")\
-                .eq("company_id", company_id)\
-                .order("processed_at", desc=True)\
-                .limit(limit)\
-                .offset(offset)\
-                .execute()
+            response = await execute_async(
+                self.client.table("press_context_units")
+                .select("*")
+                .eq("company_id", company_id)
+                .order("processed_at", desc=True)
+                .limit(limit)
+                .offset(offset)
+            )
 
             return response.data or []
 
@@ -531,7 +620,7 @@ class SupabaseClient:
             if created_by_client_id:
                 data["created_by_client_id"] = created_by_client_id
 
-            response = self.client.table("press_styles").insert(data).execute()
+            response = await execute_async(self.client.table("press_styles").insert(data))
 
             if response.data and len(response.data) > 0:
                 created_style = response.data[0]
@@ -552,12 +641,13 @@ class SupabaseClient:
     async def get_styles_by_company(self, company_id: str) -> List[Dict[str, Any]]:
         """Get all active styles for a company."""
         try:
-            response = self.client.table("press_styles")\
-                .select("*")\
-                .eq("company_id", company_id)\
-                .eq("is_active", True)\
-                .order("created_at", desc=True)\
-                .execute()
+            response = await execute_async(
+                self.client.table("press_styles")
+                .select("*")
+                .eq("company_id", company_id)
+                .eq("is_active", True)
+                .order("created_at", desc=True)
+            )
 
             return response.data or []
 
@@ -568,13 +658,14 @@ class SupabaseClient:
     async def get_style_by_id(self, style_id: str, company_id: str) -> Optional[Dict[str, Any]]:
         """Get style by ID and company."""
         try:
-            response = self.client.table("press_styles")\
-                .select("*")\
-                .eq("id", style_id)\
-                .eq("company_id", company_id)\
-                .eq("is_active", True)\
-                .single()\
-                .execute()
+            response = await execute_async(
+                self.client.table("press_styles")
+                .select("*")
+                .eq("id", style_id)
+                .eq("company_id", company_id)
+                .eq("is_active", True)
+                .single()
+            )
 
             return response.data
 
@@ -0,0 +1,446 @@
+"""Whisper transcription service backed by worker processes.
+
+AudioTranscriber used to load Whisper in the caller's process and run
+model.transcribe() synchronously, so a long press-conference recording froze
+the scheduler loop (IMAP listener included) until it finished. The service
+moves that work to dedicated processes:
+
+- Workers: TRANSCRIPTION_WORKERS processes (ProcessPoolExecutor). Each one
+  loads the model once in its initializer and reuses it for every job; the
+  executor's queue is the job queue, so extra jobs wait without blocking
+  the event loop.
+- Chunked mode: audio is decoded to 16 kHz mono (ffmpeg), split into about
+  TRANSCRIPTION_CHUNK_SECONDS pieces cut at the quietest 100 ms frame near
+  each boundary (energy VAD), and silent pieces are skipped. Chunks run as
+  separate jobs, at most one per worker per recording, so other jobs
+  interleave with a long recording; transcribe_stream() yields each chunk's
+  text in order as soon as it is ready. TRANSCRIPTION_CHUNK_SECONDS=0
+  transcribes the whole file in one job.
+- Backends: "whisper" (openai-whisper, default) or "faster_whisper"
+  (CTranslate2, TRANSCRIPTION_COMPUTE_TYPE, int8 by default on CPU). The
+  latter is an optional dependency; workers fall back to whisper when it
+  is not installed.
+
+Functions run in the workers are module-level and only touch the model and
+ffmpeg (see utils/cpu_pool for the same constraint). Workers are spawned
+rather than forked, like the CPU pool, because the parent process already
+runs other threads when the pool starts.
+
+Usage:
+    service = get_transcription_service()
+    result = await service.transcribe("/tmp/audio.mp3")  # {"text", "language", ...}
+
+    async for chunk in service.transcribe_stream("/tmp/rueda_de_prensa.mp3"):
+        print(chunk["start"], chunk["text"])
+"""
+
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import settings
+from .logger import get_logger
+
+logger = get_logger("transcription_service")
+
+SAMPLE_RATE = 16000
+FRAME_SECONDS = 0.1
+# Cut points are searched in the last part of each chunk (seconds)
+CUT_SEARCH_SECONDS = 10.0
+# Chunks whose loudest frame is below this RMS are treated as silence
+SILENCE_RMS = 0.005
+
+
+def load_audio(file_path: str, start: float = 0.0, duration: Optional[float] = None) -> np.ndarray:
+    """Decode (part of) an audio file to 16 kHz mono float32 with ffmpeg."""
+    cmd = ["ffmpeg", "-nostdin", "-threads", "0"]
+    if start > 0:
+        cmd += ["-ss", f"{start:.3f}"]
+    cmd += ["-i", file_path]
+    if duration is not None:
+        cmd += ["-t", f"{duration:.3f}"]
+    cmd += ["-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "-"]
+
+    try:
+        output = subprocess.run(cmd, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"ffmpeg failed: {e.stderr.decode(errors='ignore')[-500:]}") from e
+
+    return np.frombuffer(output, np.int16).astype(np.float32) / 32768.0
+
+
+def split_audio(audio: np.ndarray, chunk_seconds: float) -> List[Tuple[float, float]]:
+    """Split audio into (start, end) second ranges cut at quiet frames.
+
+    Each chunk is at most chunk_seconds long; its end is the lowest-energy
+    frame in the last CUT_SEARCH_SECONDS (or third) of the chunk. A short
+    tail is merged into the previous chunk and silent chunks are dropped.
+    """
+    frame = int(SAMPLE_RATE * FRAME_SECONDS)
+    n_frames = len(audio) // frame
+    duration = len(audio) / SAMPLE_RATE
+    if n_frames == 0:
+        return []
+
+    frames = audio[:n_frames * frame].reshape(n_frames, frame)
+    energy = np.sqrt(np.mean(frames ** 2, axis=1))
+
+    chunk_frames = max(1, int(chunk_seconds / FRAME_SECONDS))
+    search_frames = max(1, min(int(CUT_SEARCH_SECONDS / FRAME_SECONDS), chunk_frames // 3))
+
+    bounds = []
+    cursor = 0
+    while n_frames - cursor > chunk_frames:
+        low = cursor + chunk_frames - search_frames
+        high = cursor + chunk_frames
+        # Latest quietest frame, so steady audio keeps full-length chunks
+        cut = high - int(np.argmin(energy[low:high][::-1]))
+        bounds.append((cursor, cut))
+        cursor = cut
+
+    if bounds and n_frames - cursor < search_frames:
+        bounds[-1] = (bounds[-1][0], n_frames)
+    else:
+        bounds.append((cursor, n_frames))
+
+    chunks = []
+    for index, (first, last) in enumerate(bounds):
+        if energy[first:last].max() < SILENCE_RMS:
+            continue
+        end = duration if index == len(bounds) - 1 else last * FRAME_SECONDS
+        chunks.append((round(first * FRAME_SECONDS, 3), round(end, 3)))
+    return chunks
+
+
+# Worker process state (one model per process)
+
+_worker_model: Any = None
+_worker_backend: Optional[str] = None
+
+
+def _init_worker(model_name: str, backend: str, compute_type: str, threads: int) -> None:
+    """Load the model once per worker process."""
+    global _worker_model, _worker_backend
+
+    download_root = os.getenv("WHISPER_CACHE_DIR", None)
+
+    if backend == "faster_whisper":
+        try:
+            from faster_whisper import WhisperModel
+
+            _worker_model = WhisperModel(
+                model_name,
+                device="cpu",
+                compute_type=compute_type,
+                cpu_threads=threads,
+                download_root=download_root
+            )
+            _worker_backend = "faster_whisper"
+            logger.info("transcription_worker_ready", pid=os.getpid(), backend=_worker_backend, model=model_name)
+            return
+        except ImportError:
+            logger.warn("faster_whisper_unavailable", fallback="whisper")
+
+    import torch
+    import whisper
+
+    torch.set_num_threads(threads)
+    _worker_model = whisper.load_model(model_name, download_root=download_root)
+    _worker_backend = "whisper"
+    logger.info("transcription_worker_ready", pid=os.getpid(), backend=_worker_backend, model=model_name)
+
+
+def _plan_chunks(file_path: str, chunk_seconds: float) -> Dict[str, Any]:
+    """Decode the file once and return its duration and chunk ranges."""
+    audio = load_audio(file_path)
+    return {
+        "duration": round(len(audio) / SAMPLE_RATE, 3),
+        "chunks": split_audio(audio, chunk_seconds)
+    }
+
+
+def _transcribe_range(
+    file_path: str,
+    start: float,
+    end: Optional[float],
+    language: Optional[str]
+) -> Dict[str, Any]:
+    """Transcribe [start, end) of a file (end None = to the end)."""
+    started = time.monotonic()
+    duration = None if end is None else max(0.0, end - start)
+    audio = load_audio(file_path, start, duration)
+
+    if _worker_backend == "faster_whisper":
+        segments, info = _worker_model.transcribe(audio, language=language, vad_filter=True)
+        text = "".join(segment.text for segment in segments).strip()
+        detected_language = info.language
+    else:
+        result = _worker_model.transcribe(
+            audio,
+            language=language,
+            fp16=False  # Disable FP16 for CPU compatibility
+        )
+        text = result["text"].strip()
+        detected_language = result.get("language", "unknown")
+
+    return {
+        "text": text,
+        "language": detected_language or "unknown",
+        "audio_seconds": round(len(audio) / SAMPLE_RATE, 3),
+        "elapsed_seconds": round(time.monotonic() - started, 3)
+    }
+
+
+class TranscriptionService:
+    """Pool of transcription worker processes with chunked streaming."""
+
+    def __init__(
+        self,
+        model_name: str = "base",
+        workers: int = 1,
+        backend: str = "whisper",
+        chunk_seconds: float = 60.0,
+        compute_type: str = "int8"
+    ):
+        """
+        Initialize transcription service (workers start on the first job).
+
+        Args:
+            model_name: Whisper model size (tiny, base, small, medium, large)
+            workers: Worker processes (each holds its own model copy)
+            backend: 'whisper' or 'faster_whisper'
+            chunk_seconds: Target chunk length (0 = no chunking)
+            compute_type: CTranslate2 compute type for faster_whisper
+        """
+        self.model_name = model_name
+        self.workers = max(1, workers)
+        self.backend = backend
+        self.chunk_seconds = max(0.0, chunk_seconds)
+        self.compute_type = compute_type
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._stats = {
+            "jobs": 0,
+            "queued": 0,
+            "failed": 0,
+            "files": 0,
+            "audio_seconds": 0.0,
+            "worker_seconds": 0.0,
+            "pool_restarts": 0
+        }
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            threads = max(1, (os.cpu_count() or 1) // self.workers)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.model_name, self.backend, self.compute_type, threads)
+            )
+            logger.info("transcription_pool_created",
+                workers=self.workers,
+                backend=self.backend,
+                model=self.model_name,
+                threads_per_worker=threads
+            )
+        return self._pool
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        self._stats["queued"] += 1
+        try:
+            return await loop.run_in_executor(self._executor(), partial(func, *args))
+        except BrokenProcessPool as e:
+            # A worker died (OOM on a large model, model load failure): rebuild next time
+            logger.error("transcription_pool_broken", error=str(e))
+            self._stats["pool_restarts"] += 1
+            self._pool = None
+            raise
+        finally:
+            self._stats["queued"] -= 1
+
+    async def _transcribe_chunk(
+        self,
+        file_path: str,
+        start: float,
+        end: Optional[float],
+        language: Optional[str]
+    ) -> Dict[str, Any]:
+        self._stats["jobs"] += 1
+        try:
+            result = await self._run(_transcribe_range, file_path, start, end, language)
+        except Exception:
+            self._stats["failed"] += 1
+            raise
+
+        self._stats["audio_seconds"] += result["audio_seconds"]
+        self._stats["worker_seconds"] += result["elapsed_seconds"]
+        return result
+
+    async def transcribe_stream(
+        self,
+        file_path: str,
+        language: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Transcribe a file chunk by chunk, yielding partial results in order.
+
+        The first chunk fixes the language (when not given) for the rest.
+
+        Args:
+            file_path: Path to audio file
+            language: Language code (e.g., 'es', 'en') or None for auto-detect
+
+        Yields:
+            Dict with index, start, end, text and language of each chunk
+        """
+        self._stats["files"] += 1
+
+        if self.chunk_seconds <= 0:
+            chunks: List[Tuple[float, Optional[float]]] = [(0.0, None)]
+        else:
+            plan = await self._run(_plan_chunks, file_path, self.chunk_seconds)
+            chunks = plan["chunks"]
+            logger.debug("transcription_planned",
+                file=file_path,
+                duration=plan["duration"],
+                chunks=len(chunks)
+            )
+
+        if not chunks:
+            return
+
+        pending: List[asyncio.Future] = []
+        next_chunk = 1
+        try:
+            start, end = chunks[0]
+            result = await self._transcribe_chunk(file_path, start, end, language)
+            if end is None:
+                end = round(start + result["audio_seconds"], 3)
+            language = language or result["language"]
+            yield {"index": 0, "start": start, "end": end, "text": result["text"], "language": result["language"]}
+
+            for index in range(1, len(chunks)):
+                # Keep at most one chunk per worker in flight for this file
+                while next_chunk < len(chunks) and len(pending) < self.workers:
+                    chunk_start, chunk_end = chunks[next_chunk]
+                    pending.append(asyncio.ensure_future(
+                        self._transcribe_chunk(file_path, chunk_start, chunk_end, language)
+                    ))
+                    next_chunk += 1
+
+                result = await pending.pop(0)
+                start, end = chunks[index]
+                yield {"index": index, "start": start, "end": end, "text": result["text"], "language": result["language"]}
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def transcribe(
+        self,
+        file_path: str,
+        language: Optional[str] = None,
+        on_partial: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Transcribe a whole file without blocking the event loop.
+
+        Args:
+            file_path: Path to audio file
+            language: Language code or None for auto-detect
+            on_partial: Optional callback called with each chunk result
+
+        Returns:
+            Dict with text, language, duration (seconds) and chunks
+        """
+        started = time.monotonic()
+        logger.info("transcription_start", file=file_path, language=language)
+
+        texts = []
+        detected_language = language or "unknown"
+        duration = 0.0
+        chunks = 0
+        try:
+            async for chunk in self.transcribe_stream(file_path, language):
+                if chunks == 0:
+                    detected_language = chunk["language"]
+                if chunk["text"]:
+                    texts.append(chunk["text"])
+                duration = chunk["end"]
+                chunks += 1
+                if on_partial is not None:
+                    on_partial(chunk)
+        except Exception as e:
+            logger.error("transcription_error", file=file_path, error=str(e))
+            raise
+
+        transcription = " ".join(texts)
+        logger.info("transcription_completed",
+            file=file_path,
+            text_length=len(transcription),
+            detected_language=detected_language,
+            chunks=chunks,
+            elapsed_seconds=round(time.monotonic() - started, 2)
+        )
+
+        return {
+            "text": transcription,
+            "language": detected_language,
+            "duration": duration,
+            "chunks": chunks
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Job counters and realtime factor (worker seconds per audio second)."""
+        audio_seconds = self._stats["audio_seconds"]
+        return {
+            **self._stats,
+            "audio_seconds": round(audio_seconds, 1),
+            "worker_seconds": round(self._stats["worker_seconds"], 1),
+            "realtime_factor": round(self._stats["worker_seconds"] / audio_seconds, 3) if audio_seconds else 0.0,
+            "workers": self.workers,
+            "backend": self.backend,
+            "model": self.model_name,
+            "running": self._pool is not None
+        }
+
+    def shutdown(self) -> None:
+        """Stop worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Global service instances (one per model size)
+_services: Dict[str, TranscriptionService] = {}
+
+
+def get_transcription_service(model_name: Optional[str] = None) -> TranscriptionService:
+    """Get or create the transcription service for a model size."""
+    model_name = model_name or settings.transcription_model
+
+    if model_name not in _services:
+        _services[model_name] = TranscriptionService(
+            model_name=model_name,
+            workers=settings.transcription_workers,
+            backend=settings.transcription_backend,
+            chunk_seconds=settings.transcription_chunk_seconds,
+            compute_type=settings.transcription_compute_type
+        )
+
+    return _services[model_name]
+
+
+def shutdown_transcription_services() -> None:
+    """Stop all transcription workers (call on shutdown)."""
+    for service in _services.values():
+        service.shutdown()
+    _services.clear()
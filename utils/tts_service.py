@@ -0,0 +1,451 @@
+"""Piper TTS synthesis: persistent voice workers, sentence streaming, disk cache.
+
+POST /tts/synthesize used to run the Piper binary with a blocking
+Popen().communicate() inside the async handler (freezing the API worker for
+up to 15 s) and re-synthesized identical texts on every request. This module
+provides:
+
+- Persistent workers: up to TTS_WORKERS long-running Piper processes
+  (--json-input, one per length_scale in use) that keep the ONNX voice
+  loaded; each sentence is one JSON line and Piper answers with the path of
+  the WAV it wrote. TTS_PERSISTENT_WORKERS=false starts one async Piper
+  process per request instead (--output_raw), still without blocking.
+- Streaming: text is split into sentences and synthesize() yields a WAV
+  header followed by each sentence's PCM as soon as it is ready, so the
+  first audio arrives after the first sentence, not after the whole text.
+- Cache: finished syntheses are stored as WAV files content-addressed by
+  SHA256(voice, rate, text) under TTS_CACHE_DIR; a hit is served straight
+  from disk. The directory is trimmed to TTS_CACHE_MAX_MB (oldest first)
+  every PRUNE_EVERY writes.
+
+Usage:
+    service = get_tts_service()
+    path = service.cached_path(text, rate)
+    if path is None:
+        async for chunk in service.synthesize(text, rate):
+            ...
+
+Call close_tts_service() on shutdown.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import struct
+import tempfile
+import time
+import uuid
+import wave
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .config import settings
+from .logger import get_logger
+
+logger = get_logger("tts_service")
+
+PRUNE_EVERY = 100
+DEFAULT_SAMPLE_RATE = 16000
+RAW_READ_BYTES = 32768
+# Streaming WAV: sizes unknown up front, so RIFF/data sizes use the max value
+UNKNOWN_SIZE = 0xFFFFFFFF
+
+_SENTENCE_END = re.compile(r"(?<=[.!?…;:])\s+|\n+")
+
+
+class TTSError(Exception):
+    """Piper failed or timed out."""
+
+
+def split_sentences(text: str, max_chars: int = 400) -> List[str]:
+    """Split text into sentences (long sentences are cut at commas/spaces)."""
+    sentences = []
+    for part in _SENTENCE_END.split(text):
+        part = " ".join(part.split())
+        while len(part) > max_chars:
+            cut = part.rfind(", ", 0, max_chars)
+            if cut <= 0:
+                cut = part.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            sentences.append(part[:cut + 1].strip())
+            part = part[cut + 1:].strip()
+        if part:
+            sentences.append(part)
+    return sentences
+
+
+def wav_header(sample_rate: int, data_size: Optional[int] = None) -> bytes:
+    """Header of a 16-bit mono PCM WAV (data_size None = streaming)."""
+    riff_size = UNKNOWN_SIZE if data_size is None else 36 + data_size
+    data_size = UNKNOWN_SIZE if data_size is None else data_size
+    return (
+        b"RIFF" + struct.pack("<I", riff_size) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16)
+        + b"data" + struct.pack("<I", data_size)
+    )
+
+
+def tts_cache_key(voice: str, rate: float, text: str) -> str:
+    """Content address of one synthesis."""
+    raw = f"{voice}\0{rate:.3f}\0{text}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _read_pcm(path: str) -> bytes:
+    """PCM frames of a WAV file written by Piper (file is removed)."""
+    try:
+        with wave.open(path, "rb") as wav:
+            return wav.readframes(wav.getnframes())
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class PiperWorker:
+    """One Piper process with the voice loaded, fed one sentence per line."""
+
+    def __init__(self, binary: str, model_path: str, length_scale: float, output_dir: str):
+        self.binary = binary
+        self.model_path = model_path
+        self.length_scale = length_scale
+        self.output_dir = output_dir
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self.sentences = 0
+
+    async def start(self) -> None:
+        self._process = await asyncio.create_subprocess_exec(
+            self.binary,
+            "--model", self.model_path,
+            "--length_scale", str(self.length_scale),
+            "--json-input",
+            "--output_dir", self.output_dir,
+            "--quiet",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        logger.info("piper_worker_started", pid=self._process.pid, length_scale=self.length_scale)
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def synthesize(self, sentence: str, timeout: float) -> bytes:
+        """PCM for one sentence."""
+        output_file = os.path.join(self.output_dir, f"{uuid.uuid4().hex}.wav")
+        line = json.dumps({"text": sentence, "output_file": output_file}, ensure_ascii=False)
+
+        self._process.stdin.write(line.encode("utf-8") + b"\n")
+        await self._process.stdin.drain()
+
+        # Piper prints the written path once the sentence is done
+        response = await asyncio.wait_for(self._process.stdout.readline(), timeout)
+        if not response:
+            raise TTSError(f"piper exited with code {self._process.returncode}")
+
+        self.sentences += 1
+        return await asyncio.to_thread(_read_pcm, output_file)
+
+    async def close(self) -> None:
+        process, self._process = self._process, None
+        if process is None or process.returncode is not None:
+            return
+        try:
+            process.stdin.close()
+            await asyncio.wait_for(process.wait(), 5)
+        except Exception:
+            process.kill()
+            await process.wait()
+
+
+class TTSService:
+    """Piper synthesis with a worker pool, sentence streaming and a disk cache."""
+
+    def __init__(
+        self,
+        binary: str,
+        model_path: str,
+        workers: int = 2,
+        persistent: bool = True,
+        cache_dir: Optional[str] = None,
+        cache_max_bytes: int = 500 * 1024 * 1024,
+        sentence_timeout: float = 15.0
+    ):
+        """
+        Initialize TTS service (workers start on first use).
+
+        Args:
+            binary: Piper executable
+            model_path: Voice .onnx file (its .onnx.json gives the sample rate)
+            workers: Max Piper processes (= concurrent sentence syntheses)
+            persistent: Keep Piper processes alive between requests
+            cache_dir: Directory for cached WAV files (None disables the cache)
+            cache_max_bytes: Cache size limit
+            sentence_timeout: Max seconds per sentence
+        """
+        self.binary = binary
+        self.model_path = model_path
+        self.voice = os.path.basename(model_path).rsplit(".onnx", 1)[0]
+        self.workers = max(1, workers)
+        self.persistent = persistent
+        self.cache_dir = cache_dir
+        self.cache_max_bytes = cache_max_bytes
+        self.sentence_timeout = sentence_timeout
+        self.sample_rate = self._voice_sample_rate()
+        self._output_dir = tempfile.mkdtemp(prefix="piper_")
+        self._idle: List[PiperWorker] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._writes_since_prune = 0
+        self._stats = {
+            "requests": 0,
+            "cache_hits": 0,
+            "sentences": 0,
+            "workers_started": 0,
+            "errors": 0,
+            "first_audio_seconds": 0.0
+        }
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _voice_sample_rate(self) -> int:
+        try:
+            with open(self.model_path + ".json", encoding="utf-8") as f:
+                return int(json.load(f)["audio"]["sample_rate"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return DEFAULT_SAMPLE_RATE
+
+    def _ensure_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Semaphores and subprocess pipes are bound to their event loop
+            self._semaphore = asyncio.Semaphore(self.workers)
+            self._idle = []
+            self._loop = loop
+
+    # Cache
+
+    def _cache_path(self, text: str, rate: float) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        key = tts_cache_key(self.voice, rate, text)
+        return os.path.join(self.cache_dir, key[:2], f"{key}.wav")
+
+    def cached_path(self, text: str, rate: float) -> Optional[str]:
+        """Path of the cached WAV for (text, rate), or None."""
+        path = self._cache_path(text, rate)
+        if path is None or not os.path.exists(path):
+            return None
+        os.utime(path)  # Recently used files survive pruning
+        self._stats["requests"] += 1
+        self._stats["cache_hits"] += 1
+        return path
+
+    def _store(self, path: str, pcm: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(wav_header(self.sample_rate, len(pcm)))
+            f.write(pcm)
+        os.replace(tmp_path, path)
+
+        self._writes_since_prune += 1
+        if self._writes_since_prune >= PRUNE_EVERY:
+            self._prune()
+
+    def _prune(self) -> None:
+        """Delete least recently used files until the cache fits cache_max_bytes."""
+        self._writes_since_prune = 0
+        files = []
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for _, size, path in sorted(files):
+            if total <= self.cache_max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+
+        if removed:
+            logger.info("tts_cache_pruned", removed=removed, size_bytes=total)
+
+    # Workers
+
+    async def _acquire(self, length_scale: float) -> PiperWorker:
+        for index, worker in enumerate(self._idle):
+            if worker.length_scale == length_scale and worker.alive:
+                return self._idle.pop(index)
+
+        worker = PiperWorker(self.binary, self.model_path, length_scale, self._output_dir)
+        await worker.start()
+        self._stats["workers_started"] += 1
+        return worker
+
+    async def _release(self, worker: PiperWorker) -> None:
+        if not worker.alive:
+            return
+        self._idle.append(worker)
+        # Keep at most `workers` idle processes (drop the oldest, e.g. rare rates)
+        while len(self._idle) > self.workers:
+            await self._idle.pop(0).close()
+
+    async def _pooled_pcm(self, sentences: List[str], length_scale: float) -> AsyncIterator[bytes]:
+        for sentence in sentences:
+            async with self._semaphore:
+                worker = await self._acquire(length_scale)
+                try:
+                    pcm = await worker.synthesize(sentence, self.sentence_timeout)
+                except BaseException:
+                    await worker.close()
+                    raise
+                await self._release(worker)
+            self._stats["sentences"] += 1
+            yield pcm
+
+    async def _oneshot_pcm(self, sentences: List[str], length_scale: float) -> AsyncIterator[bytes]:
+        async with self._semaphore:
+            process = await asyncio.create_subprocess_exec(
+                self.binary,
+                "--model", self.model_path,
+                "--length_scale", str(length_scale),
+                "--output_raw",
+                "--quiet",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            self._stats["workers_started"] += 1
+            try:
+                process.stdin.write("\n".join(sentences).encode("utf-8") + b"\n")
+                await process.stdin.drain()
+                process.stdin.close()
+
+                while True:
+                    chunk = await asyncio.wait_for(process.stdout.read(RAW_READ_BYTES), self.sentence_timeout)
+                    if not chunk:
+                        break
+                    yield chunk
+
+                if await process.wait() != 0:
+                    raise TTSError(f"piper exited with code {process.returncode}")
+                self._stats["sentences"] += len(sentences)
+            finally:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+
+    async def synthesize(self, text: str, rate: float) -> AsyncIterator[bytes]:
+        """
+        Stream a WAV: header first, then PCM sentence by sentence.
+
+        The complete audio is written to the cache once the stream finishes.
+
+        Args:
+            text: Text to synthesize
+            rate: Speech rate (length_scale = 1 / rate)
+
+        Yields:
+            WAV bytes (streaming header with unknown size, then PCM)
+
+        Raises:
+            TTSError: Piper failed
+            asyncio.TimeoutError: A sentence took longer than sentence_timeout
+        """
+        self._ensure_loop()
+        self._stats["requests"] += 1
+        started = time.monotonic()
+        length_scale = round(1.0 / rate, 3)
+        sentences = split_sentences(text)
+
+        producer = self._pooled_pcm if self.persistent else self._oneshot_pcm
+        chunks = []
+        try:
+            yield wav_header(self.sample_rate)
+            async for pcm in producer(sentences, length_scale):
+                if not chunks:
+                    self._stats["first_audio_seconds"] += time.monotonic() - started
+                chunks.append(pcm)
+                yield pcm
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error("tts_synthesis_error", error=str(e) or type(e).__name__)
+            raise
+
+        path = self._cache_path(text, rate)
+        if path is not None and chunks:
+            try:
+                await asyncio.to_thread(self._store, path, b"".join(chunks))
+            except OSError as e:
+                logger.warn("tts_cache_write_error", error=str(e))
+
+    def stats(self) -> Dict[str, Any]:
+        """Request/cache counters, idle workers and mean first-audio latency."""
+        synthesized = self._stats["requests"] - self._stats["cache_hits"]
+        return {
+            **{key: value for key, value in self._stats.items() if key != "first_audio_seconds"},
+            "avg_first_audio_seconds": (
+                round(self._stats["first_audio_seconds"] / synthesized, 3) if synthesized else 0.0
+            ),
+            "idle_workers": len(self._idle),
+            "max_workers": self.workers,
+            "persistent": self.persistent,
+            "voice": self.voice
+        }
+
+    async def close(self) -> None:
+        """Stop idle Piper processes."""
+        idle, self._idle = self._idle, []
+        for worker in idle:
+            await worker.close()
+
+
+# Global service instance
+_tts_service: Optional[TTSService] = None
+
+
+def get_tts_service() -> TTSService:
+    """Get or create TTS service singleton."""
+    global _tts_service
+
+    if _tts_service is None:
+        _tts_service = TTSService(
+            binary=settings.tts_piper_binary,
+            model_path=settings.tts_voice_model,
+            workers=settings.tts_workers,
+            persistent=settings.tts_persistent_workers,
+            cache_dir=settings.tts_cache_dir if settings.tts_cache_enabled else None,
+            cache_max_bytes=settings.tts_cache_max_mb * 1024 * 1024,
+            sentence_timeout=settings.tts_sentence_timeout_seconds
+        )
+        logger.info("tts_service_initialized",
+            voice=_tts_service.voice,
+            sample_rate=_tts_service.sample_rate,
+            workers=_tts_service.workers,
+            persistent=_tts_service.persistent,
+            cache_dir=_tts_service.cache_dir
+        )
+
+    return _tts_service
+
+
+async def close_tts_service() -> None:
+    """Stop Piper workers (call on shutdown)."""
+    if _tts_service is not None:
+        await _tts_service.close()
@@ -39,7 +39,9 @@ enriched = await enrich_content(
 # Returns: {title, summary, tags, category, atomic_statements, enrichment_cost_usd, enrichment_model}
 """
 
+import asyncio
 from typing import Dict, Any, Optional, List
+from utils.config import settings
 from utils.logger import get_logger
 from utils.llm_client import get_llm_client
 
@@ -206,6 +208,7 @@ async def enrich_content_batch(
     """Batch enrichment for multiple content items.
     
     Useful for multi-noticia scenarios (scraping index pages, perplexity multiple news).
+    Items are enriched concurrently (LLM_BATCH_CONCURRENCY); results keep input order.
     
     Args:
         items: List of dicts with 'raw_text' and optional 'pre_filled'
@@ -225,33 +228,40 @@ async def enrich_content_batch(
         item_count=len(items)
     )
     
-    enriched_items = []
+    # Items run concurrently; provider rate limits are enforced by the
+    # shared LLM governor (utils/llm_governor), this only bounds fan-out
+    semaphore = asyncio.Semaphore(max(1, settings.llm_batch_concurrency))
     
-    for i, item in enumerate(items):
-        try:
-            enriched = await enrich_content(
-                raw_text=item.get("raw_text", ""),
-                source_type=source_type,
-                company_id=company_id,
-                pre_filled=item.get("pre_filled", {})
-            )
-            enriched_items.append(enriched)
-            
-        except Exception as e:
-            logger.error("batch_enrichment_item_failed",
-                source_type=source_type,
-                item_index=i,
-                error=str(e)
-            )
-            enriched_items.append({
-                "title": "Error al procesar",
-                "summary": "",
-                "tags": [],
-                "category": "general",
-                "atomic_statements": [],
-                "enrichment_cost_usd": 0.0,
-                "enrichment_model": "error"
-            })
+    async def enrich_item(i: int, item: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await enrich_content(
+                    raw_text=item.get("raw_text", ""),
+                    source_type=source_type,
+                    company_id=company_id,
+                    pre_filled=item.get("pre_filled", {})
+                )
+                
+            except Exception as e:
+                logger.error("batch_enrichment_item_failed",
+                    source_type=source_type,
+                    item_index=i,
+                    error=str(e)
+                )
+                return {
+                    "title": "Error al procesar",
+                    "summary": "",
+                    "tags": [],
+                    "category": "general",
+                    "atomic_statements": [],
+                    "enrichment_cost_usd": 0.0,
+                    "enrichment_model": "error"
+                }
+    
+    # gather preserves input order
+    enriched_items = list(await asyncio.gather(
+        *[enrich_item(i, item) for i, item in enumerate(items)]
+    ))
     
     total_cost = sum(item["enrichment_cost_usd"] for item in enriched_items)
     
@@ -18,7 +18,8 @@ Combinaciones flexibles:
 - Embeddings: FastEmbed multilingual 768d
 - Campos faltantes: Via GPT-4o-mini si needed
 - Normalización: atomic_statements en formato estándar
-- Deduplicación: Búsqueda semántica threshold 0.98
+- Deduplicación: Búsqueda semántica threshold 0.98 (índice local en memoria
+  si DUPLICATE_INDEX_ENABLED, RPC pgvector si el índice está frío)
 
 ¿CUÁNDO SE USA?
 ---------------
@@ -59,7 +60,8 @@ import uuid
 
 from .llm_client import LLMClient
 from .embedding_generator import generate_embedding
-from .supabase_client import get_supabase_client
+from .duplicate_index import get_duplicate_index
+from .supabase_client import execute_async, get_supabase_client
 from .logger import get_logger
 
 logger = get_logger("unified_context_ingester")
@@ -394,32 +396,44 @@ async def ingest_context_unit(
                 # Continue - safer to have duplicates than miss content
 
         # Step 5B: Check for semantic duplicates using embedding similarity
+        duplicate_index = get_duplicate_index()
+
         if check_duplicates and embedding:
             try:
-                supabase = get_supabase_client()
-                
                 # Select threshold based on company type
                 # Pool uses lower threshold (0.92) to catch more duplicates from multiple sources
                 # Clients use higher threshold (0.98) to avoid false positives
                 is_pool = company_id == "99999999-9999-9999-9999-999999999999"
                 threshold = DUPLICATE_THRESHOLD_POOL if is_pool else DUPLICATE_THRESHOLD_CLIENT
 
-                # Use search RPC function for duplicate detection
-                embedding_str = '[' + ','.join(map(str, embedding)) + ']'
+                duplicate = None
+
+                if duplicate_index and duplicate_index.is_warm(company_id):
+                    # Local in-memory lookup (last N days, no network round-trip)
+                    duplicate = duplicate_index.find_duplicate(company_id, embedding, threshold)
+                else:
+                    if duplicate_index:
+                        duplicate_index.record_cold_fallback(company_id)
 
-                result = supabase.client.rpc(
-                    'search_context_units_by_vector',
-                    {
-                        'p_company_id': company_id,
-                        'p_query_embedding': embedding_str,
-                        'p_threshold': threshold,
-                        'p_limit': 1
-                    }
-                ).execute()
+                    supabase = get_supabase_client()
 
-                if result.data and len(result.data) > 0:
-                    duplicate = result.data[0]
+                    # Use search RPC function for duplicate detection
+                    embedding_str = '[' + ','.join(map(str, embedding)) + ']'
 
+                    result = await execute_async(supabase.client.rpc(
+                        'search_context_units_by_vector',
+                        {
+                            'p_company_id': company_id,
+                            'p_query_embedding': embedding_str,
+                            'p_threshold': threshold,
+                            'p_limit': 1
+                        }
+                    ))
+
+                    if result.data and len(result.data) > 0:
+                        duplicate = result.data[0]
+
+                if duplicate:
                     if not force_save:
                         logger.warn("semantic_duplicate_found_skipping_save",
                             title=title[:50],
@@ -494,6 +508,9 @@ async def ingest_context_unit(
             ).execute()
 
             if result.data and len(result.data) > 0:
+                if duplicate_index and embedding:
+                    duplicate_index.add(company_id, context_unit_id, title, embedding)
+
                 logger.info("context_unit_saved",
                     context_unit_id=context_unit_id,
                     company_id=company_id,
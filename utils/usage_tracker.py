@@ -1,17 +1,38 @@
 """LLM Usage Tracker.
 
 Tracks token usage and costs for all LLM operations.
+
+Records are buffered in memory and written by a background task as bulk
+llm_usage inserts, every USAGE_TRACKER_BATCH_SIZE records or every
+USAGE_TRACKER_FLUSH_INTERVAL_SECONDS, whichever comes first, so an LLM call
+(or TTS request) no longer waits for its own insert. Batches that fail for
+a transient reason (connection error, 5xx) are put back in the buffer
+(capped at USAGE_TRACKER_MAX_BUFFER records, oldest dropped). A batch
+rejected by the database (e.g. one row references a deleted context unit)
+is retried row by row and only the rejected rows are dropped, as with
+the previous per-row inserts. Call close_usage_tracker() on shutdown to flush what is left.
+Set USAGE_TRACKER_BUFFERED=false to insert inline as before.
+
+Usage:
+    tracker = get_usage_tracker()
+    await tracker.track(model=..., operation=..., input_tokens=..., ...)
+    await tracker.flush()  # force a write (scripts, tests)
 """
 
-import uuid
-from typing import Optional, Dict, Any
+import asyncio
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
+from utils.config import settings
 from utils.logger import get_logger
-from utils.supabase_client import get_supabase_client
+from utils.supabase_client import get_supabase_client, execute_async
 
 logger = get_logger("usage_tracker")
 
+# SQLSTATE classes worth retrying: connection, transaction rollback,
+# insufficient resources, operator intervention, system error
+TRANSIENT_SQLSTATE_CLASSES = ("08", "40", "53", "57", "58")
+
 # OpenRouter pricing (per 1M tokens)
 # Source: https://openrouter.ai/models
 PRICING = {
@@ -30,12 +51,177 @@ PRICING = {
 }
 
 
+def is_transient_error(error: Exception) -> bool:
+    """True if an insert may succeed when retried later.
+
+    PostgREST errors carry a SQLSTATE (or the HTTP status when the body is
+    not JSON). Anything else (timeouts, connection errors) is transient.
+    """
+    code = getattr(error, "code", None)
+    if code is None or not hasattr(error, "details"):
+        return True
+    code = str(code)
+    if code.isdigit() and len(code) == 3:
+        return int(code) >= 500
+    return code.startswith(TRANSIENT_SQLSTATE_CLASSES)
+
+
 class UsageTracker:
     """Track LLM token usage and costs."""
 
-    def __init__(self):
-        """Initialize usage tracker."""
+    def __init__(
+        self,
+        buffered: bool = True,
+        batch_size: int = 50,
+        flush_interval: float = 5.0,
+        max_buffer: int = 5000
+    ):
+        """
+        Initialize usage tracker.
+
+        Args:
+            buffered: Write records from a background task (False = inline insert)
+            batch_size: Records that trigger an immediate flush
+            flush_interval: Max seconds a record waits in the buffer
+            max_buffer: Max records kept when the database is unavailable
+        """
         self.supabase = get_supabase_client()
+        self.buffered = buffered
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_buffer = max(self.batch_size, max_buffer)
+        self._buffer: List[Dict[str, Any]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._stats = {
+            "tracked": 0,
+            "written": 0,
+            "flushes": 0,
+            "failed_flushes": 0,
+            "rejected": 0,
+            "dropped": 0
+        }
+
+    def _ensure_flusher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Events/locks/tasks can't be shared across event loops
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._flusher = None
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write all buffered records as bulk inserts.
+
+        Returns:
+            Number of records written
+        """
+        if not self._buffer:
+            return 0
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        written = 0
+        async with self._flush_lock:
+            while self._buffer:
+                batch = self._buffer[:self.batch_size]
+                del self._buffer[:self.batch_size]
+                try:
+                    await execute_async(self.supabase.client.table("llm_usage").insert(batch))
+                except Exception as e:
+                    self._stats["failed_flushes"] += 1
+                    if is_transient_error(e):
+                        self._requeue(batch)
+                        logger.error("usage_flush_error",
+                            error=str(e),
+                            records=len(batch),
+                            buffered=len(self._buffer)
+                        )
+                        break
+                    logger.warn("usage_batch_rejected", error=str(e), records=len(batch))
+                    rows_written, completed = await self._insert_rows(batch)
+                    written += rows_written
+                    if not completed:
+                        break
+                    continue
+                written += len(batch)
+                self._stats["written"] += len(batch)
+                self._stats["flushes"] += 1
+
+        if written:
+            logger.debug("usage_flushed", records=written)
+        return written
+
+    async def _insert_rows(self, batch: List[Dict[str, Any]]) -> Tuple[int, bool]:
+        """Insert a rejected batch row by row, dropping rows the database rejects.
+
+        Returns:
+            (rows written, False if a transient error requeued the rest)
+        """
+        written = 0
+        for index, row in enumerate(batch):
+            try:
+                await execute_async(self.supabase.client.table("llm_usage").insert(row))
+            except Exception as e:
+                if is_transient_error(e):
+                    self._requeue(batch[index:])
+                    logger.error("usage_flush_error",
+                        error=str(e),
+                        records=len(batch) - index,
+                        buffered=len(self._buffer)
+                    )
+                    return written, False
+                self._stats["rejected"] += 1
+                logger.error("usage_record_rejected",
+                    error=str(e),
+                    operation=row.get("operation"),
+                    company_id=row.get("company_id"),
+                    context_unit_id=row.get("context_unit_id"),
+                    client_id=row.get("client_id")
+                )
+                continue
+            written += 1
+            self._stats["written"] += 1
+        self._stats["flushes"] += 1
+        return written, True
+
+    def _requeue(self, batch: List[Dict[str, Any]]) -> None:
+        """Put a failed batch back in front, dropping the oldest beyond max_buffer."""
+        self._buffer[:0] = batch
+        overflow = len(self._buffer) - self.max_buffer
+        if overflow > 0:
+            del self._buffer[:overflow]
+            self._stats["dropped"] += overflow
+            logger.error("usage_records_dropped", records=overflow, max_buffer=self.max_buffer)
+
+    async def close(self) -> None:
+        """Stop the background flusher and write remaining records."""
+        if self._flusher is not None and self._loop is asyncio.get_running_loop():
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+        self._flusher = None
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Buffer counters."""
+        return {**self._stats, "buffered": len(self._buffer)}
 
     async def track(
         self,
@@ -62,7 +248,7 @@ class UsageTracker:
             metadata: Additional metadata (optional)
 
         Returns:
-            Usage record UUID
+            Usage record UUID ("" when buffered: the row is written later)
         """
         try:
             # Calculate costs
@@ -90,9 +276,7 @@ class UsageTracker:
             # Add client_id (now column exists, can be null for email sources)
             data["client_id"] = client_id
 
-            # Insert into database
-            result = self.supabase.client.table("llm_usage").insert(data).execute()
-
+            self._stats["tracked"] += 1
             logger.info(
                 "usage_tracked",
                 operation=operation,
@@ -102,6 +286,15 @@ class UsageTracker:
                 cost_usd=round(total_cost, 6)
             )
 
+            if self.buffered:
+                self._buffer.append(data)
+                self._ensure_flusher()
+                if len(self._buffer) >= self.batch_size:
+                    self._wakeup.set()
+                return ""
+
+            # Insert into database
+            result = await execute_async(self.supabase.client.table("llm_usage").insert(data))
             return result.data[0]["id"] if result.data else ""
 
         except Exception as e:
@@ -173,5 +366,16 @@ def get_usage_tracker() -> UsageTracker:
     """Get or create usage tracker singleton."""
     global _usage_tracker
     if _usage_tracker is None:
-        _usage_tracker = UsageTracker()
+        _usage_tracker = UsageTracker(
+            buffered=settings.usage_tracker_buffered,
+            batch_size=settings.usage_tracker_batch_size,
+            flush_interval=settings.usage_tracker_flush_interval_seconds,
+            max_buffer=settings.usage_tracker_max_buffer
+        )
     return _usage_tracker
+
+
+async def close_usage_tracker() -> None:
+    """Flush buffered usage records (call on shutdown)."""
+    if _usage_tracker is not None:
+        await _usage_tracker.close()
@@ -0,0 +1,150 @@
+"""Vectorized cosine similarity for 768d embeddings (NumPy).
+
+Replaces per-candidate Python loops with a single matrix-vector product:
+candidates are stacked once into a contiguous float32 matrix, L2-normalized,
+and every query is answered with `matrix @ query`.
+
+Usage:
+    matrix = EmbeddingMatrix(candidate_embeddings)
+    indices = matrix.above_threshold(query_embedding, threshold=0.95)
+    top = matrix.top_k(query_embedding, k=5)  # [(index, score), ...]
+
+    cosine_similarity(a, b)  # single pair
+
+Embeddings can be lists of floats, numpy arrays, or pgvector strings
+("[0.1,0.2,...]") as returned by PostgREST.
+"""
+
+import json
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .logger import get_logger
+
+logger = get_logger("vector_similarity")
+
+EmbeddingLike = Union[Sequence[float], np.ndarray, str]
+
+
+def to_vector(embedding: EmbeddingLike) -> np.ndarray:
+    """Convert an embedding (list, array or pgvector string) to float32 array."""
+    if isinstance(embedding, str):
+        embedding = json.loads(embedding)
+    return np.asarray(embedding, dtype=np.float32).reshape(-1)
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows in place (zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+def _normalized_query(query: EmbeddingLike) -> np.ndarray:
+    vector = to_vector(query)
+    norm = np.linalg.norm(vector)
+    if norm == 0:
+        return vector
+    return vector / norm
+
+
+def cosine_similarity(embedding1: EmbeddingLike, embedding2: EmbeddingLike) -> float:
+    """Calculate cosine similarity between two embeddings.
+
+    Args:
+        embedding1: First embedding vector
+        embedding2: Second embedding vector
+
+    Returns:
+        Similarity score (-1.0 to 1.0, 0.0 if either vector is zero)
+    """
+    a = to_vector(embedding1)
+    b = to_vector(embedding2)
+
+    denominator = float(np.linalg.norm(a) * np.linalg.norm(b))
+    if denominator == 0:
+        return 0.0
+
+    return float(np.dot(a, b) / denominator)
+
+
+class EmbeddingMatrix:
+    """Pre-normalized, contiguous float32 matrix of candidate embeddings."""
+
+    def __init__(self, embeddings: Optional[List[EmbeddingLike]] = None, dim: Optional[int] = None):
+        """
+        Stack and normalize candidates.
+
+        Args:
+            embeddings: Candidate embedding vectors
+            dim: Vector dimension (only needed for an empty matrix)
+        """
+        embeddings = embeddings or []
+
+        if embeddings:
+            if any(isinstance(e, str) for e in embeddings):
+                embeddings = [to_vector(e) for e in embeddings]
+            # One C-level conversion instead of a per-row vstack
+            matrix = np.array(embeddings, dtype=np.float32, order="C")
+            self.matrix = normalize_rows(matrix.reshape(len(embeddings), -1))
+        else:
+            self.matrix = np.zeros((0, dim or 0), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    def scores(self, query: EmbeddingLike) -> np.ndarray:
+        """Cosine similarity of query against every candidate."""
+        if len(self) == 0:
+            return np.zeros(0, dtype=np.float32)
+        return self.matrix @ _normalized_query(query)
+
+    def above_threshold(self, query: EmbeddingLike, threshold: float) -> List[int]:
+        """Indices of candidates with similarity >= threshold (original order)."""
+        return np.flatnonzero(self.scores(query) >= threshold).tolist()
+
+    def top_k(
+        self,
+        query: EmbeddingLike,
+        k: int = 1,
+        threshold: Optional[float] = None
+    ) -> List[Tuple[int, float]]:
+        """Best k candidates as (index, score), highest score first."""
+        scores = self.scores(query)
+        if scores.size == 0 or k <= 0:
+            return []
+
+        k = min(k, scores.size)
+        if k < scores.size:
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(scores.size)
+        ordered = candidates[np.argsort(-scores[candidates])]
+
+        results = [(int(i), float(scores[i])) for i in ordered]
+        if threshold is not None:
+            results = [(i, s) for i, s in results if s >= threshold]
+        return results
+
+
+def find_similar(
+    query_embedding: EmbeddingLike,
+    candidate_embeddings: List[EmbeddingLike],
+    threshold: float = 0.95
+) -> List[int]:
+    """Find indices of candidates with similarity >= threshold.
+
+    Args:
+        query_embedding: Query embedding vector
+        candidate_embeddings: List of candidate embeddings
+        threshold: Minimum similarity score (0.0-1.0)
+
+    Returns:
+        List of indices of similar embeddings
+    """
+    if not candidate_embeddings:
+        return []
+
+    return EmbeddingMatrix(candidate_embeddings).above_threshold(query_embedding, threshold)
@@ -189,19 +189,12 @@ async def execute_redact_news(
         instructions = None
         try:
             supabase_client = get_supabase_client()
-            settings_result = supabase_client.client.table("companies")\
-                .select("settings")\
-                .eq("id", client["company_id"])\
-                .maybe_single()\
-                .execute()
-
-            if settings_result.data:
-                company_settings = settings_result.data.get("settings") or {}
-                instructions = company_settings.get("article_general_settings")
-                if instructions:
-                    logger.info("article_instructions_loaded",
-                        company_id=client["company_id"],
-                        instructions_preview=instructions[:100] if len(instructions) > 100 else instructions)
+            company_settings = await supabase_client.get_company_settings(client["company_id"])
+            instructions = company_settings.get("article_general_settings")
+            if instructions:
+                logger.info("article_instructions_loaded",
+                    company_id=client["company_id"],
+                    instructions_preview=instructions[:100] if len(instructions) > 100 else instructions)
         except Exception as e:
             logger.warn("company_settings_fetch_failed", error=str(e))
 
@@ -495,19 +488,12 @@ async def execute_redact_news_rich(
         # Fetch company settings for article_general_settings (inside settings JSONB)
         combined_instructions = ""
         try:
-            settings_result = supabase_client.client.table("companies")\
-                .select("settings")\
-                .eq("id", client["company_id"])\
-                .maybe_single()\
-                .execute()
-
-            if settings_result.data:
-                company_settings = settings_result.data.get("settings") or {}
-                combined_instructions = company_settings.get("article_general_settings", "")
-                if combined_instructions:
-                    logger.info("article_instructions_loaded_rich",
-                        company_id=client["company_id"],
-                        instructions_preview=combined_instructions[:100] if len(combined_instructions) > 100 else combined_instructions)
+            company_settings = await supabase_client.get_company_settings(client["company_id"])
+            combined_instructions = company_settings.get("article_general_settings") or ""
+            if combined_instructions:
+                logger.info("article_instructions_loaded_rich",
+                    company_id=client["company_id"],
+                    instructions_preview=combined_instructions[:100] if len(combined_instructions) > 100 else combined_instructions)
         except Exception as e:
             logger.warn("company_settings_fetch_failed", error=str(e))
         